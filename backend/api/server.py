@@ -7,20 +7,26 @@ the Python backend. All endpoints require Bearer token authentication.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import os
 import threading
 import time
+from collections.abc import Awaitable, Iterator
 from pathlib import Path
 from typing import Any
 
 from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
 
 _chronicle_in_flight: set[str] = set()
 _chronicle_in_flight_lock = threading.Lock()
 
+# How often a pending LLM request checks whether its HTTP client went away.
+DISCONNECT_POLL_SECONDS = 0.5
+
 
 # Auth configuration
 ENV_API_TOKEN = "STELLARIS_API_TOKEN"
@@ -121,6 +127,30 @@ def _pick_latest_game_date(*values: Any) -> str | None:
     return latest_raw if latest_raw is not None else fallback_raw
 
 
+async def _await_unless_disconnected(request: Request, awaitable: Awaitable[Any]) -> Any:
+    """Await an LLM-backed call, cancelling it if the HTTP client disconnects first.
+
+    Raises 499 (client closed request) after cancelling; the client never sees it.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+                raise HTTPException(
+                    status_code=499,
+                    detail={"error": "Client disconnected", "code": "CLIENT_DISCONNECTED"},
+                )
+    finally:
+        # Also covers this handler itself being cancelled (e.g. server shutdown).
+        task.cancel()
+
+
 def get_auth_token() -> str | None:
     """Get the expected auth token from environment."""
     return os.environ.get(ENV_API_TOKEN)
@@ -249,10 +279,15 @@ def create_app() -> FastAPI:
             "ingestionLastError": None,
             "precomputeReady": None,
             "t2Ready": None,
+            "dbMaintenance": None,
         }
 
         ingestion = getattr(request.app.state, "ingestion", None)
         companion = getattr(request.app.state, "companion", None)
+        db = getattr(request.app.state, "db", None)
+        if db is not None:
+            with contextlib.suppress(Exception):
+                diagnostics["dbMaintenance"] = db.get_maintenance_stats()
 
         # Try to get metadata from ingestion manager first
         if ingestion is not None:
@@ -462,13 +497,10 @@ def create_app() -> FastAPI:
         db.update_chronicle_custom_instructions(save_id, custom or None)
         return {"custom_instructions": custom or None, "persisted": True}
 
-    @app.post("/api/chat", dependencies=[Depends(verify_token)])
-    def chat(request: Request, body: ChatRequest) -> dict[str, Any]:
-        """Chat endpoint for asking questions about the game state.
+    def _require_chat_ready(request: Request) -> tuple[Any, dict[str, Any], str | None]:
+        """Return (companion, precompute status, save_id), or raise 503 until chat can answer.
 
-        Uses the precomputed briefing for fast responses without tool calls.
-
-        Returns 503 if the precompute is not ready yet.
+        Blocking (manager and companion locks); async handlers run it in a thread.
         """
         companion = getattr(request.app.state, "companion", None)
         ingestion = getattr(request.app.state, "ingestion", None)
@@ -539,18 +571,35 @@ def create_app() -> FastAPI:
                 },
             )
 
-        # Call ask_precomputed to get the response
-        start_time = time.time()
         save_id, _ = _resolve_current_save_id(request)
+        return companion, precompute_status, save_id
+
+    @app.post("/api/chat", dependencies=[Depends(verify_token)])
+    async def chat(request: Request, body: ChatRequest) -> dict[str, Any]:
+        """Chat endpoint for asking questions about the game state.
+
+        Uses the precomputed briefing for fast responses without tool calls.
+        Async so a slow model call holds no threadpool worker; the call is
+        cancelled if the client disconnects.
+
+        Returns 503 if the precompute is not ready yet.
+        """
+        start_time = time.time()
+        companion, precompute_status, save_id = await asyncio.to_thread(
+            _require_chat_ready, request
+        )
         scoped_session_key = _scope_chat_session_key(save_id=save_id, client_key=body.session_key)
         requested_model = (body.model or "").strip()[:120] or None
-        response_text, elapsed = companion.ask_precomputed(
-            question=body.message,
-            session_key=scoped_session_key,
-            save_id=save_id,
-            model_name=requested_model,
-            model_routing_mode=body.model_routing_mode,
-            language=body.language,
+        response_text, elapsed = await _await_unless_disconnected(
+            request,
+            companion.ask_precomputed_async(
+                question=body.message,
+                session_key=scoped_session_key,
+                save_id=save_id,
+                model_name=requested_model,
+                model_routing_mode=body.model_routing_mode,
+                language=body.language,
+            ),
         )
         response_time_ms = int((time.time() - start_time) * 1000)
         call_stats = companion.get_call_stats()
@@ -567,6 +616,61 @@ def create_app() -> FastAPI:
             "model_routing": call_stats.get("routing"),
         }
 
+    @app.post("/api/chat/stream", dependencies=[Depends(verify_token)])
+    def chat_stream(request: Request, body: ChatRequest) -> StreamingResponse:
+        """Streaming chat: the answer as server-sent events while it is generated.
+
+        Events: ``delta`` ({"text"}) for each chunk, then ``done`` with the same
+        fields as /api/chat plus ``ttft_ms`` (time to first token), or ``error``.
+        Model fallback and 503 readiness checks match /api/chat; the conversation
+        turn is only recorded once the stream completes.
+        """
+        from backend.core.json_utils import json_dumps
+
+        start_time = time.time()
+        companion, precompute_status, save_id = _require_chat_ready(request)
+        scoped_session_key = _scope_chat_session_key(save_id=save_id, client_key=body.session_key)
+        requested_model = (body.model or "").strip()[:120] or None
+        events = companion.ask_precomputed_stream(
+            question=body.message,
+            session_key=scoped_session_key,
+            save_id=save_id,
+            model_name=requested_model,
+            model_routing_mode=body.model_routing_mode,
+            language=body.language,
+        )
+
+        def _sse() -> Iterator[str]:
+            for event in events:
+                kind = event.get("type")
+                if kind == "delta":
+                    payload: dict[str, Any] = {"text": event.get("text", "")}
+                elif kind == "done":
+                    call_stats = event.get("stats") or {}
+                    # Measured by the companion at the first model token (not the data note).
+                    ttft_ms = event.get("ttft_ms")
+                    payload = {
+                        "text": event.get("text", ""),
+                        "game_date": precompute_status.get("game_date"),
+                        "response_time_ms": int((time.time() - start_time) * 1000),
+                        "ttft_ms": int(ttft_ms) if ttft_ms is not None else None,
+                        "model": call_stats.get("model") or companion.get_advisor_model(),
+                        "model_display": call_stats.get("model_display"),
+                        "requested_model": call_stats.get("requested_model"),
+                        "requested_model_display": call_stats.get("requested_model_display"),
+                        "model_routing": call_stats.get("routing"),
+                    }
+                else:
+                    kind = "error"
+                    payload = {"error": event.get("error") or "Unknown error"}
+                yield f"event: {kind}\ndata: {json_dumps(payload)}\n\n"
+
+        return StreamingResponse(
+            _sse(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @app.get("/api/status", dependencies=[Depends(verify_token)])
     async def get_status(request: Request) -> dict[str, Any]:
         """Get empire status summary.
@@ -719,6 +823,47 @@ def create_app() -> FastAPI:
 
         return {"events": events}
 
+    @app.get("/api/sessions/{session_id}/metrics/{metric}", dependencies=[Depends(verify_token)])
+    async def get_session_metric_series(
+        request: Request,
+        session_id: str,
+        metric: str,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        points: int = 200,
+    ) -> dict[str, Any]:
+        """Get a downsampled metric series for charts.
+
+        Reads the snapshot metrics timeline; each point has game_date, value (bucket
+        average), min, max and samples. See backend.core.metrics_timeline for metrics.
+        """
+        db = getattr(request.app.state, "db", None)
+
+        if db is None:
+            raise HTTPException(
+                status_code=503,
+                detail={"error": "Database not initialized"},
+            )
+
+        if db.get_session_by_id(session_id) is None:
+            raise HTTPException(
+                status_code=404,
+                detail={"error": "Session not found"},
+            )
+
+        try:
+            series = db.get_metric_series(
+                session_id=session_id,
+                metric=metric,
+                from_game_date=from_date,
+                to_game_date=to_date,
+                max_points=points,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail={"error": str(e)})
+
+        return {"metric": metric, "points": series}
+
     @app.post("/api/end-session", dependencies=[Depends(verify_token)])
     async def end_session(request: Request) -> dict[str, Any]:
         """End the current active session.
@@ -795,8 +940,34 @@ def create_app() -> FastAPI:
             "snapshot_count": stats.get("snapshot_count", 0),
         }
 
+    @app.post("/api/db/compact", dependencies=[Depends(verify_token)])
+    def compact_database(request: Request) -> dict[str, Any]:
+        """Convert an older history DB to incremental vacuum (one-off, user-initiated).
+
+        DBs created before auto_vacuum was enabled need one full VACUUM before idle
+        maintenance can return free pages. The rebuild blocks DB access while it
+        runs, so it only happens here. Returns whether a conversion ran, plus the
+        page counts afterwards.
+        """
+        db = getattr(request.app.state, "db", None)
+        if db is None:
+            raise HTTPException(
+                status_code=503,
+                detail={"error": "Database not initialized"},
+            )
+
+        converted = False
+        if db.get_page_stats()["auto_vacuum"] != "incremental":
+            converted = db.enable_incremental_vacuum()
+            if not converted:
+                raise HTTPException(
+                    status_code=409,
+                    detail={"error": "Database is busy; try again shortly"},
+                )
+        return {"converted": converted, "pages": db.get_page_stats()}
+
     @app.post("/api/recap", dependencies=[Depends(verify_token)])
-    def generate_recap(request: Request, body: RecapRequest) -> dict[str, Any]:
+    async def generate_recap(request: Request, body: RecapRequest) -> dict[str, Any]:
         """Generate a recap summary for a session.
 
         Returns a narrative recap of events and key changes during the session.
@@ -804,8 +975,8 @@ def create_app() -> FastAPI:
         - "summary": Fast deterministic recap (default)
         - "dramatic": LLM-powered dramatic narrative
 
-        Note: This is a sync endpoint because the LLM client is synchronous.
-        FastAPI runs sync endpoints in a threadpool.
+        The LLM call uses the async client and is cancelled if the client
+        disconnects.
         """
         db = getattr(request.app.state, "db", None)
 
@@ -815,16 +986,16 @@ def create_app() -> FastAPI:
                 detail={"error": "Database not initialized"},
             )
 
-        # Check if session exists
-        session = db.get_session_by_id(body.session_id)
-        if session is None:
-            raise HTTPException(
-                status_code=404,
-                detail={"error": "Session not found"},
-            )
+        def _session_stats() -> dict[str, Any]:
+            if db.get_session_by_id(body.session_id) is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail={"error": "Session not found"},
+                )
+            return db.get_session_snapshot_stats(body.session_id)
 
-        # Get session stats for date range
-        stats = db.get_session_snapshot_stats(body.session_id)
+        # Session lookup and stats for the date range (SQLite reads, off the event loop)
+        stats = await asyncio.to_thread(_session_stats)
         first_date = stats.get("first_game_date")
         last_date = stats.get("last_game_date")
 
@@ -844,14 +1015,19 @@ def create_app() -> FastAPI:
         generator = ChronicleGenerator(db=db, model_routing_mode=body.model_routing_mode)
 
         try:
-            result = generator.generate_recap(
-                session_id=body.session_id,
-                style=body.style,
-                model_routing_mode=body.model_routing_mode,
-                language=body.language,
+            result = await _await_unless_disconnected(
+                request,
+                generator.generate_recap_async(
+                    session_id=body.session_id,
+                    style=body.style,
+                    model_routing_mode=body.model_routing_mode,
+                    language=body.language,
+                ),
             )
             result["date_range"] = date_range
             return result
+        except HTTPException:
+            raise
         except ValueError as e:
             raise HTTPException(status_code=400, detail={"error": str(e)})
         except Exception as e:
@@ -861,15 +1037,14 @@ def create_app() -> FastAPI:
             )
 
     @app.post("/api/chronicle", dependencies=[Depends(verify_token)])
-    def generate_chronicle(request: Request, body: ChronicleRequest) -> dict[str, Any]:
+    async def generate_chronicle(request: Request, body: ChronicleRequest) -> dict[str, Any]:
         """Generate a full LLM-powered chronicle for a session.
 
         Returns a dramatic, multi-chapter narrative of the empire's history.
         Chronicles are cached and regenerated when significant new events occur.
 
-        Note: This is a sync endpoint (def, not async def) because the
-        Gemini client is synchronous. FastAPI runs sync endpoints in a
-        threadpool, avoiding event loop blocking.
+        LLM calls use the async client, so generation holds no threadpool
+        worker; it is cancelled (without saving) if the client disconnects.
         """
         db = getattr(request.app.state, "db", None)
 
@@ -879,19 +1054,24 @@ def create_app() -> FastAPI:
                 detail={"error": "Database not initialized"},
             )
 
-        # Check if session exists
-        session = db.get_session_by_id(body.session_id)
-        if session is None:
-            raise HTTPException(
-                status_code=404,
-                detail={"error": "Session not found"},
+        def _session_save_id() -> str:
+            session = db.get_session_by_id(body.session_id)
+            if session is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail={"error": "Session not found"},
+                )
+            return (
+                db.get_save_id_for_session(body.session_id)
+                or session.get("save_id")
+                or body.session_id
             )
 
+        # SQLite reads, off the event loop
+        save_id = await asyncio.to_thread(_session_save_id)
+
         # Prevent request storms from spawning concurrent LLM calls.
         # Chronicle generation can be network-intensive; serialize per-save.
-        save_id = (
-            db.get_save_id_for_session(body.session_id) or session.get("save_id") or body.session_id
-        )
         from backend.core.language import normalize_language
 
         language = normalize_language(body.language)
@@ -913,15 +1093,20 @@ def create_app() -> FastAPI:
         generator = ChronicleGenerator(db=db, model_routing_mode=body.model_routing_mode)
 
         try:
-            result = generator.generate_chronicle(
-                session_id=body.session_id,
-                force_refresh=body.force_refresh,
-                chapter_only=body.chapter_only,
-                refresh_mode=body.refresh_mode,
-                model_routing_mode=body.model_routing_mode,
-                language=language,
+            result = await _await_unless_disconnected(
+                request,
+                generator.generate_chronicle_async(
+                    session_id=body.session_id,
+                    force_refresh=body.force_refresh,
+                    chapter_only=body.chapter_only,
+                    refresh_mode=body.refresh_mode,
+                    model_routing_mode=body.model_routing_mode,
+                    language=language,
+                ),
             )
             return result
+        except HTTPException:
+            raise
         except ValueError as e:
             raise HTTPException(status_code=400, detail={"error": str(e)})
         except Exception as e:
@@ -0,0 +1,92 @@
+"""Compressed storage codec for large JSON columns in the history DB.
+
+Briefing-sized JSON (``sessions.latest_briefing_json``, ``snapshots.full_briefing_json``,
+``snapshots.event_state_json``) is stored as a BLOB whose first byte names the
+codec, so every row records how it was written and rows from older builds
+(plain TEXT) still read back unchanged:
+
+    TEXT        plain JSON (legacy rows, and values below the size threshold)
+    0x01 + ...  zlib stream with the shared preset dictionary ``_DICT_V1``
+
+Usage:
+    from backend.core.blob_codec import decode_json_blob, encode_json_blob
+
+    stored = encode_json_blob(briefing_json)   # str/bytes -> str or bytes
+    text = decode_json_blob(row["full_briefing_json"])
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+CODEC_ZLIB_DICT_V1 = 0x01
+
+# Values shorter than this stay plain TEXT (headers would eat the savings).
+MIN_COMPRESS_BYTES = 256
+
+# Fast, still ~8-10x on briefing JSON; snapshots are written on every autosave.
+COMPRESSION_LEVEL = 3
+
+# Preset dictionary of keys/values that recur in briefings and event states,
+# most frequent last (deflate prefers near matches). Never edit in place: a new
+# dictionary needs a new codec id so rows written with this one still decode.
+_DICT_V1 = (
+    b'"in_progress":[],"completed":[],"by_type":{},"by_level":{},"by_tree":{},'
+    b'"chokepoints":[],"border_neighbors":[],"empire_centroid":{},"known_empire_ids":[],'
+    b'"galactic_community":{"member":false,"council_member":false},'
+    b'"great_khan":{"khan_risen":false,"khan_status":null,"marauders_present":false},'
+    b'"menace":{"menace_level":0,"has_crisis_perk":false},"lgate":{"opened":false,'
+    b'"insights_collected":0,"insights_required":0},"precursors":{"precursor_progress":{}},'
+    b'"traditions":{"total_traditions":0,"finished_trees":[]},"ascension_perks":{"perks":[]},'
+    b'"fallen_empires":{"dormant_count":0,"awakened_count":0,"war_in_heaven":false},'
+    b'"subjects":{"as_overlord":[],"as_subject":[],"subject_details":[]},'
+    b'"crisis":{"active":false,"type":null,"crisis_level":0},"megastructures":[],'
+    b'"galaxy":{"galaxy_name":"","preset":null,"ironman":false,"mid_game_start":2300},'
+    b'"systems":{"total_player_systems":0},"policies":[],"edicts":[],'
+    b'"technology":{"tech_count":0,"techs":[]},"diplomacy":{"allies":[],"rivals":[],'
+    b'"treaties":{"research_agreement":[],"truce":[]},"federation":null},'
+    b'"leaders":[{"id":0,"name":"","class":"","level":1,"is_ruler":false,"status":"active"}],'
+    b'"wars":{"player_at_war":false,"count":0,"wars":[{"name":"","status":"","type":""}]},'
+    b'"territory":{"colonies":{"total_count":0}},"military":{"military_power":0,'
+    b'"military_fleets":0,"fleet_count":0},"economy":{"net_monthly":{"energy":0.0,'
+    b'"minerals":0.0,"food":0.0,"consumer_goods":0.0,"alloys":0.0}},"history":{},'
+    b'"meta":{"date":"2200.01.01","empire_name":"","campaign_id":"","player_id":0},'
+    b'"name":"","count":0,"id":0,null,true,false,0.0,'
+)
+
+
+def encode_json_blob(value: str | bytes | None) -> str | bytes | None:
+    """Encode a JSON document for storage (compressed BLOB, or TEXT when small)."""
+    if value is None:
+        return None
+    data = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+    if len(data) < MIN_COMPRESS_BYTES:
+        return data.decode("utf-8") if isinstance(value, bytes) else value
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=_DICT_V1)
+    return bytes((CODEC_ZLIB_DICT_V1,)) + compressor.compress(data) + compressor.flush()
+
+
+def decode_json_blob(value: Any) -> str | None:
+    """Decode a stored JSON column value written by any codec (or plain TEXT)."""
+    if value is None or isinstance(value, str):
+        return value
+    data = bytes(value)
+    if not data:
+        return ""
+    codec, body = data[0], data[1:]
+    if codec == CODEC_ZLIB_DICT_V1:
+        decompressor = zlib.decompressobj(zdict=_DICT_V1)
+        raw = decompressor.decompress(body) + decompressor.flush()
+    else:
+        # Uncompressed UTF-8 stored as a BLOB (e.g. bound bytes without a codec).
+        raw = data
+    return raw.decode("utf-8")
+
+
+def decode_json_columns(row: dict[str, Any], *columns: str) -> dict[str, Any]:
+    """Decode the named JSON columns of a row dict in place and return it."""
+    for column in columns:
+        if column in row:
+            row[column] = decode_json_blob(row[column])
+    return row
@@ -0,0 +1,239 @@
+"""Question-aware slicing of the complete briefing for advisor prompts.
+
+Late-game briefings run to hundreds of KB, and most questions only need a few
+top-level sections. ``slice_briefing`` splits the briefing in two:
+
+  - a base that is the same for every question (meta and identity, then the
+    remaining sections in advisor priority order while they fit the character
+    budget), so it can sit in the provider-cached prompt prefix
+  - the sections the question needs that the base left out: its focus areas
+    (the same routing the MCP server uses) and sections it names, which are
+    kept even past the budget and sent after the prefix
+
+When everything fits, the full briefing is sent unchanged.
+
+Usage:
+    from backend.core.briefing_slice import slice_briefing
+
+    sliced = slice_briefing(briefing_json, "How do I fix my alloy deficit?", max_chars=40_000)
+    sliced.json          # compact JSON object with the base sections (question-independent)
+    sliced.extra_json    # JSON object with the question's other sections (or None)
+    sliced.omitted_note  # prompt line naming the sections left out (or None)
+    sliced.stats()       # focus / sections / sizes for call stats
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from backend.core.json_utils import json_dumps
+
+# Rough chars-per-token ratio for JSON, used to turn a token budget into chars.
+CHARS_PER_TOKEN = 4
+DEFAULT_BRIEFING_BUDGET_CHARS = 60_000
+
+FOCUS_SECTIONS = {
+    "economy": ["economy", "situation", "territory", "strategic_geography"],
+    "military": ["military", "defense", "technology", "situation", "strategic_geography"],
+    "diplomacy": ["diplomacy", "federation_details", "fallen_empires", "situation"],
+    "technology": ["technology", "projects", "progression", "economy"],
+    "territory": ["territory", "strategic_geography", "defense", "economy"],
+    "chronicle": ["situation", "identity", "diplomacy", "military", "territory", "endgame"],
+    "crisis": ["endgame", "military", "diplomacy", "fallen_empires", "defense"],
+    "general": [
+        "situation",
+        "economy",
+        "military",
+        "diplomacy",
+        "territory",
+        "technology",
+        "endgame",
+    ],
+}
+
+# Keyword routing, checked in order; the first match is the primary focus.
+FOCUS_RULES: list[tuple[str, tuple[str, ...]]] = [
+    ("economy", ("economy", "energy", "minerals", "alloys", "consumer", "deficit")),
+    ("military", ("fleet", "war", "naval", "ship", "army", "starbase", "power")),
+    ("diplomacy", ("diplomacy", "federation", "ally", "rival", "subject", "vassal")),
+    ("technology", ("tech", "research", "tradition", "ascension", "project")),
+    ("territory", ("planet", "colony", "system", "sector", "claim", "border")),
+    ("crisis", ("crisis", "khan", "fallen empire", "war in heaven", "endgame")),
+    ("chronicle", ("chronicle", "chapter", "history", "story", "narrative")),
+]
+
+ADVISOR_BRIEFING_SECTIONS = [
+    "situation",
+    "economy",
+    "military",
+    "diplomacy",
+    "territory",
+    "technology",
+    "defense",
+    "strategic_geography",
+    "progression",
+    "projects",
+    "leadership",
+    "species",
+    "federation_details",
+    "fallen_empires",
+    "leviathans",
+    "endgame",
+    "history",
+]
+
+# Sections outside the focus lists that a question can still name directly.
+SECTION_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "leadership": ("leader", "admiral", "scientist", "governor", "ruler", "council"),
+    "species": ("species", "pops", "pop growth", "xeno", "robot"),
+    "leviathans": ("leviathan", "guardian"),
+    "fallen_empires": ("fallen empire",),
+    "federation_details": ("federation",),
+    "history": ("history", "trend", "over time"),
+    "projects": ("special project", "archaeolog", "precursor"),
+}
+
+_ALWAYS_SECTIONS = ("meta", "identity")
+
+
+def resolve_focuses(question: str) -> list[str]:
+    """Every focus area the question mentions, primary first (may be empty)."""
+    text = (question or "").lower()
+    return [name for name, tokens in FOCUS_RULES if any(token in text for token in tokens)]
+
+
+def resolve_focus(question: str, focus: str = "auto") -> str:
+    """A single focus area: an explicit ``focus`` if known, else keyword routing."""
+    raw_focus = str(focus or "auto").strip().lower()
+    if raw_focus in FOCUS_SECTIONS:
+        return raw_focus
+    focuses = resolve_focuses(question)
+    return focuses[0] if focuses else "general"
+
+
+@dataclass
+class BriefingSlice:
+    """The briefing JSON chosen for one question, plus what went into it."""
+
+    json: str
+    focus: list[str]
+    sections: list[str]
+    full: bool
+    full_chars: int
+    budget_chars: int | None
+    omitted: list[str] = field(default_factory=list)
+    extra_json: str | None = None
+    extra_sections: list[str] = field(default_factory=list)
+
+    @property
+    def chars(self) -> int:
+        return len(self.json) + len(self.extra_json or "")
+
+    @property
+    def omitted_note(self) -> str | None:
+        """One prompt line naming the sections left out (None when nothing was)."""
+        if not self.omitted:
+            return None
+        return f"Briefing sections omitted for this question: {', '.join(self.omitted)}"
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "focus": self.focus,
+            "sections": self.sections,
+            "extra_sections": self.extra_sections,
+            "omitted": self.omitted,
+            "full": self.full,
+            "chars": self.chars,
+            "base_chars": len(self.json),
+            "full_chars": self.full_chars,
+            "budget_chars": self.budget_chars,
+        }
+
+
+@lru_cache(maxsize=4)
+def _section_json(briefing_json: str) -> dict[str, str] | None:
+    """Top-level key -> compact JSON of its value (cached per briefing string)."""
+    try:
+        briefing = json.loads(briefing_json)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(briefing, dict):
+        return None
+    return {str(key): json_dumps(value, default=str) for key, value in briefing.items()}
+
+
+def _join_sections(sections: dict[str, str], names: list[str]) -> str:
+    # Keep the briefing's own key order so the slice reads like the full document.
+    order = [name for name in sections if name in names]
+    return "{" + ",".join(f"{json_dumps(name)}:{sections[name]}" for name in order) + "}"
+
+
+@lru_cache(maxsize=4)
+def _base_slice(briefing_json: str, budget: int) -> tuple[str, tuple[str, ...]]:
+    """(JSON, section names) of the question-independent part of a slice."""
+    sections = _section_json(briefing_json) or {}
+    chosen: list[str] = []
+    used = 2  # Braces
+    for name in dict.fromkeys([*_ALWAYS_SECTIONS, *ADVISOR_BRIEFING_SECTIONS, *sections]):
+        if name not in sections:
+            continue
+        cost = len(name) + len(sections[name]) + 4  # Quotes, colon, comma
+        if name in _ALWAYS_SECTIONS or used + cost <= budget:
+            chosen.append(name)
+            used += cost
+    return _join_sections(sections, chosen), tuple(name for name in sections if name in chosen)
+
+
+def slice_briefing(
+    briefing_json: str,
+    question: str,
+    *,
+    max_chars: int | None = DEFAULT_BRIEFING_BUDGET_CHARS,
+    max_tokens: int | None = None,
+) -> BriefingSlice:
+    """Pick the briefing sections for ``question`` within a character budget.
+
+    The base (``json``) fills the budget without looking at the question. Focus
+    sections (and sections the question names) that it left out go to
+    ``extra_json``, even past the budget. ``max_tokens`` overrides ``max_chars``
+    via ``CHARS_PER_TOKEN``. A budget of None or 0 disables slicing.
+    """
+    budget = max_tokens * CHARS_PER_TOKEN if max_tokens else max_chars
+    focuses = resolve_focuses(question)
+    sections = _section_json(briefing_json) if budget else None
+    if sections is None or len(briefing_json) <= budget:
+        return BriefingSlice(
+            json=briefing_json,
+            focus=focuses or ["general"],
+            sections=list(sections or []),
+            full=True,
+            full_chars=len(briefing_json),
+            budget_chars=budget or None,
+        )
+
+    text = (question or "").lower()
+    required: list[str] = []
+    for focus in focuses or ["general"]:
+        required.extend(FOCUS_SECTIONS[focus])
+    required.extend(
+        name for name, tokens in SECTION_KEYWORDS.items() if any(t in text for t in tokens)
+    )
+
+    base_json, base = _base_slice(briefing_json, budget)
+    extra = [name for name in sections if name in required and name not in base]
+    included = [name for name in sections if name in base or name in extra]
+    omitted = [name for name in sections if name not in included]
+    return BriefingSlice(
+        json=base_json,
+        focus=focuses or ["general"],
+        sections=included,
+        full=not omitted,
+        full_chars=len(briefing_json),
+        budget_chars=budget,
+        omitted=omitted,
+        extra_json=_join_sections(sections, extra) if extra else None,
+        extra_sections=extra,
+    )
@@ -14,9 +14,11 @@ See docs/CHRONICLE_INCREMENTAL.md for incremental chapter design.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Literal
 
@@ -27,13 +29,7 @@ from backend.core.database import GameDatabase
 from backend.core.json_utils import json_dumps
 from backend.core.language import build_language_policy, localized_text, normalize_language
 from backend.core.model_routing import (
-    GEMINI_FLASH_MODEL,
-    classify_model_error,
-    display_model_name,
-    fallback_notice,
-    get_model_unavailable_event,
-    is_model_temporarily_unavailable,
-    mark_model_failure,
+    ModelRoute,
     normalize_model_routing_mode,
     route_models_for,
 )
@@ -203,6 +199,18 @@ MAX_CHAPTERS_PER_REQUEST = 2
 MAX_EVENTS_PER_CHAPTER_PROMPT = 250
 MAX_EVENTS_CURRENT_ERA_PROMPT = 200
 
+# Metric trends shown to the chronicler (read from the DB rollups, so the cost
+# does not grow with campaign length). Each series is capped at this many points.
+TREND_METRICS = (
+    ("military_power", "Military power"),
+    ("colony_count", "Colonies"),
+    ("total_pops", "Pops"),
+    ("tech_count", "Technologies"),
+    ("energy_net", "Energy per month"),
+    ("alloys_net", "Alloys per month"),
+)
+MAX_TREND_POINTS = 8
+
 NOTABLE_EVENT_TYPES = {
     # War and diplomacy
     "war_started",
@@ -253,6 +261,20 @@ CURRENT_ERA_IMMEDIATE_REFRESH_EVENT_TYPES = NOTABLE_EVENT_TYPES - {
     "military_power_change",
 }
 
+CHAPTER_GENERATION_CONFIG: dict[str, Any] = {
+    "temperature": 1.0,
+    "max_output_tokens": 4096,  # Increased: 500-800 word narrative + JSON overhead
+    "response_mime_type": "application/json",
+    "response_schema": ChapterOutput,
+}
+RECAP_GENERATION_CONFIG: dict[str, Any] = {"temperature": 1.0, "max_output_tokens": 2048}
+CURRENT_ERA_GENERATION_CONFIG: dict[str, Any] = {
+    "temperature": 1.0,
+    "max_output_tokens": 1024,
+    "response_mime_type": "application/json",
+    "response_schema": CurrentEraOutput,
+}
+
 # Default chapters_json structure
 DEFAULT_CHAPTERS_DATA = {
     "format_version": 1,
@@ -294,6 +316,18 @@ def get_current_era_regen_min_new_events(refresh_mode: Any) -> int:
     return CURRENT_ERA_REGEN_MIN_NEW_EVENTS
 
 
+def _format_trend_value(value: float) -> str:
+    """Compact number for trend lines (1234567 -> 1.2M, 45210 -> 45.2k)."""
+    magnitude = abs(value)
+    if magnitude >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if magnitude >= 10_000:
+        return f"{value / 1_000:.1f}k"
+    if float(value).is_integer():
+        return str(int(value))
+    return f"{value:.1f}"
+
+
 def parse_year(date_str: str | None) -> int | None:
     """Parse year from Stellaris date string (e.g., '2250.03.15')."""
     if not date_str or not isinstance(date_str, str):
@@ -320,6 +354,37 @@ def _parse_iso_datetime(value: Any) -> datetime | None:
     return dt.astimezone(timezone.utc)
 
 
+@dataclass
+class _ChronicleRun:
+    """State of one generate_chronicle request, carried between its phases."""
+
+    session_id: str
+    save_id: str
+    language: str
+    force_refresh: bool
+    chapter_only: bool
+    refresh_mode: str
+    chapters_data: dict[str, Any]
+    custom_instructions: str | None
+    snapshot_range: dict[str, Any]
+    briefing: dict[str, Any]
+    chapters_finalized: int = 0
+    pending_chapters: int = 0
+    deferred_chapter_only: bool = False
+    era_start_date: str | None = None
+    era_start_snapshot_id: int | None = None
+    used_cached_current_era: bool = False
+    current_era: dict[str, Any] | None = None
+
+    @property
+    def current_date(self) -> str | None:
+        return self.snapshot_range.get("last_game_date")
+
+    @property
+    def current_snapshot_id(self) -> int | None:
+        return self.snapshot_range.get("last_snapshot_id")
+
+
 class ChronicleGenerator:
     """Generate LLM-powered chronicles for empire sessions.
 
@@ -369,17 +434,157 @@ class ChronicleGenerator:
         Maintains backward compatibility with legacy 'chronicle' string field.
         """
         # Get save_id for cross-session continuity
+        save_id = self._resolve_chronicle_save_id(session_id)
+        if not save_id:
+            # Fallback to session-based chronicle (legacy)
+            return self._generate_legacy_chronicle(session_id, force_refresh=force_refresh)
+
+        run = self._begin_chronicle(
+            session_id,
+            save_id,
+            force_refresh=force_refresh,
+            chapter_only=chapter_only,
+            refresh_mode=refresh_mode,
+            model_routing_mode=model_routing_mode,
+            language=language,
+        )
+        if isinstance(run, dict):
+            return run
+
+        # Check if we need to finalize any chapters
+        if not run.deferred_chapter_only:
+            while run.chapters_finalized < MAX_CHAPTERS_PER_REQUEST:
+                should_finalize, trigger = self._should_finalize_chapter(
+                    save_id=save_id,
+                    chapters_data=run.chapters_data,
+                    current_date=run.current_date,
+                    current_snapshot_id=run.current_snapshot_id,
+                )
+                if not should_finalize:
+                    break
+
+                # Finalize the chapter
+                finalized = self._finalize_chapter(
+                    save_id=save_id,
+                    chapters_data=run.chapters_data,
+                    briefing=run.briefing,
+                    trigger=trigger,
+                    custom_instructions=run.custom_instructions,
+                    language=run.language,
+                )
+                if not finalized:
+                    break
+                run.chapters_finalized += 1
+
+            self._update_pending_chapters(run)
+
+        if self._plan_current_era(run):
+            run.current_era = self._generate_current_era(
+                save_id=save_id,
+                chapters_data=run.chapters_data,
+                briefing=run.briefing,
+                current_date=run.current_date,
+                custom_instructions=run.custom_instructions,
+                language=run.language,
+            )
+            self._cache_current_era(run)
+
+        return self._complete_chronicle(run)
+
+    async def generate_chronicle_async(
+        self,
+        session_id: str,
+        *,
+        force_refresh: bool = False,
+        chapter_only: bool = False,
+        refresh_mode: str = DEFAULT_CHRONICLE_REFRESH_MODE,
+        model_routing_mode: str | None = None,
+        language: str | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of generate_chronicle for the API server.
+
+        Runs the same phases, with DB work in short worker-thread hops and the
+        model calls on the async client. Chapters are only saved at the end, so
+        cancelling the task part-way leaves the stored chronicle untouched.
+        """
+        save_id = await asyncio.to_thread(self._resolve_chronicle_save_id, session_id)
+        if not save_id:
+            # Sessions without a save_id predate incremental chapters; they keep the sync path.
+            return await asyncio.to_thread(
+                self._generate_legacy_chronicle, session_id, force_refresh=force_refresh
+            )
+
+        run = await asyncio.to_thread(
+            self._begin_chronicle,
+            session_id,
+            save_id,
+            force_refresh=force_refresh,
+            chapter_only=chapter_only,
+            refresh_mode=refresh_mode,
+            model_routing_mode=model_routing_mode,
+            language=language,
+        )
+        if isinstance(run, dict):
+            return run
+
+        if not run.deferred_chapter_only:
+            while run.chapters_finalized < MAX_CHAPTERS_PER_REQUEST:
+                should_finalize, trigger = await asyncio.to_thread(
+                    self._should_finalize_chapter,
+                    save_id=save_id,
+                    chapters_data=run.chapters_data,
+                    current_date=run.current_date,
+                    current_snapshot_id=run.current_snapshot_id,
+                )
+                if not should_finalize:
+                    break
+                finalized = await self._finalize_chapter_async(
+                    save_id=save_id,
+                    chapters_data=run.chapters_data,
+                    briefing=run.briefing,
+                    trigger=trigger,
+                    custom_instructions=run.custom_instructions,
+                    language=run.language,
+                )
+                if not finalized:
+                    break
+                run.chapters_finalized += 1
+
+            await asyncio.to_thread(self._update_pending_chapters, run)
+
+        if await asyncio.to_thread(self._plan_current_era, run):
+            run.current_era = await self._generate_current_era_async(
+                save_id=save_id,
+                chapters_data=run.chapters_data,
+                briefing=run.briefing,
+                custom_instructions=run.custom_instructions,
+                language=run.language,
+            )
+            self._cache_current_era(run)
+
+        return await asyncio.to_thread(self._complete_chronicle, run)
+
+    def _resolve_chronicle_save_id(self, session_id: str) -> str | None:
         save_id = self.db.get_save_id_for_session(session_id)
         if not save_id:
             session = self.db.get_session_by_id(session_id)
             if not session:
                 raise ValueError(f"Session not found: {session_id}")
             save_id = session.get("save_id")
+        return save_id
 
-        if not save_id:
-            # Fallback to session-based chronicle (legacy)
-            return self._generate_legacy_chronicle(session_id, force_refresh=force_refresh)
-
+    def _begin_chronicle(
+        self,
+        session_id: str,
+        save_id: str,
+        *,
+        force_refresh: bool,
+        chapter_only: bool,
+        refresh_mode: str,
+        model_routing_mode: str | None,
+        language: str | None,
+    ) -> _ChronicleRun | dict[str, Any]:
+        """Load the stored chapters and current state (or the empty response)."""
         self._model_route_events = []
         if model_routing_mode:
             self.model_routing_mode = normalize_model_routing_mode(model_routing_mode)
@@ -399,66 +604,51 @@ class ChronicleGenerator:
         if not snapshot_range.get("snapshot_count"):
             return self._empty_chronicle_response(language=output_language)
 
-        current_date = snapshot_range.get("last_game_date")
-        current_snapshot_id = snapshot_range.get("last_snapshot_id")
-
         # Gather briefing for current session
         briefing_json = self.db.get_latest_session_briefing_json(session_id=session_id)
         briefing = json.loads(briefing_json) if briefing_json else {}
 
-        # Check if we need to finalize any chapters
-        chapters_finalized = 0
-        pending_chapters = 0
-        deferred_chapter_only = False
+        run = _ChronicleRun(
+            session_id=session_id,
+            save_id=save_id,
+            language=output_language,
+            force_refresh=force_refresh,
+            chapter_only=chapter_only,
+            refresh_mode=refresh_mode,
+            chapters_data=chapters_data,
+            custom_instructions=custom_instructions,
+            snapshot_range=snapshot_range,
+            briefing=briefing,
+        )
 
         if chapter_only and not force_refresh:
-            deferred_chapter_only, pending_chapters = self._chapter_only_cooldown_active(
+            run.deferred_chapter_only, run.pending_chapters = self._chapter_only_cooldown_active(
                 chapters_data=chapters_data
             )
-            if deferred_chapter_only:
+            if run.deferred_chapter_only:
                 logger.debug(
                     "Chronicle chapter-only run deferred by cooldown (save_id=%s pending=%s)",
                     save_id,
-                    pending_chapters,
-                )
-
-        if not deferred_chapter_only:
-            while chapters_finalized < MAX_CHAPTERS_PER_REQUEST:
-                should_finalize, trigger = self._should_finalize_chapter(
-                    save_id=save_id,
-                    chapters_data=chapters_data,
-                    current_date=current_date,
-                    current_snapshot_id=current_snapshot_id,
+                    run.pending_chapters,
                 )
-                if not should_finalize:
-                    break
-
-                # Finalize the chapter
-                finalized = self._finalize_chapter(
-                    save_id=save_id,
-                    chapters_data=chapters_data,
-                    briefing=briefing,
-                    trigger=trigger,
-                    custom_instructions=custom_instructions,
-                    language=output_language,
-                )
-                if not finalized:
-                    break
-                chapters_finalized += 1
-
-            # Count remaining pending chapters
-            pending_chapters = self._count_pending_chapters(
-                save_id=save_id,
-                chapters_data=chapters_data,
-                current_date=current_date,
-                current_snapshot_id=current_snapshot_id,
-            )
+        return run
+
+    def _update_pending_chapters(self, run: _ChronicleRun) -> None:
+        # Count remaining pending chapters
+        run.pending_chapters = self._count_pending_chapters(
+            save_id=run.save_id,
+            chapters_data=run.chapters_data,
+            current_date=run.current_date,
+            current_snapshot_id=run.current_snapshot_id,
+        )
 
-            self._set_next_chapter_only_run(
-                chapters_data=chapters_data,
-                pending_chapters=pending_chapters,
-            )
+        self._set_next_chapter_only_run(
+            chapters_data=run.chapters_data,
+            pending_chapters=run.pending_chapters,
+        )
 
+    def _plan_current_era(self, run: _ChronicleRun) -> bool:
+        """Reuse the cached current era where allowed; True when it must be generated."""
         # Generate (or reuse cached) current era narrative unless this request is
         # finalizing chapters only for background catch-up.
         #
@@ -466,14 +656,15 @@ class ChronicleGenerator:
         # - Current era is a teaser between chapters, not a live minute-by-minute feed.
         # - Generate at most once per era window (or on explicit force refresh).
         # - Do not spend teaser calls while chapters are still pending.
-        era_start_date, era_start_snapshot_id = self._get_current_era_start(
+        save_id = run.save_id
+        chapters_data = run.chapters_data
+        run.era_start_date, run.era_start_snapshot_id = self._get_current_era_start(
             save_id=save_id,
             chapters_data=chapters_data,
-            snapshot_range=snapshot_range,
+            snapshot_range=run.snapshot_range,
         )
+        era_start_snapshot_id = run.era_start_snapshot_id
 
-        used_cached_current_era = False
-        current_era: dict[str, Any] | None = None
         current_era_cache = chapters_data.get("current_era_cache")
 
         cached_current_era = (
@@ -490,79 +681,83 @@ class ChronicleGenerator:
 
         regenerate_for_event_growth = False
 
-        if chapter_only:
+        if run.chapter_only:
             if isinstance(current_era_cache, dict) and isinstance(
                 current_era_cache.get("current_era"), dict
             ):
                 # Keep existing current-era narrative text without invoking Gemini.
                 # If finalized chapters moved the era boundary, the next visible
                 # full refresh will detect the cache mismatch and regenerate.
-                used_cached_current_era = True
-                current_era = current_era_cache["current_era"]
-        elif pending_chapters > 0:
+                run.used_cached_current_era = True
+                run.current_era = current_era_cache["current_era"]
+            return False
+        if run.pending_chapters > 0:
             # Chapter generation is always higher priority than teaser freshness.
             # While there are still chapters to finalize, avoid spending extra
             # calls on current-era rewrites.
             if cache_matches_era:
-                used_cached_current_era = True
-                current_era = cached_current_era
+                run.used_cached_current_era = True
+                run.current_era = cached_current_era
             else:
                 # Era boundary moved and no matching teaser exists yet.
                 # Keep teaser empty until chapter queue clears.
-                current_era = None
+                run.current_era = None
                 if current_era_cache:
                     chapters_data.pop("current_era_cache", None)
-        else:
-            if cache_matches_era and not force_refresh:
-                regenerate_for_event_growth = self._should_regenerate_current_era_for_event_growth(
-                    save_id=save_id,
-                    era_start_snapshot_id=era_start_snapshot_id,
-                    cached_current_era=cached_current_era,
-                    refresh_mode=refresh_mode,
-                )
-                if not regenerate_for_event_growth:
-                    used_cached_current_era = True
-                    current_era = cached_current_era
-                    logger.debug(
-                        "Chronicle current era cache hit (save_id=%s era_start_snapshot_id=%s)",
-                        save_id,
-                        era_start_snapshot_id,
-                    )
-                else:
-                    logger.debug(
-                        "Chronicle current era refresh due to event growth "
-                        "(save_id=%s era_start_snapshot_id=%s)",
-                        save_id,
-                        era_start_snapshot_id,
-                    )
-
-            if force_refresh or not cache_matches_era or regenerate_for_event_growth:
-                if current_era_cache and not used_cached_current_era:
-                    chapters_data.pop("current_era_cache", None)
+            return False
 
-                current_era = self._generate_current_era(
-                    save_id=save_id,
-                    chapters_data=chapters_data,
-                    briefing=briefing,
-                    current_date=current_date,
-                    custom_instructions=custom_instructions,
-                    language=output_language,
+        if cache_matches_era and not run.force_refresh:
+            regenerate_for_event_growth = self._should_regenerate_current_era_for_event_growth(
+                save_id=save_id,
+                era_start_snapshot_id=era_start_snapshot_id,
+                cached_current_era=cached_current_era,
+                refresh_mode=run.refresh_mode,
+            )
+            if not regenerate_for_event_growth:
+                run.used_cached_current_era = True
+                run.current_era = cached_current_era
+                logger.debug(
+                    "Chronicle current era cache hit (save_id=%s era_start_snapshot_id=%s)",
+                    save_id,
+                    era_start_snapshot_id,
+                )
+            else:
+                logger.debug(
+                    "Chronicle current era refresh due to event growth "
+                    "(save_id=%s era_start_snapshot_id=%s)",
+                    save_id,
+                    era_start_snapshot_id,
                 )
 
-                if current_era and current_snapshot_id is not None:
-                    chapters_data["current_era_cache"] = {
-                        "start_date": era_start_date,
-                        "start_snapshot_id": era_start_snapshot_id,
-                        "last_snapshot_id": current_snapshot_id,
-                        "generated_at": datetime.now(timezone.utc).isoformat(),
-                        "language": output_language,
-                        "current_era": current_era,
-                    }
-                    logger.debug(
-                        "Chronicle current era generated (save_id=%s era_start_snapshot_id=%s)",
-                        save_id,
-                        era_start_snapshot_id,
-                    )
+        if run.force_refresh or not cache_matches_era or regenerate_for_event_growth:
+            if current_era_cache and not run.used_cached_current_era:
+                chapters_data.pop("current_era_cache", None)
+            return True
+        return False
+
+    def _cache_current_era(self, run: _ChronicleRun) -> None:
+        current_snapshot_id = run.current_snapshot_id
+        if run.current_era and current_snapshot_id is not None:
+            run.chapters_data["current_era_cache"] = {
+                "start_date": run.era_start_date,
+                "start_snapshot_id": run.era_start_snapshot_id,
+                "last_snapshot_id": current_snapshot_id,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "language": run.language,
+                "current_era": run.current_era,
+            }
+            logger.debug(
+                "Chronicle current era generated (save_id=%s era_start_snapshot_id=%s)",
+                run.save_id,
+                run.era_start_snapshot_id,
+            )
+
+    def _complete_chronicle(self, run: _ChronicleRun) -> dict[str, Any]:
+        """Save the updated chapters and build the API response."""
+        save_id = run.save_id
+        chapters_data = run.chapters_data
+        current_era = run.current_era
+        pending_chapters = run.pending_chapters
 
         # Assemble full chronicle text for backward compatibility
         full_text = self._assemble_chronicle_text(chapters_data, current_era)
@@ -570,24 +765,24 @@ class ChronicleGenerator:
         # Calculate total event count
         all_events = self.db.get_all_events_by_save_id(save_id=save_id)
         event_count = len(all_events)
-        snapshot_count = snapshot_range.get("snapshot_count", 0)
+        snapshot_count = run.snapshot_range.get("snapshot_count", 0)
 
         # Save updated chapters
         self.db.upsert_chronicle_by_save_id(
             save_id=save_id,
-            session_id=session_id,
+            session_id=run.session_id,
             chronicle_text=full_text,
             chapters_json=json_dumps(chapters_data),
             event_count=event_count,
             snapshot_count=snapshot_count,
-            language=output_language,
+            language=run.language,
         )
 
         # Build response
         response_cached = (
-            not force_refresh
-            and chapters_finalized == 0
-            and (used_cached_current_era or current_era is None)
+            not run.force_refresh
+            and run.chapters_finalized == 0
+            and (run.used_cached_current_era or current_era is None)
         )
         return {
             # New structured format
@@ -807,6 +1002,7 @@ class ChronicleGenerator:
             custom_instructions=custom_instructions,
             regeneration_instructions=regeneration_instructions,
             language=output_language,
+            save_id=save_id,
         )
 
         # Update the chapter
@@ -858,6 +1054,61 @@ class ChronicleGenerator:
         Args:
             style: "summary" (deterministic) or "dramatic" (LLM-powered)
         """
+        prepared = self._prepare_recap(
+            session_id,
+            style=style,
+            max_events=max_events,
+            model_routing_mode=model_routing_mode,
+            language=language,
+        )
+        if "prompt" not in prepared:
+            return prepared
+
+        response = self._generate_content_with_routing(
+            contents=prepared["prompt"],
+            config=RECAP_GENERATION_CONFIG,
+            purpose_label="Chronicle recap",
+        )
+        return self._recap_response(response, events_summarized=prepared["events_summarized"])
+
+    async def generate_recap_async(
+        self,
+        session_id: str,
+        *,
+        style: str = "summary",
+        max_events: int = 30,
+        model_routing_mode: str | None = None,
+        language: str | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of generate_recap (DB work in a thread, async model client)."""
+        prepared = await asyncio.to_thread(
+            self._prepare_recap,
+            session_id,
+            style=style,
+            max_events=max_events,
+            model_routing_mode=model_routing_mode,
+            language=language,
+        )
+        if "prompt" not in prepared:
+            return prepared
+
+        response = await self._generate_content_with_routing_async(
+            contents=prepared["prompt"],
+            config=RECAP_GENERATION_CONFIG,
+            purpose_label="Chronicle recap",
+        )
+        return self._recap_response(response, events_summarized=prepared["events_summarized"])
+
+    def _prepare_recap(
+        self,
+        session_id: str,
+        *,
+        style: str,
+        max_events: int,
+        model_routing_mode: str | None,
+        language: str | None,
+    ) -> dict[str, Any]:
+        """The finished recap when no model call is needed, else its prompt."""
         self._model_route_events = []
         if model_routing_mode:
             self.model_routing_mode = normalize_model_routing_mode(model_routing_mode)
@@ -879,18 +1130,16 @@ class ChronicleGenerator:
                 "events_summarized": 0,
             }
 
-        prompt = self._build_recap_prompt(data, language=output_language)
-
-        response = self._generate_content_with_routing(
-            contents=prompt,
-            config={"temperature": 1.0, "max_output_tokens": 2048},
-            purpose_label="Chronicle recap",
-        )
+        return {
+            "prompt": self._build_recap_prompt(data, language=output_language),
+            "events_summarized": len(data["events"]),
+        }
 
+    def _recap_response(self, response: Any, *, events_summarized: int) -> dict[str, Any]:
         return {
             "recap": response.text,
             "style": "dramatic",
-            "events_summarized": len(data["events"]),
+            "events_summarized": events_summarized,
             "model_routing": self._model_routing_response(),
         }
 
@@ -902,91 +1151,51 @@ class ChronicleGenerator:
         purpose_label: str,
     ) -> Any:
         """Generate content with Flash-first routing and Flash-Lite fallback on quota errors."""
-        candidate_models = route_models_for(
-            mode=self.model_routing_mode,
-            purpose="chronicle",
+        route = ModelRoute(
+            route_models_for(mode=self.model_routing_mode, purpose="chronicle"),
+            purpose_label=purpose_label,
         )
-        requested_model = candidate_models[0] if candidate_models else GEMINI_FLASH_MODEL
-        route_event = None
-        last_error: Exception | None = None
-
-        for index, candidate_model in enumerate(candidate_models):
-            fallback_model = (
-                candidate_models[index + 1] if index + 1 < len(candidate_models) else None
-            )
-            if fallback_model and is_model_temporarily_unavailable(candidate_model):
-                route_event = get_model_unavailable_event(
-                    requested_model=requested_model,
-                    skipped_model=candidate_model,
-                    final_model=fallback_model,
-                )
-                continue
-
+        for candidate_model in route:
             try:
                 response = self.client.models.generate_content(
                     model=candidate_model,
                     contents=contents,
                     config=config,
                 )
-                final_event = route_event or (
-                    None
-                    if candidate_model == requested_model
-                    else get_model_unavailable_event(
-                        requested_model=requested_model,
-                        skipped_model=requested_model,
-                        final_model=candidate_model,
-                    )
-                )
-                if final_event:
-                    final_event.final_model = candidate_model
-                    self._model_route_events.append(final_event.to_dict())
-                else:
-                    self._model_route_events.append(
-                        {
-                            "requested_model": requested_model,
-                            "requested_model_display": display_model_name(requested_model),
-                            "attempted_model": candidate_model,
-                            "attempted_model_display": display_model_name(candidate_model),
-                            "final_model": candidate_model,
-                            "final_model_display": display_model_name(candidate_model),
-                            "fallback": False,
-                            "reason": None,
-                            "notice": None,
-                            "error": None,
-                        }
-                    )
-                return response
             except Exception as exc:
-                last_error = exc
-                failure = classify_model_error(exc)
-                if failure and fallback_model:
-                    logger.warning(
-                        "%s failed on %s; routing via %s: %s",
-                        purpose_label,
-                        display_model_name(candidate_model),
-                        display_model_name(fallback_model),
-                        exc,
-                    )
-                    mark_model_failure(candidate_model, failure)
-                    route_event = get_model_unavailable_event(
-                        requested_model=requested_model,
-                        skipped_model=candidate_model,
-                        final_model=fallback_model,
-                    )
-                    if route_event:
-                        route_event.reason = failure.reason
-                        route_event.error = failure.message[:500]
-                        route_event.notice = fallback_notice(
-                            candidate_model,
-                            fallback_model,
-                            reason=failure.reason,
-                        )
+                if route.should_fall_back(candidate_model, exc):
                     continue
                 raise
+            self._model_route_events.append(route.succeeded(candidate_model))
+            return response
+        raise route.exhausted_error()
 
-        if last_error is not None:
-            raise last_error
-        raise RuntimeError("No Chronicle model was available")
+    async def _generate_content_with_routing_async(
+        self,
+        *,
+        contents: str,
+        config: dict[str, Any],
+        purpose_label: str,
+    ) -> Any:
+        """Async variant of _generate_content_with_routing using ``client.aio``."""
+        route = ModelRoute(
+            route_models_for(mode=self.model_routing_mode, purpose="chronicle"),
+            purpose_label=purpose_label,
+        )
+        for candidate_model in route:
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=candidate_model,
+                    contents=contents,
+                    config=config,
+                )
+            except Exception as exc:
+                if route.should_fall_back(candidate_model, exc):
+                    continue
+                raise
+            self._model_route_events.append(route.succeeded(candidate_model))
+            return response
+        raise route.exhausted_error()
 
     def _model_routing_response(self) -> dict[str, Any]:
         events = list(self._model_route_events)
@@ -1206,6 +1415,76 @@ class ChronicleGenerator:
         Returns True when a chapter was added; False when finalization is
         skipped (for example, no new snapshot range is available yet).
         """
+        plan = self._plan_chapter(save_id=save_id, chapters_data=chapters_data, trigger=trigger)
+        if plan is None:
+            return False
+        content = self._generate_chapter_content(
+            chapter_number=plan["chapter_number"],
+            events=plan["events"],
+            briefing=briefing,
+            previous_chapters=chapters_data.get("chapters", []),
+            start_date=plan["start_date"],
+            end_date=plan["end_date"],
+            custom_instructions=custom_instructions,
+            language=language,
+            save_id=save_id,
+        )
+        self._append_chapter(chapters_data, plan, content, trigger=trigger)
+        return True
+
+    async def _finalize_chapter_async(
+        self,
+        save_id: str,
+        chapters_data: dict[str, Any],
+        briefing: dict[str, Any],
+        trigger: str | None,
+        custom_instructions: str | None = None,
+        language: str = "en",
+    ) -> bool:
+        """Async variant of _finalize_chapter (DB reads and prompt building in a thread)."""
+
+        def _prepare() -> tuple[dict[str, Any], str] | None:
+            plan = self._plan_chapter(save_id=save_id, chapters_data=chapters_data, trigger=trigger)
+            if plan is None:
+                return None
+            prompt = self._build_chapter_prompt(
+                chapter_number=plan["chapter_number"],
+                events=plan["events"],
+                briefing=briefing,
+                previous_chapters=chapters_data.get("chapters", []),
+                start_date=plan["start_date"],
+                end_date=plan["end_date"],
+                custom_instructions=custom_instructions,
+                language=language,
+                save_id=save_id,
+            )
+            return plan, prompt
+
+        prepared = await asyncio.to_thread(_prepare)
+        if prepared is None:
+            return False
+        plan, prompt = prepared
+        chapter_number = plan["chapter_number"]
+        try:
+            response = await self._generate_content_with_routing_async(
+                contents=prompt,
+                config=CHAPTER_GENERATION_CONFIG,
+                purpose_label=f"Chronicle chapter {chapter_number}",
+            )
+        except Exception as e:
+            content = self._chapter_content_from_response(chapter_number, None, error=e)
+        else:
+            content = self._chapter_content_from_response(chapter_number, response)
+        self._append_chapter(chapters_data, plan, content, trigger=trigger)
+        return True
+
+    def _plan_chapter(
+        self,
+        save_id: str,
+        chapters_data: dict[str, Any],
+        trigger: str | None,
+    ) -> dict[str, Any] | None:
+        """Date/snapshot range and events for the next chapter, or None to skip."""
         chapters = chapters_data.get("chapters", [])
         chapter_number = len(chapters) + 1
         snapshot_range = self.db.get_snapshot_range_for_save(save_id)
@@ -1263,9 +1542,9 @@ class ChronicleGenerator:
             )
 
         if end_snapshot_id is None:
-            return False
+            return None
         if start_snapshot_id is not None and int(end_snapshot_id) <= int(start_snapshot_id):
-            return False
+            return None
 
         # Get events for this chapter
         chapter_events = self.db.get_events_in_snapshot_range(
@@ -1279,27 +1558,33 @@ class ChronicleGenerator:
         chapter_events = [
             e for e in chapter_events if (parse_year(e.get("game_date")) or 0) <= (end_year or 9999)
         ]
+        return {
+            "chapter_number": chapter_number,
+            "start_date": start_date,
+            "end_date": end_date,
+            "start_snapshot_id": start_snapshot_id,
+            "end_snapshot_id": end_snapshot_id,
+            "events": chapter_events,
+        }
 
-        # Generate chapter content
-        content = self._generate_chapter_content(
-            chapter_number=chapter_number,
-            events=chapter_events,
-            briefing=briefing,
-            previous_chapters=chapters,
-            start_date=start_date,
-            end_date=end_date,
-            custom_instructions=custom_instructions,
-            language=language,
-        )
-
-        # Add the new chapter
+    def _append_chapter(
+        self,
+        chapters_data: dict[str, Any],
+        plan: dict[str, Any],
+        content: dict[str, Any],
+        *,
+        trigger: str | None,
+    ) -> None:
+        """Add a generated chapter and move the current era start past it."""
+        end_date = plan["end_date"]
+        end_snapshot_id = plan["end_snapshot_id"]
         chapters_data["chapters"].append(
             {
-                "number": chapter_number,
+                "number": plan["chapter_number"],
                 "title": content["title"],
-                "start_date": start_date,
+                "start_date": plan["start_date"],
                 "end_date": end_date,
-                "start_snapshot_id": start_snapshot_id,
+                "start_snapshot_id": plan["start_snapshot_id"],
                 "end_snapshot_id": end_snapshot_id,
                 "epigraph": content.get("epigraph", ""),
                 "sections": content.get("sections"),
@@ -1309,14 +1594,13 @@ class ChronicleGenerator:
                 "is_finalized": True,
                 "context_stale": False,
                 "trigger": trigger,
-                "event_count": len(chapter_events),
+                "event_count": len(plan["events"]),
             }
         )
 
         # Update current era start
         chapters_data["current_era_start_date"] = end_date
         chapters_data["current_era_start_snapshot_id"] = end_snapshot_id
-        return True
 
     def _generate_chapter_content(
         self,
@@ -1329,8 +1613,44 @@ class ChronicleGenerator:
         custom_instructions: str | None = None,
         regeneration_instructions: str | None = None,
         language: str = "en",
+        save_id: str | None = None,
     ) -> dict[str, str]:
         """Generate chapter content using Gemini structured output."""
+        prompt = self._build_chapter_prompt(
+            chapter_number=chapter_number,
+            events=events,
+            briefing=briefing,
+            previous_chapters=previous_chapters,
+            start_date=start_date,
+            end_date=end_date,
+            custom_instructions=custom_instructions,
+            regeneration_instructions=regeneration_instructions,
+            language=language,
+            save_id=save_id,
+        )
+        try:
+            response = self._generate_content_with_routing(
+                contents=prompt,
+                config=CHAPTER_GENERATION_CONFIG,
+                purpose_label=f"Chronicle chapter {chapter_number}",
+            )
+        except Exception as e:
+            return self._chapter_content_from_response(chapter_number, None, error=e)
+        return self._chapter_content_from_response(chapter_number, response)
+
+    def _build_chapter_prompt(
+        self,
+        chapter_number: int,
+        events: list[dict],
+        briefing: dict[str, Any],
+        previous_chapters: list[dict],
+        start_date: str,
+        end_date: str,
+        custom_instructions: str | None = None,
+        regeneration_instructions: str | None = None,
+        language: str = "en",
+        save_id: str | None = None,
+    ) -> str:
         identity = briefing.get("identity", {})
         empire_name = identity.get("empire_name", "Unknown Empire")
         ethics = ", ".join(identity.get("ethics", []))
@@ -1369,6 +1689,8 @@ class ChronicleGenerator:
         diplomatic_section = f"\n{diplomatic_context}\n" if diplomatic_context else ""
         geographic_context = self._format_geographic_context(briefing)
         geographic_section = f"\n{geographic_context}\n" if geographic_context else ""
+        trends = self._format_metric_trends(save_id=save_id, from_date=start_date, to_date=end_date)
+        trends_section = f"\n{trends}\n" if trends else ""
 
         custom_section = ""
         if custom_instructions and custom_instructions.strip():
@@ -1401,7 +1723,7 @@ Incorporate this guidance while maintaining narrative consistency.
 
 === PREVIOUS CHAPTERS ===
 {previous_context}
-{diplomatic_section}{geographic_section}
+{diplomatic_section}{geographic_section}{trends_section}
 === EVENTS FOR THIS CHAPTER ({start_date} to {end_date}) ===
 {truncation_note}
 {events_text}
@@ -1425,65 +1747,63 @@ Do NOT give advice. You are a historian, not an advisor.
 Do NOT fabricate events not in the event list.
 {regen_section}"""
 
-        try:
-            response = self._generate_content_with_routing(
-                contents=prompt,
-                config={
-                    "temperature": 1.0,
-                    "max_output_tokens": 4096,  # Increased: 500-800 word narrative + JSON overhead
-                    "response_mime_type": "application/json",
-                    "response_schema": ChapterOutput,
-                },
-                purpose_label=f"Chronicle chapter {chapter_number}",
-            )
+        return prompt
 
-            # Parse with Pydantic for validation
-            chapter = ChapterOutput.model_validate_json(response.text)
-            sections = [s.model_dump() for s in chapter.sections]
-            return {
-                "title": chapter.title,
-                "epigraph": chapter.epigraph,
-                "sections": sections,
-                "narrative": _sections_to_text(sections, chapter.epigraph),
-                "summary": chapter.summary,
-            }
-        except Exception as e:
-            # Fallback for errors - try JSON repair as last resort
-            logger.warning("Structured output failed for chapter %d: %s", chapter_number, e)
+    def _chapter_content_from_response(
+        self, chapter_number: int, response: Any, *, error: Exception | None = None
+    ) -> dict[str, str]:
+        """Parse a chapter response, falling back to JSON repair or an error chapter."""
+        if error is None:
             try:
-                # Attempt JSON repair if we got a response
-                if hasattr(e, "__context__") and hasattr(e.__context__, "doc"):
-                    raw_text = e.__context__.doc
-                else:
-                    raw_text = getattr(response, "text", "") if "response" in dir() else ""
-
-                if raw_text:
-                    repaired = _repair_json_string(raw_text)
-                    result = json.loads(repaired)
-                    logger.info("JSON repair succeeded for chapter %d", chapter_number)
-                    sections = result.get("sections", [])
-                    epigraph = result.get("epigraph", "")
-                    narrative = result.get("narrative", "")
-                    if sections:
-                        narrative = _sections_to_text(sections, epigraph)
-                    return {
-                        "title": result.get("title", f"Chapter {chapter_number}"),
-                        "epigraph": epigraph,
-                        "sections": sections,
-                        "narrative": narrative,
-                        "summary": result.get("summary", ""),
-                    }
-            except Exception:
-                pass
+                # Parse with Pydantic for validation
+                chapter = ChapterOutput.model_validate_json(response.text)
+                sections = [s.model_dump() for s in chapter.sections]
+                return {
+                    "title": chapter.title,
+                    "epigraph": chapter.epigraph,
+                    "sections": sections,
+                    "narrative": _sections_to_text(sections, chapter.epigraph),
+                    "summary": chapter.summary,
+                }
+            except Exception as e:
+                error = e
 
-            error_text = f"[Generation error: {e}]"
-            return {
-                "title": f"Chapter {chapter_number}",
-                "epigraph": "",
-                "sections": [{"type": "prose", "text": error_text, "attribution": ""}],
-                "narrative": error_text,
-                "summary": "",
-            }
+        # Fallback for errors - try JSON repair as last resort
+        logger.warning("Structured output failed for chapter %d: %s", chapter_number, error)
+        try:
+            # Attempt JSON repair if we got a response
+            if hasattr(error, "__context__") and hasattr(error.__context__, "doc"):
+                raw_text = error.__context__.doc
+            else:
+                raw_text = getattr(response, "text", "") or ""
+
+            if raw_text:
+                repaired = _repair_json_string(raw_text)
+                result = json.loads(repaired)
+                logger.info("JSON repair succeeded for chapter %d", chapter_number)
+                sections = result.get("sections", [])
+                epigraph = result.get("epigraph", "")
+                narrative = result.get("narrative", "")
+                if sections:
+                    narrative = _sections_to_text(sections, epigraph)
+                return {
+                    "title": result.get("title", f"Chapter {chapter_number}"),
+                    "epigraph": epigraph,
+                    "sections": sections,
+                    "narrative": narrative,
+                    "summary": result.get("summary", ""),
+                }
+        except Exception:
+            pass
+
+        error_text = f"[Generation error: {error}]"
+        return {
+            "title": f"Chapter {chapter_number}",
+            "epigraph": "",
+            "sections": [{"type": "prose", "text": error_text, "attribution": ""}],
+            "narrative": error_text,
+            "summary": "",
+        }
 
     def _generate_current_era(
         self,
@@ -1495,6 +1815,67 @@ Do NOT fabricate events not in the event list.
         language: str = "en",
     ) -> dict[str, Any] | None:
         """Generate the current era narrative (not finalized)."""
+        request = self._build_current_era_request(
+            save_id=save_id,
+            chapters_data=chapters_data,
+            briefing=briefing,
+            custom_instructions=custom_instructions,
+            language=language,
+        )
+        if request is None:
+            return None
+
+        response = None
+        try:
+            response = self._generate_content_with_routing(
+                contents=request["prompt"],
+                config=CURRENT_ERA_GENERATION_CONFIG,
+                purpose_label="Chronicle current era",
+            )
+        except Exception as error:
+            logger.warning("Current era generation failed: %s", error)
+        return self._current_era_from_response(request, response, language=language)
+
+    async def _generate_current_era_async(
+        self,
+        save_id: str,
+        chapters_data: dict[str, Any],
+        briefing: dict[str, Any],
+        custom_instructions: str | None = None,
+        language: str = "en",
+    ) -> dict[str, Any] | None:
+        """Async variant of _generate_current_era."""
+        request = await asyncio.to_thread(
+            self._build_current_era_request,
+            save_id=save_id,
+            chapters_data=chapters_data,
+            briefing=briefing,
+            custom_instructions=custom_instructions,
+            language=language,
+        )
+        if request is None:
+            return None
+
+        response = None
+        try:
+            response = await self._generate_content_with_routing_async(
+                contents=request["prompt"],
+                config=CURRENT_ERA_GENERATION_CONFIG,
+                purpose_label="Chronicle current era",
+            )
+        except Exception as error:
+            logger.warning("Current era generation failed: %s", error)
+        return self._current_era_from_response(request, response, language=language)
+
+    def _build_current_era_request(
+        self,
+        save_id: str,
+        chapters_data: dict[str, Any],
+        briefing: dict[str, Any],
+        custom_instructions: str | None = None,
+        language: str = "en",
+    ) -> dict[str, Any] | None:
+        """Prompt and era metadata for the current era, or None when it has no events."""
         chapters = chapters_data.get("chapters", [])
 
         # Determine era start
@@ -1554,6 +1935,8 @@ Do NOT fabricate events not in the event list.
         diplomatic_section = f"\n{diplomatic_context}\n" if diplomatic_context else ""
         geographic_context = self._format_geographic_context(briefing)
         geographic_section = f"\n{geographic_context}\n" if geographic_context else ""
+        trends = self._format_metric_trends(save_id=save_id, from_date=era_start_date)
+        trends_section = f"\n{trends}\n" if trends else ""
 
         era_custom_section = ""
         if custom_instructions and custom_instructions.strip():
@@ -1577,7 +1960,7 @@ Do NOT fabricate events not in the event list.
 
 === PREVIOUS CHAPTERS ===
 {previous_context}
-{diplomatic_section}{geographic_section}
+{diplomatic_section}{geographic_section}{trends_section}
 === CURRENT ERA EVENTS ({era_start_date} to present) ===
 {truncation_note}
 {events_text}
@@ -1595,23 +1978,12 @@ End the final prose section with "The story continues..."
 Do NOT give advice. You are a historian, not an advisor.
 """
 
-        config = {
-            "temperature": 1.0,
-            "max_output_tokens": 1024,
-            "response_mime_type": "application/json",
-            "response_schema": CurrentEraOutput,
-        }
-
-        response = None
-        try:
-            response = self._generate_content_with_routing(
-                contents=prompt,
-                config=config,
-                purpose_label="Chronicle current era",
-            )
-        except Exception as error:
-            logger.warning("Current era generation failed: %s", error)
+        return {"prompt": prompt, "start_date": era_start_date, "events_covered": len(events)}
 
+    def _current_era_from_response(
+        self, request: dict[str, Any], response: Any, *, language: str = "en"
+    ) -> dict[str, Any]:
+        """Parse a current era response, falling back to the localized placeholder."""
         try:
             if response is None or not getattr(response, "text", None):
                 raise ValueError("Current era generation returned empty response")
@@ -1619,18 +1991,18 @@ Do NOT give advice. You are a historian, not an advisor.
             era_output = CurrentEraOutput.model_validate_json(response.text)
             sections = [s.model_dump() for s in era_output.sections]
             return {
-                "start_date": era_start_date,
+                "start_date": request["start_date"],
                 "sections": sections,
                 "narrative": _sections_to_text(sections),
-                "events_covered": len(events),
+                "events_covered": request["events_covered"],
             }
         except Exception:
             fallback_text = localized_text("current_era_fallback", language)
             return {
-                "start_date": era_start_date,
+                "start_date": request["start_date"],
                 "sections": [{"type": "prose", "text": fallback_text, "attribution": ""}],
                 "narrative": fallback_text,
-                "events_covered": len(events),
+                "events_covered": request["events_covered"],
             }
 
     def _assemble_chronicle_text(
@@ -1772,6 +2144,7 @@ Do NOT give advice. You are a historian, not an advisor.
             "briefing": briefing,
             "first_date": stats.get("first_game_date"),
             "last_date": stats.get("last_game_date"),
+            "trends": self._format_metric_trends(session_id=session_id),
         }
 
     def _build_chronicler_prompt(self, data: dict[str, Any]) -> str:
@@ -1787,6 +2160,7 @@ Do NOT give advice. You are a historian, not an advisor.
         voice = self._get_voice_for_ethics(identity, ethics)
         events_text = self._format_events(data["events"])
         state_text = self._summarize_state(briefing)
+        trends_text = f"\n{data['trends']}\n" if data.get("trends") else ""
 
         return f"""You are the Royal Chronicler of {empire_name}. Your task is to write the official historical chronicle of this empire.
 
@@ -1812,7 +2186,7 @@ You are NOT an advisor. You do NOT give recommendations or strategic advice. You
 - DO NOT give advice or recommendations - you are a chronicler, not an advisor
 
 {state_text}
-
+{trends_text}
 === COMPLETE EVENT HISTORY ===
 (From {data["first_date"]} to {data["last_date"]})
 {events_text}
@@ -1874,6 +2248,7 @@ End with "The Story Continues..." about the current situation.
 
         events_text = self._format_events(data["events"])
         state_text = self._summarize_state(briefing)
+        trends_text = f"\n{data['trends']}\n" if data.get("trends") else ""
 
         language_policy = build_language_policy(language)
 
@@ -1882,7 +2257,7 @@ End with "The Story Continues..." about the current situation.
 {language_policy}
 
 {state_text}
-
+{trends_text}
 === RECENT EVENTS ===
 {events_text}
 
@@ -1925,6 +2300,51 @@ Do NOT give advice. Write as a historian, not an advisor.
 
         return "\n".join(lines)
 
+    def _format_metric_trends(
+        self,
+        *,
+        session_id: str | None = None,
+        save_id: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> str:
+        """Format whole-span metric trends (end-of-period values) for the LLM prompt.
+
+        Returns an empty string when there is no timeline data for the span.
+        """
+        if session_id is None and save_id is None:
+            return ""
+        lines = []
+        resolution = None
+        for metric, label in TREND_METRICS:
+            try:
+                trend = self.db.get_metric_trend(
+                    metric=metric,
+                    session_id=session_id,
+                    save_id=save_id,
+                    from_game_date=from_date,
+                    to_game_date=to_date,
+                    max_points=MAX_TREND_POINTS,
+                )
+            except Exception:
+                continue
+            if not isinstance(trend, dict) or not isinstance(trend.get("points"), list):
+                continue
+            points = [
+                p for p in trend["points"] if isinstance(p, dict) and p.get("last") is not None
+            ]
+            if len(points) < 2:
+                continue
+            resolution = trend.get("resolution")
+            series = " → ".join(f"{p['period']}: {_format_trend_value(p['last'])}" for p in points)
+            lines.append(f"- {label}: {series}")
+        if not lines:
+            return ""
+        heading = "=== EMPIRE TRENDS ==="
+        if resolution in ("year", "decade"):
+            heading = f"=== EMPIRE TRENDS (end of each {resolution}) ==="
+        return "\n".join([heading, *lines])
+
     def _format_diplomatic_context(self, briefing: dict) -> str:
         """Format diplomatic relations for the LLM prompt.
 
@@ -6,6 +6,7 @@ Provides the Companion class — the Gemini-powered strategic advisor
 used by the Electron app via the backend API.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -13,6 +14,10 @@ import sys
 import threading
 import time
 import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
@@ -27,21 +32,25 @@ try:
 except ImportError:
     raise ImportError("google-genai package not installed. Run: pip install google-genai")
 
+from backend.core.briefing_slice import (
+    DEFAULT_BRIEFING_BUDGET_CHARS,
+    BriefingSlice,
+    slice_briefing,
+)
 from backend.core.conversation import ConversationManager
+from backend.core.database import resolve_search_index_dir
 from backend.core.json_utils import json_dumps
 from backend.core.language import build_language_policy, localized_text, normalize_language
 from backend.core.model_routing import (
     GEMINI_FLASH_MODEL,
+    ModelRoute,
     classify_model_error,
     display_model_name,
-    fallback_notice,
-    get_model_unavailable_event,
-    is_model_temporarily_unavailable,
-    mark_model_failure,
     normalize_model_routing_mode,
     route_event_payload,
     route_models_for,
 )
+from backend.core.prompt_cache import PromptCache, PromptPrefix, build_prompt_prefix
 from backend.core.utils import compute_save_hash_from_briefing
 from stellaris_companion.personality import build_optimized_prompt
 from stellaris_save_extractor import SaveExtractor
@@ -76,6 +85,47 @@ FACTUAL ACCURACY CONTRACT:
 - If `safe_to_claim_over_cap` is false, do not present `derived_status` or `derived_over_by` as the empire's current naval-cap status."""
 
 
+@dataclass
+class _AdvisorTurn:
+    """Everything ask_precomputed needs for one question, built before calling the model."""
+
+    question: str
+    session_key: str  # Language-scoped conversation key
+    save_id: str | None
+    language: str
+    explicit_model: str | None
+    selected_model: str
+    model_routing_mode: str | None
+    briefing_json: str
+    game_date: str | None
+    data_note: str | None
+    save_memory_summary: str | None
+    briefing_slice: BriefingSlice
+    prefix: PromptPrefix
+    turn_prompt: str
+    system_instruction: str
+    use_cached_prefix: bool
+    standalone: bool  # No earlier turns or history context in the prompt
+
+
+def _prime_stream(response: Any) -> Iterator[Any]:
+    """Receive the first chunk now (so request errors raise here) and keep the rest lazy."""
+    chunks = iter(response)
+    first = next(chunks, None)
+    return chunks if first is None else chain([first], chunks)
+
+
+def _log_write_failure(event: str) -> Callable[[Future], None]:
+    """Done-callback for fire-and-forget DB writer jobs: log the failure, if any."""
+
+    def _callback(future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            logger.debug("%s error=%s", event, error)
+
+    return _callback
+
+
 class Companion:
     """Stellaris companion powered by Gemini with precomputed briefings.
 
@@ -90,12 +140,15 @@ class Companion:
         auto_precompute: bool = True,
         advisor_model: str = DEFAULT_ADVISOR_MODEL,
         model_routing_mode: str | None = None,
+        briefing_budget_chars: int | None = None,
     ):
         """Initialize the companion.
 
         Args:
             save_path: Path to the Stellaris .sav file. If None, will try to find most recent.
             api_key: Google API key. If None, reads from GOOGLE_API_KEY env var.
+            briefing_budget_chars: Briefing JSON budget per chat prompt (0 sends the full
+                briefing). Defaults to STELLARIS_BRIEFING_BUDGET_CHARS or 60k.
         """
         # Get API key
         self.api_key = api_key or os.environ.get("GOOGLE_API_KEY")
@@ -111,6 +164,14 @@ class Companion:
         self.model_routing_mode = normalize_model_routing_mode(
             model_routing_mode or os.environ.get("STELLARIS_MODEL_ROUTING_MODE")
         )
+        if briefing_budget_chars is None:
+            try:
+                briefing_budget_chars = int(
+                    os.environ.get("STELLARIS_BRIEFING_BUDGET_CHARS", DEFAULT_BRIEFING_BUDGET_CHARS)
+                )
+            except ValueError:
+                briefing_budget_chars = DEFAULT_BRIEFING_BUDGET_CHARS
+        self.briefing_budget_chars = max(0, briefing_budget_chars)
 
         # Initialize save-related attributes
         self.save_path: Path | None = None
@@ -158,6 +219,12 @@ class Companion:
             max_history_context_chars=3500,
         )
         self._max_prompt_question_chars = 4000
+        # Provider-side cache of the (system prompt + briefing) prefix shared by chat turns.
+        self._prompt_cache = PromptCache()
+        # Persistent answers for repeated questions on an unchanged save (GameDatabase).
+        self._answer_cache_lock = threading.Lock()
+        self._answer_cache_stats = {"lookups": 0, "hits": 0, "saved_ms": 0.0}
+        self._save_hash_memo: tuple[str, str | None] | None = None
         self._max_save_memory_chars = 2200
         self._max_save_memory_entries = 8
 
@@ -212,7 +279,9 @@ class Companion:
             raise FileNotFoundError(f"Save file not found: {save_path}")
 
         self.last_modified = self.save_path.stat().st_mtime
-        self.extractor = SaveExtractor(str(self.save_path))
+        self.extractor = SaveExtractor(
+            str(self.save_path), search_index_dir=resolve_search_index_dir()
+        )
 
         # Get basic metadata for context
         self.metadata = self.extractor.get_metadata()
@@ -342,7 +411,9 @@ class Companion:
         old_date = self._last_known_date
 
         # Reload extractor
-        self.extractor = SaveExtractor(str(self.save_path))
+        self.extractor = SaveExtractor(
+            str(self.save_path), search_index_dir=resolve_search_index_dir()
+        )
         self.last_modified = self.save_path.stat().st_mtime
         self.metadata = self.extractor.get_metadata()
 
@@ -387,8 +458,20 @@ class Companion:
                 - wall_time_ms: total time in milliseconds
                 - response_length: length of final response text
                 - payload_sizes: dict mapping tool names to response sizes in bytes
+                - answer_cache: whether the last answer came from the answer cache,
+                  plus lookups/hits/hit_rate/saved_ms since startup
         """
-        return self._last_call_stats.copy()
+        stats = self._last_call_stats.copy()
+        with self._answer_cache_lock:
+            counters = dict(self._answer_cache_stats)
+        lookups = counters["lookups"]
+        stats["answer_cache"] = {
+            "hit": bool((stats.get("answer_cache") or {}).get("hit")),
+            **counters,
+            "saved_ms": round(counters["saved_ms"], 1),
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None,
+        }
+        return stats
 
     def get_advisor_model(self) -> str:
         """Return the default advisor model for chat requests."""
@@ -474,7 +557,9 @@ class Companion:
 
         for attempt in range(1, 4):
             try:
-                extractor = SaveExtractor(str(save_path))
+                extractor = SaveExtractor(
+                    str(save_path), search_index_dir=resolve_search_index_dir()
+                )
                 briefing = extractor.get_complete_briefing()
                 break
             except (zipfile.BadZipFile, KeyError) as e:
@@ -692,27 +777,42 @@ class Companion:
             from backend.core.database import get_default_db
 
             db = get_default_db()
-            existing = db.get_advisor_memory_summary(save_id, language=language) or ""
-            lines = [ln.strip() for ln in existing.splitlines() if ln.strip()]
-
-            # Keep recent continuity, then append current turn.
-            if len(lines) >= self._max_save_memory_entries:
-                lines = lines[-(self._max_save_memory_entries - 1) :]
-            lines.append(entry)
-
-            # Enforce character budget by trimming oldest lines first.
-            while len("\n".join(lines)) > self._max_save_memory_chars and len(lines) > 1:
-                lines.pop(0)
-
-            db.upsert_advisor_memory_summary(
+            # Group-committed with other turns' writes; the turn does not wait on it.
+            future = db.submit_write(
+                self._append_save_memory_entry,
+                db,
                 save_id=save_id,
                 language=language,
-                summary_text="\n".join(lines),
-                last_game_date=game_date,
+                entry=entry,
+                game_date=game_date,
             )
+            future.add_done_callback(_log_write_failure("advisor_memory_update_failed"))
         except Exception as e:
             logger.debug("advisor_memory_update_failed error=%s", e)
 
+    def _append_save_memory_entry(
+        self, db: Any, *, save_id: str, language: str, entry: str, game_date: str | None
+    ) -> None:
+        """DB writer job: read, trim and rewrite the save's memory summary."""
+        existing = db.get_advisor_memory_summary(save_id, language=language) or ""
+        lines = [ln.strip() for ln in existing.splitlines() if ln.strip()]
+
+        # Keep recent continuity, then append current turn.
+        if len(lines) >= self._max_save_memory_entries:
+            lines = lines[-(self._max_save_memory_entries - 1) :]
+        lines.append(entry)
+
+        # Enforce character budget by trimming oldest lines first.
+        while len("\n".join(lines)) > self._max_save_memory_chars and len(lines) > 1:
+            lines.pop(0)
+
+        db.upsert_advisor_memory_summary(
+            save_id=save_id,
+            language=language,
+            summary_text="\n".join(lines),
+            last_game_date=game_date,
+        )
+
     @staticmethod
     def _classify_naval_capacity_intent(question: str) -> str | None:
         normalized = " ".join((question or "").lower().split())
@@ -925,20 +1025,110 @@ class Companion:
         rules.append("- Use the fact summary in the first paragraph, then continue in character.")
         return "\n".join(rules)
 
-    def ask_precomputed(
+    def _generate_advisor_content(
+        self,
+        *,
+        model: str,
+        cfg: Any,
+        prefix: PromptPrefix,
+        turn_prompt: str,
+        use_cache: bool,
+        stream: bool = False,
+    ) -> tuple[Any, bool]:
+        """generate_content for an advisor turn; returns (response, used cached prefix).
+
+        With a provider-side cached context only the per-turn text is sent. A
+        rejected handle (e.g. expired server-side) is dropped and the turn is
+        retried with the full prompt; model failures (quota etc.) propagate.
+        With ``stream`` the response is a chunk iterator whose first chunk has
+        already been received, so failures surface here (before any output).
+        """
+        generate = (
+            self.client.models.generate_content_stream
+            if stream
+            else self.client.models.generate_content
+        )
+        handle = (
+            self._prompt_cache.handle_for(self.client, model=model, prefix=prefix)
+            if use_cache
+            else None
+        )
+        if handle:
+            try:
+                response = generate(
+                    model=model,
+                    contents=turn_prompt,
+                    config=cfg.model_copy(
+                        update={"cached_content": handle, "system_instruction": None}
+                    ),
+                )
+                return (_prime_stream(response) if stream else response), True
+            except Exception as exc:
+                if classify_model_error(exc):
+                    raise
+                logger.debug("cached_prefix_rejected model=%s error=%s", model, exc)
+                self._prompt_cache.invalidate(model=model, prefix=prefix)
+        response = generate(
+            model=model,
+            contents=f"{prefix.text}\n\n{turn_prompt}",
+            config=cfg,
+        )
+        return (_prime_stream(response) if stream else response), False
+
+    async def _generate_advisor_content_async(
+        self,
+        *,
+        model: str,
+        cfg: Any,
+        prefix: PromptPrefix,
+        turn_prompt: str,
+        use_cache: bool,
+    ) -> tuple[Any, bool]:
+        """Async variant of _generate_advisor_content using ``client.aio``."""
+        generate = self.client.aio.models.generate_content
+        handle = (
+            # Creating a cached context is a (rare) blocking call; keep it off the loop.
+            await asyncio.to_thread(
+                self._prompt_cache.handle_for, self.client, model=model, prefix=prefix
+            )
+            if use_cache
+            else None
+        )
+        if handle:
+            try:
+                response = await generate(
+                    model=model,
+                    contents=turn_prompt,
+                    config=cfg.model_copy(
+                        update={"cached_content": handle, "system_instruction": None}
+                    ),
+                )
+                return response, True
+            except Exception as exc:
+                if classify_model_error(exc):
+                    raise
+                logger.debug("cached_prefix_rejected model=%s error=%s", model, exc)
+                self._prompt_cache.invalidate(model=model, prefix=prefix)
+        response = await generate(
+            model=model,
+            contents=f"{prefix.text}\n\n{turn_prompt}",
+            config=cfg,
+        )
+        return response, False
+
+    def _prepare_advisor_turn(
         self,
+        *,
         question: str,
         session_key: str,
-        save_id: str | None = None,
-        history_context: str | None = None,
-        model_name: str | None = None,
-        model_routing_mode: str | None = None,
-        language: str | None = None,
-    ) -> tuple[str, float]:
-        """Ask a question using the fully precomputed briefing (no tools)."""
-        start_time = time.time()
+        save_id: str | None,
+        history_context: str | None,
+        model_name: str | None,
+        model_routing_mode: str | None,
+        language: str | None,
+    ) -> _AdvisorTurn | str:
+        """Build prompts and model config for one ask; returns text when no briefing exists."""
         output_language = normalize_language(language)
-        language_scoped_session_key = f"{session_key}:lang:{output_language}"
         explicit_model = str(model_name).strip() if model_name else None
         selected_model = explicit_model or self.advisor_model or DEFAULT_ADVISOR_MODEL
 
@@ -948,10 +1138,7 @@ class Companion:
 
         briefing_json, game_date, data_note = self._get_best_briefing_json()
         if not briefing_json:
-            return (
-                localized_text("no_precomputed_state", output_language),
-                0.0,
-            )
+            return localized_text("no_precomputed_state", output_language)
 
         if data_note:
             data_note = localized_text("loaded_from_cache", output_language)
@@ -961,165 +1148,551 @@ class Companion:
             language=output_language,
         )
 
-        # Build prompt with sliding-window history (Phase 4)
-        user_prompt = self._conversations.build_prompt(
+        # A question-independent base of the briefing (full when it fits) for the
+        # cached prefix, plus the question's other focus sections after it.
+        briefing_slice = slice_briefing(
+            briefing_json, cleaned_question, max_chars=self.briefing_budget_chars
+        )
+
+        # Build prompt with sliding-window history (Phase 4). The briefing block is a
+        # stable prefix; everything that changes per turn comes after it.
+        language_scoped_session_key = f"{session_key}:lang:{output_language}"
+        standalone = not history_context and not self._conversations.has_recent_history(
+            language_scoped_session_key, game_date=game_date
+        )
+        prefix_prompt, turn_prompt = self._conversations.build_prompt_parts(
             session_key=language_scoped_session_key,
-            briefing_json=briefing_json,
+            briefing_json=briefing_slice.json,
             game_date=game_date,
             question=cleaned_question,
             data_note=data_note,
             history_context=history_context,
             long_term_summary=save_memory_summary,
+            briefing_note=briefing_slice.omitted_note,
+            briefing_extra_json=briefing_slice.extra_json,
         )
 
         ask_system_prompt = (
             f"{self.system_prompt}\n\n"
             f"{build_language_policy(output_language)}\n\n"
             "ASK MODE (NO TOOLS):\n"
-            "- You are given the complete current game state as JSON in the user message.\n"
+            "- You are given the current game state as JSON in the user message (for large\n"
+            "  saves, a subset of sections plus more for this question; the others are\n"
+            "  listed as omitted, so do not guess their contents).\n"
             "- Do NOT call tools or ask to call tools.\n"
             "- ALL numbers and factual claims must come from the JSON.\n"
             "- If a value is missing, say so in the requested language and suggest what to check in-game.\n"
             "- Be a strategic ADVISOR: interpret, prioritize, and recommend next actions.\n"
         )
+        prompt_prefix = build_prompt_prefix(
+            system_instruction=ask_system_prompt,
+            text=prefix_prompt,
+            briefing_json=briefing_slice.json,
+            language=output_language,
+        )
         naval_cap_policy_block = self._build_naval_capacity_policy_block(
             question=cleaned_question,
             briefing_json=briefing_json,
         )
         if naval_cap_policy_block:
+            # Question-specific system text: this turn cannot use the cached prefix.
             ask_system_prompt += f"{naval_cap_policy_block}\n"
 
-        try:
-            cfg = types.GenerateContentConfig(
-                system_instruction=ask_system_prompt,
-                temperature=1.0,
-                max_output_tokens=4096,
-            )
-            if self._thinking_level != "dynamic":
-                cfg.thinking_config = types.ThinkingConfig(thinking_level=self._thinking_level)
+        return _AdvisorTurn(
+            question=cleaned_question,
+            session_key=language_scoped_session_key,
+            save_id=save_id,
+            language=output_language,
+            explicit_model=explicit_model,
+            selected_model=selected_model,
+            model_routing_mode=model_routing_mode,
+            briefing_json=briefing_json,
+            game_date=game_date,
+            data_note=data_note,
+            save_memory_summary=save_memory_summary,
+            briefing_slice=briefing_slice,
+            prefix=prompt_prefix,
+            turn_prompt=turn_prompt,
+            system_instruction=ask_system_prompt,
+            use_cached_prefix=not naval_cap_policy_block,
+            standalone=standalone,
+        )
 
-            candidate_models = route_models_for(
-                mode=model_routing_mode or self.model_routing_mode,
-                purpose="advisor",
-                explicit_model=explicit_model,
-            )
-            if not candidate_models:
-                candidate_models = [selected_model]
-
-            requested_model = candidate_models[0]
-            response = None
-            final_model = requested_model
-            route_event = None
-            last_error: Exception | None = None
-
-            for index, candidate_model in enumerate(candidate_models):
-                fallback_model = (
-                    candidate_models[index + 1] if index + 1 < len(candidate_models) else None
+    def _advisor_config(self, turn: _AdvisorTurn) -> Any:
+        cfg = types.GenerateContentConfig(
+            system_instruction=turn.system_instruction,
+            temperature=1.0,
+            max_output_tokens=4096,
+        )
+        if self._thinking_level != "dynamic":
+            cfg.thinking_config = types.ThinkingConfig(thinking_level=self._thinking_level)
+        return cfg
+
+    def _advisor_route(self, turn: _AdvisorTurn) -> ModelRoute:
+        candidate_models = route_models_for(
+            mode=turn.model_routing_mode or self.model_routing_mode,
+            purpose="advisor",
+            explicit_model=turn.explicit_model,
+        )
+        return ModelRoute(candidate_models or [turn.selected_model], purpose_label="Advisor")
+
+    @staticmethod
+    def _advisor_call_result(
+        route: ModelRoute, model: str, response: Any, used_cached_prefix: bool
+    ) -> dict[str, Any]:
+        route.succeeded(model)
+        return {
+            "response": response,
+            "final_model": model,
+            "requested_model": route.requested_model,
+            "route_event": route.route_event,
+            "used_cached_prefix": used_cached_prefix,
+        }
+
+    def _call_advisor_models(self, turn: _AdvisorTurn, *, stream: bool = False) -> dict[str, Any]:
+        """Try the routed advisor models in order, falling back on quota/availability errors.
+
+        Returns the response (a primed chunk iterator with ``stream``) plus the
+        routing details needed for call stats.
+        """
+        cfg = self._advisor_config(turn)
+        route = self._advisor_route(turn)
+        for candidate_model in route:
+            try:
+                response, used_cached_prefix = self._generate_advisor_content(
+                    model=candidate_model,
+                    cfg=cfg,
+                    prefix=turn.prefix,
+                    turn_prompt=turn.turn_prompt,
+                    use_cache=turn.use_cached_prefix,
+                    stream=stream,
                 )
-                if fallback_model and is_model_temporarily_unavailable(candidate_model):
-                    route_event = get_model_unavailable_event(
-                        requested_model=requested_model,
-                        skipped_model=candidate_model,
-                        final_model=fallback_model,
-                    )
+            except Exception as exc:
+                if route.should_fall_back(candidate_model, exc):
+                    continue
+                raise
+            return self._advisor_call_result(route, candidate_model, response, used_cached_prefix)
+        raise route.exhausted_error()
+
+    async def _call_advisor_models_async(self, turn: _AdvisorTurn) -> dict[str, Any]:
+        """Async variant of _call_advisor_models (same routing, async model client)."""
+        cfg = self._advisor_config(turn)
+        route = self._advisor_route(turn)
+        for candidate_model in route:
+            try:
+                response, used_cached_prefix = await self._generate_advisor_content_async(
+                    model=candidate_model,
+                    cfg=cfg,
+                    prefix=turn.prefix,
+                    turn_prompt=turn.turn_prompt,
+                    use_cache=turn.use_cached_prefix,
+                )
+            except Exception as exc:
+                if route.should_fall_back(candidate_model, exc):
                     continue
+                raise
+            return self._advisor_call_result(route, candidate_model, response, used_cached_prefix)
+        raise route.exhausted_error()
 
-                try:
-                    response = self.client.models.generate_content(
-                        model=candidate_model,
-                        contents=user_prompt,
-                        config=cfg,
-                    )
-                    final_model = candidate_model
-                    if route_event and route_event.final_model != final_model:
-                        route_event.final_model = final_model
-                    break
-                except Exception as exc:
-                    last_error = exc
-                    failure = classify_model_error(exc)
-                    if failure and fallback_model:
-                        mark_model_failure(candidate_model, failure)
-                        route_event = route_event or get_model_unavailable_event(
-                            requested_model=requested_model,
-                            skipped_model=candidate_model,
-                            final_model=fallback_model,
-                        )
-                        if route_event:
-                            route_event.reason = failure.reason
-                            route_event.error = failure.message[:500]
-                            route_event.notice = fallback_notice(
-                                candidate_model,
-                                fallback_model,
-                                reason=failure.reason,
-                            )
-                        continue
-                    raise
+    def _finish_advisor_turn(
+        self,
+        turn: _AdvisorTurn,
+        call: dict[str, Any],
+        *,
+        response_text_raw: str,
+        start_time: float,
+        ttft_ms: float | None = None,
+    ) -> str:
+        """Record call stats, the conversation turn and save memory; returns the final text."""
+        response_text = response_text_raw
+        # Deterministic disclaimer on stale/cache fallback.
+        if turn.data_note:
+            response_text = f"*{turn.data_note}*\n\n{response_text}"
+
+        wall_time_ms = (time.time() - start_time) * 1000
+        final_model = call["final_model"]
+        requested_model = call["requested_model"]
+        self._last_call_stats = {
+            "total_calls": 1,
+            "tools_used": ["ask_precomputed_no_tools"],
+            "wall_time_ms": wall_time_ms,
+            "response_length": len(response_text),
+            "payload_sizes": {
+                "briefing_json": turn.briefing_slice.chars,
+                "briefing_json_full": len(turn.briefing_json),
+                "prompt_total": len(turn.prefix.text) + 2 + len(turn.turn_prompt),
+                "save_memory_summary": len(turn.save_memory_summary or ""),
+            },
+            "model": final_model,
+            "model_display": display_model_name(final_model),
+            "requested_model": requested_model,
+            "requested_model_display": display_model_name(requested_model),
+            "routing": route_event_payload(call["route_event"]),
+            "briefing_slice": turn.briefing_slice.stats(),
+            "prompt_cache": {
+                "key": list(turn.prefix.key),
+                "prefix_chars": turn.prefix.chars,
+                "cached": call["used_cached_prefix"],
+                **self._prompt_cache.get_stats(),
+            },
+        }
+        if ttft_ms is not None:
+            self._last_call_stats["ttft_ms"] = ttft_ms
+
+        self._conversations.record_turn(
+            session_key=turn.session_key,
+            question=turn.question,
+            answer=response_text,
+            game_date=turn.game_date,
+        )
+        self._update_save_memory_summary(
+            save_id=turn.save_id,
+            question=turn.question,
+            answer=response_text_raw,
+            game_date=turn.game_date,
+            language=turn.language,
+        )
+        return response_text
+
+    def _complete_advisor_answer(
+        self, turn: _AdvisorTurn, call: dict[str, Any], *, start_time: float
+    ) -> str:
+        """Cache and record a non-streamed model answer; returns the final text."""
+        response_text_raw = call["response"].text
+        if response_text_raw:
+            self._store_cached_answer(
+                turn,
+                answer=response_text_raw,
+                response_ms=(time.time() - start_time) * 1000,
+            )
+        else:
+            response_text_raw = localized_text("could_not_generate", turn.language)
+        return self._finish_advisor_turn(
+            turn, call, response_text_raw=response_text_raw, start_time=start_time
+        )
 
-            if response is None:
-                if last_error is not None:
-                    raise last_error
-                raise RuntimeError("No advisor model was available")
+    def _record_advisor_error(
+        self, turn: _AdvisorTurn, error: Exception, *, start_time: float
+    ) -> None:
+        self._last_call_stats = {
+            "total_calls": 0,
+            "tools_used": [],
+            "wall_time_ms": (time.time() - start_time) * 1000,
+            "response_length": 0,
+            "payload_sizes": {"briefing_json": len(turn.briefing_json)},
+            "error": str(error),
+            "model": turn.selected_model,
+            "model_display": display_model_name(turn.selected_model),
+            "routing": None,
+        }
 
-            response_text_raw = response.text or localized_text(
-                "could_not_generate", output_language
-            )
-            response_text = response_text_raw
+    @staticmethod
+    def _answer_cache_question_key(question: str) -> str:
+        """Question text normalized for answer-cache lookups (case, spacing, end punctuation)."""
+        return " ".join((question or "").lower().split()).strip(" ?!.\"'")
+
+    def _briefing_save_hash(self, briefing_json: str) -> str | None:
+        memo = self._save_hash_memo
+        if memo is not None and (memo[0] is briefing_json or memo[0] == briefing_json):
+            return memo[1]
+        try:
+            save_hash = compute_save_hash_from_briefing(json.loads(briefing_json))
+        except Exception:
+            save_hash = None
+        self._save_hash_memo = (briefing_json, save_hash)
+        return save_hash
+
+    def _answer_cache_params(self, turn: _AdvisorTurn) -> dict[str, Any] | None:
+        """Answer-cache key for a turn, or None when the turn cannot use the cache.
+
+        Answers are only stored and looked up for standalone turns (no earlier
+        conversation or history context in the prompt), so a follow-up is never
+        answered from a turn that lacked its context. The key holds the requested
+        routing model (not the one a fallback ended up using, so lookup and store
+        agree) and the personality/system prompt hash. The save memory summary is
+        left out: every answered turn appends to it, so it would never repeat.
+        """
+        question_key = self._answer_cache_question_key(turn.question)
+        if not turn.standalone or not turn.save_id or not question_key:
+            return None
+        save_hash = self._briefing_save_hash(turn.briefing_json)
+        if not save_hash:
+            return None
+        return {
+            "save_id": turn.save_id,
+            "save_hash": save_hash,
+            "language": turn.language,
+            "model": (
+                route_models_for(
+                    mode=turn.model_routing_mode or self.model_routing_mode,
+                    purpose="advisor",
+                    explicit_model=turn.explicit_model,
+                )
+                or [turn.selected_model]
+            )[0],
+            "question_key": question_key,
+            # Personality/system prompt hash
+            "prompt_key": turn.prefix.key[1],
+        }
 
-            # Deterministic disclaimer on stale/cache fallback.
-            if data_note:
-                response_text = f"*{data_note}*\n\n{response_text}"
+    def _lookup_cached_answer(self, turn: _AdvisorTurn) -> dict[str, Any] | None:
+        params = self._answer_cache_params(turn)
+        if params is None:
+            return None
+        try:
+            from backend.core.database import get_default_db
 
-            elapsed = time.time() - start_time
-            wall_time_ms = elapsed * 1000
-
-            self._last_call_stats = {
-                "total_calls": 1,
-                "tools_used": ["ask_precomputed_no_tools"],
-                "wall_time_ms": wall_time_ms,
-                "response_length": len(response_text),
-                "payload_sizes": {
-                    "briefing_json": len(briefing_json),
-                    "prompt_total": len(user_prompt),
-                    "save_memory_summary": len(save_memory_summary or ""),
-                },
-                "model": final_model,
-                "model_display": display_model_name(final_model),
-                "requested_model": requested_model,
-                "requested_model_display": display_model_name(requested_model),
-                "routing": route_event_payload(route_event),
-            }
+            db = get_default_db()
+            cached = db.get_cached_answer(**params)
+        except Exception as e:
+            logger.debug("answer_cache_lookup_failed error=%s", e)
+            return None
+        if cached:
+            try:
+                future = db.submit_write(
+                    db.record_answer_cache_hit,
+                    save_id=params["save_id"],
+                    language=params["language"],
+                    model=params["model"],
+                    question_key=params["question_key"],
+                )
+                future.add_done_callback(_log_write_failure("answer_cache_hit_failed"))
+            except Exception as e:
+                logger.debug("answer_cache_hit_failed error=%s", e)
+        with self._answer_cache_lock:
+            self._answer_cache_stats["lookups"] += 1
+            if cached:
+                self._answer_cache_stats["hits"] += 1
+                self._answer_cache_stats["saved_ms"] += float(cached.get("response_ms") or 0.0)
+        if cached:
+            cached["model"] = params["model"]
+        return cached
+
+    def _store_cached_answer(self, turn: _AdvisorTurn, *, answer: str, response_ms: float) -> None:
+        params = self._answer_cache_params(turn)
+        if params is None:
+            return
+        try:
+            from backend.core.database import get_default_db
 
-            self._conversations.record_turn(
-                session_key=language_scoped_session_key,
-                question=cleaned_question,
-                answer=response_text,
-                game_date=game_date,
+            db = get_default_db()
+            future = db.submit_write(
+                db.put_cached_answer,
+                answer=answer,
+                game_date=turn.game_date,
+                response_ms=response_ms,
+                **params,
             )
-            self._update_save_memory_summary(
-                save_id=save_id,
-                question=cleaned_question,
-                answer=response_text_raw,
-                game_date=game_date,
-                language=output_language,
+            future.add_done_callback(_log_write_failure("answer_cache_store_failed"))
+        except Exception as e:
+            logger.debug("answer_cache_store_failed error=%s", e)
+
+    def _finish_cached_turn(
+        self, turn: _AdvisorTurn, cached: dict[str, Any], *, start_time: float
+    ) -> str:
+        """Serve a cached answer: record stats and the conversation turn, no model call."""
+        response_text = str(cached["answer"])
+        if turn.data_note:
+            response_text = f"*{turn.data_note}*\n\n{response_text}"
+        model = cached["model"]
+        self._last_call_stats = {
+            "total_calls": 0,
+            "tools_used": ["answer_cache"],
+            "wall_time_ms": (time.time() - start_time) * 1000,
+            "response_length": len(response_text),
+            "payload_sizes": {},
+            "model": model,
+            "model_display": display_model_name(model),
+            "requested_model": model,
+            "requested_model_display": display_model_name(model),
+            "routing": None,
+            "answer_cache": {"hit": True, "original_response_ms": cached.get("response_ms")},
+        }
+        self._conversations.record_turn(
+            session_key=turn.session_key,
+            question=turn.question,
+            answer=response_text,
+            game_date=turn.game_date,
+        )
+        return response_text
+
+    def ask_precomputed(
+        self,
+        question: str,
+        session_key: str,
+        save_id: str | None = None,
+        history_context: str | None = None,
+        model_name: str | None = None,
+        model_routing_mode: str | None = None,
+        language: str | None = None,
+    ) -> tuple[str, float]:
+        """Ask a question using the fully precomputed briefing (no tools)."""
+        start_time = time.time()
+        turn = self._prepare_advisor_turn(
+            question=question,
+            session_key=session_key,
+            save_id=save_id,
+            history_context=history_context,
+            model_name=model_name,
+            model_routing_mode=model_routing_mode,
+            language=language,
+        )
+        if isinstance(turn, str):
+            return turn, 0.0
+
+        cached = self._lookup_cached_answer(turn)
+        if cached:
+            response_text = self._finish_cached_turn(turn, cached, start_time=start_time)
+            return response_text, time.time() - start_time
+
+        try:
+            call = self._call_advisor_models(turn)
+            response_text = self._complete_advisor_answer(turn, call, start_time=start_time)
+            return response_text, time.time() - start_time
+
+        except Exception as e:
+            self._record_advisor_error(turn, e, start_time=start_time)
+            return f"Error: {str(e)}", time.time() - start_time
+
+    async def ask_precomputed_async(
+        self,
+        question: str,
+        session_key: str,
+        save_id: str | None = None,
+        history_context: str | None = None,
+        model_name: str | None = None,
+        model_routing_mode: str | None = None,
+        language: str | None = None,
+    ) -> tuple[str, float]:
+        """Async variant of ask_precomputed for the API server.
+
+        Prompt assembly and the DB bookkeeping run in short worker-thread hops;
+        the model call itself uses the async client, so waiting on the model
+        holds no thread. Cancelling the task abandons the call before anything
+        is recorded.
+        """
+        start_time = time.time()
+        turn = await asyncio.to_thread(
+            self._prepare_advisor_turn,
+            question=question,
+            session_key=session_key,
+            save_id=save_id,
+            history_context=history_context,
+            model_name=model_name,
+            model_routing_mode=model_routing_mode,
+            language=language,
+        )
+        if isinstance(turn, str):
+            return turn, 0.0
+
+        cached = await asyncio.to_thread(self._lookup_cached_answer, turn)
+        if cached:
+            response_text = await asyncio.to_thread(
+                self._finish_cached_turn, turn, cached, start_time=start_time
             )
+            return response_text, time.time() - start_time
 
-            return response_text, elapsed
+        try:
+            call = await self._call_advisor_models_async(turn)
+            response_text = await asyncio.to_thread(
+                self._complete_advisor_answer, turn, call, start_time=start_time
+            )
+            return response_text, time.time() - start_time
 
         except Exception as e:
+            self._record_advisor_error(turn, e, start_time=start_time)
+            return f"Error: {str(e)}", time.time() - start_time
+
+    def ask_precomputed_stream(
+        self,
+        question: str,
+        session_key: str,
+        save_id: str | None = None,
+        history_context: str | None = None,
+        model_name: str | None = None,
+        model_routing_mode: str | None = None,
+        language: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Streaming variant of ask_precomputed.
+
+        Yields ``{"type": "delta", "text": ...}`` events as the model produces
+        text, then one ``{"type": "done", ...}`` event with the full text and
+        call stats (or ``{"type": "error", "error": ...}``). Model fallback
+        happens before the first delta; the conversation turn is only recorded
+        once the stream completes, so an abandoned stream leaves no history.
+        """
+        start_time = time.time()
+        turn = self._prepare_advisor_turn(
+            question=question,
+            session_key=session_key,
+            save_id=save_id,
+            history_context=history_context,
+            model_name=model_name,
+            model_routing_mode=model_routing_mode,
+            language=language,
+        )
+        if isinstance(turn, str):
+            yield {"type": "delta", "text": turn}
+            yield {"type": "done", "text": turn, "elapsed": 0.0, "ttft_ms": None, "stats": {}}
+            return
+
+        cached = self._lookup_cached_answer(turn)
+        if cached:
+            response_text = self._finish_cached_turn(turn, cached, start_time=start_time)
             elapsed = time.time() - start_time
-            wall_time_ms = elapsed * 1000
-            self._last_call_stats = {
-                "total_calls": 0,
-                "tools_used": [],
-                "wall_time_ms": wall_time_ms,
-                "response_length": 0,
-                "payload_sizes": {"briefing_json": len(briefing_json)},
-                "error": str(e),
-                "model": selected_model,
-                "model_display": display_model_name(selected_model),
-                "routing": None,
+            yield {"type": "delta", "text": response_text}
+            yield {
+                "type": "done",
+                "text": response_text,
+                "elapsed": elapsed,
+                "ttft_ms": elapsed * 1000,
+                "stats": self.get_call_stats(),
             }
-            return f"Error: {str(e)}", elapsed
+            return
+
+        try:
+            call = self._call_advisor_models(turn, stream=True)
+            ttft_ms: float | None = None
+            parts: list[str] = []
+            if turn.data_note:
+                yield {"type": "delta", "text": f"*{turn.data_note}*\n\n"}
+            for chunk in call["response"]:
+                text = getattr(chunk, "text", None)
+                if not text:
+                    continue
+                if ttft_ms is None:
+                    ttft_ms = (time.time() - start_time) * 1000
+                parts.append(text)
+                yield {"type": "delta", "text": text}
+
+            response_text_raw = "".join(parts)
+            if response_text_raw:
+                self._store_cached_answer(
+                    turn,
+                    answer=response_text_raw,
+                    response_ms=(time.time() - start_time) * 1000,
+                )
+            else:
+                response_text_raw = localized_text("could_not_generate", turn.language)
+                yield {"type": "delta", "text": response_text_raw}
+            response_text = self._finish_advisor_turn(
+                turn,
+                call,
+                response_text_raw=response_text_raw,
+                start_time=start_time,
+                ttft_ms=ttft_ms,
+            )
+            yield {
+                "type": "done",
+                "text": response_text,
+                "elapsed": time.time() - start_time,
+                "ttft_ms": ttft_ms,
+                "stats": self.get_call_stats(),
+            }
+
+        except Exception as e:
+            self._record_advisor_error(turn, e, start_time=start_time)
+            yield {"type": "error", "error": str(e)}
 
     def get_status_data(self) -> dict:
         """Get raw status data for embedding without LLM processing.
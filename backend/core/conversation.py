@@ -3,8 +3,9 @@
 Provides sliding-window conversation memory with per-session isolation,
 automatic timeout handling, and prompt building for the LLM advisor.
 
-The design is intentionally simple: each turn re-injects the full briefing,
-and only recent chat history is retained for follow-up context. This avoids
+The design is intentionally simple: each turn re-injects the briefing (sliced
+to the question by the caller), and only recent chat history is retained for
+follow-up context. This avoids
 unbounded context growth while supporting conversational continuity.
 """
 
@@ -153,6 +154,14 @@ class ConversationManager:
             session.last_active = self._now()
             return session
 
+    def has_recent_history(self, session_key: str, *, game_date: str | None) -> bool:
+        """True if the next prompt for this session would include earlier turns."""
+        with self._lock:
+            session = self._sessions.get(session_key)
+            if not session or not session.history:
+                return False
+            return not self._is_expired(session, current_game_date=game_date)
+
     def clear(self, session_key: str) -> None:
         """Remove a session and its history.
 
@@ -175,11 +184,46 @@ class ConversationManager:
     ) -> str:
         """Build the full prompt for the LLM including context and history.
 
-        Assembles a prompt containing:
+        This is ``build_prompt_parts`` joined into one string; see there for the
+        layout and arguments.
+
+        Returns:
+            The assembled prompt string ready for LLM input.
+        """
+        prefix, turn = self.build_prompt_parts(
+            session_key=session_key,
+            briefing_json=briefing_json,
+            game_date=game_date,
+            question=question,
+            data_note=data_note,
+            history_context=history_context,
+            long_term_summary=long_term_summary,
+        )
+        return f"{prefix}\n\n{turn}"
+
+    def build_prompt_parts(
+        self,
+        *,
+        session_key: str,
+        briefing_json: str,
+        game_date: str | None,
+        question: str,
+        data_note: str | None = None,
+        history_context: str | None = None,
+        long_term_summary: str | None = None,
+        briefing_note: str | None = None,
+        briefing_extra_json: str | None = None,
+    ) -> tuple[str, str]:
+        """Build the prompt as (stable prefix, per-turn part).
+
+        The prefix is only the current empire state as JSON briefing, so it is
+        byte-identical across turns until the briefing changes (which lets the
+        provider cache it). The per-turn part contains:
+        - Optional briefing sections only this question needs (JSON)
+        - Optional briefing note (sections left out of the JSON for this question)
         - Optional data note (warnings about data quality)
         - Game date change notification if date progressed
-        - Current empire state as JSON briefing
-        - Optional history context for trend questions
+        - Optional save memory and history context for trend questions
         - Recent conversation turns (sliding window)
         - The current user question
 
@@ -190,14 +234,28 @@ class ConversationManager:
             question: The user's current question.
             data_note: Optional warning about data quality/freshness.
             history_context: Optional historical data for trend analysis.
+            briefing_note: Optional line about what the briefing JSON leaves out.
+            briefing_extra_json: Optional JSON object with further sections for this
+                question (kept out of the prefix so it stays the same across questions).
 
         Returns:
-            The assembled prompt string ready for LLM input.
+            (prefix, turn) strings; the full prompt is prefix + blank line + turn.
         """
         session = self._get_or_create(session_key, current_game_date=game_date)
 
+        header = f"EMPIRE STATE ({game_date}):" if game_date else "EMPIRE STATE (date unknown):"
+        prefix = "\n".join([header, "```json", briefing_json, "```"])
+
         lines: list[str] = []
 
+        if briefing_extra_json:
+            lines.append("MORE EMPIRE STATE FOR THIS QUESTION:")
+            lines.extend(["```json", briefing_extra_json, "```", ""])
+
+        if briefing_note:
+            lines.append(f"[{briefing_note}]")
+            lines.append("")
+
         if data_note:
             lines.append(f"[Data note: {data_note}]")
             lines.append("")
@@ -206,15 +264,6 @@ class ConversationManager:
             lines.append(f"[Game updated: {session.last_game_date} → {game_date}]")
             lines.append("")
 
-        if game_date:
-            lines.append(f"EMPIRE STATE ({game_date}):")
-        else:
-            lines.append("EMPIRE STATE (date unknown):")
-        lines.append("```json")
-        lines.append(briefing_json)
-        lines.append("```")
-        lines.append("")
-
         if long_term_summary:
             lines.append("SAVE MEMORY (key goals and prior commitments):")
             lines.append(long_term_summary[: self.max_summary_chars])
@@ -254,7 +303,7 @@ class ConversationManager:
         lines.append("CURRENT QUESTION:")
         lines.append(question)
 
-        return "\n".join(lines).strip()
+        return prefix, "\n".join(lines).strip()
 
     def record_turn(
         self,
@@ -8,26 +8,135 @@ from __future__ import annotations
 
 import contextlib
 import json
+import logging
 import os
+import queue
 import sqlite3
 import threading
+import time
 import uuid
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from backend.core.blob_codec import decode_json_blob, decode_json_columns, encode_json_blob
+from backend.core.db_maintenance import MaintenanceScheduler
 from backend.core.events import compute_events
+from backend.core.json_patch import apply_json_patch, json_diff
 from backend.core.json_utils import json_dumps
+from backend.core.metrics_timeline import TIMELINE_METRICS
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_DB_FILENAME = "stellaris_history.db"
 ENV_DB_PATH = "STELLARIS_DB_PATH"
+ENV_SEARCH_INDEX = "STELLARIS_SEARCH_INDEX"
+SEARCH_INDEX_DIRNAME = "search_index"
 
 # Default DB retention (no user-facing knobs).
 # Keep the earliest full briefing (baseline). The latest briefing is stored on the session row
 # (see `sessions.latest_briefing_json`) to avoid writing a large JSON blob per snapshot.
 DEFAULT_KEEP_FULL_BRIEFINGS_RECENT = 0
 
+# Per-snapshot event state is stored as a keyframe every N snapshots (or when a
+# delta would not be much smaller) and as a JSON patch against the previous
+# snapshot otherwise. Recent reconstructions are kept in an LRU cache.
+EVENT_STATE_KEYFRAME_INTERVAL = 32
+EVENT_STATE_CACHE_SIZE = 64
+
+# Write-behind queue (see GameDatabase.submit_write): producers block once this
+# many jobs are pending, and the writer commits up to WRITE_GROUP_MAX jobs per
+# transaction.
+WRITE_QUEUE_MAXSIZE = 64
+WRITE_GROUP_MAX = 32
+
+# Idle read-only connections kept open for concurrent readers (more are opened
+# on demand under load and closed when returned).
+READ_POOL_SIZE = 4
+
+# Recompute the materialized per-session counters from the snapshot/event rows.
+# Used by the schema 12 backfill and refresh_session_stats(); normal writes keep
+# the counters current incrementally.
+_SESSION_STATS_RECOUNT_SQL = """
+    UPDATE sessions
+    SET
+        snapshot_count = (SELECT COUNT(*) FROM snapshots WHERE session_id = sessions.id),
+        event_count = (SELECT COUNT(*) FROM events WHERE session_id = sessions.id),
+        first_snapshot_game_date = (
+            SELECT MIN(game_date) FROM snapshots WHERE session_id = sessions.id
+        ),
+        last_snapshot_game_date = (
+            SELECT MAX(game_date) FROM snapshots WHERE session_id = sessions.id
+        )
+"""
+
+# Snapshot columns that also seed the metrics timeline when a briefing lacks them.
+_SNAPSHOT_METRIC_COLUMNS = (
+    "military_power",
+    "colony_count",
+    "wars_count",
+    "energy_net",
+    "alloys_net",
+)
+# Metric rollups (metric_rollups table) kept per session at these resolutions.
+# get_metric_trend() assumes about this many snapshots per in-game year when
+# deciding whether raw snapshots fit the point budget (monthly autosaves).
+ROLLUP_RESOLUTIONS = ("year", "decade")
+ROLLUP_SNAPSHOTS_PER_YEAR = 12
+_ROLLUP_UPSERT_SQL = """
+    INSERT INTO metric_rollups (
+        session_id, resolution, period, metric,
+        samples, min_value, max_value, sum_value, last_value, last_game_date
+    )
+    VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?, ?)
+    ON CONFLICT(session_id, resolution, metric, period) DO UPDATE SET
+        samples = samples + 1,
+        min_value = min(min_value, excluded.min_value),
+        max_value = max(max_value, excluded.max_value),
+        sum_value = sum_value + excluded.sum_value,
+        last_value = CASE
+            WHEN excluded.last_game_date >= last_game_date THEN excluded.last_value
+            ELSE last_value
+        END,
+        last_game_date = max(last_game_date, excluded.last_game_date);
+"""
+# snapshot_metrics columns as created by schema 13. Frozen so the migration and its
+# rollup backfill (schema 14) stay fixed when TIMELINE_METRICS changes: a new metric
+# needs its own ALTER TABLE migration, and init_schema() checks TIMELINE_METRICS
+# against the table.
+_TIMELINE_COLUMNS_V13 = (
+    "military_power",
+    "military_fleets",
+    "military_ships",
+    "fleet_size",
+    "victory_rank",
+    "wars_count",
+    "economy_power",
+    "tech_power",
+    "colony_count",
+    "total_population",
+    "celestial_bodies",
+    "total_pops",
+    "tech_count",
+    "research_total",
+    "energy_net",
+    "minerals_net",
+    "food_net",
+    "consumer_goods_net",
+    "alloys_net",
+    "unity_net",
+    "influence_net",
+    "physics_research_net",
+    "society_research_net",
+    "engineering_research_net",
+    "exotic_gases_net",
+    "rare_crystals_net",
+    "volatile_motes_net",
+)
+
 
 @dataclass(frozen=True)
 class DatabaseConfig:
@@ -44,6 +153,149 @@ def resolve_db_path(db_path: str | Path | None = None) -> Path:
     return Path(db_path).expanduser()
 
 
+def resolve_search_index_dir(db_path: str | Path | None = None) -> Path | None:
+    """Directory for cached gamestate search indexes (next to the DB), if enabled.
+
+    Opt-in via STELLARIS_SEARCH_INDEX; None when disabled or the DB is in-memory.
+    """
+    if os.environ.get(ENV_SEARCH_INDEX, "").strip().lower() not in ("1", "true", "yes", "on"):
+        return None
+    path = resolve_db_path(db_path)
+    if path == Path(":memory:"):
+        return None
+    return path.parent / SEARCH_INDEX_DIRNAME
+
+
+def _game_year(game_date: str | None) -> int | None:
+    """Year of a Stellaris game date ("2250.03.01" -> 2250)."""
+    if not isinstance(game_date, str):
+        return None
+    try:
+        return int(game_date.split(".", 1)[0])
+    except ValueError:
+        return None
+
+
+def _metric_scope(*, session_id: str | None, save_id: str | None) -> tuple[str, tuple[str]]:
+    """WHERE clause selecting timeline/rollup rows for a session or a whole save."""
+    if session_id is not None:
+        return "session_id = ?", (session_id,)
+    if save_id is not None:
+        return "session_id IN (SELECT id FROM sessions WHERE save_id = ?)", (save_id,)
+    raise ValueError("session_id or save_id is required")
+
+
+def _merge_points(points: list[dict[str, Any]], budget: int) -> list[dict[str, Any]]:
+    """Merge runs of adjacent trend points so at most ``budget`` remain."""
+    if len(points) <= budget:
+        return points
+    size = -(-len(points) // budget)
+    merged = []
+    for start in range(0, len(points), size):
+        run = points[start : start + size]
+        samples = sum(p["samples"] for p in run)
+        merged.append(
+            {
+                "period": run[0]["period"],
+                "game_date": run[-1]["game_date"],
+                "value": sum(p["value"] * p["samples"] for p in run) / samples,
+                "min": min(p["min"] for p in run),
+                "max": max(p["max"] for p in run),
+                "last": run[-1]["last"],
+                "samples": samples,
+            }
+        )
+    return merged
+
+
+def _rollup_backfill_sql(resolution: str, metric: str) -> str:
+    """Aggregate existing timeline rows into metric_rollups for one metric."""
+    year = "CAST(substr(game_date, 1, instr(game_date, '.') - 1) AS INTEGER)"
+    period = year if resolution == "year" else f"({year} / 10) * 10"
+    return f"""
+        INSERT OR REPLACE INTO metric_rollups (
+            session_id, resolution, period, metric,
+            samples, min_value, max_value, sum_value, last_value, last_game_date
+        )
+        SELECT
+            session_id, '{resolution}', period, '{metric}',
+            COUNT(*), MIN(v), MAX(v), SUM(v), MAX(CASE WHEN rn = 1 THEN v END), MAX(game_date)
+        FROM (
+            SELECT
+                session_id,
+                game_date,
+                {period} AS period,
+                {metric} AS v,
+                ROW_NUMBER() OVER (
+                    PARTITION BY session_id, {period}
+                    ORDER BY game_date DESC, snapshot_id DESC
+                ) AS rn
+            FROM snapshot_metrics
+            WHERE {metric} IS NOT NULL AND instr(COALESCE(game_date, ''), '.') > 1
+        )
+        GROUP BY session_id, period;
+    """
+
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO events (
+        session_id, captured_at, game_date, event_type, summary, data_json,
+        from_snapshot_id, to_snapshot_id
+    )
+    VALUES (?, COALESCE(?, strftime('%s','now')), ?, ?, ?, ?, ?, ?);
+"""
+
+
+def _event_row(
+    session_id: str,
+    captured_at: int | None,
+    game_date: str | None,
+    event_type: str,
+    summary: str,
+    data: dict[str, Any] | None,
+) -> tuple[Any, ...]:
+    """Parameters for _INSERT_EVENT_SQL."""
+    data = data or {}
+    return (
+        session_id,
+        int(captured_at) if captured_at is not None else None,
+        game_date,
+        event_type,
+        summary,
+        json_dumps(data),
+        _snapshot_link(data, "from_snapshot_id"),
+        _snapshot_link(data, "to_snapshot_id"),
+    )
+
+
+def _json_object(value: Any) -> dict[str, Any] | None:
+    """Decode a stored JSON column to a dict (None if missing, invalid or not an object)."""
+    try:
+        parsed = json.loads(decode_json_blob(value) or "null")
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _snapshot_link(data: dict[str, Any], key: str) -> int | None:
+    """Snapshot id stored under ``key`` in an event's data, as an int (or None)."""
+    value = data.get(key)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class _WriteJob:
+    __slots__ = ("fn", "args", "kwargs", "future")
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: dict[str, Any]):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+
+
 class GameDatabase:
     """SQLite wrapper for game history storage (sessions/snapshots/events)."""
 
@@ -53,6 +305,32 @@ class GameDatabase:
             self.path.parent.mkdir(parents=True, exist_ok=True)
 
         self._lock = threading.RLock()
+        # snapshot_id -> (event state, patches since its keyframe); treat as read-only.
+        self._event_state_cache: OrderedDict[int, tuple[dict[str, Any], int]] = OrderedDict()
+        self._event_state_cache_lock = threading.Lock()
+        # Pooled read-only connections (see _read()); enabled once the schema is ready.
+        self._local = threading.local()
+        self._read_pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._read_conns: list[sqlite3.Connection] = []
+        self._read_conns_lock = threading.Lock()
+        self._read_pool_enabled = False
+        # Idle-time maintenance (see start_maintenance()); idleness is measured from
+        # the last committed write.
+        self._maintenance: MaintenanceScheduler | None = None
+        self._last_write_at = time.monotonic()
+        # Write-behind queue; the writer thread starts on the first submit_write().
+        self._write_queue: queue.Queue[_WriteJob | None] = queue.Queue(WRITE_QUEUE_MAXSIZE)
+        self._writer: threading.Thread | None = None
+        self._writer_start_lock = threading.Lock()
+        self._write_stats_lock = threading.Lock()  # Not the DB lock: readable mid-commit
+        self._write_stats = {
+            "commits": 0,
+            "jobs": 0,
+            "failed_jobs": 0,
+            "last_commit_ms": None,
+            "max_commit_ms": None,
+            "total_commit_ms": 0.0,
+        }
         self._conn = sqlite3.connect(
             str(self.path),
             check_same_thread=False,
@@ -61,18 +339,67 @@ class GameDatabase:
         self._conn.row_factory = sqlite3.Row
         self._configure_connection()
         self.init_schema()
+        self._read_pool_enabled = self.path != Path(":memory:")
 
     def close(self) -> None:
+        if self._maintenance is not None:
+            self._maintenance.stop()
+        self._stop_writer()
+        self._read_pool_enabled = False
+        with self._read_conns_lock:
+            read_conns, self._read_conns = self._read_conns, []
+        for conn in read_conns:
+            conn.close()
         with self._lock:
             self._conn.close()
 
     def _configure_connection(self) -> None:
         with self._lock:
             self._conn.execute("PRAGMA foreign_keys = ON;")
+            # Only takes effect for a new (empty) DB; older files are converted once on
+            # request (see enable_incremental_vacuum()).
+            self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
             self._conn.execute("PRAGMA journal_mode = WAL;")
             self._conn.execute("PRAGMA synchronous = NORMAL;")
             self._conn.execute("PRAGMA busy_timeout = 5000;")
 
+    @contextlib.contextmanager
+    def _read(self):
+        """Connection for read-only queries.
+
+        Reads use a pooled read-only connection, so in WAL mode they run
+        alongside each other and alongside the writer, and see the last
+        committed state. Inside a write transaction on this thread (and for
+        in-memory DBs) they use the primary connection to see pending writes.
+        """
+        if not self._read_pool_enabled or getattr(self._local, "write_depth", 0):
+            with self._lock:
+                yield self._conn
+            return
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_read_connection()
+        try:
+            yield conn
+        finally:
+            if self._read_pool_enabled and self._read_pool.qsize() < READ_POOL_SIZE:
+                self._read_pool.put(conn)
+            else:
+                with self._read_conns_lock:
+                    if conn in self._read_conns:
+                        self._read_conns.remove(conn)
+                conn.close()
+
+    def _open_read_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON;")
+        conn.execute("PRAGMA busy_timeout = 5000;")
+        with self._read_conns_lock:
+            self._read_conns.append(conn)
+        return conn
+
     def execute(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Cursor:
         with self._lock:
             return self._conn.execute(sql, tuple(params))
@@ -85,6 +412,146 @@ class GameDatabase:
         with self._lock:
             self._conn.commit()
 
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Run a group of writes atomically.
+
+        Inside an open transaction this is a savepoint, so a failure only undoes
+        this group and leaves the caller's transaction usable.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                begin, commit = "SAVEPOINT txn;", "RELEASE txn;"
+                rollback = ("ROLLBACK TO txn;", "RELEASE txn;")
+            else:
+                begin, commit, rollback = "BEGIN;", "COMMIT;", ("ROLLBACK;",)
+            self._conn.execute(begin)
+            self._local.write_depth = getattr(self._local, "write_depth", 0) + 1
+            try:
+                yield
+            except BaseException:
+                for sql in rollback:
+                    self._conn.execute(sql)
+                # States cached by the rolled-back writes may name reused row ids.
+                with self._event_state_cache_lock:
+                    self._event_state_cache.clear()
+                raise
+            finally:
+                self._local.write_depth -= 1
+            self._conn.execute(commit)
+            self._last_write_at = time.monotonic()
+
+    # --- Write-behind queue ---
+
+    def submit_write(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Queue ``fn(*args, **kwargs)`` to run on the writer thread.
+
+        Jobs queued together are group-committed in one transaction (each in its
+        own savepoint, so a failing job does not undo the others). The returned
+        future resolves once the job's writes are committed. Jobs run with the DB
+        lock held and must only touch this database. Blocks while the queue is full.
+        """
+        job = _WriteJob(fn, args, kwargs)
+        self._ensure_writer()
+        self._write_queue.put(job)
+        return job.future
+
+    def flush_writes(self, timeout: float | None = None) -> bool:
+        """Wait until every write queued so far is committed."""
+        if self._writer is None:
+            return True
+        try:
+            self.submit_write(lambda: None).result(timeout=timeout)
+        except Exception:
+            return False
+        return True
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_start_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="db-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _stop_writer(self) -> None:
+        with self._writer_start_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+
+    def _writer_loop(self) -> None:
+        while True:
+            job = self._write_queue.get()
+            if job is None:
+                return
+            group = [job]
+            stop = False
+            while len(group) < WRITE_GROUP_MAX:
+                try:
+                    job = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                group.append(job)
+            self._commit_group(group)
+            if stop:
+                return
+
+    def _commit_group(self, group: list[_WriteJob]) -> None:
+        started = time.perf_counter()
+        results: list[tuple[bool, Any]] = []
+        try:
+            with self._transaction():
+                for job in group:
+                    try:
+                        with self._transaction():
+                            results.append((True, job.fn(*job.args, **job.kwargs)))
+                    except Exception as e:
+                        results.append((False, e))
+        except Exception as e:
+            logger.warning("db_write_group_failed jobs=%d error=%s", len(group), e)
+            results = [(False, e)] * len(group)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        failed = sum(1 for ok, _ in results if not ok)
+        with self._write_stats_lock:
+            stats = self._write_stats
+            stats["commits"] += 1
+            stats["jobs"] += len(group)
+            stats["failed_jobs"] += failed
+            stats["last_commit_ms"] = round(elapsed_ms, 2)
+            stats["max_commit_ms"] = round(max(stats["max_commit_ms"] or 0.0, elapsed_ms), 2)
+            stats["total_commit_ms"] += elapsed_ms
+
+        # Resolve only after COMMIT so waiters always see their writes.
+        for job, (ok, value) in zip(group, results, strict=True):
+            if ok:
+                job.future.set_result(value)
+            else:
+                job.future.set_exception(value)
+        with contextlib.suppress(Exception):
+            self.maybe_checkpoint_wal()
+
+    def get_write_stats(self) -> dict[str, Any]:
+        """Writer queue depth and group-commit latency."""
+        with self._write_stats_lock:
+            stats = dict(self._write_stats)
+        commits = stats.pop("commits")
+        total_ms = stats.pop("total_commit_ms")
+        return {
+            "queue_depth": self._write_queue.qsize(),
+            "running": self._writer is not None,
+            "commits": commits,
+            **stats,
+            "avg_commit_ms": round(total_ms / commits, 2) if commits else None,
+        }
+
     def get_schema_version(self) -> int:
         with self._lock:
             row = self._conn.execute("SELECT version FROM schema_version LIMIT 1;").fetchone()
@@ -282,12 +749,103 @@ class GameDatabase:
                 "ALTER TABLE advisor_memory_new RENAME TO advisor_memory;",
                 "CREATE INDEX IF NOT EXISTS idx_advisor_memory_updated ON advisor_memory(updated_at);",
             ],
+            10: [
+                # Promote the event -> snapshot linkage out of data_json so snapshot-range
+                # queries (chronicle chapters, source material) are index seeks.
+                "ALTER TABLE events ADD COLUMN from_snapshot_id INTEGER;",
+                "ALTER TABLE events ADD COLUMN to_snapshot_id INTEGER;",
+                """
+                UPDATE events
+                SET
+                    from_snapshot_id = CAST(json_extract(data_json, '$.from_snapshot_id') AS INTEGER),
+                    to_snapshot_id = CAST(json_extract(data_json, '$.to_snapshot_id') AS INTEGER)
+                WHERE json_valid(data_json);
+                """,
+                "CREATE INDEX IF NOT EXISTS idx_events_session_to_snapshot ON events(session_id, to_snapshot_id, captured_at);",
+            ],
+            11: [
+                # Delta-encoded event state: when set, event_state_json holds JSON patch ops
+                # against this (earlier) snapshot's event state instead of a full keyframe.
+                "ALTER TABLE snapshots ADD COLUMN event_state_base_id INTEGER;",
+            ],
+            12: [
+                # Materialized per-session stats so session lists do not aggregate snapshots.
+                "ALTER TABLE sessions ADD COLUMN snapshot_count INTEGER NOT NULL DEFAULT 0;",
+                "ALTER TABLE sessions ADD COLUMN event_count INTEGER NOT NULL DEFAULT 0;",
+                "ALTER TABLE sessions ADD COLUMN first_snapshot_game_date TEXT;",
+                "ALTER TABLE sessions ADD COLUMN last_snapshot_game_date TEXT;",
+                _SESSION_STATS_RECOUNT_SQL + ";",
+            ],
+            13: [
+                # Wide metrics timeline: one row per snapshot (see backend.core.metrics_timeline).
+                f"""
+                CREATE TABLE IF NOT EXISTS snapshot_metrics (
+                    snapshot_id INTEGER PRIMARY KEY
+                        REFERENCES snapshots(id) ON DELETE CASCADE,
+                    session_id TEXT NOT NULL,
+                    game_date TEXT,
+                    {", ".join(f"{name} REAL" for name in _TIMELINE_COLUMNS_V13)}
+                );
+                """,
+                "CREATE INDEX IF NOT EXISTS idx_snapshot_metrics_session_date "
+                "ON snapshot_metrics(session_id, game_date);",
+                # Older snapshots only have the five snapshot columns to offer.
+                f"""
+                INSERT OR IGNORE INTO snapshot_metrics (
+                    snapshot_id, session_id, game_date, {", ".join(_SNAPSHOT_METRIC_COLUMNS)}
+                )
+                SELECT id, session_id, game_date, {", ".join(_SNAPSHOT_METRIC_COLUMNS)}
+                FROM snapshots;
+                """,
+            ],
+            14: [
+                # Per-year/per-decade aggregates of the metrics timeline (get_metric_trend).
+                """
+                CREATE TABLE IF NOT EXISTS metric_rollups (
+                    session_id TEXT NOT NULL,
+                    resolution TEXT NOT NULL,
+                    period INTEGER NOT NULL,
+                    metric TEXT NOT NULL,
+                    samples INTEGER NOT NULL,
+                    min_value REAL,
+                    max_value REAL,
+                    sum_value REAL,
+                    last_value REAL,
+                    last_game_date TEXT,
+                    PRIMARY KEY (session_id, resolution, metric, period)
+                ) WITHOUT ROWID;
+                """,
+                *(
+                    _rollup_backfill_sql(resolution, metric)
+                    for resolution in ROLLUP_RESOLUTIONS
+                    for metric in _TIMELINE_COLUMNS_V13
+                ),
+            ],
+            15: [
+                # Advisor answers for repeated questions on an unchanged save (see
+                # get_cached_answer). Cleared for a save whenever it gets a new snapshot.
+                """
+                CREATE TABLE IF NOT EXISTS answer_cache (
+                    save_id TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    question_key TEXT NOT NULL,
+                    save_hash TEXT NOT NULL,
+                    prompt_key TEXT NOT NULL,
+                    answer TEXT NOT NULL,
+                    game_date TEXT,
+                    response_ms REAL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    created_at INTEGER NOT NULL,
+                    last_hit_at INTEGER,
+                    PRIMARY KEY (save_id, language, model, question_key)
+                ) WITHOUT ROWID;
+                """,
+            ],
         }
 
         current = self.get_schema_version()
         target = max(migrations.keys(), default=0)
-        if current >= target:
-            return
 
         for next_version in range(current + 1, target + 1):
             statements = migrations.get(next_version)
@@ -304,11 +862,24 @@ class GameDatabase:
                     self._conn.execute("ROLLBACK;")
                     raise
 
+        self._check_timeline_columns()
+
+    def _check_timeline_columns(self) -> None:
+        """Fail fast if TIMELINE_METRICS names a column snapshot_metrics lacks."""
+        with self._lock:
+            rows = self._conn.execute("PRAGMA table_info(snapshot_metrics);").fetchall()
+        missing = set(TIMELINE_METRICS) - {row["name"] for row in rows}
+        if missing:
+            raise RuntimeError(
+                "snapshot_metrics is missing timeline columns "
+                f"{sorted(missing)}; add a schema migration for new TIMELINE_METRICS"
+            )
+
     # --- Phase 3 Milestone 1: sessions + snapshot writes ---
 
     def get_active_session_id(self, save_id: str) -> str | None:
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT id
                 FROM sessions
@@ -389,13 +960,15 @@ class GameDatabase:
         self,
         *,
         session_id: str,
-        latest_briefing_json: str,
+        latest_briefing_json: str | bytes,
         last_game_date: str | None = None,
     ) -> None:
         """Persist the latest full briefing JSON for a session (single row overwrite).
 
         This is used as the primary persistence mechanism for precomputed ask mode
         across restarts, without storing a large blob on every snapshot row.
+
+        The briefing (str or UTF-8 bytes) is stored through the blob codec.
         """
         with self._lock:
             self._conn.execute(
@@ -407,12 +980,12 @@ class GameDatabase:
                     last_updated_at = strftime('%s','now')
                 WHERE id = ?;
                 """,
-                (latest_briefing_json, last_game_date, session_id),
+                (encode_json_blob(latest_briefing_json), last_game_date, session_id),
             )
 
     def get_session_advisor_custom(self, *, session_id: str) -> str | None:
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT advisor_custom_instructions
                 FROM sessions
@@ -473,7 +1046,7 @@ class GameDatabase:
                     last_updated_at = strftime('%s','now')
                 WHERE id = ?;
                 """,
-                (str(latest_json), row["game_date"], session_id),
+                (latest_json, row["game_date"], session_id),  # Already codec-encoded
             )
             return True
 
@@ -503,8 +1076,8 @@ class GameDatabase:
 
     def get_latest_session_briefing_json(self, *, session_id: str) -> str | None:
         """Return the latest full briefing JSON stored on the session row."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT latest_briefing_json
                 FROM sessions
@@ -515,13 +1088,13 @@ class GameDatabase:
             ).fetchone()
             if not row:
                 return None
-            value = row["latest_briefing_json"]
-            return str(value) if value else None
+            value = decode_json_blob(row["latest_briefing_json"])
+            return value or None
 
     def get_latest_session_briefing_json_any(self) -> str | None:
         """Return the latest full briefing JSON across all sessions (best-effort)."""
-        with self._lock:
-            row = self._conn.execute("""
+        with self._read() as conn:
+            row = conn.execute("""
                 SELECT latest_briefing_json
                 FROM sessions
                 WHERE latest_briefing_json IS NOT NULL AND latest_briefing_json != ''
@@ -530,12 +1103,12 @@ class GameDatabase:
                 """).fetchone()
             if not row:
                 return None
-            value = row["latest_briefing_json"]
-            return str(value) if value else None
+            value = decode_json_blob(row["latest_briefing_json"])
+            return value or None
 
     def get_latest_snapshot_identity(self, session_id: str) -> dict[str, Any] | None:
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT id, captured_at, game_date, save_hash
                 FROM snapshots
@@ -549,8 +1122,8 @@ class GameDatabase:
 
     def get_latest_snapshot_full_briefing_json(self, *, session_id: str) -> str | None:
         """Return the most recent snapshot JSON for a session (newest-first)."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT full_briefing_json
                 FROM snapshots
@@ -562,13 +1135,13 @@ class GameDatabase:
             ).fetchone()
             if not row:
                 return None
-            value = row["full_briefing_json"]
-            return str(value) if value else None
+            value = decode_json_blob(row["full_briefing_json"])
+            return value or None
 
     def get_latest_snapshot_full_briefing_json_any(self) -> str | None:
         """Return the most recent snapshot JSON across all sessions."""
-        with self._lock:
-            row = self._conn.execute("""
+        with self._read() as conn:
+            row = conn.execute("""
                 SELECT full_briefing_json
                 FROM snapshots
                 WHERE full_briefing_json IS NOT NULL AND full_briefing_json != ''
@@ -577,8 +1150,8 @@ class GameDatabase:
                 """).fetchone()
             if not row:
                 return None
-            value = row["full_briefing_json"]
-            return str(value) if value else None
+            value = decode_json_blob(row["full_briefing_json"])
+            return value or None
 
     def insert_snapshot(
         self,
@@ -591,10 +1164,20 @@ class GameDatabase:
         wars_count: int | None,
         energy_net: float | None,
         alloys_net: float | None,
-        full_briefing_json: str | None,
+        full_briefing_json: str | bytes | None,
         event_state_json: str | None,
+        metrics: dict[str, float | None] | None = None,
     ) -> int:
-        with self._lock:
+        """Insert a snapshot row; JSON columns (str or UTF-8 bytes) go through the blob codec.
+
+        ``event_state_json`` is the full state; it is stored as a delta against the
+        session's previous snapshot when that is worthwhile (see get_snapshot_event_state).
+        ``metrics`` (from extract_timeline_metrics) fills the snapshot's timeline row.
+        """
+        with self._transaction():
+            state, stored_state, base_id, depth = self._encode_event_state(
+                session_id, event_state_json
+            )
             cur = self._conn.execute(
                 """
                 INSERT INTO snapshots (
@@ -607,9 +1190,10 @@ class GameDatabase:
                     energy_net,
                     alloys_net,
                     full_briefing_json,
-                    event_state_json
+                    event_state_json,
+                    event_state_base_id
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
                 """,
                 (
                     session_id,
@@ -620,11 +1204,168 @@ class GameDatabase:
                     wars_count,
                     energy_net,
                     alloys_net,
-                    full_briefing_json,
-                    event_state_json,
+                    encode_json_blob(full_briefing_json),
+                    encode_json_blob(stored_state),
+                    base_id,
                 ),
             )
-            return int(cur.lastrowid)
+            snapshot_id = int(cur.lastrowid)
+            timeline = {name: (metrics or {}).get(name) for name in TIMELINE_METRICS}
+            for name, value in zip(
+                _SNAPSHOT_METRIC_COLUMNS,
+                (military_power, colony_count, wars_count, energy_net, alloys_net),
+                strict=True,
+            ):
+                if timeline[name] is None:
+                    timeline[name] = value
+            self._conn.execute(
+                f"""
+                INSERT INTO snapshot_metrics (snapshot_id, session_id, game_date, {", ".join(timeline)})
+                VALUES (?, ?, ?{", ?" * len(timeline)});
+                """,
+                (snapshot_id, session_id, game_date, *timeline.values()),
+            )
+            year = _game_year(game_date)
+            if year is not None:
+                self._conn.executemany(
+                    _ROLLUP_UPSERT_SQL,
+                    [
+                        (
+                            session_id,
+                            resolution,
+                            period,
+                            name,
+                            value,
+                            value,
+                            value,
+                            value,
+                            game_date,
+                        )
+                        for resolution, period in (("year", year), ("decade", year - year % 10))
+                        for name, value in timeline.items()
+                        if value is not None
+                    ],
+                )
+            self._conn.execute(
+                """
+                UPDATE sessions
+                SET
+                    snapshot_count = snapshot_count + 1,
+                    first_snapshot_game_date = COALESCE(
+                        min(first_snapshot_game_date, ?), first_snapshot_game_date, ?
+                    ),
+                    last_snapshot_game_date = COALESCE(
+                        max(last_snapshot_game_date, ?), last_snapshot_game_date, ?
+                    )
+                WHERE id = ?;
+                """,
+                (game_date, game_date, game_date, game_date, session_id),
+            )
+            # Cached advisor answers describe the previous state of this save.
+            self._conn.execute(
+                """
+                DELETE FROM answer_cache
+                WHERE save_id = (SELECT save_id FROM sessions WHERE id = ?);
+                """,
+                (session_id,),
+            )
+        if state is not None:
+            self._cache_event_state(snapshot_id, state, depth)
+        return snapshot_id
+
+    def _encode_event_state(
+        self, session_id: str, event_state_json: str | None
+    ) -> tuple[dict[str, Any] | None, str | None, int | None, int]:
+        """Pick keyframe or delta storage for a new snapshot's event state.
+
+        Returns (parsed state, value to store, base snapshot id or None, chain depth).
+        """
+        if not event_state_json:
+            return None, event_state_json, None, 0
+        try:
+            state = json.loads(event_state_json)
+        except (TypeError, ValueError):
+            state = None
+        if not isinstance(state, dict):
+            return None, event_state_json, None, 0
+
+        prev = self._conn.execute(
+            "SELECT id FROM snapshots WHERE session_id = ? ORDER BY id DESC LIMIT 1;",
+            (session_id,),
+        ).fetchone()
+        if prev is not None:
+            base_state, base_depth = self._load_event_state(int(prev["id"]))
+            if base_state is not None and base_depth + 1 < EVENT_STATE_KEYFRAME_INTERVAL:
+                patch_json = json_dumps(json_diff(base_state, state))
+                if len(patch_json) * 2 < len(event_state_json):
+                    return state, patch_json, int(prev["id"]), base_depth + 1
+        return state, event_state_json, None, 0
+
+    def _cache_event_state(self, snapshot_id: int, state: dict[str, Any], depth: int) -> None:
+        with self._event_state_cache_lock:
+            cache = self._event_state_cache
+            cache[snapshot_id] = (state, depth)
+            cache.move_to_end(snapshot_id)
+            while len(cache) > EVENT_STATE_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _cached_event_state(self, snapshot_id: int) -> tuple[dict[str, Any], int] | None:
+        with self._event_state_cache_lock:
+            cached = self._event_state_cache.get(snapshot_id)
+            if cached is not None:
+                self._event_state_cache.move_to_end(snapshot_id)
+            return cached
+
+    def _load_event_state(self, snapshot_id: int) -> tuple[dict[str, Any] | None, int]:
+        """Reconstruct a snapshot's event state: nearest keyframe/cached state + patches."""
+        with self._read() as conn:
+            patches: list[tuple[int, list[dict[str, Any]]]] = []
+            current = int(snapshot_id)
+            state: Any = None
+            depth = 0
+            while True:
+                cached = self._cached_event_state(current)
+                if cached is not None:
+                    state, depth = cached
+                    break
+                row = conn.execute(
+                    "SELECT event_state_json, event_state_base_id FROM snapshots WHERE id = ?;",
+                    (current,),
+                ).fetchone()
+                if row is None:
+                    return None, 0
+                try:
+                    value = json.loads(decode_json_blob(row["event_state_json"]) or "null")
+                except ValueError:
+                    return None, 0
+                if row["event_state_base_id"] is None:
+                    if not isinstance(value, dict):
+                        return None, 0
+                    state = value
+                    self._cache_event_state(current, state, 0)
+                    break
+                if not isinstance(value, list) or len(patches) > EVENT_STATE_KEYFRAME_INTERVAL * 4:
+                    return None, 0
+                patches.append((current, value))
+                current = int(row["event_state_base_id"])
+
+            for patched_id, ops in reversed(patches):
+                state = apply_json_patch(state, ops)
+                depth += 1
+                self._cache_event_state(patched_id, state, depth)
+            return (state if isinstance(state, dict) else None), depth
+
+    def get_snapshot_event_state(self, snapshot_id: int) -> dict[str, Any] | None:
+        """Return a snapshot's (reconstructed) event state; the dict is shared, do not mutate."""
+        return self._load_event_state(int(snapshot_id))[0]
+
+    def _decode_snapshot_row(self, row: sqlite3.Row) -> dict[str, Any]:
+        """Row dict with JSON columns decoded and delta event state reconstructed."""
+        data = decode_json_columns(dict(row), "full_briefing_json", "event_state_json")
+        if data.pop("event_state_base_id", None) is not None:
+            state = self.get_snapshot_event_state(int(data["id"]))
+            data["event_state_json"] = json_dumps(state) if state is not None else None
+        return data
 
     def insert_snapshot_if_new(
         self,
@@ -637,8 +1378,9 @@ class GameDatabase:
         wars_count: int | None,
         energy_net: float | None,
         alloys_net: float | None,
-        full_briefing_json: str | None,
+        full_briefing_json: str | bytes | None,
         event_state_json: str | None,
+        metrics: dict[str, float | None] | None = None,
     ) -> tuple[bool, int | None]:
         latest = self.get_latest_snapshot_identity(session_id)
         if latest:
@@ -668,6 +1410,7 @@ class GameDatabase:
             alloys_net=alloys_net,
             full_briefing_json=baseline_full,
             event_state_json=event_state_json,
+            metrics=metrics,
         )
         self.update_session(session_id=session_id, last_game_date=game_date)
         return True, snapshot_id
@@ -800,6 +1543,9 @@ class GameDatabase:
 
         try:
             with self._lock:
+                if self._conn.in_transaction:
+                    # Cannot checkpoint mid-transaction; the writer retries after COMMIT.
+                    return False
                 self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
             return True
         except Exception:
@@ -808,7 +1554,7 @@ class GameDatabase:
     def get_db_stats(self) -> dict[str, Any]:
         """Return small DB stats for status reporting."""
         if self.path == Path(":memory:"):
-            return {"path": ":memory:", "bytes": 0}
+            return {"path": ":memory:", "bytes": 0, "writer": self.get_write_stats()}
         try:
             db_path = self.path
             sizes: dict[str, int] = {}
@@ -821,10 +1567,113 @@ class GameDatabase:
                     continue
                 sizes[suffix or "db"] = int(st.st_size)
                 total += int(st.st_size)
-            return {"path": str(db_path), "bytes": total, "files": sizes}
+            return {
+                "path": str(db_path),
+                "bytes": total,
+                "files": sizes,
+                "writer": self.get_write_stats(),
+                "maintenance": self.get_maintenance_stats(),
+            }
         except Exception:
             return {"path": str(self.path), "bytes": None}
 
+    # --- Maintenance ---
+
+    def start_maintenance(self, **kwargs: Any) -> MaintenanceScheduler:
+        """Start the idle-time maintenance thread (see backend.core.db_maintenance)."""
+        if self._maintenance is None:
+            self._maintenance = MaintenanceScheduler(self, **kwargs)
+        self._maintenance.start()
+        return self._maintenance
+
+    def get_maintenance_stats(self) -> dict[str, Any]:
+        """What the maintenance scheduler has done, plus current page counts."""
+        stats: dict[str, Any] = (
+            self._maintenance.get_stats() if self._maintenance is not None else {"running": False}
+        )
+        with contextlib.suppress(Exception):
+            stats["pages"] = self.get_page_stats()
+        return stats
+
+    def schedule_retention(self, *, session_id: str) -> None:
+        """Apply full-briefing retention to a session after it received a snapshot.
+
+        With the maintenance scheduler running this is deferred to the next idle
+        tick; otherwise retention and a WAL size check run inline.
+        """
+        if self._maintenance is not None and self._maintenance.running:
+            self._maintenance.mark_session(session_id)
+            return
+        self.enforce_full_briefing_retention(session_id=session_id)
+        self.maybe_checkpoint_wal()
+
+    def is_idle(self, idle_seconds: float) -> bool:
+        """True when no write is queued or open and none committed recently."""
+        if self._write_queue.qsize() or self._conn.in_transaction:
+            return False
+        return time.monotonic() - self._last_write_at >= idle_seconds
+
+    def get_session_ids_for_maintenance(self, *, limit: int = 500) -> list[str]:
+        """Most recently updated session ids (bounded, like the other all-session sweeps)."""
+        lim = max(1, min(int(limit), 5000))
+        with self._read() as conn:
+            rows = conn.execute(
+                """
+                SELECT id
+                FROM sessions
+                ORDER BY COALESCE(last_updated_at, started_at) DESC
+                LIMIT ?;
+                """,
+                (lim,),
+            ).fetchall()
+        return [str(r["id"]) for r in rows]
+
+    def get_page_stats(self) -> dict[str, Any]:
+        """Page size/count, free pages and the auto_vacuum mode of the main DB file."""
+        with self._read() as conn:
+            values = {
+                name: int(conn.execute(f"PRAGMA {name};").fetchone()[0])
+                for name in ("page_size", "page_count", "freelist_count", "auto_vacuum")
+            }
+        modes = {0: "none", 1: "full", 2: "incremental"}
+        values["auto_vacuum"] = modes.get(values["auto_vacuum"], str(values["auto_vacuum"]))
+        return values
+
+    def incremental_vacuum(self, *, max_pages: int) -> int:
+        """Return up to ``max_pages`` free pages to the filesystem; returns pages freed."""
+        with self._lock:
+            if self._conn.in_transaction:
+                return 0
+            before = int(self._conn.execute("PRAGMA freelist_count;").fetchone()[0])
+            # The pragma frees one page per step; executescript runs it to completion.
+            self._conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+            after = int(self._conn.execute("PRAGMA freelist_count;").fetchone()[0])
+        return max(0, before - after)
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch an existing DB to auto_vacuum=INCREMENTAL (rebuilds the file once).
+
+        The full VACUUM holds the DB lock for as long as the rebuild takes, so this
+        only runs when the user asks for it (POST /api/db/compact), never on a
+        maintenance tick.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                return False
+            try:
+                self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+                self._conn.execute("VACUUM;")
+            except sqlite3.Error as e:
+                logger.warning("db_vacuum_convert_failed error=%s", e)
+                return False
+            return int(self._conn.execute("PRAGMA auto_vacuum;").fetchone()[0]) == 2
+
+    def optimize(self) -> None:
+        """Let SQLite refresh query planner statistics where they are stale."""
+        with self._lock:
+            if not self._conn.in_transaction:
+                self._conn.execute("PRAGMA optimize;")
+
     def end_session(self, *, session_id: str, ended_at: int | None = None) -> None:
         """Mark a session as ended."""
         with self._lock:
@@ -868,16 +1717,19 @@ class GameDatabase:
             return session_ids
 
     def get_session_snapshot_stats(self, session_id: str) -> dict[str, Any]:
-        """Get basic snapshot stats for a session (count and date range)."""
-        with self._lock:
-            row = self._conn.execute(
+        """Get basic snapshot stats for a session (count and date range).
+
+        Reads the counters maintained by insert_snapshot(); see refresh_session_stats().
+        """
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT
-                    COUNT(*) AS snapshot_count,
-                    MIN(game_date) AS first_game_date,
-                    MAX(game_date) AS last_game_date
-                FROM snapshots
-                WHERE session_id = ?;
+                    snapshot_count,
+                    first_snapshot_game_date AS first_game_date,
+                    last_snapshot_game_date AS last_game_date
+                FROM sessions
+                WHERE id = ?;
                 """,
                 (session_id,),
             ).fetchone()
@@ -896,22 +1748,22 @@ class GameDatabase:
     # --- Phase 3 Milestone 3: events ---
 
     def get_snapshot_row(self, snapshot_id: int) -> dict[str, Any] | None:
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT id, session_id, captured_at, game_date, save_hash,
                        military_power, colony_count, wars_count, energy_net, alloys_net,
-                       full_briefing_json, event_state_json
+                       full_briefing_json, event_state_json, event_state_base_id
                 FROM snapshots
                 WHERE id = ?;
                 """,
                 (int(snapshot_id),),
             ).fetchone()
-            return dict(row) if row else None
+            return self._decode_snapshot_row(row) if row else None
 
     def get_previous_snapshot_id(self, *, session_id: str, before_snapshot_id: int) -> int | None:
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT id
                 FROM snapshots
@@ -933,25 +1785,17 @@ class GameDatabase:
     ) -> int:
         if not events:
             return 0
-        rows = []
-        for e in events:
-            rows.append(
-                (
-                    session_id,
-                    int(captured_at) if captured_at is not None else None,
-                    game_date,
-                    e["event_type"],
-                    e["summary"],
-                    json_dumps(e.get("data") or {}),
-                )
+        rows = [
+            _event_row(
+                session_id, captured_at, game_date, e["event_type"], e["summary"], e.get("data")
             )
-        with self._lock:
-            self._conn.executemany(
-                """
-                INSERT INTO events (session_id, captured_at, game_date, event_type, summary, data_json)
-                VALUES (?, COALESCE(?, strftime('%s','now')), ?, ?, ?, ?);
-                """,
-                rows,
+            for e in events
+        ]
+        with self._transaction():
+            self._conn.executemany(_INSERT_EVENT_SQL, rows)
+            self._conn.execute(
+                "UPDATE sessions SET event_count = event_count + ? WHERE id = ?;",
+                (len(rows), session_id),
             )
         return len(rows)
 
@@ -972,18 +1816,20 @@ class GameDatabase:
         if prev_id is None:
             return 0
 
-        prev_row = self.get_snapshot_row(prev_id)
         curr_row = self.get_snapshot_row(int(snapshot_id))
-        if not prev_row or not curr_row:
+        if not curr_row:
             return 0
 
-        prev_state_json = prev_row.get("event_state_json") or prev_row.get("full_briefing_json")
-        if not isinstance(prev_state_json, str) or not prev_state_json:
-            return 0
-        try:
-            prev_briefing = json.loads(prev_state_json)
-        except Exception:
-            return 0
+        prev_briefing: Any = self.get_snapshot_event_state(prev_id)
+        if prev_briefing is None:
+            prev_row = self.get_snapshot_row(prev_id)
+            prev_state_json = prev_row.get("full_briefing_json") if prev_row else None
+            if not isinstance(prev_state_json, str) or not prev_state_json:
+                return 0
+            try:
+                prev_briefing = json.loads(prev_state_json)
+            except Exception:
+                return 0
 
         # Compute current state from the live briefing (avoid depending on persisted JSON).
         try:
@@ -1010,12 +1856,97 @@ class GameDatabase:
             events=payloads,
         )
 
+    def recompute_session_events(self, *, session_id: str) -> int:
+        """Regenerate all derived events of a session from its stored snapshot states.
+
+        For use after event rules change. Walks the session's snapshots once in id
+        order (the baseline order record_events_for_new_snapshot uses), decoding
+        each event state once: keyframes are parsed and deltas applied to the
+        previous state. Consecutive pairs go through compute_events(), and the
+        events of the recomputed pairs are replaced in a single transaction with one
+        executemany. Pairs that cannot be recomputed (legacy snapshots stored without
+        an event state) keep their events, as do events without a snapshot link.
+        Returns the number of events stored.
+        """
+        with self._transaction():
+            snapshots = self._conn.execute(
+                """
+                SELECT
+                    id, captured_at, game_date, full_briefing_json,
+                    event_state_json, event_state_base_id
+                FROM snapshots
+                WHERE session_id = ?
+                ORDER BY id ASC;
+                """,
+                (session_id,),
+            ).fetchall()
+
+            rows = []
+            recomputed: list[tuple[str, int]] = []  # (session_id, to_snapshot_id)
+            prev_id: int | None = None
+            prev_state: dict[str, Any] | None = None  # Reconstructed event state only
+            prev_baseline: dict[str, Any] | None = None  # Event state, else full briefing
+            for snap in snapshots:
+                snapshot_id = int(snap["id"])
+                state = self._walk_event_state(snap, prev_id, prev_state)
+                baseline = state if state is not None else _json_object(snap["full_briefing_json"])
+                if prev_baseline is not None and prev_id is not None and state is not None:
+                    recomputed.append((session_id, snapshot_id))
+                    for e in compute_events(
+                        prev=prev_baseline,
+                        curr=state,
+                        from_snapshot_id=prev_id,
+                        to_snapshot_id=snapshot_id,
+                    ):
+                        rows.append(
+                            _event_row(
+                                session_id,
+                                snap["captured_at"],
+                                snap["game_date"],
+                                e.event_type,
+                                e.summary,
+                                e.data,
+                            )
+                        )
+                prev_id, prev_state, prev_baseline = snapshot_id, state, baseline
+
+            self._conn.executemany(
+                "DELETE FROM events WHERE session_id = ? AND to_snapshot_id = ?;", recomputed
+            )
+            self._conn.executemany(_INSERT_EVENT_SQL, rows)
+            self._conn.execute(
+                """
+                UPDATE sessions
+                SET event_count = (SELECT COUNT(*) FROM events WHERE session_id = ?)
+                WHERE id = ?;
+                """,
+                (session_id, session_id),
+            )
+        return len(rows)
+
+    def _walk_event_state(
+        self, snap: sqlite3.Row, prev_id: int | None, prev_state: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Event state of ``snap`` during an in-order walk (patches apply to prev_state)."""
+        base_id = snap["event_state_base_id"]
+        if base_id is None:
+            return _json_object(snap["event_state_json"])
+        if base_id == prev_id and prev_state is not None:
+            try:
+                ops = json.loads(decode_json_blob(snap["event_state_json"]) or "null")
+            except ValueError:
+                ops = None
+            if isinstance(ops, list):
+                state = apply_json_patch(prev_state, ops)
+                return state if isinstance(state, dict) else None
+        return self.get_snapshot_event_state(int(snap["id"]))
+
     # --- Queries for Milestone 4 (/history + reports) ---
 
     def get_active_or_latest_session_id(self, *, save_id: str) -> str | None:
         """Return the active session id for this save_id, else the most recent ended session."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT id
                 FROM sessions
@@ -1031,8 +1962,8 @@ class GameDatabase:
         """Best-effort lookup by last known save_path (useful on startup without parsing gamestate)."""
         if not save_path:
             return None
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT id
                 FROM sessions
@@ -1046,8 +1977,8 @@ class GameDatabase:
 
     def get_recent_events(self, *, session_id: str, limit: int = 20) -> list[dict[str, Any]]:
         lim = max(1, min(int(limit), 100))
-        with self._lock:
-            rows = self._conn.execute(
+        with self._read() as conn:
+            rows = conn.execute(
                 """
                 SELECT id, captured_at, game_date, event_type, summary, data_json
                 FROM events
@@ -1062,10 +1993,11 @@ class GameDatabase:
     def get_first_last_snapshot_rows(
         self, *, session_id: str
     ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
-        with self._lock:
-            first = self._conn.execute(
+        with self._read() as conn:
+            first = conn.execute(
                 """
-                SELECT id, captured_at, game_date, full_briefing_json, event_state_json
+                SELECT id, captured_at, game_date, full_briefing_json, event_state_json,
+                       event_state_base_id
                 FROM snapshots
                 WHERE session_id = ?
                 ORDER BY captured_at ASC, id ASC
@@ -1073,9 +2005,10 @@ class GameDatabase:
                 """,
                 (session_id,),
             ).fetchone()
-            last = self._conn.execute(
+            last = conn.execute(
                 """
-                SELECT id, captured_at, game_date, full_briefing_json, event_state_json
+                SELECT id, captured_at, game_date, full_briefing_json, event_state_json,
+                       event_state_base_id
                 FROM snapshots
                 WHERE session_id = ?
                 ORDER BY captured_at DESC, id DESC
@@ -1083,15 +2016,18 @@ class GameDatabase:
                 """,
                 (session_id,),
             ).fetchone()
-            return (dict(first) if first else None, dict(last) if last else None)
+            return (
+                self._decode_snapshot_row(first) if first else None,
+                self._decode_snapshot_row(last) if last else None,
+            )
 
     def get_recent_snapshot_points(
         self, *, session_id: str, limit: int = 8
     ) -> list[dict[str, Any]]:
         """Return a small set of snapshot metric points for trend questions."""
         lim = max(1, min(int(limit), 50))
-        with self._lock:
-            rows = self._conn.execute(
+        with self._read() as conn:
+            rows = conn.execute(
                 """
                 SELECT id, captured_at, game_date, military_power, colony_count, wars_count, energy_net, alloys_net
                 FROM snapshots
@@ -1103,11 +2039,194 @@ class GameDatabase:
             ).fetchall()
             return [dict(r) for r in rows]
 
+    def get_metric_series(
+        self,
+        *,
+        metric: str,
+        session_id: str | None = None,
+        save_id: str | None = None,
+        from_game_date: str | None = None,
+        to_game_date: str | None = None,
+        max_points: int = 200,
+    ) -> list[dict[str, Any]]:
+        """Return a metric's timeline over a game-date range, downsampled to max_points.
+
+        Scoped to one session, or to every session of ``save_id``. Snapshots are
+        split into at most ``max_points`` equal-count buckets in date order; each
+        point carries the bucket's last game_date, avg (``value``), min, max, last
+        value and sample count. Spans with fewer snapshots come back unaggregated.
+        """
+        if metric not in TIMELINE_METRICS:
+            raise ValueError(f"Unknown timeline metric: {metric}")
+        scope_sql, scope_params = _metric_scope(session_id=session_id, save_id=save_id)
+        points = max(1, min(int(max_points), 2000))
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                WITH pts AS (
+                    SELECT
+                        game_date,
+                        snapshot_id,
+                        {metric} AS v,
+                        ntile(?) OVER (ORDER BY game_date, snapshot_id) AS bucket
+                    FROM snapshot_metrics
+                    WHERE {scope_sql}
+                      AND game_date IS NOT NULL
+                      AND {metric} IS NOT NULL
+                      AND (? IS NULL OR game_date >= ?)
+                      AND (? IS NULL OR game_date <= ?)
+                ),
+                ranked AS (
+                    SELECT
+                        *,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY bucket ORDER BY game_date DESC, snapshot_id DESC
+                        ) AS rn
+                    FROM pts
+                )
+                SELECT
+                    MAX(game_date) AS game_date,
+                    AVG(v) AS value,
+                    MIN(v) AS min,
+                    MAX(v) AS max,
+                    MAX(CASE WHEN rn = 1 THEN v END) AS last,
+                    COUNT(*) AS samples
+                FROM ranked
+                GROUP BY bucket
+                ORDER BY bucket;
+                """,
+                (
+                    points,
+                    *scope_params,
+                    from_game_date,
+                    from_game_date,
+                    to_game_date,
+                    to_game_date,
+                ),
+            ).fetchall()
+            return [dict(r) for r in rows]
+
+    def get_metric_trend(
+        self,
+        *,
+        metric: str,
+        session_id: str | None = None,
+        save_id: str | None = None,
+        from_game_date: str | None = None,
+        to_game_date: str | None = None,
+        max_points: int = 60,
+    ) -> dict[str, Any]:
+        """Return a metric trend at a resolution that fits ``max_points``.
+
+        Short spans read the per-snapshot timeline (downsampled); longer spans
+        read the per-year or per-decade rollups, so the cost is bounded by the
+        number of periods rather than snapshots. Rollup periods that overlap the
+        range are included whole; adjacent decades are merged if they still
+        exceed the budget. Points share the get_metric_series() keys plus
+        ``period`` (game date, year or first decade label).
+        """
+        if metric not in TIMELINE_METRICS:
+            raise ValueError(f"Unknown timeline metric: {metric}")
+        budget = max(1, int(max_points))
+        first_year, last_year = _game_year(from_game_date), _game_year(to_game_date)
+        if first_year is None or last_year is None:
+            bounds = self._metric_year_bounds(session_id=session_id, save_id=save_id)
+            first_year = first_year if first_year is not None else bounds[0]
+            last_year = last_year if last_year is not None else bounds[1]
+        if first_year is None or last_year is None:
+            return {"metric": metric, "resolution": None, "points": []}
+
+        span_years = max(1, last_year - first_year + 1)
+        if span_years * ROLLUP_SNAPSHOTS_PER_YEAR <= budget:
+            points = self.get_metric_series(
+                metric=metric,
+                session_id=session_id,
+                save_id=save_id,
+                from_game_date=from_game_date,
+                to_game_date=to_game_date,
+                max_points=budget,
+            )
+            for point in points:
+                point["period"] = point["game_date"]
+            return {"metric": metric, "resolution": "snapshot", "points": points}
+
+        resolution = "year" if span_years <= budget else "decade"
+        if resolution == "decade":
+            first_year, last_year = first_year - first_year % 10, last_year - last_year % 10
+        scope_sql, scope_params = _metric_scope(session_id=session_id, save_id=save_id)
+        with self._read() as conn:
+            rows = conn.execute(
+                f"""
+                WITH ranked AS (
+                    SELECT
+                        *,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY period ORDER BY last_game_date DESC
+                        ) AS rn
+                    FROM metric_rollups
+                    WHERE {scope_sql}
+                      AND resolution = ?
+                      AND metric = ?
+                      AND period BETWEEN ? AND ?
+                )
+                SELECT
+                    period,
+                    MAX(last_game_date) AS game_date,
+                    SUM(sum_value) / SUM(samples) AS value,
+                    MIN(min_value) AS min,
+                    MAX(max_value) AS max,
+                    MAX(CASE WHEN rn = 1 THEN last_value END) AS last,
+                    SUM(samples) AS samples
+                FROM ranked
+                GROUP BY period
+                ORDER BY period;
+                """,
+                (*scope_params, resolution, metric, first_year, last_year),
+            ).fetchall()
+        points = [dict(r) for r in rows]
+        for point in points:
+            point["period"] = (
+                f"{point['period']}s" if resolution == "decade" else str(point["period"])
+            )
+        return {"metric": metric, "resolution": resolution, "points": _merge_points(points, budget)}
+
+    def _metric_year_bounds(
+        self, *, session_id: str | None, save_id: str | None
+    ) -> tuple[int | None, int | None]:
+        """First/last snapshot year from the materialized session stats."""
+        if session_id is not None:
+            where, params = "id = ?", (session_id,)
+        else:
+            where, params = "save_id = ?", (save_id,)
+        with self._read() as conn:
+            row = conn.execute(
+                f"""
+                SELECT MIN(first_snapshot_game_date) AS first, MAX(last_snapshot_game_date) AS last
+                FROM sessions
+                WHERE {where};
+                """,
+                params,
+            ).fetchone()
+        if row is None:
+            return None, None
+        return _game_year(row["first"]), _game_year(row["last"])
+
+    def refresh_session_stats(self, session_id: str | None = None) -> None:
+        """Recount the materialized session counters from the snapshot/event rows.
+
+        Writes keep them current; this is for repairs after bulk edits or deletes.
+        """
+        with self._transaction():
+            if session_id is None:
+                self._conn.execute(_SESSION_STATS_RECOUNT_SQL + ";")
+            else:
+                self._conn.execute(_SESSION_STATS_RECOUNT_SQL + " WHERE id = ?;", (session_id,))
+
     def get_sessions(self, *, limit: int = 50) -> list[dict[str, Any]]:
         """Return all sessions with snapshot stats, ordered by started_at DESC."""
         lim = max(1, min(int(limit), 100))
-        with self._lock:
-            rows = self._conn.execute(
+        with self._read() as conn:
+            rows = conn.execute(
                 """
                 SELECT
                     s.id,
@@ -1118,12 +2237,10 @@ class GameDatabase:
                     s.ended_at,
                     s.last_game_date,
                     s.last_updated_at,
-                    COUNT(snap.id) AS snapshot_count,
-                    MIN(snap.game_date) AS first_game_date,
-                    MAX(snap.game_date) AS last_game_date_computed
+                    s.snapshot_count,
+                    s.first_snapshot_game_date AS first_game_date,
+                    s.last_snapshot_game_date AS last_game_date_computed
                 FROM sessions s
-                LEFT JOIN snapshots snap ON snap.session_id = s.id
-                GROUP BY s.id
                 ORDER BY s.started_at DESC
                 LIMIT ?;
                 """,
@@ -1133,8 +2250,8 @@ class GameDatabase:
 
     def get_session_by_id(self, session_id: str) -> dict[str, Any] | None:
         """Get a single session by ID with snapshot stats."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT
                     s.id,
@@ -1145,13 +2262,11 @@ class GameDatabase:
                     s.ended_at,
                     s.last_game_date,
                     s.last_updated_at,
-                    COUNT(snap.id) AS snapshot_count,
-                    MIN(snap.game_date) AS first_game_date,
-                    MAX(snap.game_date) AS last_game_date_computed
+                    s.snapshot_count,
+                    s.first_snapshot_game_date AS first_game_date,
+                    s.last_snapshot_game_date AS last_game_date_computed
                 FROM sessions s
-                LEFT JOIN snapshots snap ON snap.session_id = s.id
-                WHERE s.id = ?
-                GROUP BY s.id;
+                WHERE s.id = ?;
                 """,
                 (session_id,),
             ).fetchone()
@@ -1165,8 +2280,8 @@ class GameDatabase:
         Used by chronicle generation which needs full history.
         Note: get_recent_events() has a hard 100-event cap.
         """
-        with self._lock:
-            rows = self._conn.execute(
+        with self._read() as conn:
+            rows = conn.execute(
                 """
                 SELECT id, captured_at, game_date, event_type, summary, data_json
                 FROM events
@@ -1181,8 +2296,8 @@ class GameDatabase:
         self, session_id: str, *, language: str = "en"
     ) -> dict[str, Any] | None:
         """Get cached chronicle if it exists."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT * FROM cached_chronicles
                 WHERE session_id = ? AND language = ?
@@ -1194,18 +2309,18 @@ class GameDatabase:
 
     def get_event_count(self, session_id: str) -> int:
         """Get total event count for a session."""
-        with self._lock:
-            row = self._conn.execute(
-                "SELECT COUNT(*) as cnt FROM events WHERE session_id = ?",
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT event_count AS cnt FROM sessions WHERE id = ?",
                 (session_id,),
             ).fetchone()
             return row["cnt"] if row else 0
 
     def get_snapshot_count(self, session_id: str) -> int:
         """Get total snapshot count for a session."""
-        with self._lock:
-            row = self._conn.execute(
-                "SELECT COUNT(*) as cnt FROM snapshots WHERE session_id = ?",
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT snapshot_count AS cnt FROM sessions WHERE id = ?",
                 (session_id,),
             ).fetchone()
             return row["cnt"] if row else 0
@@ -1277,8 +2392,8 @@ class GameDatabase:
 
     def get_save_id_for_session(self, session_id: str) -> str | None:
         """Get the save_id for a session."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 "SELECT save_id FROM sessions WHERE id = ?",
                 (session_id,),
             ).fetchone()
@@ -1291,8 +2406,8 @@ class GameDatabase:
         language: str = "en",
     ) -> dict[str, Any] | None:
         """Get cached chronicle by save_id (cross-session)."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """SELECT * FROM cached_chronicles
                    WHERE save_id = ? AND language = ?
                    ORDER BY generated_at DESC LIMIT 1""",
@@ -1302,8 +2417,8 @@ class GameDatabase:
 
     def get_chronicle_custom_instructions(self, save_id: str) -> str | None:
         """Get chronicle custom instructions for a save_id."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT chronicle_custom_instructions
                 FROM cached_chronicles
@@ -1352,8 +2467,8 @@ class GameDatabase:
         """Get persisted save-scoped advisor memory summary."""
         if not save_id:
             return None
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT summary_text
                 FROM advisor_memory
@@ -1392,13 +2507,103 @@ class GameDatabase:
                 (save_id, language, cleaned if cleaned else None, last_game_date),
             )
 
+    def get_cached_answer(
+        self,
+        *,
+        save_id: str,
+        save_hash: str,
+        language: str,
+        model: str,
+        question_key: str,
+        prompt_key: str,
+    ) -> dict[str, Any] | None:
+        """Cached advisor answer for this question on this exact save state, if any.
+
+        Read-only; callers record a hit with record_answer_cache_hit(). Returns
+        answer, game_date and the original response_ms (the latency the hit saved).
+        """
+        if not save_id or not save_hash:
+            return None
+        with self._read() as conn:
+            row = conn.execute(
+                """
+                SELECT answer, game_date, response_ms
+                FROM answer_cache
+                WHERE save_id = ? AND language = ? AND model = ? AND question_key = ?
+                  AND save_hash = ? AND prompt_key = ?;
+                """,
+                (save_id, language, model, question_key, save_hash, prompt_key),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def record_answer_cache_hit(
+        self, *, save_id: str, language: str, model: str, question_key: str
+    ) -> None:
+        """Bump the hit counter of a cached answer (run it on the DB writer thread)."""
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE answer_cache
+                SET hits = hits + 1, last_hit_at = strftime('%s','now')
+                WHERE save_id = ? AND language = ? AND model = ? AND question_key = ?;
+                """,
+                (save_id, language, model, question_key),
+            )
+
+    def put_cached_answer(
+        self,
+        *,
+        save_id: str,
+        save_hash: str,
+        language: str,
+        model: str,
+        question_key: str,
+        prompt_key: str,
+        answer: str,
+        game_date: str | None,
+        response_ms: float | None,
+    ) -> None:
+        """Store (or replace) the cached answer for a question on a save."""
+        if not save_id or not save_hash or not answer:
+            return
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO answer_cache (
+                    save_id, language, model, question_key, save_hash, prompt_key,
+                    answer, game_date, response_ms, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, strftime('%s','now'))
+                ON CONFLICT(save_id, language, model, question_key) DO UPDATE SET
+                    save_hash = excluded.save_hash,
+                    prompt_key = excluded.prompt_key,
+                    answer = excluded.answer,
+                    game_date = excluded.game_date,
+                    response_ms = excluded.response_ms,
+                    hits = 0,
+                    created_at = excluded.created_at,
+                    last_hit_at = NULL;
+                """,
+                (
+                    save_id,
+                    language,
+                    model,
+                    question_key,
+                    save_hash,
+                    prompt_key,
+                    answer,
+                    game_date,
+                    response_ms,
+                ),
+            )
+
     def get_all_events_by_save_id(self, *, save_id: str) -> list[dict[str, Any]]:
         """Get ALL events across all sessions for a save_id (no limit cap).
 
         Used by incremental chronicle generation which needs full cross-session history.
         """
-        with self._lock:
-            rows = self._conn.execute(
+        with self._read() as conn:
+            rows = conn.execute(
                 """
                 SELECT e.id, e.captured_at, e.game_date, e.event_type, e.summary, e.data_json
                 FROM events e
@@ -1419,83 +2624,75 @@ class GameDatabase:
     ) -> list[dict[str, Any]]:
         """Get events within a snapshot ID range for a save_id.
 
-        Events are primarily linked to snapshots via `data_json.to_snapshot_id`
-        (recorded by event computation). For backwards compatibility with older
-        rows missing snapshot linkage, fall back to `captured_at` bounds derived
-        from the snapshot rows.
+        Events are primarily linked to snapshots via the indexed `to_snapshot_id`
+        column (recorded by event computation, backfilled from `data_json`). For
+        backwards compatibility with older rows missing snapshot linkage, fall back
+        to `captured_at` bounds derived from the snapshot rows.
         """
-        with self._lock:
+        with self._read() as conn:
             if from_snapshot_id is None and to_snapshot_id is None:
                 return self.get_all_events_by_save_id(save_id=save_id)
 
             from_captured_at: int | None = None
             to_captured_at: int | None = None
             if from_snapshot_id is not None:
-                from_row = self._conn.execute(
+                from_row = conn.execute(
                     "SELECT captured_at FROM snapshots WHERE id = ?",
                     (int(from_snapshot_id),),
                 ).fetchone()
                 if from_row and from_row["captured_at"] is not None:
                     from_captured_at = int(from_row["captured_at"])
             if to_snapshot_id is not None:
-                to_row = self._conn.execute(
+                to_row = conn.execute(
                     "SELECT captured_at FROM snapshots WHERE id = ?",
                     (int(to_snapshot_id),),
                 ).fetchone()
                 if to_row and to_row["captured_at"] is not None:
                     to_captured_at = int(to_row["captured_at"])
 
-            # Build query based on provided bounds
-            conditions = ["s.save_id = ?"]
+            # Linked events: an index seek on (session_id, to_snapshot_id).
+            columns = ", ".join(
+                f"e.{c} AS {c}"
+                for c in ("id", "captured_at", "game_date", "event_type", "summary", "data_json")
+            )
+            linked = ["s.save_id = ?", "e.to_snapshot_id IS NOT NULL"]
             params: list[Any] = [save_id]
-
             if from_snapshot_id is not None:
-                if from_captured_at is not None:
-                    conditions.append(
-                        """
-                        (
-                            CAST(json_extract(e.data_json, '$.to_snapshot_id') AS INTEGER) > ?
-                            OR (
-                                json_extract(e.data_json, '$.to_snapshot_id') IS NULL
-                                AND e.captured_at > ?
-                            )
-                        )
-                        """
-                    )
-                    params.extend([int(from_snapshot_id), from_captured_at])
-                else:
-                    conditions.append(
-                        "CAST(json_extract(e.data_json, '$.to_snapshot_id') AS INTEGER) > ?"
-                    )
-                    params.append(int(from_snapshot_id))
+                linked.append("e.to_snapshot_id > ?")
+                params.append(int(from_snapshot_id))
             if to_snapshot_id is not None:
-                if to_captured_at is not None:
-                    conditions.append(
-                        """
-                        (
-                            CAST(json_extract(e.data_json, '$.to_snapshot_id') AS INTEGER) <= ?
-                            OR (
-                                json_extract(e.data_json, '$.to_snapshot_id') IS NULL
-                                AND e.captured_at <= ?
-                            )
-                        )
-                        """
-                    )
-                    params.extend([int(to_snapshot_id), to_captured_at])
-                else:
-                    conditions.append(
-                        "CAST(json_extract(e.data_json, '$.to_snapshot_id') AS INTEGER) <= ?"
-                    )
-                    params.append(int(to_snapshot_id))
-
+                linked.append("e.to_snapshot_id <= ?")
+                params.append(int(to_snapshot_id))
             query = f"""
-                SELECT e.id, e.captured_at, e.game_date, e.event_type, e.summary, e.data_json
-                FROM events e
-                JOIN sessions s ON e.session_id = s.id
-                WHERE {" AND ".join(conditions)}
-                ORDER BY e.game_date ASC, e.captured_at ASC, e.id ASC;
+                SELECT {columns}
+                FROM sessions s
+                JOIN events e ON e.session_id = s.id
+                WHERE {" AND ".join(linked)}
             """
-            rows = self._conn.execute(query, tuple(params)).fetchall()
+
+            # Older unlinked rows fall back to captured_at, but only when every
+            # requested bound resolved to a snapshot timestamp.
+            bounds = [
+                (from_snapshot_id, from_captured_at, ">"),
+                (to_snapshot_id, to_captured_at, "<="),
+            ]
+            if all(cap is not None for snap, cap, _ in bounds if snap is not None):
+                unlinked = ["s.save_id = ?", "e.to_snapshot_id IS NULL"]
+                params.append(save_id)
+                for snap, cap, op in bounds:
+                    if snap is not None:
+                        unlinked.append(f"e.captured_at {op} ?")
+                        params.append(cap)
+                query += f"""
+                UNION ALL
+                SELECT {columns}
+                FROM sessions s
+                JOIN events e ON e.session_id = s.id
+                WHERE {" AND ".join(unlinked)}
+                """
+
+            query += "ORDER BY game_date ASC, captured_at ASC, id ASC;"
+            rows = conn.execute(query, tuple(params)).fetchall()
             return [dict(r) for r in rows]
 
     def get_latest_snapshot_at_or_before(
@@ -1505,8 +2702,8 @@ class GameDatabase:
         game_date: str,
     ) -> dict[str, Any] | None:
         """Get the latest snapshot for save_id with game_date <= target."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT snap.id, snap.game_date, snap.captured_at
                 FROM snapshots snap
@@ -1523,8 +2720,8 @@ class GameDatabase:
 
     def get_snapshot_range_for_save(self, save_id: str) -> dict[str, Any]:
         """Get first and last snapshot IDs and dates for a save_id."""
-        with self._lock:
-            row = self._conn.execute(
+        with self._read() as conn:
+            row = conn.execute(
                 """
                 SELECT
                     MIN(snap.id) AS first_snapshot_id,
@@ -1542,8 +2739,8 @@ class GameDatabase:
 
     def get_all_sessions_for_save(self, save_id: str) -> list[dict[str, Any]]:
         """Get all sessions (active and ended) for a save_id."""
-        with self._lock:
-            rows = self._conn.execute(
+        with self._read() as conn:
+            rows = conn.execute(
                 """
                 SELECT id, save_id, empire_name, started_at, ended_at, last_game_date
                 FROM sessions
@@ -1665,23 +2862,8 @@ def get_default_db(db_path: str | Path | None = None) -> GameDatabase:
     if _default_db is None:
         _default_db = GameDatabase()
 
-        # Best-effort background maintenance for older DBs.
-        # Keeps startup fast while preventing unbounded full JSON accumulation.
-        def _maintenance(db: GameDatabase) -> None:
-            with contextlib.suppress(Exception):
-                db.backfill_latest_briefings_all_sessions(limit_sessions=500)
-            with contextlib.suppress(Exception):
-                db.enforce_full_briefing_retention_all_sessions(
-                    keep_recent=DEFAULT_KEEP_FULL_BRIEFINGS_RECENT, keep_first=True
-                )
-            with contextlib.suppress(Exception):
-                db.maybe_checkpoint_wal()
-
+        # Backfill, retention, vacuum and WAL checkpoints run in the background while
+        # the DB is idle (the first tick sweeps every session, for older DBs).
         with contextlib.suppress(Exception):
-            threading.Thread(
-                target=_maintenance,
-                args=(_default_db,),
-                daemon=True,
-                name="db-maintenance",
-            ).start()
+            _default_db.start_maintenance()
     return _default_db
@@ -0,0 +1,216 @@
+"""Idle-time maintenance for the history DB.
+
+A daemon thread wakes every ``MAINTENANCE_TICK_SECONDS`` and, once the DB has
+seen no writes for ``MAINTENANCE_IDLE_SECONDS``, runs as many of these steps as
+fit in the per-tick time budget:
+
+  1. sessions: latest-briefing backfill + full-briefing retention for sessions
+     that received snapshots (and, on the first tick, every session)
+  2. vacuum: ``PRAGMA incremental_vacuum`` in small page batches (DBs created
+     before auto_vacuum was enabled are skipped until they are converted once
+     with GameDatabase.enable_incremental_vacuum(), via POST /api/db/compact;
+     that full VACUUM cannot be split across ticks)
+  3. optimize: ``PRAGMA optimize`` (refreshes planner stats; ANALYZE as needed)
+  4. checkpoint: truncate the WAL once it passes a small threshold
+
+Each step is a short exclusive section on the DB lock, and the scheduler
+re-checks idleness between steps, so a write that arrives mid-tick waits for at
+most one step. Work left over when the budget runs out resumes on the next tick.
+
+Usage:
+    db.start_maintenance()          # get_default_db() does this
+    db.get_maintenance_stats()      # reported by /api/diagnostics
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backend.core.database import GameDatabase
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_TICK_SECONDS = 30.0
+MAINTENANCE_IDLE_SECONDS = 20.0
+MAINTENANCE_BUDGET_SECONDS = 0.25
+VACUUM_PAGES_PER_STEP = 256
+OPTIMIZE_INTERVAL_SECONDS = 6 * 60 * 60
+WAL_IDLE_CHECKPOINT_BYTES = 4 * 1024 * 1024
+
+
+class MaintenanceScheduler:
+    """Runs budgeted maintenance steps on a GameDatabase while it is idle."""
+
+    def __init__(
+        self,
+        db: GameDatabase,
+        *,
+        tick_seconds: float = MAINTENANCE_TICK_SECONDS,
+        idle_seconds: float = MAINTENANCE_IDLE_SECONDS,
+        budget_seconds: float = MAINTENANCE_BUDGET_SECONDS,
+    ):
+        self._db = db
+        self.tick_seconds = tick_seconds
+        self.idle_seconds = idle_seconds
+        self.budget_seconds = budget_seconds
+
+        self._lock = threading.Lock()
+        self._pending_sessions: dict[str, None] = {}  # Insertion-ordered set
+        self._sweep_done = False
+        self._last_optimize: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats: dict[str, Any] = {
+            "ticks": 0,
+            "skipped_busy": 0,
+            "last_tick_at": None,
+            "last_tick_ms": None,
+            "max_tick_ms": None,
+            "last_tick_steps": [],
+            "sessions_maintained": 0,
+            "briefings_backfilled": 0,
+            "briefings_cleared": 0,
+            "pages_vacuumed": 0,
+            "optimize_runs": 0,
+            "checkpoints": 0,
+            "last_error": None,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="db-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+    def mark_session(self, session_id: str) -> None:
+        """Queue retention for a session that just received a snapshot."""
+        with self._lock:
+            self._pending_sessions[session_id] = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.tick_seconds):
+            try:
+                self.tick()
+            except Exception as e:
+                logger.warning("db_maintenance_tick_failed error=%s", e)
+                with self._lock:
+                    self._stats["last_error"] = str(e)
+
+    def tick(self, *, force: bool = False) -> list[str]:
+        """Run one budgeted round of maintenance; returns the steps that did work.
+
+        Without ``force`` nothing runs unless the DB is idle.
+        """
+        if not force and not self._db.is_idle(self.idle_seconds):
+            with self._lock:
+                self._stats["skipped_busy"] += 1
+            return []
+
+        started = time.monotonic()
+        deadline = started + self.budget_seconds
+        steps: list[str] = []
+
+        def can_continue() -> bool:
+            if time.monotonic() >= deadline or self._stop.is_set():
+                return False
+            return force or self._db.is_idle(self.idle_seconds)
+
+        if self._maintain_sessions(can_continue):
+            steps.append("sessions")
+        if can_continue() and self._vacuum(can_continue):
+            steps.append("vacuum")
+        if can_continue() and self._optimize():
+            steps.append("optimize")
+        if can_continue() and self._db.maybe_checkpoint_wal(
+            threshold_bytes=WAL_IDLE_CHECKPOINT_BYTES
+        ):
+            steps.append("checkpoint")
+            with self._lock:
+                self._stats["checkpoints"] += 1
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            stats = self._stats
+            stats["ticks"] += 1
+            stats["last_tick_at"] = int(time.time())
+            stats["last_tick_ms"] = round(elapsed_ms, 2)
+            stats["max_tick_ms"] = round(max(stats["max_tick_ms"] or 0.0, elapsed_ms), 2)
+            stats["last_tick_steps"] = steps
+        return steps
+
+    def _maintain_sessions(self, can_continue) -> bool:
+        if not self._sweep_done:
+            for session_id in self._db.get_session_ids_for_maintenance():
+                self.mark_session(session_id)
+            self._sweep_done = True
+
+        did_work = False
+        while can_continue():
+            with self._lock:
+                if not self._pending_sessions:
+                    break
+                session_id = next(iter(self._pending_sessions))
+                del self._pending_sessions[session_id]
+            backfilled = self._db.backfill_session_latest_briefing_from_snapshots(
+                session_id=session_id
+            )
+            cleared = self._db.enforce_full_briefing_retention(session_id=session_id)
+            did_work = True
+            with self._lock:
+                self._stats["sessions_maintained"] += 1
+                self._stats["briefings_backfilled"] += int(backfilled)
+                self._stats["briefings_cleared"] += cleared
+        return did_work
+
+    def _vacuum(self, can_continue) -> bool:
+        pages = self._db.get_page_stats()
+        if pages["freelist_count"] <= 0 or pages["auto_vacuum"] != "incremental":
+            return False
+
+        freed = 0
+        while can_continue():
+            step = self._db.incremental_vacuum(max_pages=VACUUM_PAGES_PER_STEP)
+            freed += step
+            if step < VACUUM_PAGES_PER_STEP:
+                break
+        with self._lock:
+            self._stats["pages_vacuumed"] += freed
+        return freed > 0
+
+    def _optimize(self) -> bool:
+        now = time.monotonic()
+        if self._last_optimize is not None and now - self._last_optimize < (
+            OPTIMIZE_INTERVAL_SECONDS
+        ):
+            return False
+        self._db.optimize()
+        self._last_optimize = now
+        with self._lock:
+            self._stats["optimize_runs"] += 1
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            pending = len(self._pending_sessions)
+        return {
+            "running": self.running,
+            "budget_ms": round(self.budget_seconds * 1000, 2),
+            "pending_sessions": pending,
+            **stats,
+        }
@@ -13,6 +13,7 @@ from typing import Any
 
 from backend.core.database import GameDatabase
 from backend.core.json_utils import json_dumps
+from backend.core.metrics_timeline import extract_timeline_metrics
 from backend.core.utils import safe_float, safe_int
 
 
@@ -328,13 +329,19 @@ def record_snapshot_from_briefing(
     save_path: Path | None,
     save_hash: str | None,
     briefing: dict[str, Any],
-    briefing_json: str | None = None,
+    briefing_json: str | bytes | None = None,
+    timeline_metrics: dict[str, float | None] | None = None,
 ) -> tuple[bool, int | None, str]:
     """Record a snapshot when you already have a full briefing dict.
 
     This avoids re-parsing gamestate in the main process (useful when ingestion happens
     in a separate worker process). If the briefing already contains a `history` key,
     it will be persisted as-is.
+
+    When `briefing_json` (str or UTF-8 bytes) is given, `briefing` only needs the
+    fields read here, so the compact event state built by the worker is enough;
+    pass the worker's `timeline_metrics` too, since the compact state lacks most
+    of them.
     """
     metrics = extract_snapshot_metrics(briefing)
     resolved_campaign_id = metrics.get("campaign_id")
@@ -356,7 +363,9 @@ def record_snapshot_from_briefing(
     )
 
     full_json = (
-        briefing_json if isinstance(briefing_json, str) and briefing_json else json_dumps(briefing)
+        briefing_json
+        if isinstance(briefing_json, (str, bytes)) and briefing_json
+        else json_dumps(briefing)
     )
     inserted, snapshot_id = db.insert_snapshot_if_new(
         session_id=session_id,
@@ -370,6 +379,11 @@ def record_snapshot_from_briefing(
         # Full briefings are stored on the session row (latest) and only kept per-snapshot for the baseline.
         full_briefing_json=full_json,
         event_state_json=json_dumps(build_event_state_from_briefing(briefing)),
+        metrics=(
+            timeline_metrics
+            if isinstance(timeline_metrics, dict)
+            else extract_timeline_metrics(briefing)
+        ),
     )
     if inserted and snapshot_id is not None:
         try:
@@ -388,9 +402,7 @@ def record_snapshot_from_briefing(
                 current_briefing=briefing,
             )
         with contextlib.suppress(Exception):
-            db.enforce_full_briefing_retention(session_id=session_id)
-        with contextlib.suppress(Exception):
-            db.maybe_checkpoint_wal()
+            db.schedule_retention(session_id=session_id)
 
     return inserted, snapshot_id, session_id
 
@@ -454,6 +466,7 @@ def record_snapshot_from_companion(
         alloys_net=metrics.get("alloys_net"),
         full_briefing_json=full_json,
         event_state_json=json_dumps(build_event_state_from_briefing(briefing_for_storage)),
+        metrics=extract_timeline_metrics(briefing_for_storage),
     )
     if inserted and snapshot_id is not None:
         with contextlib.suppress(Exception):
@@ -472,8 +485,6 @@ def record_snapshot_from_companion(
             # Event generation should never break snapshot recording.
             pass
         with contextlib.suppress(Exception):
-            db.enforce_full_briefing_retention(session_id=session_id)
-        with contextlib.suppress(Exception):
-            db.maybe_checkpoint_wal()
+            db.schedule_retention(session_id=session_id)
 
     return inserted, snapshot_id, session_id
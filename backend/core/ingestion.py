@@ -11,12 +11,20 @@ from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
-from backend.core.database import DEFAULT_KEEP_FULL_BRIEFINGS_RECENT
+from backend.core.database import DEFAULT_KEEP_FULL_BRIEFINGS_RECENT, resolve_search_index_dir
 from backend.core.history import record_snapshot_from_briefing
-from backend.core.ingestion_worker import WorkerJob, run_worker_job
+from backend.core.ingestion_worker import (
+    IngestionWorkerPool,
+    WorkerJob,
+    discard_briefing,
+    take_briefing,
+)
 
 logger = logging.getLogger(__name__)
 
+# How long a T2 run waits for its snapshot to be committed before reporting ready.
+PERSIST_WAIT_SECONDS = 30.0
+
 IngestionStage = Literal[
     "idle",
     "waiting_for_stable_save",
@@ -54,6 +62,7 @@ class IngestionStatus:
     cancel_count: int = 0
     worker_pid: int | None = None
     worker_tier: str | None = None
+    worker_start: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -73,6 +82,7 @@ class IngestionManager:
         db: Any,
         stable_window_seconds: float = 0.6,
         stable_max_wait_seconds: float = 10.0,
+        worker_pool: IngestionWorkerPool | None = None,
     ) -> None:
         self._companion = companion
         self._db = db
@@ -92,6 +102,7 @@ class IngestionManager:
         self._active_worker: threading.Thread | None = None
         self._active_worker_job: WorkerJob | None = None
         self._active_worker_cancel: threading.Event | None = None
+        self._worker_pool = worker_pool or IngestionWorkerPool()
 
         self._status = IngestionStatus()
 
@@ -100,11 +111,22 @@ class IngestionManager:
             if self._started:
                 return
             self._started = True
+            self._worker_pool.start()
             self._thread.start()
 
+    def stop(self) -> None:
+        """Shut down the warm worker process (any running job fails as cancelled)."""
+        with self._lock:
+            cancel_event = self._active_worker_cancel
+        if cancel_event is not None:
+            cancel_event.set()
+        self._worker_pool.close()
+
     def get_status(self) -> dict[str, Any]:
         with self._lock:
             payload = self._status.to_dict()
+        with contextlib.suppress(Exception):
+            payload["worker_pool"] = self._worker_pool.get_stats()
         db = self._db
         if db is not None:
             try:
@@ -141,6 +163,7 @@ class IngestionManager:
                     "pending_save_path": self._status.pending_save_path,
                     "worker_pid": self._status.worker_pid,
                     "worker_tier": self._status.worker_tier,
+                    "worker_start": self._status.worker_start,
                     "t2_game_date": self._status.t2_game_date,
                     "t2_updated_at": self._status.t2_updated_at,
                     "t2_last_duration_ms": self._status.t2_last_duration_ms,
@@ -360,7 +383,11 @@ class IngestionManager:
                 continue
             logger.info("[TIMING] T2 worker complete: %.1fms", (time.time() - t2_start) * 1000)
 
-            briefing_json = t2.get("briefing_json")
+            # The worker hands the briefing over as UTF-8 bytes plus a compact event
+            # state; the full JSON is only decoded once, for the companion's cache.
+            briefing_bytes = take_briefing(t2)
+            event_state = t2.get("event_state")
+            timeline_metrics = t2.get("timeline_metrics")
             t2_meta = t2.get("meta")
             identity = t2.get("identity")
             situation = t2.get("situation")
@@ -375,7 +402,7 @@ class IngestionManager:
             if isinstance(t2_meta, dict):
                 merged_meta.update(t2_meta)
 
-            if not isinstance(briefing_json, str) or not briefing_json:
+            if not briefing_bytes:
                 with self._lock:
                     self._status.last_error = "Tier 2 returned empty briefing"
                     self._set_stage_locked("error", "tier 2 failed")
@@ -386,30 +413,28 @@ class IngestionManager:
                     continue
                 self._set_stage_locked("persisting", "saving snapshot and activating cache")
 
-            # Persist + activate cache (main process only).
+            # Persist on the DB writer thread (main process only) while the cache activates.
             persist_start = time.time()
+            persist_future = None
             try:
-                parsed = json.loads(briefing_json)
+                parsed = (
+                    event_state if isinstance(event_state, dict) else json.loads(briefing_bytes)
+                )
                 if isinstance(parsed, dict):
-                    inserted, snapshot_id, session_id = record_snapshot_from_briefing(
-                        db=self._db,
+                    persist_future = self._db.submit_write(
+                        self._persist_snapshot,
                         save_path=save_path,
                         save_hash=save_hash if isinstance(save_hash, str) else None,
                         briefing=parsed,
-                        briefing_json=briefing_json,
+                        briefing_json=briefing_bytes,
+                        timeline_metrics=(
+                            timeline_metrics if isinstance(timeline_metrics, dict) else None
+                        ),
                     )
-                    # If the UI has already set per-playthrough customization in memory,
-                    # persist it once the session row exists (session_id is stable here).
-                    with contextlib.suppress(Exception):
-                        custom = getattr(self._companion, "custom_instructions", None)
-                        if isinstance(custom, str) and custom.strip():
-                            self._db.update_session_advisor_custom(
-                                session_id=session_id,
-                                text=custom,
-                            )
             except Exception as e:
                 logger.warning("snapshot_persist_failed error=%s", e)
-            logger.info("[TIMING] DB persist: %.1fms", (time.time() - persist_start) * 1000)
+            briefing_json = briefing_bytes.decode("utf-8")
+            del briefing_bytes
 
             activate_start = time.time()
             try:
@@ -432,6 +457,14 @@ class IngestionManager:
                 (time.time() - activate_start) * 1000,
             )
 
+            # "ready" implies the snapshot is committed (history/chronicle read it next).
+            if persist_future is not None:
+                try:
+                    persist_future.result(timeout=PERSIST_WAIT_SECONDS)
+                except Exception as e:
+                    logger.warning("snapshot_persist_failed error=%s", e)
+                logger.info("[TIMING] DB persist: %.1fms", (time.time() - persist_start) * 1000)
+
             with self._lock:
                 if request_id != self._request_id:
                     continue
@@ -447,6 +480,16 @@ class IngestionManager:
                 self._set_stage_locked("ready", "complete briefing ready")
                 logger.info("[TIMING] T2 complete - status now 'ready'")
 
+    def _persist_snapshot(self, **snapshot: Any) -> None:
+        """DB writer job: record the snapshot, then any in-memory advisor customization."""
+        _inserted, _snapshot_id, session_id = record_snapshot_from_briefing(db=self._db, **snapshot)
+        # If the UI has already set per-playthrough customization in memory,
+        # persist it once the session row exists (session_id is stable here).
+        with contextlib.suppress(Exception):
+            custom = getattr(self._companion, "custom_instructions", None)
+            if isinstance(custom, str) and custom.strip():
+                self._db.update_session_advisor_custom(session_id=session_id, text=custom)
+
     def _run_worker_tier(
         self, tier: Literal["t2"], *, save_path: Path, request_id: int
     ) -> dict[str, Any] | None:
@@ -456,6 +499,9 @@ class IngestionManager:
             "save_path": str(save_path),
             "requested_at": time.time(),
         }
+        search_index_dir = resolve_search_index_dir(getattr(self._db, "path", None))
+        if search_index_dir is not None:
+            job["search_index_dir"] = str(search_index_dir)
         with self._lock:
             self._active_worker_job = job
             self._active_worker_cancel = cancel_event
@@ -464,7 +510,7 @@ class IngestionManager:
 
         result: dict[str, Any]
         try:
-            result = run_worker_job(job=job, cancel_event=cancel_event)
+            result = self._worker_pool.run_job(job=job, cancel_event=cancel_event)
         except Exception as e:
             result = {"ok": False, "error": str(e)}
 
@@ -474,6 +520,7 @@ class IngestionManager:
             self._status.worker_tier = None
 
         if request_id != self._request_id:
+            discard_briefing(result.get("payload"))
             return None
 
         if result.get("error") == "cancelled":
@@ -493,4 +540,7 @@ class IngestionManager:
                 self._status.worker_tier = tier
 
         payload = result.get("payload") if isinstance(result.get("payload"), dict) else None
+        if payload and isinstance(payload.get("worker_start"), str):
+            with self._lock:
+                self._status.worker_start = payload["worker_start"]
         return payload or {}
@@ -4,20 +4,52 @@ import contextlib
 import logging
 import multiprocessing as mp
 import os
+import sys
+import tempfile
+import threading
 import time
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any, Literal, TypedDict
 
-from backend.core.json_utils import json_dumps
+from backend.core.json_utils import json_dumps_bytes
 from backend.core.utils import compute_save_hash_from_briefing
 from stellaris_save_extractor import SaveExtractor
 
 
-class WorkerJob(TypedDict):
+class _RequiredWorkerJob(TypedDict):
     tier: Literal["t2"]
     save_path: str
     requested_at: float
 
 
+class WorkerJob(_RequiredWorkerJob, total=False):
+    # Where to cache the save's full-text search index.
+    search_index_dir: str
+
+
+# Concurrent producer workers for get_complete_briefing. Each extra worker opens its
+# own Rust session, which re-parses the whole save; that costs about as much as the
+# rust_session_start timing and outweighs the producers it would overlap, so T2
+# runs them sequentially. Compare "briefing nodes" against "_session_start" in the
+# timing log before raising this.
+DEFAULT_BRIEFING_WORKERS = 1
+
+# Recycle a warm worker once its peak RSS crosses this mark (MB).
+DEFAULT_WORKER_MEMORY_HIGH_WATER_MB = 2048.0
+
+
+# Serialized briefings go to the manager through a file, not the result queue
+# (which would pickle the multi-MB JSON again). Unclaimed files expire after this.
+HANDOFF_DIRNAME = "stellaris-companion-handoff"
+HANDOFF_STALE_SECONDS = 600.0
+
+
+class BriefingHandoff(TypedDict):
+    path: str
+    size: int
+
+
 class WorkerResult(TypedDict, total=False):
     ok: bool
     error: str
@@ -25,9 +57,8 @@ class WorkerResult(TypedDict, total=False):
     worker_pid: int
 
 
-def _process_main(job: WorkerJob, out_q: mp.Queue[dict[str, Any]]) -> None:
-    # Configure logging for subprocess (parent's config doesn't propagate)
-    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(message)s")
+def _execute_job(job: WorkerJob) -> dict[str, Any]:
+    """Run a single tier job inside a worker process and return the result message."""
     logger = logging.getLogger("stellaris.worker")
 
     def log_timing(label: str, elapsed: float) -> None:
@@ -48,7 +79,7 @@ def _process_main(job: WorkerJob, out_q: mp.Queue[dict[str, Any]]) -> None:
 
         t0 = time.time()
         ctx = rust_session(save_path)
-        ctx.__enter__()
+        rust_sess = ctx.__enter__()
         timings["rust_session_start"] = time.time() - t0
         log_timing("Rust session started", timings["rust_session_start"])
 
@@ -60,9 +91,23 @@ def _process_main(job: WorkerJob, out_q: mp.Queue[dict[str, Any]]) -> None:
 
             if tier == "t2":
                 t0 = time.time()
-                briefing = extractor.get_complete_briefing()
+                briefing = extractor.get_complete_briefing(max_workers=DEFAULT_BRIEFING_WORKERS)
                 timings["briefing"] = time.time() - t0
                 log_timing("get_complete_briefing", timings["briefing"])
+                briefing_node_timings = extractor.get_briefing_timings()
+                briefing_round_trips = int(briefing_node_timings.get("_round_trips", 0))
+                requests_after_briefing = rust_sess.request_count
+                timings["ipc_round_trips_briefing"] = briefing_round_trips
+                slowest = sorted(
+                    ((k, v) for k, v in briefing_node_timings.items() if not k.startswith("_")),
+                    key=lambda x: -x[1],
+                )[:5]
+                logger.debug(
+                    "[TIMING] briefing nodes (slowest, %d worker(s), %.0fms session start): %s",
+                    int(briefing_node_timings.get("_workers", 1)),
+                    briefing_node_timings.get("_session_start", 0.0) * 1000,
+                    ", ".join(f"{k}={v * 1000:.0f}ms" for k, v in slowest),
+                )
 
             # Add history/event enrichment for DB + recap/event detection.
             try:
@@ -101,10 +146,25 @@ def _process_main(job: WorkerJob, out_q: mp.Queue[dict[str, Any]]) -> None:
                 logger.warning("History enrichment error: %s", e)
 
             t0 = time.time()
-            briefing_json = json_dumps(briefing, default=str)
+            briefing_bytes = json_dumps_bytes(briefing, default=str)
             timings["json_serialize"] = time.time() - t0
             log_timing("JSON serialize", timings["json_serialize"])
 
+            # Compact state the manager persists from, so it never re-parses the briefing.
+            from backend.core.history import build_event_state_from_briefing
+            from backend.core.metrics_timeline import extract_timeline_metrics
+
+            event_state = build_event_state_from_briefing(briefing)
+            timeline_metrics = extract_timeline_metrics(briefing)
+
+            t0 = time.time()
+            handoff: BriefingHandoff | None = None
+            try:
+                handoff = publish_briefing(briefing_bytes)
+            except OSError as e:
+                logger.warning("Briefing handoff file failed, sending inline: %s", e)
+            timings["briefing_handoff"] = time.time() - t0
+
             briefing_meta = briefing.get("meta", {}) if isinstance(briefing, dict) else {}
             extractor_meta = extractor.get_metadata() if isinstance(briefing, dict) else {}
             worker_meta: dict[str, Any] = {}
@@ -118,8 +178,12 @@ def _process_main(job: WorkerJob, out_q: mp.Queue[dict[str, Any]]) -> None:
                 if isinstance(missing_dlcs, list):
                     worker_meta["missing_dlcs"] = missing_dlcs
 
+            # Every Rust request is one IPC round-trip: briefing (all sessions) + later work.
+            timings["ipc_round_trips"] = briefing_round_trips + (
+                rust_sess.request_count - requests_after_briefing
+            )
+
             payload = {
-                "briefing_json": briefing_json,
                 "meta": worker_meta,
                 "identity": (briefing.get("identity") if isinstance(briefing, dict) else None),
                 "situation": (briefing.get("situation") if isinstance(briefing, dict) else None),
@@ -131,88 +195,435 @@ def _process_main(job: WorkerJob, out_q: mp.Queue[dict[str, Any]]) -> None:
                 "game_date": worker_meta.get("date"),
                 "duration_ms": (time.time() - started) * 1000,
                 "timings": timings,
+                "briefing_node_timings": briefing_node_timings,
+                "event_state": event_state,
+                "timeline_metrics": timeline_metrics,
             }
+            if handoff is not None:
+                payload["briefing_handoff"] = handoff
+            else:
+                payload["briefing_json"] = briefing_bytes
 
             timings["total"] = time.time() - started
             log_timing("TOTAL (t2)", timings["total"])
 
             # Log timing summary
+            # ipc_* entries are request counts, not durations.
             summary_lines = [
-                f"  {k}: {v * 1000:.1f}ms" for k, v in sorted(timings.items(), key=lambda x: -x[1])
+                f"  {k}: {v * 1000:.1f}ms"
+                for k, v in sorted(timings.items(), key=lambda x: -x[1])
+                if not k.startswith("ipc_")
             ]
+            summary_lines += [f"  {k}: {v:.0f}" for k, v in timings.items() if k.startswith("ipc_")]
             logger.info("[TIMING SUMMARY]\n%s", "\n".join(summary_lines))
 
-            out_q.put({"ok": True, "payload": payload, "worker_pid": os.getpid()})
-            return
+            return {"ok": True, "payload": payload, "worker_pid": os.getpid()}
         finally:
             t0 = time.time()
             ctx.__exit__(None, None, None)
             log_timing("Rust session close", time.time() - t0)
     except Exception as e:
         logger.error("Worker error: %s", e, exc_info=True)
-        out_q.put({"ok": False, "error": str(e), "worker_pid": os.getpid()})
+        return {"ok": False, "error": str(e), "worker_pid": os.getpid()}
+
+
+def _handoff_dir() -> Path:
+    return Path(tempfile.gettempdir()) / HANDOFF_DIRNAME
+
+
+def _prune_stale_handoffs(directory: Path) -> None:
+    """Remove handoff files nobody claimed (e.g. the job was cancelled mid-send)."""
+    cutoff = time.time() - HANDOFF_STALE_SECONDS
+    for stale in directory.glob("briefing-*.json"):
+        with contextlib.suppress(OSError):
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink()
+
+
+def publish_briefing(data: bytes) -> BriefingHandoff:
+    """Write serialized briefing bytes to a handoff file and return its descriptor."""
+    directory = _handoff_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    _prune_stale_handoffs(directory)
+    fd, path = tempfile.mkstemp(prefix="briefing-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        Path(path).unlink(missing_ok=True)
+        raise
+    return {"path": path, "size": len(data)}
 
 
-def run_worker_job(*, job: WorkerJob, cancel_event: Any) -> WorkerResult:
-    """Run a worker job in a separate process, allowing hard cancellation.
+def take_briefing(payload: dict[str, Any]) -> bytes | None:
+    """Claim the serialized briefing of a T2 payload (handoff file or inline fallback).
 
-    Cancellation is process-based (terminate/kill), so stale work stops consuming CPU/RAM.
+    The handoff file is removed once read; returns None if it is missing or short.
     """
-    ctx = mp.get_context("spawn")
-    q: mp.Queue[dict[str, Any]] = ctx.Queue(maxsize=1)
-    proc = ctx.Process(target=_process_main, args=(job, q), daemon=True)
-    proc.start()
+    handoff = payload.pop("briefing_handoff", None)
+    if isinstance(handoff, dict) and handoff.get("path"):
+        path = Path(handoff["path"])
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        finally:
+            path.unlink(missing_ok=True)
+        return data if len(data) == handoff.get("size") else None
+
+    inline = payload.pop("briefing_json", None)
+    if isinstance(inline, str):
+        return inline.encode("utf-8")
+    return inline if isinstance(inline, bytes) else None
+
 
-    worker_pid = proc.pid or None
+def discard_briefing(payload: dict[str, Any] | None) -> None:
+    """Drop an unclaimed T2 result's handoff file (stale or superseded result)."""
+    handoff = payload.get("briefing_handoff") if isinstance(payload, dict) else None
+    if isinstance(handoff, dict) and handoff.get("path"):
+        Path(handoff["path"]).unlink(missing_ok=True)
 
+
+def _is_cancelled(cancel_event: Any) -> bool:
+    return cancel_event is not None and bool(getattr(cancel_event, "is_set", lambda: False)())
+
+
+def _terminate_process(proc: Any) -> None:
+    """Terminate a worker process, escalating to kill if it does not exit promptly."""
     try:
-        while True:
-            if cancel_event is not None and getattr(cancel_event, "is_set", lambda: False)():
-                try:
-                    if proc.is_alive():
-                        proc.terminate()
-                except Exception:
-                    pass
-                proc.join(timeout=0.5)
+        if proc.is_alive():
+            proc.terminate()
+    except Exception:
+        pass
+    proc.join(timeout=0.5)
+    try:
+        if proc.is_alive():
+            proc.kill()
+    except Exception:
+        pass
+    proc.join(timeout=0.5)
+
+
+def _preload_modules() -> None:
+    """Import the heavy extraction/enrichment modules so warm jobs skip that cost."""
+    import stellaris_companion.rust_bridge  # noqa: F401
+    from backend.core import history, signals  # noqa: F401
+
+
+def _peak_rss_mb() -> float | None:
+    """Return this process's peak resident set size in MB (None if unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss_mb()
+    try:
+        peak = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    except Exception:
+        return None
+    # ru_maxrss is reported in bytes on macOS and KiB on Linux.
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _windows_peak_rss_mb() -> float | None:
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()  # type: ignore[attr-defined]
+        ok = ctypes.windll.psapi.GetProcessMemoryInfo(  # type: ignore[attr-defined]
+            handle, ctypes.byref(counters), counters.cb
+        )
+        if not ok:
+            return None
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def _pool_worker_main(in_q: mp.Queue[Any], out_q: mp.Queue[dict[str, Any]]) -> None:
+    """Long-lived worker loop: pre-import once, then serve jobs until told to stop."""
+    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(message)s")
+    started = time.time()
+    _preload_modules()
+    out_q.put({"ready": True, "worker_pid": os.getpid(), "startup": time.time() - started})
+
+    while True:
+        request = in_q.get()
+        if request is None:
+            return
+        job: WorkerJob = request["job"]
+        queue_wait = time.time() - float(request.get("dispatched_at") or time.time())
+        msg = _execute_job(job)
+        payload = msg.get("payload")
+        if isinstance(payload, dict) and isinstance(payload.get("timings"), dict):
+            payload["timings"]["worker_queue_wait"] = max(0.0, queue_wait)
+        msg["worker_peak_rss_mb"] = _peak_rss_mb()
+        out_q.put(msg)
+        if msg.get("ok") and job.get("search_index_dir"):
+            # Idle-time work: give way as soon as the next job (or shutdown) is queued.
+            _build_search_index(job, should_stop=lambda: not in_q.empty())
+
+
+def _build_search_index(job: WorkerJob, *, should_stop: Callable[[], bool]) -> bool:
+    """Build and cache the save's search index while the worker is otherwise idle.
+
+    Returns False if the build failed or was abandoned; the app's extractor then
+    builds the index on its first search instead.
+    """
+    logger = logging.getLogger("stellaris.worker")
+    t0 = time.time()
+    if should_stop():
+        return False
+    try:
+        # The buffer mode comes from STELLARIS_GAMESTATE_MMAP here as in the app's
+        # extractors, so the index file's unit (chars or bytes) matches theirs.
+        with SaveExtractor(job["save_path"], search_index_dir=job["search_index_dir"]) as extractor:
+            built = extractor.get_search_index(should_stop=should_stop) is not None
+    except Exception as e:
+        logger.warning("Search index build failed: %s", e)
+        return False
+    if built:
+        logger.debug("[TIMING] search index: %.1fms", (time.time() - t0) * 1000)
+    else:
+        logger.debug("Search index build abandoned for the next job")
+    return built
+
+
+class IngestionWorkerPool:
+    """Long-lived, pre-imported worker process for ingestion jobs.
+
+    Keeps one spawn-context process alive between saves so each autosave skips
+    interpreter startup and the extractor/signals imports. The Rust ``serve``
+    subprocess is bound to a single save path, so it is still started per job.
+
+    The worker is recycled only when a job is cancelled (the process is killed,
+    so only the latest save's job keeps running), when it crashes, or when
+    its peak RSS crosses ``memory_high_water_mb``. A replacement is spawned right
+    away so it can finish importing while the game is still writing the next save.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_high_water_mb: float | None = DEFAULT_WORKER_MEMORY_HIGH_WATER_MB,
+        ready_timeout_seconds: float = 120.0,
+    ) -> None:
+        self._ctx = mp.get_context("spawn")
+        self._memory_high_water_mb = memory_high_water_mb
+        self._ready_timeout_seconds = max(1.0, float(ready_timeout_seconds))
+
+        self._lock = threading.Lock()
+        self._job_lock = threading.Lock()
+        self._proc: Any = None
+        self._in_q: mp.Queue[Any] | None = None
+        self._out_q: mp.Queue[dict[str, Any]] | None = None
+        self._ready = False
+        self._jobs_served = 0
+        self._closed = False
+
+        self._stats: dict[str, Any] = {
+            "cold_starts": 0,
+            "warm_starts": 0,
+            "recycled_cancelled": 0,
+            "recycled_memory": 0,
+            "recycled_crashed": 0,
+            "last_peak_rss_mb": None,
+            "last_start": None,
+        }
+
+    def start(self) -> None:
+        """Pre-spawn the worker so the first save can be served warm."""
+        with self._lock:
+            if not self._closed:
+                self._ensure_process_locked()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["worker_pid"] = self._proc.pid if self._proc is not None else None
+            stats["worker_ready"] = self._ready
+            stats["jobs_served_by_worker"] = self._jobs_served
+            stats["memory_high_water_mb"] = self._memory_high_water_mb
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._shutdown_locked()
+
+    def run_job(self, *, job: WorkerJob, cancel_event: Any) -> WorkerResult:
+        """Run a job on the warm worker, killing and recycling it on cancellation."""
+        with self._job_lock:
+            with self._lock:
+                if self._closed:
+                    return {"ok": False, "error": "worker pool closed"}
+                self._ensure_process_locked()
+                self._poll_ready_locked()
+                warm = self._ready
+                proc = self._proc
+                in_q = self._in_q
+                out_q = self._out_q
+            worker_pid = proc.pid or 0
+
+            wait_started = time.time()
+            if not warm:
+                ready = self._wait_until_ready(proc, out_q, cancel_event)
+                if ready is not None:
+                    return {**ready, "worker_pid": worker_pid}
+            startup_wait = time.time() - wait_started
+
+            in_q.put({"job": job, "dispatched_at": time.time()})
+
+            while True:
+                if _is_cancelled(cancel_event):
+                    self._recycle(proc, "recycled_cancelled")
+                    return {"ok": False, "error": "cancelled", "worker_pid": worker_pid}
+
                 try:
-                    if proc.is_alive():
-                        proc.kill()
+                    msg = out_q.get(timeout=0.1)
                 except Exception:
-                    pass
-                proc.join(timeout=0.5)
-                return {
-                    "ok": False,
-                    "error": "cancelled",
-                    "worker_pid": worker_pid or 0,
-                }
-
+                    msg = None
+
+                if isinstance(msg, dict) and not msg.get("ready"):
+                    return self._finish_job(proc, msg, warm=warm, startup_wait=startup_wait)
+
+                if not proc.is_alive():
+                    with contextlib.suppress(Exception):
+                        msg = out_q.get_nowait()
+                        if isinstance(msg, dict) and not msg.get("ready"):
+                            return self._finish_job(proc, msg, warm=warm, startup_wait=startup_wait)
+                    self._recycle(proc, "recycled_crashed")
+                    return {
+                        "ok": False,
+                        "error": "worker exited without result",
+                        "worker_pid": worker_pid,
+                    }
+
+    # --- internals ---
+
+    def _finish_job(
+        self, proc: Any, msg: dict[str, Any], *, warm: bool, startup_wait: float
+    ) -> WorkerResult:
+        peak_rss_mb = msg.pop("worker_peak_rss_mb", None)
+        msg.setdefault("worker_pid", proc.pid or 0)
+
+        payload = msg.get("payload")
+        if isinstance(payload, dict):
+            timings = payload.get("timings")
+            if isinstance(timings, dict):
+                if warm:
+                    timings["worker_warm_start"] = timings.pop("worker_queue_wait", 0.0)
+                else:
+                    timings["worker_cold_start"] = startup_wait
+            payload["worker_start"] = "warm" if warm else "cold"
+
+        with self._lock:
+            self._stats["warm_starts" if warm else "cold_starts"] += 1
+            self._stats["last_start"] = "warm" if warm else "cold"
+            self._stats["last_peak_rss_mb"] = peak_rss_mb
+            self._jobs_served += 1
+
+        high_water = self._memory_high_water_mb
+        if (
+            isinstance(peak_rss_mb, (int, float))
+            and high_water is not None
+            and peak_rss_mb >= high_water
+        ):
+            logging.getLogger(__name__).info(
+                "Recycling ingestion worker pid=%s peak_rss=%.0fMB (high-water %.0fMB)",
+                proc.pid,
+                peak_rss_mb,
+                high_water,
+            )
+            self._recycle(proc, "recycled_memory")
+        return msg  # type: ignore[return-value]
+
+    def _wait_until_ready(
+        self, proc: Any, out_q: mp.Queue[dict[str, Any]], cancel_event: Any
+    ) -> dict[str, Any] | None:
+        """Block until the worker reports ready; return an error result on failure."""
+        deadline = time.time() + self._ready_timeout_seconds
+        while time.time() < deadline:
+            if _is_cancelled(cancel_event):
+                # The worker is still importing; leave it to warm up for the next save.
+                return {"ok": False, "error": "cancelled"}
             try:
-                msg = q.get(timeout=0.1)
-                if isinstance(msg, dict):
-                    msg.setdefault("worker_pid", worker_pid or 0)
-                    return msg  # type: ignore[return-value]
+                msg = out_q.get(timeout=0.1)
             except Exception:
-                pass
-
+                msg = None
+            if isinstance(msg, dict) and msg.get("ready"):
+                with self._lock:
+                    if proc is self._proc:
+                        self._ready = True
+                return None
             if not proc.is_alive():
-                proc.join(timeout=0.1)
-                # Attempt to pull a final message if it exited quickly.
-                try:
-                    msg = q.get_nowait()
-                    if isinstance(msg, dict):
-                        msg.setdefault("worker_pid", worker_pid or 0)
-                        return msg  # type: ignore[return-value]
-                except Exception:
-                    pass
-                return {
-                    "ok": False,
-                    "error": "worker exited without result",
-                    "worker_pid": worker_pid or 0,
-                }
-    finally:
-        try:
-            if proc.is_alive():
-                proc.terminate()
-        except Exception:
-            pass
-        proc.join(timeout=0.1)
+                self._recycle(proc, "recycled_crashed")
+                return {"ok": False, "error": "worker exited during startup"}
+        self._recycle(proc, "recycled_crashed")
+        return {"ok": False, "error": "worker startup timed out"}
+
+    def _poll_ready_locked(self) -> None:
+        if self._ready or self._out_q is None:
+            return
+        with contextlib.suppress(Exception):
+            msg = self._out_q.get_nowait()
+            if isinstance(msg, dict) and msg.get("ready"):
+                self._ready = True
+
+    def _ensure_process_locked(self) -> None:
+        if self._proc is not None and self._proc.is_alive():
+            return
+        if self._proc is not None:
+            self._shutdown_locked()
+        self._in_q = self._ctx.Queue()
+        self._out_q = self._ctx.Queue()
+        self._proc = self._ctx.Process(
+            target=_pool_worker_main,
+            args=(self._in_q, self._out_q),
+            daemon=True,
+            name="ingestion-worker",
+        )
+        self._proc.start()
+        self._ready = False
+        self._jobs_served = 0
+
+    def _recycle(self, proc: Any, reason: str) -> None:
+        with self._lock:
+            if proc is not self._proc:
+                return
+            self._stats[reason] += 1
+            self._shutdown_locked()
+            if not self._closed:
+                self._ensure_process_locked()
+
+    def _shutdown_locked(self) -> None:
+        proc = self._proc
+        if proc is not None:
+            _terminate_process(proc)
+        for q in (self._in_q, self._out_q):
+            if q is not None:
+                with contextlib.suppress(Exception):
+                    q.close()
+                    q.cancel_join_thread()
+        self._proc = None
+        self._in_q = None
+        self._out_q = None
+        self._ready = False
@@ -0,0 +1,103 @@
+"""Structural diffs between JSON documents (RFC 6902 style add/remove/replace ops).
+
+Used to store per-snapshot event state as a delta against the previous snapshot.
+Only the subset of JSON Patch produced by ``json_diff`` is supported:
+
+    {"op": "add", "path": "/history/leaders/7", "value": {...}}
+    {"op": "remove", "path": "/history/wars/wars/2"}
+    {"op": "replace", "path": "/military/military_power", "value": 12000}
+
+``apply_json_patch`` never mutates its input; it copies only the containers
+along patched paths, so unchanged sub-trees are shared with the base document.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Ops that turn ``old`` into ``new``.
+
+    Dicts are diffed per key and lists per index (tail items added/removed);
+    anything else that differs is replaced whole.
+    """
+    if type(old) is type(new) and old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = [
+            {"op": "remove", "path": f"{path}/{_escape(str(key))}"} for key in old if key not in new
+        ]
+        for key, value in new.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key in old:
+                ops.extend(json_diff(old[key], value, child))
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        ops = []
+        for i in range(common):
+            ops.extend(json_diff(old[i], new[i], f"{path}/{i}"))
+        ops.extend(
+            {"op": "add", "path": f"{path}/{i}", "value": new[i]} for i in range(common, len(new))
+        )
+        ops.extend(
+            {"op": "remove", "path": f"{path}/{i}"} for i in reversed(range(common, len(old)))
+        )
+        return ops
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_json_patch(doc: Any, ops: list[dict[str, Any]]) -> Any:
+    """Return ``doc`` with ``ops`` applied (``doc`` itself is left untouched)."""
+    copied: set[int] = set()  # ids of containers already copied for this patch
+
+    def own(container: Any) -> Any:
+        clone = dict(container) if isinstance(container, dict) else list(container)
+        copied.add(id(clone))
+        return clone
+
+    for op in ops:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            doc = op.get("value")
+            continue
+
+        if id(doc) not in copied:
+            doc = own(doc)
+        parent = doc
+        for token in tokens[:-1]:
+            key = int(token) if isinstance(parent, list) else token
+            child = parent[key]
+            if id(child) not in copied:
+                child = parent[key] = own(child)
+            parent = child
+
+        last = tokens[-1]
+        kind = op["op"]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if kind == "remove":
+                del parent[index]
+            elif kind == "add":
+                parent.insert(index, op["value"])
+            else:
+                parent[index] = op["value"]
+        elif kind == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return doc
@@ -10,6 +10,9 @@ Usage:
     json_str = json_dumps(data)
     json_str = json_dumps(data, indent=2)
     json_str = json_dumps(data, default=str)
+
+    # UTF-8 bytes without an intermediate str (for files, pipes and SQLite)
+    json_bytes = json_dumps_bytes(data, default=str)
 """
 
 from __future__ import annotations
@@ -49,6 +52,10 @@ try:
 
         return orjson.dumps(obj, default=default, option=option).decode("utf-8")
 
+    def json_dumps_bytes(obj: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes using orjson."""
+        return orjson.dumps(obj, default=default)
+
 except ImportError:
     import json
 
@@ -76,6 +83,10 @@ except ImportError:
             separators=separators,
         )
 
+    def json_dumps_bytes(obj: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes using stdlib json."""
+        return json_dumps(obj, default=default).encode("utf-8")
+
 
 def is_orjson_available() -> bool:
     """Check if orjson is being used."""
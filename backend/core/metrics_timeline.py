@@ -0,0 +1,84 @@
+"""Wide per-snapshot metrics timeline (the ``snapshot_metrics`` table).
+
+Every snapshot gets one append-only row of numeric metrics pulled from the
+complete briefing, so trend questions and charts can read a series without
+decoding JSON blobs (which retention drops anyway). Columns are fixed by
+``TIMELINE_METRICS``; adding one needs a schema migration.
+
+Usage:
+    from backend.core.metrics_timeline import extract_timeline_metrics
+
+    metrics = extract_timeline_metrics(briefing)   # {"military_power": 1.2e5, ...}
+    db.get_metric_series(session_id=sid, metric="alloys_net", max_points=120)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from backend.core.utils import safe_float
+
+# column -> path into the complete briefing (see SaveExtractor.get_complete_briefing).
+TIMELINE_METRICS: dict[str, tuple[str, ...]] = {
+    # Military
+    "military_power": ("military", "military_power"),
+    "military_fleets": ("military", "military_fleets"),
+    "military_ships": ("military", "military_ships"),
+    "fleet_size": ("military", "fleet_size"),
+    "victory_rank": ("military", "victory_rank"),
+    "wars_count": ("military", "wars", "active_war_count"),
+    # Power scores
+    "economy_power": ("economy", "economy_power"),
+    "tech_power": ("economy", "tech_power"),
+    # Territory / population
+    "colony_count": ("territory", "colonies", "total_count"),
+    "total_population": ("territory", "colonies", "total_population"),
+    "celestial_bodies": ("territory", "celestial_bodies_in_territory"),
+    "total_pops": ("economy", "pop_statistics", "total_pops"),
+    # Technology
+    "tech_count": ("technology", "completed_count"),
+    "research_total": ("economy", "resources", "summary", "research_total"),
+    # Monthly net per resource
+    "energy_net": ("economy", "net_monthly", "energy"),
+    "minerals_net": ("economy", "net_monthly", "minerals"),
+    "food_net": ("economy", "net_monthly", "food"),
+    "consumer_goods_net": ("economy", "net_monthly", "consumer_goods"),
+    "alloys_net": ("economy", "net_monthly", "alloys"),
+    "unity_net": ("economy", "net_monthly", "unity"),
+    "influence_net": ("economy", "net_monthly", "influence"),
+    "physics_research_net": ("economy", "net_monthly", "physics_research"),
+    "society_research_net": ("economy", "net_monthly", "society_research"),
+    "engineering_research_net": ("economy", "net_monthly", "engineering_research"),
+    "exotic_gases_net": ("economy", "net_monthly", "exotic_gases"),
+    "rare_crystals_net": ("economy", "net_monthly", "rare_crystals"),
+    "volatile_motes_net": ("economy", "net_monthly", "volatile_motes"),
+}
+
+# Fallback paths for briefings shaped differently (e.g. the compact event state).
+_FALLBACK_PATHS: dict[str, tuple[str, ...]] = {
+    "military_fleets": ("military", "fleet_count"),
+    "tech_count": ("technology", "tech_count"),
+    "wars_count": ("history", "wars", "count"),
+}
+
+
+def _lookup(briefing: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value: Any = briefing
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def extract_timeline_metrics(briefing: dict[str, Any]) -> dict[str, float | None]:
+    """Numeric timeline metrics from a briefing (missing values are None)."""
+    if not isinstance(briefing, dict):
+        return dict.fromkeys(TIMELINE_METRICS)
+    metrics: dict[str, float | None] = {}
+    for column, path in TIMELINE_METRICS.items():
+        value = safe_float(_lookup(briefing, path))
+        if value is None and column in _FALLBACK_PATHS:
+            value = safe_float(_lookup(briefing, _FALLBACK_PATHS[column]))
+        metrics[column] = value
+    return metrics
@@ -6,13 +6,17 @@ Advisor and Chronicle generation.
 
 from __future__ import annotations
 
+import logging
 import re
 import time
+from collections.abc import Iterator, Sequence
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Any, Literal
 from zoneinfo import ZoneInfo
 
+logger = logging.getLogger(__name__)
+
 GEMINI_FLASH_MODEL = "gemini-3-flash-preview"
 GEMINI_FLASH_LITE_MODEL = "gemini-3.1-flash-lite-preview"
 GOOGLE_GEMMA_MODEL = "gemma-4-26b-a4b-it"
@@ -215,6 +219,93 @@ def route_event_payload(event: ModelRouteEvent | None) -> dict[str, Any] | None:
     return event.to_dict() if event is not None else None
 
 
+class ModelRoute:
+    """Model fallback state for one model call, shared by the sync and async paths.
+
+    Iterating yields the candidate models to try in order (skipping ones marked
+    temporarily unavailable while a fallback remains). After a failed attempt,
+    should_fall_back() decides whether to continue to the next candidate.
+    """
+
+    def __init__(self, candidate_models: Sequence[str], *, purpose_label: str):
+        self.candidate_models = list(candidate_models)
+        self.requested_model = (
+            self.candidate_models[0] if self.candidate_models else GEMINI_FLASH_MODEL
+        )
+        self.purpose_label = purpose_label
+        self.route_event: ModelRouteEvent | None = None
+        self.last_error: Exception | None = None
+        self._fallback_model: str | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        models = self.candidate_models
+        for index, candidate_model in enumerate(models):
+            fallback_model = models[index + 1] if index + 1 < len(models) else None
+            if fallback_model and is_model_temporarily_unavailable(candidate_model):
+                self.route_event = get_model_unavailable_event(
+                    requested_model=self.requested_model,
+                    skipped_model=candidate_model,
+                    final_model=fallback_model,
+                )
+                continue
+            self._fallback_model = fallback_model
+            yield candidate_model
+
+    def succeeded(self, model: str) -> dict[str, Any]:
+        """Settle the route on ``model`` and return the route payload to report."""
+        requested_model = self.requested_model
+        if self.route_event is None and model != requested_model:
+            self.route_event = get_model_unavailable_event(
+                requested_model=requested_model,
+                skipped_model=requested_model,
+                final_model=model,
+            )
+        if self.route_event:
+            self.route_event.final_model = model
+            return self.route_event.to_dict()
+        return {
+            "requested_model": requested_model,
+            "requested_model_display": display_model_name(requested_model),
+            "attempted_model": model,
+            "attempted_model_display": display_model_name(model),
+            "final_model": model,
+            "final_model_display": display_model_name(model),
+            "fallback": False,
+            "reason": None,
+            "notice": None,
+            "error": None,
+        }
+
+    def should_fall_back(self, model: str, exc: Exception) -> bool:
+        """Record a failed attempt; True when the next candidate should be tried."""
+        self.last_error = exc
+        failure = classify_model_error(exc)
+        fallback_model = self._fallback_model
+        if not (failure and fallback_model):
+            return False
+        logger.warning(
+            "%s failed on %s; routing via %s: %s",
+            self.purpose_label,
+            display_model_name(model),
+            display_model_name(fallback_model),
+            exc,
+        )
+        mark_model_failure(model, failure)
+        self.route_event = self.route_event or get_model_unavailable_event(
+            requested_model=self.requested_model,
+            skipped_model=model,
+            final_model=fallback_model,
+        )
+        if self.route_event:
+            self.route_event.reason = failure.reason
+            self.route_event.error = failure.message[:500]
+            self.route_event.notice = fallback_notice(model, fallback_model, reason=failure.reason)
+        return True
+
+    def exhausted_error(self) -> Exception:
+        return self.last_error or RuntimeError(f"No {self.purpose_label} model was available")
+
+
 def _match(text: str, pattern: str) -> str | None:
     match = re.search(pattern, text, re.IGNORECASE)
     return match.group(1) if match else None
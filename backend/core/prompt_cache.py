@@ -0,0 +1,237 @@
+"""Provider-side caching of the stable advisor prompt prefix.
+
+Between two T2 briefings every chat turn starts with the same bytes: the
+advisor system instruction (personality, language policy, ask-mode rules) and
+the briefing JSON block. ``PromptPrefix`` captures that part, keyed by
+(briefing hash, personality hash, language), and ``PromptCache`` turns it into a
+Gemini cached-content handle per model, so later turns only send the
+per-turn conversation and question.
+
+Providers without explicit caching (or a failed create) fall back to sending
+the full prompt, which still starts with the identical prefix and so benefits
+from implicit prefix caching where the provider offers it. Transient create
+failures (rate limits, server errors, timeouts) are retried; only a prefix
+below the model's minimum or a model without caching support stops further
+creates on that model for a while. Turns that need a handle another turn is
+already creating wait for that create instead of starting their own.
+
+Usage:
+    prefix = build_prompt_prefix(system_instruction=sys_prompt, text=briefing_block,
+                                 briefing_json=briefing_json, language="en")
+    handle = prompt_cache.handle_for(client, model=model, prefix=prefix)
+    # handle -> GenerateContentConfig(cached_content=handle), contents=turn_text
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+PROMPT_CACHE_TTL_SECONDS = 30 * 60
+# Explicit caches have a provider minimum (a few thousand tokens); smaller
+# prefixes are cheaper to resend than to store.
+MIN_CACHED_PREFIX_CHARS = 16_000
+PROMPT_CACHE_MAX_ENTRIES = 8
+# Attempts per create when the provider fails transiently, with a linear backoff.
+PROMPT_CACHE_CREATE_ATTEMPTS = 3
+PROMPT_CACHE_RETRY_DELAY_SECONDS = 0.5
+# How long a turn waits for another turn's in-flight create of the same handle.
+PROMPT_CACHE_CREATE_WAIT_SECONDS = 30.0
+
+# Create errors that will not go away by retrying on this model.
+_UNSUPPORTED_MARKERS = (
+    "too small",
+    "min_total_token_count",
+    "does not support",
+    "not supported",
+    "unsupported",
+)
+_TRANSIENT_MARKERS = (
+    "resource_exhausted",
+    "unavailable",
+    "deadline",
+    "timeout",
+    "timed out",
+    "connection",
+)
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _create_failure_kind(error: BaseException) -> str:
+    """Classify a create failure as "unsupported", "transient" or "other".
+
+    "unsupported" is a prefix below the model's minimum or a model without
+    caching; "transient" is a rate limit, server error or timeout.
+    """
+    text = str(error).lower()
+    if any(marker in text for marker in _UNSUPPORTED_MARKERS):
+        return "unsupported"
+    code = getattr(error, "code", None)
+    if isinstance(code, int) and (code == 429 or code >= 500):
+        return "transient"
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return "transient"
+    if any(marker in text for marker in _TRANSIENT_MARKERS) or "429" in text:
+        return "transient"
+    return "other"
+
+
+@dataclass(frozen=True)
+class PromptPrefix:
+    """The turn-invariant part of an advisor prompt."""
+
+    system_instruction: str
+    text: str
+    key: tuple[str, str, str]  # (briefing hash, personality hash, language)
+
+    @property
+    def chars(self) -> int:
+        return len(self.system_instruction) + len(self.text)
+
+
+def build_prompt_prefix(
+    *, system_instruction: str, text: str, briefing_json: str, language: str
+) -> PromptPrefix:
+    return PromptPrefix(
+        system_instruction=system_instruction,
+        text=text,
+        key=(_digest(briefing_json), _digest(system_instruction), language),
+    )
+
+
+class PromptCache:
+    """Cached-content handles per (model, prefix key), with a TTL and LRU bound."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = PROMPT_CACHE_TTL_SECONDS,
+        min_chars: int = MIN_CACHED_PREFIX_CHARS,
+        max_entries: int = PROMPT_CACHE_MAX_ENTRIES,
+        retry_delay_seconds: float = PROMPT_CACHE_RETRY_DELAY_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.min_chars = min_chars
+        self.max_entries = max_entries
+        self.retry_delay_seconds = retry_delay_seconds
+        self._lock = threading.Lock()
+        # (model, key) -> (handle name, expires_at monotonic)
+        self._entries: OrderedDict[tuple[str, tuple[str, str, str]], tuple[str, float]] = (
+            OrderedDict()
+        )
+        # (model, key) -> set once the in-flight create for it has finished
+        self._creating: dict[tuple[str, tuple[str, str, str]], threading.Event] = {}
+        self._unsupported_until: dict[str, float] = {}
+        self._stats = {
+            "hits": 0,
+            "creates": 0,
+            "create_failures": 0,
+            "create_retries": 0,
+            "create_waits": 0,
+            "invalidations": 0,
+        }
+
+    def _cached_handle_locked(self, entry_key: tuple[str, tuple[str, str, str]]) -> str | None:
+        entry = self._entries.get(entry_key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        self._entries.move_to_end(entry_key)
+        self._stats["hits"] += 1
+        return entry[0]
+
+    def handle_for(self, client: Any, *, model: str, prefix: PromptPrefix) -> str | None:
+        """A cached-content name for this prefix on ``model``, or None to send it inline."""
+        caches = getattr(client, "caches", None)
+        if caches is None or prefix.chars < self.min_chars:
+            return None
+        entry_key = (model, prefix.key)
+        with self._lock:
+            name = self._cached_handle_locked(entry_key)
+            if name is not None:
+                return name
+            if self._unsupported_until.get(model, 0.0) > time.monotonic():
+                return None
+            in_flight = self._creating.get(entry_key)
+            if in_flight is None:
+                self._creating[entry_key] = threading.Event()
+            else:
+                self._stats["create_waits"] += 1
+
+        if in_flight is not None:
+            # Another turn is creating this handle; use its result (None if it failed).
+            in_flight.wait(PROMPT_CACHE_CREATE_WAIT_SECONDS)
+            with self._lock:
+                return self._cached_handle_locked(entry_key)
+
+        evicted: list[str] = []
+        try:
+            name = self._create(caches, model=model, prefix=prefix)
+            if name is not None:
+                with self._lock:
+                    self._stats["creates"] += 1
+                    # Expire a little early so a handle is never used right at the
+                    # server-side TTL.
+                    self._entries[entry_key] = (name, time.monotonic() + self.ttl_seconds * 0.9)
+                    while len(self._entries) > self.max_entries:
+                        evicted.append(self._entries.popitem(last=False)[1][0])
+        finally:
+            with self._lock:
+                self._creating.pop(entry_key).set()
+        for old_name in evicted:
+            with contextlib.suppress(Exception):
+                caches.delete(name=old_name)
+        return name
+
+    def _create(self, caches: Any, *, model: str, prefix: PromptPrefix) -> str | None:
+        """Create the cached content, retrying transient failures; None if it failed."""
+        for attempt in range(1, PROMPT_CACHE_CREATE_ATTEMPTS + 1):
+            try:
+                cache = caches.create(
+                    model=model,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=prefix.system_instruction,
+                        contents=[prefix.text],
+                        ttl=f"{int(self.ttl_seconds)}s",
+                    ),
+                )
+                return str(cache.name)
+            except Exception as e:
+                kind = _create_failure_kind(e)
+                if kind == "transient" and attempt < PROMPT_CACHE_CREATE_ATTEMPTS:
+                    with self._lock:
+                        self._stats["create_retries"] += 1
+                    time.sleep(self.retry_delay_seconds * attempt)
+                    continue
+                logger.debug("prompt_cache_create_failed model=%s kind=%s error=%s", model, kind, e)
+                with self._lock:
+                    self._stats["create_failures"] += 1
+                    if kind == "unsupported":
+                        # Below the model's minimum size, or no caching on it: stop
+                        # trying on this model for a while. Anything else is retried
+                        # on the next turn.
+                        self._unsupported_until[model] = time.monotonic() + self.ttl_seconds
+                return None
+        return None
+
+    def invalidate(self, *, model: str, prefix: PromptPrefix) -> None:
+        """Forget a handle the provider rejected (expired or deleted server-side)."""
+        with self._lock:
+            if self._entries.pop((model, prefix.key), None) is not None:
+                self._stats["invalidations"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), **self._stats}
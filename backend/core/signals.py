@@ -617,7 +617,11 @@ def _resolve_war_names_from_raw(extractor: SaveExtractor, session) -> list[str]:
 
         resolved_names: list[str] = []
 
-        for war_id, war_data in iter_section_entries(extractor.save_path, "war"):
+        for war_id, war_data in iter_section_entries(
+            extractor.save_path,
+            "war",
+            fields=("name", "attackers[].country", "defenders[].country"),
+        ):
             if not isinstance(war_data, dict):
                 continue
 
@@ -518,9 +518,10 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     finally:
-        # Clean up save watcher
+        # Clean up save watcher and the warm ingestion worker
         if save_watcher.is_running:
             save_watcher.stop()
+        ingestion.stop()
         logger.info("Server stopped")
 
 
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from backend.core.briefing_slice import ADVISOR_BRIEFING_SECTIONS, FOCUS_SECTIONS, resolve_focus
 from backend.core.database import GameDatabase
 from backend.core.language import language_name, normalize_language
 
@@ -63,45 +64,6 @@ NOTABLE_EVENT_TYPES = {
     "military_power_change",
 }
 
-FOCUS_SECTIONS = {
-    "economy": ["economy", "situation", "territory", "strategic_geography"],
-    "military": ["military", "defense", "technology", "situation", "strategic_geography"],
-    "diplomacy": ["diplomacy", "federation_details", "fallen_empires", "situation"],
-    "technology": ["technology", "projects", "progression", "economy"],
-    "territory": ["territory", "strategic_geography", "defense", "economy"],
-    "chronicle": ["situation", "identity", "diplomacy", "military", "territory", "endgame"],
-    "crisis": ["endgame", "military", "diplomacy", "fallen_empires", "defense"],
-    "general": [
-        "situation",
-        "economy",
-        "military",
-        "diplomacy",
-        "territory",
-        "technology",
-        "endgame",
-    ],
-}
-
-ADVISOR_BRIEFING_SECTIONS = [
-    "situation",
-    "economy",
-    "military",
-    "diplomacy",
-    "territory",
-    "technology",
-    "defense",
-    "strategic_geography",
-    "progression",
-    "projects",
-    "leadership",
-    "species",
-    "federation_details",
-    "fallen_empires",
-    "leviathans",
-    "endgame",
-    "history",
-]
-
 ROMAN_NUMERALS = {
     "1": "I",
     "2": "II",
@@ -916,12 +878,10 @@ class StellarisMcpContext:
                 s.ended_at,
                 s.last_game_date,
                 s.last_updated_at,
-                COUNT(snap.id) AS snapshot_count,
-                MIN(snap.game_date) AS first_game_date,
-                MAX(snap.game_date) AS last_game_date_computed
+                s.snapshot_count,
+                s.first_snapshot_game_date AS first_game_date,
+                s.last_snapshot_game_date AS last_game_date_computed
             FROM sessions s
-            LEFT JOIN snapshots snap ON snap.session_id = s.id
-            GROUP BY s.id
             ORDER BY (s.ended_at IS NULL) DESC, COALESCE(s.last_updated_at, s.started_at) DESC
             LIMIT 1;
             """
@@ -947,24 +907,7 @@ class StellarisMcpContext:
         return self.db.get_session_advisor_custom(session_id=session_id)
 
     def _resolve_focus(self, *, question: str, focus: str) -> str:
-        raw_focus = str(focus or "auto").strip().lower()
-        if raw_focus in FOCUS_SECTIONS:
-            return raw_focus
-
-        text = question.lower()
-        rules = [
-            ("economy", ("economy", "energy", "minerals", "alloys", "consumer", "deficit")),
-            ("military", ("fleet", "war", "naval", "ship", "army", "starbase", "power")),
-            ("diplomacy", ("diplomacy", "federation", "ally", "rival", "subject", "vassal")),
-            ("technology", ("tech", "research", "tradition", "ascension", "project")),
-            ("territory", ("planet", "colony", "system", "sector", "claim", "border")),
-            ("crisis", ("crisis", "khan", "fallen empire", "war in heaven", "endgame")),
-            ("chronicle", ("chronicle", "chapter", "history", "story", "narrative")),
-        ]
-        for name, tokens in rules:
-            if any(token in text for token in tokens):
-                return name
-        return "general"
+        return resolve_focus(question, focus)
 
     def _select_briefing_sections(self, briefing: dict[str, Any], focus: str) -> dict[str, Any]:
         sections = ["meta", "identity", *FOCUS_SECTIONS.get(focus, FOCUS_SECTIONS["general"])]
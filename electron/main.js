@@ -487,6 +487,10 @@ async function callBackendApiEnvelope(endpoint, options = {}) {
   return backendClient.callBackendApiEnvelope(endpoint, options)
 }
 
+async function streamBackendApiEnvelope(endpoint, options = {}, onDelta) {
+  return backendClient.streamBackendApiEnvelope(endpoint, options, onDelta)
+}
+
 // =============================================================================
 // Discord wiring (DISC-007 / DISC-008 / DISC-011)
 // =============================================================================
@@ -1367,6 +1371,7 @@ registerBackendIpcHandlers({
   ipcMain,
   validateSender,
   callBackendApiEnvelope,
+  streamBackendApiEnvelope,
   getResolvedLanguage: getResolvedLanguageSetting,
 })
 
@@ -136,15 +136,109 @@ function createBackendClient({ host, getPort, getAuthToken }) {
     }
   }
 
+  /**
+   * Call a server-sent events endpoint and return a structured envelope.
+   *
+   * `delta` events are passed to `onDelta(text)` as they arrive; the envelope
+   * resolves with the `done` event payload, or the `error` event as a failure.
+   */
+  async function streamBackendApiEnvelope(endpoint, options = {}, onDelta = () => {}) {
+    const url = `http://${host}:${getPort()}${endpoint}`
+
+    let response
+    try {
+      response = await fetch(url, {
+        ...options,
+        headers: {
+          ...options.headers,
+          Authorization: `Bearer ${getAuthToken()}`,
+          'Content-Type': 'application/json',
+          Accept: 'text/event-stream',
+        },
+      })
+    } catch (e) {
+      return { ok: false, error: e instanceof Error ? e.message : 'Request failed' }
+    }
+
+    if (!response.ok || !response.body) {
+      // Readiness checks fail before the stream starts, with the usual JSON error body
+      const rawBody = await response.text().catch(() => '')
+      let parsedBody = null
+      try {
+        parsedBody = rawBody ? JSON.parse(rawBody) : null
+      } catch {
+        parsedBody = null
+      }
+      const { message, code, retryAfterMs, details } = extractBackendErrorFields(parsedBody, rawBody)
+      return {
+        ok: false,
+        error: message,
+        code,
+        retry_after_ms: retryAfterMs,
+        http_status: response.status,
+        details,
+      }
+    }
+
+    const decoder = new TextDecoder()
+    let buffer = ''
+    try {
+      for await (const chunk of response.body) {
+        buffer += decoder.decode(chunk, { stream: true })
+        let boundary
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+          const frame = buffer.slice(0, boundary)
+          buffer = buffer.slice(boundary + 2)
+          const event = parseSseFrame(frame)
+          if (!event) continue
+          if (event.type === 'delta') {
+            onDelta(event.data?.text || '')
+          } else if (event.type === 'done') {
+            return { ok: true, data: event.data }
+          } else if (event.type === 'error') {
+            return { ok: false, error: event.data?.error || 'Request failed' }
+          }
+        }
+      }
+    } catch (e) {
+      return { ok: false, error: e instanceof Error ? e.message : 'Request failed' }
+    }
+
+    return { ok: false, error: 'Stream ended before the response was complete' }
+  }
+
   return {
     callBackendApiOrThrow,
     callBackendApiEnvelope,
+    streamBackendApiEnvelope,
+  }
+}
+
+/**
+ * Parse one server-sent events frame into `{ type, data }` (data is JSON).
+ */
+function parseSseFrame(frame) {
+  let type = 'message'
+  const dataLines = []
+  for (const line of frame.split('\n')) {
+    if (line.startsWith('event:')) {
+      type = line.slice(6).trim()
+    } else if (line.startsWith('data:')) {
+      dataLines.push(line.slice(5).trimStart())
+    }
+  }
+  if (dataLines.length === 0) return null
+  try {
+    return { type, data: JSON.parse(dataLines.join('\n')) }
+  } catch {
+    return null
   }
 }
 
 module.exports = {
   BackendApiError,
   extractBackendErrorFields,
+  parseSseFrame,
   createBackendClient,
 }
 
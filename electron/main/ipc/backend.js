@@ -1,4 +1,4 @@
-function registerBackendIpcHandlers({ ipcMain, validateSender, callBackendApiEnvelope, getResolvedLanguage }) {
+function registerBackendIpcHandlers({ ipcMain, validateSender, callBackendApiEnvelope, streamBackendApiEnvelope, getResolvedLanguage }) {
   // IPC Handlers - Backend Proxy (requires ELEC-005 for full implementation)
   // Basic handlers for backend proxy
 
@@ -30,6 +30,26 @@ function registerBackendIpcHandlers({ ipcMain, validateSender, callBackendApiEnv
     })
   })
 
+  // Streaming chat: deltas are pushed to the sender on 'backend:chat-delta' (tagged
+  // with the caller's stream_id); the invoke resolves with the final /api/chat fields.
+  ipcMain.handle('backend:chat-stream', async (event, { stream_id, message, session_key, model, model_routing_mode }) => {
+    try { validateSender(event) } catch (e) { return { ok: false, error: e instanceof Error ? e.message : 'IPC error', code: 'IPC_SENDER_INVALID' } }
+    const sender = event.sender
+    return await streamBackendApiEnvelope('/api/chat/stream', {
+      method: 'POST',
+      body: JSON.stringify(withLanguage({
+        message,
+        session_key,
+        model: model || null,
+        model_routing_mode: model_routing_mode || null,
+      })),
+    }, (text) => {
+      if (!sender.isDestroyed()) {
+        sender.send('backend:chat-delta', { stream_id, text })
+      }
+    })
+  })
+
   ipcMain.handle('backend:status', async (event) => {
     try { validateSender(event) } catch (e) { return { ok: false, error: e instanceof Error ? e.message : 'IPC error', code: 'IPC_SENDER_INVALID' } }
     return await callBackendApiEnvelope('/api/status')
@@ -96,6 +116,13 @@ function registerBackendIpcHandlers({ ipcMain, validateSender, callBackendApiEnv
     })
   })
 
+  ipcMain.handle('backend:compact-database', async (event) => {
+    try { validateSender(event) } catch (e) { return { ok: false, error: e instanceof Error ? e.message : 'IPC error', code: 'IPC_SENDER_INVALID' } }
+    return await callBackendApiEnvelope('/api/db/compact', {
+      method: 'POST',
+    })
+  })
+
   ipcMain.handle('backend:get-chronicle-custom', async (event) => {
     try { validateSender(event) } catch (e) { return { ok: false, error: e instanceof Error ? e.message : 'IPC error', code: 'IPC_SENDER_INVALID' } }
     return await callBackendApiEnvelope('/api/chronicle-custom-instructions')
@@ -74,6 +74,18 @@ contextBridge.exposeInMainWorld('electronAPI', {
         model,
         model_routing_mode: modelRoutingMode,
       }),
+    chatStream: (streamId, message, sessionKey, model, modelRoutingMode) =>
+      ipcRenderer.invoke('backend:chat-stream', {
+        stream_id: streamId,
+        message,
+        session_key: sessionKey,
+        model,
+        model_routing_mode: modelRoutingMode,
+      }),
+    // Uses managed listener to prevent accumulation
+    onChatDelta: (callback) => {
+      return createManagedListener('backend:chat-delta', callback)
+    },
     status: () => ipcRenderer.invoke('backend:status'),
     sessions: () => ipcRenderer.invoke('backend:sessions'),
     sessionEvents: (sessionId, limit) =>
@@ -104,6 +116,7 @@ contextBridge.exposeInMainWorld('electronAPI', {
         model_routing_mode: modelRoutingMode,
       }),
     endSession: () => ipcRenderer.invoke('backend:end-session'),
+    compactDatabase: () => ipcRenderer.invoke('backend:compact-database'),
     getChronicleCustom: () => ipcRenderer.invoke('backend:get-chronicle-custom'),
     setChronicleCustom: (customInstructions) =>
       ipcRenderer.invoke('backend:set-chronicle-custom', {
@@ -4,8 +4,10 @@ import type {
   BackendIpcResponse,
   BackendStatusEvent,
   ChatResponse,
+  ChatStreamDelta,
   ChronicleCustomResponse,
   ChronicleResponse,
+  CompactDatabaseResponse,
   DiagnosticsResponse,
   DiscordConnectResult,
   DiscordRelayStatus,
@@ -84,6 +86,14 @@ declare global {
           model?: string,
           modelRoutingMode?: ModelRoutingMode,
         ) => Promise<BackendIpcResponse<ChatResponse>>
+        chatStream: (
+          streamId: string,
+          message: string,
+          sessionKey?: string,
+          model?: string,
+          modelRoutingMode?: ModelRoutingMode,
+        ) => Promise<BackendIpcResponse<ChatResponse>>
+        onChatDelta: (callback: (delta: ChatStreamDelta) => void) => () => void
         status: () => Promise<BackendIpcResponse<StatusResponse>>
         sessions: () => Promise<BackendIpcResponse<SessionsResponse>>
         sessionEvents: (sessionId: string, limit?: number) => Promise<BackendIpcResponse<SessionEventsResponse>>
@@ -107,6 +117,7 @@ declare global {
           modelRoutingMode?: ModelRoutingMode,
         ) => Promise<BackendIpcResponse<RegenerateChapterResponse>>
         endSession: () => Promise<BackendIpcResponse<EndSessionResponse>>
+        compactDatabase: () => Promise<BackendIpcResponse<CompactDatabaseResponse>>
         getChronicleCustom: () => Promise<BackendIpcResponse<ChronicleCustomResponse>>
         setChronicleCustom: (customInstructions: string) => Promise<BackendIpcResponse<ChronicleCustomResponse>>
         getSessionAdvisorCustom: () => Promise<BackendIpcResponse<AdvisorCustomResponse>>
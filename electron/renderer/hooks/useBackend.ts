@@ -63,6 +63,12 @@ export interface ChatResponse {
   requested_model?: string
   requested_model_display?: string
   model_routing?: ModelRoutingEvent | null
+  ttft_ms?: number | null
+}
+
+export interface ChatStreamDelta {
+  stream_id: string
+  text: string
 }
 
 export interface ChatRetryResponse {
@@ -205,6 +211,16 @@ export interface EndSessionResponse {
   snapshot_count: number
 }
 
+export interface CompactDatabaseResponse {
+  converted: boolean
+  pages: {
+    page_size: number
+    page_count: number
+    freelist_count: number
+    auto_vacuum: string
+  }
+}
+
 export interface ErrorResponse {
   error: string
   code?: string
@@ -413,6 +429,32 @@ export function useBackend() {
     )
   }, [callApi])
 
+  /**
+   * Send a chat message and stream the response
+   *
+   * `onDelta` receives each text chunk as it is generated; the result carries
+   * the same fields as `chat` once the stream completes.
+   */
+  const chatStream = useCallback(async (
+    message: string,
+    onDelta: (text: string) => void,
+    sessionKey?: string,
+    model?: string,
+    modelRoutingMode?: ModelRoutingMode,
+  ): Promise<UseBackendResult<ChatResponse>> => {
+    const streamId = `stream-${Date.now()}-${Math.random().toString(36).slice(2)}`
+    const unsubscribe = window.electronAPI?.backend.onChatDelta((delta) => {
+      if (delta.stream_id === streamId) onDelta(delta.text)
+    })
+    try {
+      return await callApi<ChatResponse>('chat', () =>
+        window.electronAPI!.backend.chatStream(streamId, message, sessionKey, model, modelRoutingMode)
+      )
+    } finally {
+      unsubscribe?.()
+    }
+  }, [callApi])
+
   /**
    * Get current empire status
    */
@@ -512,6 +554,15 @@ export function useBackend() {
     )
   }, [callApi])
 
+  /**
+   * Convert an older history DB to incremental vacuum (one-off full rebuild)
+   */
+  const compactDatabase = useCallback(async (): Promise<UseBackendResult<CompactDatabaseResponse>> => {
+    return callApi<CompactDatabaseResponse>('compactDatabase', () =>
+      window.electronAPI!.backend.compactDatabase()
+    )
+  }, [callApi])
+
   /**
    * Get chronicle custom instructions for the current playthrough
    */
@@ -540,6 +591,7 @@ export function useBackend() {
     // Methods
     health,
     chat,
+    chatStream,
     status,
     sessions,
     sessionEvents,
@@ -547,6 +599,7 @@ export function useBackend() {
     chronicle,
     regenerateChapter,
     endSession,
+    compactDatabase,
     getChronicleCustom,
     setChronicleCustom,
 
@@ -555,7 +608,7 @@ export function useBackend() {
     get loadingStates() {
       return loadingStatesRef.current
     },
-  }), [health, chat, status, sessions, sessionEvents, recap, chronicle, regenerateChapter, endSession, getChronicleCustom, setChronicleCustom, isLoading])
+  }), [health, chat, chatStream, status, sessions, sessionEvents, recap, chronicle, regenerateChapter, endSession, compactDatabase, getChronicleCustom, setChronicleCustom, isLoading])
 }
 
 export default useBackend
@@ -142,6 +142,7 @@ function ChatPage({
   const backend = useBackend()
   const [messages, setMessages] = useState<Message[]>([])
   const [isLoading, setIsLoading] = useState(false)
+  const [streamingMessageId, setStreamingMessageId] = useState<string | null>(null)
   const [sessionKey, setSessionKey] = useState(() => createSessionKey())
   const [scrollToBottomSignal, setScrollToBottomSignal] = useState(0)
   const [empireType, setEmpireType] = useState<EmpireType | null>(null)
@@ -256,12 +257,34 @@ function ChatPage({
     setLoadingMessage(getLoadingMessage(empireType, loadingMessages))
     setIsLoading(true)
 
+    // Streamed text grows a placeholder assistant message until the final response arrives
+    const streamingId = `assistant-${Date.now()}`
+    let streamedText = ''
+    const onDelta = (delta: string) => {
+      if (!isMountedRef.current) return
+      const isFirstDelta = streamedText === ''
+      streamedText += delta
+      const content = streamedText
+      setMessages(prev => {
+        if (isFirstDelta) {
+          return capMessages([...prev, { id: streamingId, role: 'assistant', content, timestamp: new Date() }])
+        }
+        return prev.map(m => (m.id === streamingId ? { ...m, content } : m))
+      })
+      setStreamingMessageId(streamingId)
+    }
+
     try {
-      const result = await backend.chat(text, sessionKey, undefined, modelRoutingMode)
+      const result = await backend.chatStream(text, onDelta, sessionKey, undefined, modelRoutingMode)
 
       // Only update state if component is still mounted
       if (!isMountedRef.current) return
 
+      if (result.error) {
+        // A failed stream replaces whatever partial text was shown
+        setMessages(prev => prev.filter(m => m.id !== streamingId))
+      }
+
       if (result.error) {
         // Retryable backend state (precompute not ready)
         if (result.errorCode === 'BRIEFING_NOT_READY' && result.retryAfterMs) {
@@ -290,7 +313,7 @@ function ChatPage({
         // Success - add assistant response
         const chatResponse = result.data as ChatResponse
         const assistantMessage: Message = {
-          id: `assistant-${Date.now()}`,
+          id: streamingId,
           role: 'assistant',
           content: chatResponse.text,
           timestamp: new Date(),
@@ -299,12 +322,17 @@ function ChatPage({
           modelDisplay: chatResponse.model_display,
           modelRouting: chatResponse.model_routing,
         }
-        setMessages(prev => capMessages([...prev, assistantMessage]))
+        setMessages(prev => capMessages([
+          ...prev.filter(m => m.id !== streamingId),
+          assistantMessage,
+        ]))
       }
     } catch (err) {
       // Only update state if component is still mounted
       if (!isMountedRef.current) return
 
+      setMessages(prev => prev.filter(m => m.id !== streamingId))
+
       // Unexpected error
       const errorMessage: Message = {
         id: `error-${Date.now()}`,
@@ -317,6 +345,7 @@ function ChatPage({
     } finally {
       if (isMountedRef.current) {
         setIsLoading(false)
+        setStreamingMessageId(null)
       }
     }
   }, [backend, sessionKey, empireType, modelRoutingMode, loadingMessages, t])
@@ -345,7 +374,7 @@ function ChatPage({
           modelRouting={message.modelRouting}
           isError={message.isError}
           onReport={
-            onReportLlmIssue && message.role === 'assistant' && !message.isError
+            onReportLlmIssue && message.role === 'assistant' && !message.isError && message.id !== streamingMessageId
               ? () => {
                 const lastPrompt = [...messages.slice(0, idx)].reverse().find((m) => m.role === 'user')?.content
                 onReportLlmIssue({
@@ -362,7 +391,7 @@ function ChatPage({
       ),
     }))
 
-    if (isLoading) {
+    if (isLoading && !streamingMessageId) {
       base.push({
         key: '__loading__',
         render: (ref: (el: HTMLDivElement | null) => void) => (
@@ -379,7 +408,7 @@ function ChatPage({
     }
 
     return base
-  }, [messages, isLoading, loadingMessage, onReportLlmIssue])
+  }, [messages, isLoading, streamingMessageId, loadingMessage, onReportLlmIssue])
 
   return (
     <div className="flex flex-col h-full min-h-0 relative">
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark GameDatabase.get_events_in_snapshot_range on a synthetic campaign.
+
+Builds a temporary DB with one save, N snapshots and M events (default 100k),
+then times chapter-sized range queries through the indexed to_snapshot_id
+column against the previous json_extract(data_json) filter.
+
+Usage:
+    python3 scripts/experiments/bench_event_ranges.py
+    python3 scripts/experiments/bench_event_ranges.py --events 200000 --snapshots 2000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from backend.core.database import GameDatabase  # noqa: E402
+
+SAVE_ID = "bench-save"
+
+# The pre-index filter, kept here for comparison.
+LEGACY_QUERY = """
+    SELECT e.id, e.captured_at, e.game_date, e.event_type, e.summary, e.data_json
+    FROM events e
+    JOIN sessions s ON e.session_id = s.id
+    WHERE s.save_id = ?
+      AND CAST(json_extract(e.data_json, '$.to_snapshot_id') AS INTEGER) > ?
+      AND CAST(json_extract(e.data_json, '$.to_snapshot_id') AS INTEGER) <= ?
+    ORDER BY e.game_date ASC, e.captured_at ASC, e.id ASC;
+"""
+
+
+def _populate(db: GameDatabase, *, snapshots: int, events: int) -> list[int]:
+    session_id = db.get_or_create_active_session(save_id=SAVE_ID, empire_name="Bench Empire")
+    snapshot_ids = []
+    for i in range(snapshots):
+        snapshot_ids.append(
+            db.insert_snapshot(
+                session_id=session_id,
+                game_date=f"{2200 + i // 12}.{i % 12 + 1:02d}.01",
+                save_hash=f"hash-{i}",
+                military_power=None,
+                colony_count=None,
+                wars_count=None,
+                energy_net=None,
+                alloys_net=None,
+                full_briefing_json=None,
+                event_state_json="{}",
+            )
+        )
+
+    rng = random.Random(0)
+    per_snapshot = max(1, events // max(1, snapshots - 1))
+    db.execute("BEGIN;")
+    remaining = events
+    for prev_id, snap_id in zip(snapshot_ids, snapshot_ids[1:], strict=False):
+        batch = min(per_snapshot, remaining)
+        if batch <= 0:
+            break
+        db.insert_events(
+            session_id=session_id,
+            captured_at=snap_id,
+            game_date=None,
+            events=[
+                {
+                    "event_type": rng.choice(("war_started", "leader_hired", "tech_researched")),
+                    "summary": "Synthetic event",
+                    "data": {
+                        "from_snapshot_id": prev_id,
+                        "to_snapshot_id": snap_id,
+                        "detail": "x" * rng.randint(20, 200),
+                    },
+                }
+                for _ in range(batch)
+            ],
+        )
+        remaining -= batch
+    db.execute("COMMIT;")
+    return snapshot_ids
+
+
+def _time(fn, repeat: int) -> tuple[float, int]:
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        rows = len(fn())
+    return (time.perf_counter() - started) * 1000 / repeat, rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--snapshots", type=int, default=1_000)
+    parser.add_argument("--chapter", type=int, default=50, help="Snapshots per range query")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = GameDatabase(Path(tmp) / "bench.db")
+        t0 = time.perf_counter()
+        snapshot_ids = _populate(db, snapshots=args.snapshots, events=args.events)
+        print(f"populated {args.events:,} events in {time.perf_counter() - t0:.1f}s")
+
+        lo = snapshot_ids[len(snapshot_ids) // 2]
+        hi = lo + args.chapter
+        indexed_ms, indexed_rows = _time(
+            lambda: db.get_events_in_snapshot_range(
+                save_id=SAVE_ID, from_snapshot_id=lo, to_snapshot_id=hi
+            ),
+            args.repeat,
+        )
+        legacy_ms, legacy_rows = _time(
+            lambda: db.execute(LEGACY_QUERY, (SAVE_ID, lo, hi)).fetchall(), args.repeat
+        )
+        db.close()
+
+    print(f"{'query':<24}{'rows':>8}{'ms':>10}")
+    print(f"{'indexed to_snapshot_id':<24}{indexed_rows:>8}{indexed_ms:>10.2f}")
+    print(f"{'json_extract (legacy)':<24}{legacy_rows:>8}{legacy_ms:>10.2f}")
+    if indexed_ms > 0:
+        print(f"speedup: {legacy_ms / indexed_ms:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
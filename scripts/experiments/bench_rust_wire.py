@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Compare the Rust parser session wire formats (JSON lines vs MessagePack frames).
+
+Runs the same ops against one save in a JSON session and a msgpack session and
+reports response bytes and Python-side decode time per op. Requires the parser
+binary and, for the msgpack column, the `msgpack` module.
+
+Usage:
+    python3 scripts/experiments/bench_rust_wire.py
+    python3 scripts/experiments/bench_rust_wire.py --save path/to/save.sav --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from stellaris_companion.rust_bridge import RustSession  # noqa: E402
+
+OPS = {
+    "extract_sections(galactic_object)": lambda s: s.extract_sections(["galactic_object"]),
+    "extract_sections(planets)": lambda s: s.extract_sections(["planets"]),
+    "iter_section(country)": lambda s: sum(1 for _ in s.iter_section("country")),
+    "iter_section(fleet)": lambda s: sum(1 for _ in s.iter_section("fleet")),
+    "get_entry(country 0)": lambda s: s.get_entry("country", "0"),
+    "batch_ops(x20 get_entry)": lambda s: s.batch_ops(
+        [{"op": "get_entry", "section": "country", "key": str(i)} for i in range(20)]
+    ),
+}
+
+
+def _measure(save: Path, wire: str, repeat: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    with RustSession(save, timeout=120.0, wire=wire) as sess:
+        sess.extract_sections(["meta"])  # Completes the handshake before measuring.
+        if sess.wire != wire:
+            print(f"WARNING: parser answered with {sess.wire!r} instead of {wire!r}")
+        for name, op in OPS.items():
+            before = sess.get_wire_stats()
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                op(sess)
+            wall = time.perf_counter() - t0
+            after = sess.get_wire_stats()
+            results[name] = {
+                "bytes": (after["bytes_received"] - before["bytes_received"]) / repeat,
+                "decode_ms": (after["decode_seconds"] - before["decode_seconds"]) * 1000 / repeat,
+                "wall_ms": wall * 1000 / repeat,
+            }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--save",
+        type=Path,
+        default=Path(__file__).resolve().parents[2] / "test_save.sav",
+        help="Save file to benchmark (default: test_save.sav)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per op (default: 3)")
+    args = parser.parse_args()
+
+    if not args.save.exists():
+        print(f"ERROR: save not found: {args.save}")
+        return 1
+
+    wires = ["json", "msgpack"]
+
+    by_wire = {wire: _measure(args.save, wire, max(1, args.repeat)) for wire in wires}
+
+    header = f"{'op':<34}" + "".join(
+        f"{wire + ' KB':>14}{wire + ' dec ms':>16}{wire + ' wall ms':>17}" for wire in wires
+    )
+    print(header)
+    print("-" * len(header))
+    for name in OPS:
+        row = f"{name:<34}"
+        for wire in wires:
+            m = by_wire[wire][name]
+            row += f"{m['bytes'] / 1024:>14.1f}{m['decode_ms']:>16.1f}{m['wall_ms']:>17.1f}"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
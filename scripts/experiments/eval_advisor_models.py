@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Compare advisor responses across Gemini routing models on a real save."""
+"""Compare advisor responses across Gemini routing models on a real save.
+
+With --budget (repeatable) each model is also run at several briefing budgets,
+to measure answer quality against prompt size (0 = full briefing).
+"""
 
 from __future__ import annotations
 
@@ -41,6 +45,7 @@ class CaseResult:
     question: str
     notes: str
     model: str
+    budget_chars: int
     ok: bool
     issues: list[str]
     elapsed_s: float
@@ -221,8 +226,9 @@ def build_companion(save_path: Path, api_key: str, briefing: dict[str, Any]) ->
     return companion
 
 
-def run_case(companion: Companion, case: EvalCase, model: str) -> CaseResult:
-    session_key = f"eval::{model}::{case.name}::{int(time.time() * 1000)}"
+def run_case(companion: Companion, case: EvalCase, model: str, budget_chars: int = 0) -> CaseResult:
+    companion.briefing_budget_chars = budget_chars
+    session_key = f"eval::{model}::{budget_chars}::{case.name}::{int(time.time() * 1000)}"
     answer, elapsed = companion.ask_precomputed(
         question=case.question,
         session_key=session_key,
@@ -236,6 +242,7 @@ def run_case(companion: Companion, case: EvalCase, model: str) -> CaseResult:
         question=case.question,
         notes=case.notes,
         model=model,
+        budget_chars=budget_chars,
         ok=not issues and not answer.startswith("Error:"),
         issues=issues,
         elapsed_s=elapsed,
@@ -245,6 +252,10 @@ def run_case(companion: Companion, case: EvalCase, model: str) -> CaseResult:
     )
 
 
+def _prompt_chars(result: CaseResult) -> int:
+    return int((result.stats.get("payload_sizes") or {}).get("prompt_total") or 0)
+
+
 def print_summary(results_by_model: dict[str, list[CaseResult]]) -> None:
     print("\nAdvisor model comparison\n")
     for model, results in results_by_model.items():
@@ -252,13 +263,15 @@ def print_summary(results_by_model: dict[str, list[CaseResult]]) -> None:
         passed = sum(1 for result in results if result.ok)
         errors = sum(1 for result in results if result.response.startswith("Error:"))
         avg_elapsed = sum(result.elapsed_s for result in results) / max(total, 1)
+        avg_prompt = sum(_prompt_chars(result) for result in results) / max(total, 1)
         print(
             f"- {model}: {passed}/{total} heuristic passes, {errors} API/runtime errors, "
-            f"avg {avg_elapsed:.2f}s"
+            f"avg {avg_elapsed:.2f}s, avg prompt {avg_prompt:,.0f} chars"
         )
         for result in results:
             status = "PASS" if result.ok else "FAIL"
-            print(f"  [{status}] {result.name}: {result.notes}")
+            budget = f"budget {result.budget_chars:,}" if result.budget_chars else "full"
+            print(f"  [{status}] {result.name} ({budget}): {result.notes}")
             if result.issues:
                 print(f"    issues: {'; '.join(result.issues)}")
             preview = " ".join(result.response.split())
@@ -278,6 +291,13 @@ def parse_args() -> argparse.Namespace:
         dest="models",
         help="Model to test (repeatable). Defaults to Gemini Flash + Flash-Lite.",
     )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        dest="budgets",
+        type=int,
+        help="Briefing budget in chars (repeatable; 0 = full briefing). Defaults to 0.",
+    )
     parser.add_argument(
         "--json-out",
         type=Path,
@@ -311,18 +331,27 @@ def main() -> int:
     print(f"Loaded save: {save_path}")
     print(f"Empire: {(briefing.get('identity') or {}).get('empire_name')}")
     print(f"Date: {meta.get('date')}  Version: {meta.get('version')}")
-    print(f"Running {len(cases)} cases across {len(models)} models...\n")
+    budgets = args.budgets or [0]
+    print(
+        f"Running {len(cases)} cases across {len(models)} models "
+        f"and {len(budgets)} briefing budgets...\n"
+    )
 
     results_by_model: dict[str, list[CaseResult]] = {}
     for model in models:
-        model_results: list[CaseResult] = []
-        results_by_model[model] = model_results
-        print(f"Testing {model}...")
-        for case in cases:
-            result = run_case(companion, case, model=model)
-            model_results.append(result)
-            status = "PASS" if result.ok else "FAIL"
-            print(f"  {status} {case.name} ({result.elapsed_s:.2f}s)")
+        for budget in budgets:
+            label = f"{model} @ {budget:,} chars" if budget else model
+            model_results: list[CaseResult] = []
+            results_by_model[label] = model_results
+            print(f"Testing {label}...")
+            for case in cases:
+                result = run_case(companion, case, model=model, budget_chars=budget)
+                model_results.append(result)
+                status = "PASS" if result.ok else "FAIL"
+                print(
+                    f"  {status} {case.name} ({result.elapsed_s:.2f}s, "
+                    f"prompt {_prompt_chars(result):,} chars)"
+                )
 
     print_summary(results_by_model)
 
@@ -331,6 +360,7 @@ def main() -> int:
             "save_path": str(save_path),
             "meta": meta,
             "models": models,
+            "budgets": budgets,
             "cases": [asdict(case) for case in cases],
             "results_by_model": {
                 model: [asdict(result) for result in results]
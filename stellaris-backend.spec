@@ -100,6 +100,8 @@ a = Analysis(
         'watchdog.events',
         # Performance: orjson for ~3x faster JSON serialization
         'orjson',
+        # Binary wire format for the Rust parser session (falls back to JSON)
+        'msgpack',
         # Standard library modules that may be missed
         'sqlite3',
         'json',
@@ -2,15 +2,34 @@
 //!
 //! Loads and parses a save file once, then responds to JSON requests via stdin/stdout.
 //! This eliminates re-parsing overhead when making multiple queries against the same save.
+//!
+//! Requests are always newline-delimited JSON. Responses start as JSON lines; a client
+//! may send `{"op": "hello", "wire": ["msgpack"]}` to switch every later response to
+//! length-prefixed MessagePack frames (4-byte big-endian length, then the payload).
 
 use crate::error::{ErrorKind, SCHEMA_VERSION, TOOL_VERSION};
+use crate::projection::{project_entry, project_value, Projection};
+use crate::wire::{self, Wire};
 use aho_corasick::AhoCorasick;
 use anyhow::{Context, Result};
 use jomini::text::de::from_windows1252_slice;
 use serde::{Deserialize, Serialize};
 use serde_json::{json, Map, Value};
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::io::{self, BufRead, Write};
+use std::sync::atomic::{AtomicBool, Ordering};
+
+/// Response framing negotiated via the `hello` op (false = JSON lines).
+static MSGPACK_WIRE: AtomicBool = AtomicBool::new(false);
+
+fn current_wire() -> Wire {
+    if MSGPACK_WIRE.load(Ordering::Relaxed) {
+        Wire::Msgpack
+    } else {
+        Wire::Json
+    }
+}
 
 /// Request types for session mode
 #[derive(Debug, Deserialize)]
@@ -23,6 +42,8 @@ enum Request {
         section: String,
         #[serde(default = "default_batch_size")]
         batch_size: usize,
+        #[serde(default)]
+        fields: Option<Vec<String>>,
     },
     GetEntry {
         section: String,
@@ -60,6 +81,11 @@ enum Request {
     Multi {
         ops: Vec<MultiOp>,
     },
+    /// Negotiate the response wire format (acknowledged in the current framing)
+    Hello {
+        #[serde(default)]
+        wire: Vec<String>,
+    },
     Close,
 }
 
@@ -176,6 +202,11 @@ enum ResponseData {
     MultiResults {
         results: Vec<Value>,
     },
+    /// Acknowledgement of a hello request
+    Hello {
+        wire: String,
+        tool_version: String,
+    },
 }
 
 #[derive(Debug, Serialize)]
@@ -265,44 +296,27 @@ impl ParsedSave {
     }
 }
 
-/// Write a JSON line to stdout (protocol output)
+/// Write a response to stdout (protocol output) in the negotiated framing
 fn write_response<T: Serialize>(response: &T) -> io::Result<()> {
     let mut stdout = io::stdout().lock();
-    serde_json::to_writer(&mut stdout, response)?;
-    stdout.write_all(b"\n")?;
-    stdout.flush()?;
-    Ok(())
+    wire::write_response(&mut stdout, current_wire(), response)?;
+    stdout.flush()
 }
 
 /// Write a stream entry directly without cloning the value.
 /// This avoids expensive deep clones of large Value trees.
 fn write_stream_entry(key: &str, value: &Value) -> io::Result<()> {
     let mut stdout = io::stdout().lock();
-    // Write the JSON structure directly, serializing value in place
-    write!(stdout, r#"{{"ok":true,"entry":{{"key":"{}","value":"#, key)?;
-    serde_json::to_writer(&mut stdout, value)?;
-    stdout.write_all(b"}}\n")?;
-    stdout.flush()?;
-    Ok(())
+    wire::write_stream_entry(&mut stdout, current_wire(), key, value)?;
+    stdout.flush()
 }
 
 /// Write a batch of stream entries directly without cloning.
-/// Each entry's value is serialized in place to avoid deep clones.
-fn write_stream_batch(entries: &[(&str, &Value)]) -> io::Result<()> {
+/// Values may be borrowed or projected copies.
+fn write_stream_batch(entries: &[(&str, Cow<Value>)]) -> io::Result<()> {
     let mut stdout = io::stdout().lock();
-    // Build JSON: {"ok":true,"entries":[{"key":"...","value":...},...]}
-    stdout.write_all(b"{\"ok\":true,\"entries\":[")?;
-    for (i, (key, value)) in entries.iter().enumerate() {
-        if i > 0 {
-            stdout.write_all(b",")?;
-        }
-        write!(stdout, r#"{{"key":"{}","value":"#, key)?;
-        serde_json::to_writer(&mut stdout, value)?;
-        stdout.write_all(b"}")?;
-    }
-    stdout.write_all(b"]}\n")?;
-    stdout.flush()?;
-    Ok(())
+    wire::write_stream_batch(&mut stdout, current_wire(), entries)?;
+    stdout.flush()
 }
 
 /// Write an error response
@@ -320,7 +334,12 @@ fn handle_extract_sections(parsed: &ParsedSave, sections: Vec<String>) -> io::Re
 }
 
 /// Handle iter_section operation (streaming)
-fn handle_iter_section(parsed: &ParsedSave, section: String, batch_size: usize) -> io::Result<()> {
+fn handle_iter_section(
+    parsed: &ParsedSave,
+    section: String,
+    batch_size: usize,
+    fields: Option<Vec<String>>,
+) -> io::Result<()> {
     // Write stream header
     write_response(&SuccessResponse {
         ok: true,
@@ -331,18 +350,21 @@ fn handle_iter_section(parsed: &ParsedSave, section: String, batch_size: usize)
         },
     })?;
 
+    // Without a projection, entries are borrowed and serialized in place.
+    let projection = fields.as_deref().map(Projection::compile);
+
     // Get section and iterate
     if let Some(Value::Object(map)) = parsed.gamestate.get(&section) {
         if batch_size <= 1 {
             // Single-entry mode (backward compatible)
             for (key, value) in map {
-                write_stream_entry(key, value)?;
+                write_stream_entry(key, &project_value(projection.as_ref(), value))?;
             }
         } else {
             // Batched mode - collect entries and write in batches
-            let mut batch: Vec<(&str, &Value)> = Vec::with_capacity(batch_size);
+            let mut batch: Vec<(&str, Cow<Value>)> = Vec::with_capacity(batch_size);
             for (key, value) in map {
-                batch.push((key.as_str(), value));
+                batch.push((key.as_str(), project_value(projection.as_ref(), value)));
                 if batch.len() >= batch_size {
                     write_stream_batch(&batch)?;
                     batch.clear();
@@ -398,38 +420,14 @@ fn handle_get_entries(
     keys: Vec<String>,
     fields: Option<Vec<String>>,
 ) -> io::Result<()> {
+    let projection = fields.as_deref().map(Projection::compile);
     let mut entries: Vec<Value> = Vec::new();
 
     // Get the section from gamestate
     if let Some(Value::Object(map)) = parsed.gamestate.get(&section) {
         for key in &keys {
             if let Some(entry_value) = map.get(key) {
-                // Apply field projection if specified
-                let projected = if let Some(ref field_list) = fields {
-                    if let Value::Object(entry_obj) = entry_value {
-                        let mut projected_obj = Map::new();
-                        projected_obj.insert("_key".to_string(), json!(key));
-                        for field in field_list {
-                            if let Some(field_value) = entry_obj.get(field) {
-                                projected_obj.insert(field.clone(), field_value.clone());
-                            }
-                        }
-                        Value::Object(projected_obj)
-                    } else {
-                        // Non-object entry (e.g., "none"), include as-is with key
-                        let mut obj = Map::new();
-                        obj.insert("_key".to_string(), json!(key));
-                        obj.insert("_value".to_string(), entry_value.clone());
-                        Value::Object(obj)
-                    }
-                } else {
-                    // No projection - include full entry with key
-                    let mut obj = Map::new();
-                    obj.insert("_key".to_string(), json!(key));
-                    obj.insert("_value".to_string(), entry_value.clone());
-                    Value::Object(obj)
-                };
-                entries.push(projected);
+                entries.push(project_entry(key, entry_value, projection.as_ref()));
             }
             // Note: keys that don't exist are silently skipped
         }
@@ -916,34 +914,12 @@ fn handle_multi_op(parsed: &ParsedSave, ops: Vec<MultiOp>) -> io::Result<()> {
                 keys,
                 fields,
             } => {
+                let projection = fields.as_deref().map(Projection::compile);
                 let mut entries: Vec<Value> = Vec::new();
                 if let Some(Value::Object(map)) = parsed.gamestate.get(&section) {
                     for key in &keys {
                         if let Some(entry_value) = map.get(key) {
-                            let projected = if let Some(ref field_list) = fields {
-                                if let Value::Object(entry_obj) = entry_value {
-                                    let mut projected_obj = Map::new();
-                                    projected_obj.insert("_key".to_string(), json!(key));
-                                    for field in field_list {
-                                        if let Some(field_value) = entry_obj.get(field) {
-                                            projected_obj
-                                                .insert(field.clone(), field_value.clone());
-                                        }
-                                    }
-                                    Value::Object(projected_obj)
-                                } else {
-                                    let mut obj = Map::new();
-                                    obj.insert("_key".to_string(), json!(key));
-                                    obj.insert("_value".to_string(), entry_value.clone());
-                                    Value::Object(obj)
-                                }
-                            } else {
-                                let mut obj = Map::new();
-                                obj.insert("_key".to_string(), json!(key));
-                                obj.insert("_value".to_string(), entry_value.clone());
-                                Value::Object(obj)
-                            };
-                            entries.push(projected);
+                            entries.push(project_entry(key, entry_value, projection.as_ref()));
                         }
                     }
                 }
@@ -1109,6 +1085,21 @@ fn handle_multi_op(parsed: &ParsedSave, ops: Vec<MultiOp>) -> io::Result<()> {
     })
 }
 
+/// Handle hello: pick the first supported wire format the client asked for.
+/// The acknowledgement is written in the current framing; later responses use the new one.
+fn handle_hello(wire: Vec<String>) -> io::Result<()> {
+    let chosen = Wire::negotiate(&wire);
+    write_response(&SuccessResponse {
+        ok: true,
+        data: ResponseData::Hello {
+            wire: chosen.name().to_string(),
+            tool_version: TOOL_VERSION.to_string(),
+        },
+    })?;
+    MSGPACK_WIRE.store(chosen == Wire::Msgpack, Ordering::Relaxed);
+    Ok(())
+}
+
 /// Main serve loop
 pub fn run(path: &str) -> Result<()> {
     // Log startup to stderr (stdout is reserved for protocol)
@@ -1174,7 +1165,8 @@ pub fn run(path: &str) -> Result<()> {
             Request::IterSection {
                 section,
                 batch_size,
-            } => handle_iter_section(&parsed, section, batch_size),
+                fields,
+            } => handle_iter_section(&parsed, section, batch_size, fields),
             Request::GetEntry { section, key } => handle_get_entry(&parsed, section, key),
             Request::GetEntries {
                 section,
@@ -1198,6 +1190,7 @@ pub fn run(path: &str) -> Result<()> {
                 handle_get_entry_text(&parsed.gamestate_bytes, section, key)
             }
             Request::Multi { ops } => handle_multi_op(&parsed, ops),
+            Request::Hello { wire } => handle_hello(wire),
             Request::Close => {
                 eprintln!("[serve] Received close request, shutting down");
                 write_response(&SuccessResponse {
@@ -1242,6 +1235,7 @@ mod tests {
             Request::IterSection {
                 section,
                 batch_size,
+                ..
             } => {
                 assert_eq!(section, "country");
                 assert_eq!(batch_size, 100); // Default batch size
@@ -1258,6 +1252,7 @@ mod tests {
             Request::IterSection {
                 section,
                 batch_size,
+                ..
             } => {
                 assert_eq!(section, "country");
                 assert_eq!(batch_size, 50);
@@ -1322,6 +1317,24 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_iter_section_request_with_fields() {
+        let json = r#"{"op": "iter_section", "section": "galactic_object", "fields": ["coordinate.x", "hyperlane[].to"]}"#;
+        let req: Request = serde_json::from_str(json).unwrap();
+        match req {
+            Request::IterSection { fields, .. } => {
+                assert_eq!(
+                    fields,
+                    Some(vec![
+                        "coordinate.x".to_string(),
+                        "hyperlane[].to".to_string()
+                    ])
+                );
+            }
+            _ => panic!("Wrong request type"),
+        }
+    }
+
     #[test]
     fn test_count_keys_request() {
         let json = r#"{"op": "count_keys", "keys": ["name", "type", "flag"]}"#;
@@ -1399,6 +1412,18 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_hello_request() {
+        let json = r#"{"op": "hello", "wire": ["msgpack", "json"]}"#;
+        let req: Request = serde_json::from_str(json).unwrap();
+        match req {
+            Request::Hello { wire } => {
+                assert_eq!(wire, vec!["msgpack", "json"]);
+            }
+            _ => panic!("Wrong request type"),
+        }
+    }
+
     #[test]
     fn test_multi_op_request() {
         let json = r#"{"op": "multi", "ops": [{"op": "get_entry", "section": "country", "key": "0"}, {"op": "count_keys", "keys": ["name"]}]}"#;
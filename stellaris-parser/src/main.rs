@@ -4,6 +4,8 @@ mod commands;
 mod edge_cases;
 mod error;
 mod output;
+mod projection;
+mod wire;
 
 #[derive(Parser)]
 #[command(name = "stellaris-parser")]
@@ -0,0 +1,179 @@
+//! Field projection for entry-returning session ops (`fields` lists)
+//!
+//! Paths use `.` to descend into objects (`coordinate.x`). A `[]` suffix marks a
+//! list whose elements are projected individually (`hyperlane[].to`); arrays are
+//! mapped element-wise wherever they occur, so the suffix is only documentation.
+//! A path that ends at a segment keeps that whole value.
+
+use serde_json::{json, Map, Value};
+use std::borrow::Cow;
+use std::collections::BTreeMap;
+
+/// Compiled field projection
+#[derive(Debug, Default)]
+pub struct Projection {
+    children: BTreeMap<String, Projection>,
+    whole: bool,
+}
+
+impl Projection {
+    pub fn compile(paths: &[String]) -> Self {
+        let mut root = Projection::default();
+        for path in paths {
+            let mut node = &mut root;
+            for segment in path.split('.') {
+                let name = segment.strip_suffix("[]").unwrap_or(segment);
+                if name.is_empty() {
+                    continue;
+                }
+                node = node.children.entry(name.to_string()).or_default();
+            }
+            node.whole = true;
+        }
+        root
+    }
+
+    /// Copy only the projected parts of `value`.
+    pub fn apply(&self, value: &Value) -> Value {
+        if self.whole {
+            return value.clone();
+        }
+        match value {
+            Value::Object(obj) => Value::Object(self.project_object(obj)),
+            Value::Array(items) => Value::Array(items.iter().map(|v| self.apply(v)).collect()),
+            other => other.clone(),
+        }
+    }
+
+    fn project_object(&self, obj: &Map<String, Value>) -> Map<String, Value> {
+        let mut out = Map::new();
+        for (name, child) in &self.children {
+            if let Some(value) = obj.get(name) {
+                out.insert(name.clone(), child.apply(value));
+            }
+        }
+        out
+    }
+}
+
+/// Borrow `value` as-is, or copy its projected parts when a projection is given.
+pub fn project_value<'v>(projection: Option<&Projection>, value: &'v Value) -> Cow<'v, Value> {
+    match projection {
+        Some(projection) => Cow::Owned(projection.apply(value)),
+        None => Cow::Borrowed(value),
+    }
+}
+
+/// Build a get_entries result item: `_key` plus projected fields, or `_key` and
+/// the full `_value` when there is no projection or the entry is not an object.
+pub fn project_entry(key: &str, value: &Value, projection: Option<&Projection>) -> Value {
+    let mut obj = match (projection, value) {
+        (Some(projection), Value::Object(entry)) => projection.project_object(entry),
+        _ => {
+            let mut obj = Map::new();
+            obj.insert("_value".to_string(), value.clone());
+            obj
+        }
+    };
+    obj.insert("_key".to_string(), json!(key));
+    Value::Object(obj)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn fields(paths: &[&str]) -> Projection {
+        Projection::compile(&paths.iter().map(|p| p.to_string()).collect::<Vec<_>>())
+    }
+
+    fn keys(value: &Value) -> Vec<&str> {
+        value
+            .as_object()
+            .unwrap()
+            .keys()
+            .map(String::as_str)
+            .collect()
+    }
+
+    #[test]
+    fn test_projection_nested_paths() {
+        let system = json!({
+            "name": {"key": "Sol"},
+            "coordinate": {"x": 1.5, "y": -2.0, "origin": 4294967295u32},
+            "hyperlane": [{"to": 7, "length": 40}, {"to": 9, "length": 55}],
+            "starbases": [12],
+        });
+        let projection = fields(&["name", "coordinate.x", "hyperlane[].to", "missing.field"]);
+
+        assert_eq!(
+            projection.apply(&system),
+            json!({
+                "name": {"key": "Sol"},
+                "coordinate": {"x": 1.5},
+                "hyperlane": [{"to": 7}, {"to": 9}],
+            })
+        );
+        // Deleted entries ("none") pass through untouched.
+        assert_eq!(projection.apply(&json!("none")), json!("none"));
+    }
+
+    #[test]
+    fn test_project_entry_keeps_key() {
+        let entry = json!({"name": "UNE", "type": "default", "flags": {"a": 1}});
+        let projection = fields(&["name"]);
+
+        assert_eq!(
+            project_entry("0", &entry, Some(&projection)),
+            json!({"_key": "0", "name": "UNE"})
+        );
+        assert_eq!(
+            project_entry("0", &json!("none"), Some(&projection)),
+            json!({"_key": "0", "_value": "none"})
+        );
+        assert_eq!(
+            project_entry("1", &entry, None),
+            json!({"_key": "1", "_value": entry.clone()})
+        );
+    }
+
+    #[test]
+    fn test_projected_section_returns_only_requested_keys() {
+        let section = json!({
+            "0": {
+                "name": {"key": "UNE"},
+                "capital": 12,
+                "budget": {"income": {"alloys": 40}, "expenses": {"alloys": 10}},
+                "flags": {"first_contact": 1},
+                "owned_planets": [12, 13],
+            },
+            "1": {"name": {"key": "Blorg"}, "capital": 7, "flags": {}},
+            "2": "none",
+        });
+        let projection = fields(&["capital", "budget.income"]);
+
+        // iter_section: each value is projected before it is written.
+        let streamed: Vec<(&str, Cow<Value>)> = section
+            .as_object()
+            .unwrap()
+            .iter()
+            .map(|(key, value)| (key.as_str(), project_value(Some(&projection), value)))
+            .collect();
+        assert_eq!(keys(&streamed[0].1), ["budget", "capital"]);
+        assert_eq!(keys(&streamed[0].1["budget"]), ["income"]);
+        assert_eq!(keys(&streamed[1].1), ["capital"]);
+        assert_eq!(*streamed[2].1, json!("none"));
+        assert!(matches!(streamed[0].1, Cow::Owned(_)));
+
+        // get_entries: the projected fields plus `_key`, nothing else.
+        let entry = project_entry("0", &section["0"], Some(&projection));
+        assert_eq!(keys(&entry), ["_key", "budget", "capital"]);
+        assert_eq!(entry["budget"], json!({"income": {"alloys": 40}}));
+    }
+
+    #[test]
+    fn test_no_projection_borrows_value() {
+        let value = json!({"name": "UNE"});
+        assert!(matches!(project_value(None, &value), Cow::Borrowed(_)));
+    }
+}
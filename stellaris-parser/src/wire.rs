@@ -0,0 +1,353 @@
+//! Response framing for session mode (`serve`)
+//!
+//! Responses are either newline-delimited JSON or length-prefixed MessagePack frames
+//! (4-byte big-endian length, then the payload). MessagePack is written by `rmp-serde`
+//! straight into the frame buffer, so responses are never converted to an
+//! intermediate `Value`.
+//!
+//! Maps and structs are always encoded with their field names (like JSON), so both
+//! framings decode to the same objects on the Python side.
+
+use serde::ser::{self, Serialize, SerializeSeq};
+use serde_json::Value;
+use std::borrow::Borrow;
+use std::io::{self, Write};
+
+/// Response framing negotiated with the client
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum Wire {
+    Json,
+    Msgpack,
+}
+
+impl Wire {
+    /// Pick the first supported format the client asked for (JSON otherwise).
+    pub fn negotiate(requested: &[String]) -> Self {
+        requested
+            .iter()
+            .find_map(|name| match name.as_str() {
+                "msgpack" => Some(Wire::Msgpack),
+                "json" => Some(Wire::Json),
+                _ => None,
+            })
+            .unwrap_or(Wire::Json)
+    }
+
+    pub fn name(self) -> &'static str {
+        match self {
+            Wire::Json => "json",
+            Wire::Msgpack => "msgpack",
+        }
+    }
+}
+
+/// Write a complete response in the given framing.
+pub fn write_response<W: Write, T: Serialize + ?Sized>(
+    out: &mut W,
+    wire: Wire,
+    response: &T,
+) -> io::Result<()> {
+    match wire {
+        Wire::Json => {
+            serde_json::to_writer(&mut *out, response)?;
+            out.write_all(b"\n")
+        }
+        Wire::Msgpack => out.write_all(&encode_frame(response)?),
+    }
+}
+
+/// Write a single stream entry, serializing the value in place (no deep clone).
+pub fn write_stream_entry<W: Write>(
+    out: &mut W,
+    wire: Wire,
+    key: &str,
+    value: &Value,
+) -> io::Result<()> {
+    match wire {
+        Wire::Json => {
+            // Write the JSON structure directly, serializing value in place
+            write!(out, r#"{{"ok":true,"entry":{{"key":"{}","value":"#, key)?;
+            serde_json::to_writer(&mut *out, value)?;
+            out.write_all(b"}}\n")
+        }
+        Wire::Msgpack => out.write_all(&encode_frame(&StreamEntry {
+            ok: true,
+            entry: EntryRef { key, value },
+        })?),
+    }
+}
+
+/// Write a batch of stream entries; values may be borrowed or projected copies.
+pub fn write_stream_batch<W: Write, V: Borrow<Value>>(
+    out: &mut W,
+    wire: Wire,
+    entries: &[(&str, V)],
+) -> io::Result<()> {
+    match wire {
+        Wire::Json => {
+            // Build JSON: {"ok":true,"entries":[{"key":"...","value":...},...]}
+            out.write_all(b"{\"ok\":true,\"entries\":[")?;
+            for (i, (key, value)) in entries.iter().enumerate() {
+                if i > 0 {
+                    out.write_all(b",")?;
+                }
+                write!(out, r#"{{"key":"{}","value":"#, key)?;
+                serde_json::to_writer(&mut *out, value.borrow())?;
+                out.write_all(b"}")?;
+            }
+            out.write_all(b"]}\n")
+        }
+        Wire::Msgpack => out.write_all(&encode_frame(&StreamBatch {
+            ok: true,
+            entries: BatchEntries(entries),
+        })?),
+    }
+}
+
+/// Borrowed stream entry, serialized without cloning the value
+#[derive(serde::Serialize)]
+struct EntryRef<'a> {
+    key: &'a str,
+    value: &'a Value,
+}
+
+#[derive(serde::Serialize)]
+struct StreamEntry<'a> {
+    ok: bool,
+    entry: EntryRef<'a>,
+}
+
+#[derive(serde::Serialize)]
+#[serde(bound(serialize = "V: Borrow<Value>"))]
+struct StreamBatch<'a, V> {
+    ok: bool,
+    entries: BatchEntries<'a, V>,
+}
+
+struct BatchEntries<'a, V>(&'a [(&'a str, V)]);
+
+impl<V: Borrow<Value>> Serialize for BatchEntries<'_, V> {
+    fn serialize<S: ser::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        let mut seq = serializer.serialize_seq(Some(self.0.len()))?;
+        for (key, value) in self.0 {
+            seq.serialize_element(&EntryRef {
+                key,
+                value: value.borrow(),
+            })?;
+        }
+        seq.end()
+    }
+}
+
+/// Encode `value` as one frame: 4-byte big-endian payload length, then MessagePack.
+pub fn encode_frame<T: Serialize + ?Sized>(value: &T) -> io::Result<Vec<u8>> {
+    let mut buf = vec![0u8; 4];
+    rmp_serde::encode::write_named(&mut buf, value)
+        .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e.to_string()))?;
+    let len = u32::try_from(buf.len() - 4)
+        .map_err(|_| io::Error::new(io::ErrorKind::InvalidData, "response frame too large"))?;
+    buf[..4].copy_from_slice(&len.to_be_bytes());
+    Ok(buf)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde::Serialize;
+    use serde_json::json;
+    use std::borrow::Cow;
+
+    /// Split a session's stdout into responses: JSON lines until the hello ack
+    /// switches to msgpack, then length-prefixed frames.
+    fn read_session(out: &[u8]) -> Vec<Value> {
+        let mut responses = Vec::new();
+        let mut pos = 0;
+        let mut msgpack = false;
+        while pos < out.len() {
+            if msgpack {
+                let len = u32::from_be_bytes(out[pos..pos + 4].try_into().unwrap()) as usize;
+                let frame = &out[pos + 4..pos + 4 + len];
+                responses.push(rmp_serde::from_slice(frame).unwrap());
+                pos += 4 + len;
+            } else {
+                let end = pos + out[pos..].iter().position(|&b| b == b'\n').unwrap();
+                let response: Value = serde_json::from_slice(&out[pos..end]).unwrap();
+                msgpack = response["wire"] == "msgpack";
+                responses.push(response);
+                pos = end + 1;
+            }
+        }
+        responses
+    }
+
+    /// Mirrors serve's `SuccessResponse { ok, #[serde(flatten)] data }` shape.
+    #[derive(Serialize)]
+    struct Success<D> {
+        ok: bool,
+        #[serde(flatten)]
+        data: D,
+    }
+
+    #[derive(Serialize)]
+    #[serde(untagged)]
+    enum Data {
+        Hello {
+            wire: String,
+            tool_version: String,
+        },
+        StreamHeader {
+            stream: bool,
+            op: String,
+            section: String,
+        },
+        Entry {
+            found: bool,
+            entry: Option<Value>,
+        },
+    }
+
+    #[derive(Serialize)]
+    struct Failure {
+        ok: bool,
+        error: String,
+        #[serde(skip_serializing_if = "Option::is_none")]
+        line: Option<u32>,
+        exit_code: i32,
+    }
+
+    fn session_values() -> (Value, Value) {
+        let country = json!({
+            "name": {"key": "UNE", "variables": [{"key": "adj", "value": "Terran"}]},
+            "flags": {},
+            "capital": 1,
+            "budget": {"income": 123.25, "debt": -40, "min": -2147483649i64},
+            "owned": (0..40).collect::<Vec<u32>>(),
+            "long": "x".repeat(300),
+            "big": 4294967296u64,
+            "none": null,
+            "active": true,
+        });
+        (country, json!("none"))
+    }
+
+    /// Run the serve response sequence for a hello-negotiated session.
+    fn run_session(wire: Wire) -> Vec<u8> {
+        let (country, deleted) = session_values();
+        let mut out = Vec::new();
+        let ack = Success {
+            ok: true,
+            data: Data::Hello {
+                wire: wire.name().to_string(),
+                tool_version: "0.4.0".to_string(),
+            },
+        };
+        // The ack is always sent in the framing that was active before the hello.
+        write_response(&mut out, Wire::Json, &ack).unwrap();
+
+        let header = Success {
+            ok: true,
+            data: Data::StreamHeader {
+                stream: true,
+                op: "iter_section".to_string(),
+                section: "country".to_string(),
+            },
+        };
+        write_response(&mut out, wire, &header).unwrap();
+        write_stream_entry(&mut out, wire, "0", &country).unwrap();
+        let batch: Vec<(&str, Cow<Value>)> =
+            vec![("0", Cow::Borrowed(&country)), ("1", Cow::Owned(deleted))];
+        write_stream_batch(&mut out, wire, &batch).unwrap();
+        write_response(
+            &mut out,
+            wire,
+            &Success {
+                ok: true,
+                data: Data::Entry {
+                    found: false,
+                    entry: None,
+                },
+            },
+        )
+        .unwrap();
+        write_response(
+            &mut out,
+            wire,
+            &Failure {
+                ok: false,
+                error: "InvalidRequest".to_string(),
+                line: None,
+                exit_code: 3,
+            },
+        )
+        .unwrap();
+        out
+    }
+
+    #[test]
+    fn test_msgpack_session_round_trips_like_json_lines() {
+        let json_responses = read_session(&run_session(Wire::Json));
+        let msgpack_responses = read_session(&run_session(Wire::Msgpack));
+
+        assert_eq!(msgpack_responses.len(), 6);
+        assert_eq!(msgpack_responses[0]["wire"], "msgpack");
+        assert_eq!(json_responses[0]["wire"], "json");
+        assert_eq!(msgpack_responses[1..], json_responses[1..]);
+
+        let (country, _) = session_values();
+        assert_eq!(
+            msgpack_responses[2],
+            json!({"ok": true, "entry": {"key": "0", "value": country}})
+        );
+        assert_eq!(
+            msgpack_responses[3]["entries"][1],
+            json!({"key": "1", "value": "none"})
+        );
+        assert_eq!(
+            msgpack_responses[5],
+            json!({"ok": false, "error": "InvalidRequest", "exit_code": 3})
+        );
+    }
+
+    #[test]
+    fn test_frame_length_prefix_and_minimal_ints() {
+        let frame = encode_frame(&json!([0, 127, 128, 65535, 65536, -1, -32, -33, -129])).unwrap();
+        assert_eq!(frame[..4], 20u32.to_be_bytes());
+        assert_eq!(
+            frame[4..],
+            [
+                0x99, 0x00, 0x7f, 0xcc, 0x80, 0xcd, 0xff, 0xff, 0xce, 0x00, 0x01, 0x00, 0x00, 0xff,
+                0xe0, 0xd0, 0xdf, 0xd1, 0xff, 0x7f
+            ]
+        );
+    }
+
+    #[test]
+    fn test_flattened_struct_is_a_named_map() {
+        // serde(flatten) serializes the outer struct as a map of unknown length.
+        let frame = encode_frame(&Success {
+            ok: true,
+            data: Data::StreamHeader {
+                stream: true,
+                op: "iter_section".to_string(),
+                section: "country".to_string(),
+            },
+        })
+        .unwrap();
+        assert_eq!(frame[4], 0x84);
+        assert_eq!(
+            rmp_serde::from_slice::<Value>(&frame[4..]).unwrap(),
+            json!({"ok": true, "stream": true, "op": "iter_section", "section": "country"})
+        );
+    }
+
+    #[test]
+    fn test_negotiate_picks_first_supported() {
+        let ask = |names: &[&str]| {
+            Wire::negotiate(&names.iter().map(|n| n.to_string()).collect::<Vec<_>>())
+        };
+        assert_eq!(ask(&["cbor", "msgpack", "json"]), Wire::Msgpack);
+        assert_eq!(ask(&["json", "msgpack"]), Wire::Json);
+        assert_eq!(ask(&["cbor"]), Wire::Json);
+        assert_eq!(ask(&[]), Wire::Json);
+    }
+}
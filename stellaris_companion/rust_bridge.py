@@ -10,6 +10,12 @@ The Rust binary can be located in multiple places (in order of priority):
 3. Packaged: bin/ directory relative to this file
 4. System: PATH-accessible stellaris-parser binary
 
+Wire Format:
+    Requests are newline-delimited JSON. At session start the client asks the
+    parser (``hello`` op) to send responses as length-prefixed MessagePack
+    frames; older parsers or STELLARIS_PARSER_WIRE=json keep newline-delimited
+    JSON responses.
+
 Session Mode:
     For improved performance when making multiple queries against the same save,
     use the session() context manager. This keeps the parsed save in memory:
@@ -58,11 +64,14 @@ import queue
 import subprocess
 import sys
 import threading
+import time
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager, suppress
 from pathlib import Path
 
+import msgpack
+
 from .paths import get_repo_root
 
 
@@ -209,6 +218,21 @@ class ParserError(Exception):
 # Thread-local storage for session context
 _tls = threading.local()
 
+# Exit code the parser reports for malformed/unknown requests (ErrorKind::InvalidArgument)
+_EXIT_INVALID_ARGUMENT = 3
+
+
+class _MsgpackFrame(bytes):
+    """Raw MessagePack response frame (JSON responses stay plain ``bytes`` lines)."""
+
+
+def _default_wire() -> str:
+    """Preferred session wire format: STELLARIS_PARSER_WIRE, else msgpack."""
+    requested = os.environ.get("STELLARIS_PARSER_WIRE", "").strip().lower()
+    if requested == "json":
+        return "json"
+    return "msgpack"
+
 
 class RustSession:
     """Session-mode connection to Rust parser.
@@ -223,12 +247,14 @@ class RustSession:
                 print(country["name"])
     """
 
-    def __init__(self, save_path: str | Path, timeout: float = 30.0):
+    def __init__(self, save_path: str | Path, timeout: float = 30.0, *, wire: str | None = None):
         """Start a session with a save file.
 
         Args:
             save_path: Path to the .sav file
             timeout: Timeout in seconds for receiving responses (default: 30)
+            wire: Response format to request ("msgpack" or "json"); defaults to
+                msgpack (see STELLARIS_PARSER_WIRE)
         """
         self._save_path = Path(save_path)
         self._timeout = timeout
@@ -239,6 +265,13 @@ class RustSession:
         self._stderr_lines: deque[str] = deque(maxlen=200)
         self._closed = False
         self._in_stream = False  # Track if we're in a stream (iter_section)
+        self._request_count = 0  # IPC round-trips issued (one per request line)
+        self._wire_requested = wire or _default_wire()
+        self._wire = "json"  # Switched by the reader thread once the parser acks hello
+        self._awaiting_hello_ack = False  # Reader: next line is the hello ack
+        self._hello_pending = False  # _recv: consume the hello ack first
+        self._bytes_received = 0
+        self._decode_seconds = 0.0
 
         # Start the session process
         self._start()
@@ -260,6 +293,14 @@ class RustSession:
             **_windows_subprocess_kwargs(),
         )
 
+        # Ask for binary framing before the reader starts so it can switch framing
+        # right after the ack line. The ack is consumed lazily by the first _recv().
+        if self._wire_requested == "msgpack":
+            self._awaiting_hello_ack = True
+            self._hello_pending = True
+            self._proc.stdin.write(_json_dumps({"op": "hello", "wire": ["msgpack"]}) + b"\n")
+            self._proc.stdin.flush()
+
         # Start a reader thread to handle stdout asynchronously
         # This prevents deadlocks on Windows and allows timeouts
         self._reader_thread = threading.Thread(
@@ -277,16 +318,62 @@ class RustSession:
         atexit.register(self._cleanup)
 
     def _reader_loop(self):
-        """Background thread that reads stdout lines into a queue."""
+        """Background thread that reads response frames (JSON lines or msgpack) into a queue."""
         try:
-            for line in self._proc.stdout:
-                if line:
-                    self._response_queue.put(line)
+            stdout = self._proc.stdout
+            while True:
+                if self._wire == "msgpack":
+                    header = stdout.read(4)
+                    if len(header) < 4:
+                        break
+                    size = int.from_bytes(header, "big")
+                    payload = stdout.read(size)
+                    if len(payload) < size:
+                        break
+                    self._response_queue.put(_MsgpackFrame(payload))
+                    continue
+
+                line = stdout.readline()
+                if not line:
+                    break
+                if self._awaiting_hello_ack:
+                    # First line is either the hello ack or a load/unknown-op error.
+                    self._awaiting_hello_ack = False
+                    with suppress(ValueError, TypeError, AttributeError):
+                        ack = _json_loads(line)
+                        if ack.get("ok") and ack.get("wire") == "msgpack":
+                            self._wire = "msgpack"
+                self._response_queue.put(line)
             # EOF reached
             self._response_queue.put(None)
         except Exception as e:
             self._response_queue.put(e)
 
+    def _decode(self, item: bytes) -> dict:
+        """Decode one response frame, tracking transfer size and decode time."""
+        t0 = time.perf_counter()
+        if isinstance(item, _MsgpackFrame):
+            response = msgpack.unpackb(item, raw=False, strict_map_key=False)
+        else:
+            response = _json_loads(item)
+        self._decode_seconds += time.perf_counter() - t0
+        self._bytes_received += len(item)
+        return response
+
+    @property
+    def wire(self) -> str:
+        """Response wire format in use ("json" until a msgpack hello is acknowledged)."""
+        return self._wire
+
+    def get_wire_stats(self) -> dict:
+        """Transfer counters: wire format, requests, response bytes and decode seconds."""
+        return {
+            "wire": self._wire,
+            "requests": self._request_count,
+            "bytes_received": self._bytes_received,
+            "decode_seconds": self._decode_seconds,
+        }
+
     def _stderr_loop(self):
         """Background thread that drains stderr to avoid subprocess deadlocks.
 
@@ -324,7 +411,7 @@ class RustSession:
                 break
 
             try:
-                response = _json_loads(item)
+                response = self._decode(item)
                 if response.get("done"):
                     break
             except (ValueError, TypeError):
@@ -354,9 +441,24 @@ class RustSession:
             self._proc.stdin.flush()
         except BrokenPipeError:
             raise ParserError("Session crashed unexpectedly")
+        self._request_count += 1
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests (IPC round-trips) sent over this session so far."""
+        return self._request_count
 
     def _recv(self, *, timeout: float | None = None) -> dict:
-        """Receive a JSON response from the subprocess with timeout."""
+        """Receive a response from the subprocess with timeout."""
+        if self._hello_pending:
+            self._hello_pending = False
+            try:
+                self._recv(timeout=timeout)
+            except ParserError as e:
+                # Parsers without the hello op reject it; keep JSON lines.
+                if e.exit_code != _EXIT_INVALID_ARGUMENT:
+                    raise
+
         effective_timeout = self._timeout if timeout is None else timeout
         try:
             item = self._response_queue.get(timeout=effective_timeout)
@@ -382,7 +484,7 @@ class RustSession:
         if isinstance(item, Exception):
             raise ParserError(f"Session reader error: {item}")
 
-        response = _json_loads(item)
+        response = self._decode(item)
         if not response.get("ok", False):
             raise ParserError(
                 message=response.get("message", "Unknown error"),
@@ -410,6 +512,7 @@ class RustSession:
         section: str,
         batch_size: int = 100,
         *,
+        fields: Sequence[str] | None = None,
         timeout: float | None = None,
     ) -> Iterator[tuple[str, dict]]:
         """Stream entries from a section.
@@ -418,6 +521,10 @@ class RustSession:
             section: Section name (e.g., "country", "fleet")
             batch_size: Number of entries per batch (default: 100).
                        Use 1 for single-entry mode (backward compatible).
+            fields: Optional field projection. Entries then carry only these
+                   fields; dotted paths select nested values ("coordinate.x") and
+                   lists are projected per element ("hyperlane[].to").
+                   Non-dict entries (e.g. "none") are passed through unchanged.
             timeout: Optional per-frame receive timeout override (seconds).
                      Useful for very large entries (e.g., wars with huge battle logs).
 
@@ -431,7 +538,10 @@ class RustSession:
         # Drain any leftover stream from a previous iter_section (prevents nested stream corruption)
         self._drain_stream()
 
-        self._send({"op": "iter_section", "section": section, "batch_size": batch_size})
+        request = {"op": "iter_section", "section": section, "batch_size": batch_size}
+        if fields is not None:
+            request["fields"] = list(fields)
+        self._send(request)
 
         # First frame: stream header
         header = self._recv(timeout=timeout)
@@ -496,6 +606,7 @@ class RustSession:
             fields: Optional list of field names to extract (projection).
                    If None, returns full entries with _key and _value.
                    If specified, returns entries with _key plus only those fields.
+                   Accepts the same nested paths as iter_section(fields=...).
 
         Returns:
             List of entry dicts. Each entry contains:
@@ -775,6 +886,27 @@ def session(save_path: str | Path):
         sess.close()
 
 
+@contextmanager
+def bind_session(sess: RustSession | None):
+    """Make an existing session the active one for the current thread.
+
+    Unlike session(), this does not start or close the subprocess. It is used to
+    hand a session to worker threads (thread-local state is not inherited).
+
+    Args:
+        sess: Session to activate, or None to run without a session
+
+    Yields:
+        The bound session
+    """
+    prev = getattr(_tls, "session", None)
+    _tls.session = sess
+    try:
+        yield sess
+    finally:
+        _tls.session = prev
+
+
 def _get_active_session() -> RustSession | None:
     """Get the current thread-local session if any."""
     return getattr(_tls, "session", None)
@@ -878,7 +1010,9 @@ def _spawn_extract_sections(save_path: str | Path, sections: list[str]) -> dict:
     return _json_loads(result.stdout)
 
 
-def iter_section_entries(save_path: str | Path, section: str) -> Iterator[tuple[str, dict]]:
+def iter_section_entries(
+    save_path: str | Path, section: str, fields: Sequence[str] | None = None
+) -> Iterator[tuple[str, dict]]:
     """Stream entries from a large section without loading all into memory.
 
     If called within a session() context, uses the session's cached parsed data.
@@ -890,6 +1024,8 @@ def iter_section_entries(save_path: str | Path, section: str) -> Iterator[tuple[
     Args:
         save_path: Path to .sav file (recommended) or extracted gamestate (debug only)
         section: Section name (e.g., "country", "ships", "pops")
+        fields: Optional field projection (see RustSession.iter_section). Only
+                applied in session mode; the spawn fallback yields full entries.
 
     Yields:
         Tuples of (key, value) for each entry in the section
@@ -905,7 +1041,7 @@ def iter_section_entries(save_path: str | Path, section: str) -> Iterator[tuple[
     # Use active session if available
     sess = _get_active_session()
     if sess is not None:
-        yield from sess.iter_section(section)
+        yield from sess.iter_section(section, fields=fields)
         return
 
     # Fallback to spawn-per-call
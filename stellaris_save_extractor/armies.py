@@ -282,15 +282,10 @@ class ArmiesMixin:
         planet_names = self._get_planet_names_map()
 
         # Find the army section
-        army_start = self.gamestate.find("\narmy=")
-        if army_start == -1:
-            army_start = self.gamestate.find("army=")
-        if army_start == -1:
+        army_section = self._extract_section("army")
+        if not army_section:
             return result
 
-        # Get a chunk for the army section
-        army_section = self.gamestate[army_start : army_start + 5000000]
-
         # Find the opening brace of the army section
         brace_pos = army_section.find("{")
         if brace_pos == -1:
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import io
+import itertools
+import json
 import logging
+import mmap
+import os
 import re
+import shutil
+import tempfile
+import threading
+import time
 import zipfile
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import Any, ClassVar
 
 # Rust bridge for Clausewitz parsing (required for session mode)
 from stellaris_companion.rust_bridge import (
@@ -19,26 +31,267 @@ from .name_resolution import resolve_name as _resolve_name
 
 logger = logging.getLogger(__name__)
 
+# Ops whose inputs are independent items answered by one shared scan; queued requests
+# for the same op are merged into a single request (op -> (input field, result field)).
+_MERGEABLE_RUST_OPS: dict[str, tuple[str, str]] = {
+    "contains_tokens": ("tokens", "matches"),
+    "contains_kv": ("pairs", "matches"),
+    "count_keys": ("keys", "counts"),
+}
+
+
+def _rust_op_key(op: dict[str, Any]) -> str:
+    """Canonical memo key for a non-mergeable Rust op."""
+    return json.dumps(op, sort_keys=True, separators=(",", ":"))
+
+
+def _merged_item_key(op_name: str, item: Any) -> str:
+    """Result key for one item of a mergeable op (contains_kv reports ``key=value``)."""
+    if op_name == "contains_kv":
+        return f"{item[0]}={item[1]}"
+    return str(item)
+
+
+# Top-level `key=` in the gamestate; group 2 is set when the value is a block.
+# Anchored on a literal newline (not ^ with MULTILINE) so re can skip ahead quickly.
+_TOP_LEVEL_ASSIGN = r"\n([A-Za-z_][A-Za-z0-9_.]*)[ \t]*=(?:\s*(\{))?"
+_FIRST_ASSIGN = r"([A-Za-z_][A-Za-z0-9_.]*)[ \t]*=(?:\s*(\{))?"
+
+# Set to 1 to serve regex-fallback reads from a memory-mapped inflated gamestate.
+GAMESTATE_MMAP_ENV = "STELLARIS_GAMESTATE_MMAP"
+
+# Inflated gamestates share one temp folder; past this total size the least
+# recently used files are evicted, whichever save they belong to.
+GAMESTATE_CACHE_MAX_BYTES = 1 << 30
+
+# Partial inflations left behind by a killed process are removed after this.
+INFLATE_TMP_STALE_SECONDS = 3600.0
+
+# Gamestate text as str (decoded) or a bytes-like buffer (bytes / mmap).
+GamestateBuffer = str | bytes | mmap.mmap
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_pattern(pattern: str, flags: int, as_bytes: bool) -> re.Pattern:
+    """Compile a str regex, or its UTF-8 bytes twin for bytes-like buffers."""
+    return re.compile(pattern.encode("utf-8") if as_bytes else pattern, flags)
+
+
+def gamestate_pattern(pattern: str, buffer: GamestateBuffer, flags: int = 0) -> re.Pattern:
+    """Compile ``pattern`` for searching ``buffer`` (str or bytes-like).
+
+    Bytes patterns fold case for ASCII only, which covers the identifiers the
+    regex fallbacks look for; use literal_search_pattern() for user text.
+    """
+    return _compile_pattern(pattern, flags, not isinstance(buffer, str))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_literal(text: str, as_bytes: bool) -> re.Pattern:
+    if not as_bytes:
+        return re.compile(f"(?={re.escape(text)})", re.IGNORECASE)
+    parts = []
+    for ch in text:
+        variants = sorted({v for v in (ch, ch.lower(), ch.upper()) if len(v) == 1})
+        if ch.isascii() or len(variants) == 1:
+            parts.append(re.escape(ch.encode("utf-8")))
+        else:
+            parts.append(b"(?:" + b"|".join(re.escape(v.encode("utf-8")) for v in variants) + b")")
+    return re.compile(b"(?=" + b"".join(parts) + b")", re.IGNORECASE)
+
+
+def literal_search_pattern(text: str, buffer: GamestateBuffer) -> re.Pattern:
+    """Case-insensitive, overlapping search for the literal ``text`` in ``buffer``.
+
+    Bytes-like buffers only fold ASCII under re.IGNORECASE, so non-ASCII letters
+    match the UTF-8 encoding of either case instead (``ü`` finds ``Ü``). Matches
+    are zero-width; ``match.start()`` is a byte offset for bytes-like buffers.
+    """
+    return _compile_literal(text, not isinstance(buffer, str))
+
+
+def build_section_index(gamestate: GamestateBuffer) -> dict[str, tuple[int, int]]:
+    """Map every top-level block section to its (start, end) span in one pass.
+
+    Top-level keys start at column 0 and everything nested is indented, so a
+    block ends at the last ``}`` before the next top-level key. Scalar
+    assignments (``country=0``) are skipped; for keys with several blocks the
+    first one wins.
+
+    Args:
+        gamestate: Decoded gamestate text, or raw bytes / an mmap of them
+            (offsets are then byte offsets)
+
+    Returns:
+        Dict mapping section name to (start of ``key=``, end after closing brace)
+    """
+    as_bytes = not isinstance(gamestate, str)
+    close = b"}" if as_bytes else "}"
+    index: dict[str, tuple[int, int]] = {}
+    pending: str | None = None
+    pending_start = 0
+    first = gamestate_pattern(_FIRST_ASSIGN, gamestate).match(gamestate)
+    matches = gamestate_pattern(_TOP_LEVEL_ASSIGN, gamestate).finditer(gamestate)
+    for match in itertools.chain([first] if first else [], matches):
+        key_start = match.start(1)
+        if pending is not None:
+            end = gamestate.rfind(close, pending_start, key_start)
+            if end != -1:
+                index[pending] = (pending_start, end + 1)
+            pending = None
+        name = match.group(1)
+        if as_bytes:
+            name = name.decode("ascii")
+        if match.group(2) and name not in index:
+            pending, pending_start = name, key_start
+    if pending is not None:
+        end = gamestate.rfind(close, pending_start)
+        if end != -1:
+            index[pending] = (pending_start, end + 1)
+    return index
+
+
+def _default_mmap_gamestate() -> bool:
+    return os.environ.get(GAMESTATE_MMAP_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def inflate_gamestate(
+    save_path: str | Path,
+    cache_dir: str | Path | None = None,
+    *,
+    max_cache_bytes: int = GAMESTATE_CACHE_MAX_BYTES,
+) -> Path:
+    """Inflate a save's gamestate member to a file that can be memory-mapped.
+
+    Files are keyed by save path, mtime and size, so an unchanged save that is
+    still inflated (e.g. mapped by another extractor) reuses the existing file.
+    Each new inflation removes older ones of the same save, then evicts the
+    least recently used files of any save until the folder fits in
+    ``max_cache_bytes``. Inflation streams in 1MB chunks and never holds the
+    whole text. Extractors delete their file again on release_gamestate().
+
+    Args:
+        save_path: Path to the .sav file
+        cache_dir: Directory for inflated files (default: a folder in the
+            system temp dir)
+        max_cache_bytes: Total size the directory is trimmed to (the new file
+            is always kept)
+
+    Returns:
+        Path of the inflated gamestate file
+    """
+    save_path = Path(save_path)
+    stat = save_path.stat()
+    cache_dir = Path(cache_dir or Path(tempfile.gettempdir()) / "stellaris-companion-gamestate")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    path_key = hashlib.blake2b(str(save_path.resolve()).encode(), digest_size=8).hexdigest()
+    target = cache_dir / f"{path_key}-{stat.st_mtime_ns}-{stat.st_size}.gamestate"
+    if target.exists():
+        try:
+            os.utime(target)  # Mark as recently used for eviction
+            return target
+        except FileNotFoundError:
+            pass  # Evicted or released in the meantime; inflate again
+
+    tmp = target.with_name(f"{target.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with zipfile.ZipFile(save_path, "r") as z, z.open("gamestate") as src:
+            with open(tmp, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    _prune_inflated(cache_dir, keep=target, path_key=path_key, max_bytes=max_cache_bytes)
+    return target
+
+
+def _unlink_quietly(path: Path) -> bool:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False  # Still mapped by another extractor (Windows); removed next time
+    return True
+
+
+def _prune_inflated(cache_dir: Path, *, keep: Path, path_key: str, max_bytes: int) -> None:
+    """Drop older inflations of one save, then evict the oldest files past ``max_bytes``."""
+    now = time.time()
+    total = keep.stat().st_size
+    candidates: list[tuple[float, int, Path]] = []
+    for path in cache_dir.glob("*.gamestate*"):
+        if path == keep:
+            continue
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if path.suffix == ".tmp":
+            # Another process may still be writing it; only clear abandoned ones.
+            if now - st.st_mtime > INFLATE_TMP_STALE_SECONDS:
+                _unlink_quietly(path)
+        elif path.name.startswith(f"{path_key}-"):
+            _unlink_quietly(path)
+        else:
+            total += st.st_size
+            candidates.append((st.st_mtime, st.st_size, path))
+
+    for _, size, path in sorted(candidates):
+        if total <= max_bytes:
+            break
+        if _unlink_quietly(path):
+            total -= size
+
 
 class SaveExtractorBase:
     """Base implementation: file I/O, caches, and shared parsing helpers."""
 
     _MAX_CACHED_SECTION_CHARS = 2_000_000
 
-    def __init__(self, save_path: str):
+    # Rust session ops a mixin always issues, prefetched together by prefetch_rust_ops().
+    # ``{player_id}`` in string values is replaced with the player's country ID.
+    RUST_PREFETCH_OPS: ClassVar[tuple[dict[str, Any], ...]] = (
+        {"op": "extract_sections", "sections": ["player"]},
+        {"op": "get_entry", "section": "country", "key": "{player_id}"},
+    )
+
+    def __init__(
+        self,
+        save_path: str,
+        *,
+        mmap_gamestate: bool | None = None,
+        search_index_dir: str | Path | None = None,
+    ):
         """Load and parse a Stellaris save file.
 
         Args:
             save_path: Path to the .sav file
+            mmap_gamestate: Serve regex-fallback reads (section slices, searches)
+                from a memory-mapped, inflated copy of the gamestate instead of
+                one decoded str. Defaults to the STELLARIS_GAMESTATE_MMAP env var.
+            search_index_dir: Directory of cached full-text search indexes. When
+                set, search() answers from a token index keyed by the save's
+                content hash (built on first use) instead of scanning.
         """
         self.save_path = Path(save_path)
+        self.mmap_gamestate = (
+            _default_mmap_gamestate() if mmap_gamestate is None else bool(mmap_gamestate)
+        )
+        self.search_index_dir = Path(search_index_dir) if search_index_dir else None
         self._meta: str | None = None
         self._gamestate: str | None = None
+        self._gamestate_mm: mmap.mmap | bytes | None = None  # mmap_gamestate mode only
+        self._gamestate_file: Path | None = None  # Inflated file behind _gamestate_mm
         self._load_meta()
 
         # Cache for parsed sections
         self._section_cache: dict[str, str | None] = {}
-        self._section_bounds_cache: dict[str, tuple[int, int] | None] = {}
+        self._section_index: dict[str, tuple[int, int]] | None = None  # Top-level spans
+        self._search_index = None  # Lazy-loaded GamestateSearchIndex (search_index_dir only)
         self._building_types = None  # Lazy-loaded building ID→type map
         self._country_names = None  # Lazy-loaded country ID→name map
         self._country_authorities = None  # Lazy-loaded country ID→authority map
@@ -53,6 +306,16 @@ class SaveExtractorBase:
         self._player_status_cache = None  # Cached player status (expensive to compute)
         self._player_country_entry_cache = None  # Cached player country from Rust get_entry
         self._player_country_content_cache = None  # Cached player country string content
+        self._briefing_timings: dict[str, float] = {}  # Per-node get_complete_briefing timings
+        self._rust_op_results: dict[str, dict] = {}  # Memoized Rust op responses by op key
+        self._rust_merged_results: dict[str, dict[str, Any]] = {
+            name: {} for name in _MERGEABLE_RUST_OPS
+        }  # Memoized per-item answers of mergeable ops
+        self._rust_query_stats = {"requests": 0, "ops_sent": 0, "cache_hits": 0}
+
+        # Per-cache fill locks so concurrent briefing producers build each cache once
+        self._cache_locks: dict[str, threading.RLock] = {}
+        self._cache_locks_guard = threading.Lock()
 
     def close(self) -> None:
         """Release large in-memory state (best-effort)."""
@@ -61,8 +324,15 @@ class SaveExtractorBase:
     def release_gamestate(self) -> None:
         """Free the extracted gamestate and any dependent caches."""
         self._gamestate = None
+        if isinstance(self._gamestate_mm, mmap.mmap):
+            self._gamestate_mm.close()
+        self._gamestate_mm = None
+        if self._gamestate_file is not None:
+            _unlink_quietly(self._gamestate_file)
+            self._gamestate_file = None
         self._section_cache.clear()
-        self._section_bounds_cache.clear()
+        self._section_index = None
+        self._search_index = None
         self._building_types = None
         self._country_names = None
         self._country_authorities = None
@@ -77,6 +347,17 @@ class SaveExtractorBase:
         self._player_status_cache = None
         self._player_country_entry_cache = None
         self._player_country_content_cache = None
+        self._rust_op_results.clear()
+        for results in self._rust_merged_results.values():
+            results.clear()
+
+    def _cache_lock(self, name: str) -> threading.RLock:
+        """Return the fill lock for a named lazy cache (created on first use)."""
+        with self._cache_locks_guard:
+            lock = self._cache_locks.get(name)
+            if lock is None:
+                lock = self._cache_locks[name] = threading.RLock()
+            return lock
 
     def __enter__(self) -> SaveExtractorBase:
         return self
@@ -104,6 +385,68 @@ class SaveExtractorBase:
     def gamestate(self, value: str | None) -> None:
         self._gamestate = value
 
+    @property
+    def gamestate_buffer(self) -> GamestateBuffer:
+        """Gamestate for offset-based scans: an mmap in mmap_gamestate mode, else the str.
+
+        Offsets into an mmap are byte offsets. Prefer the _gamestate_* helpers,
+        which accept either form.
+        """
+        if not self.mmap_gamestate:
+            return self.gamestate
+        if self._gamestate_mm is not None:
+            return self._gamestate_mm
+
+        with self._cache_lock("gamestate_mm"):
+            if self._gamestate_mm is None:
+                self._gamestate_mm = self._map_inflated_gamestate()
+        return self._gamestate_mm
+
+    def _map_inflated_gamestate(self) -> mmap.mmap | bytes:
+        try:
+            return self._open_inflated(inflate_gamestate(self.save_path))
+        except FileNotFoundError:
+            # Another extractor released the shared file after inflate_gamestate()
+            # returned it; inflate a fresh copy.
+            return self._open_inflated(inflate_gamestate(self.save_path))
+
+    def _open_inflated(self, path: Path) -> mmap.mmap | bytes:
+        with open(path, "rb") as f:
+            self._gamestate_file = path
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _gamestate_len(self) -> int:
+        """Length of gamestate_buffer (bytes in mmap mode, chars otherwise)."""
+        return len(self.gamestate_buffer)
+
+    def _gamestate_text(self, start: int, end: int) -> str:
+        """Decode ``gamestate_buffer[start:end]`` to str."""
+        buffer = self.gamestate_buffer
+        if isinstance(buffer, str):
+            return buffer[start:end]
+        return buffer[start:end].decode("utf-8", errors="replace")
+
+    def _gamestate_pattern(self, pattern: str, flags: int = 0) -> re.Pattern:
+        """Compile ``pattern`` for searching gamestate_buffer."""
+        return gamestate_pattern(pattern, self.gamestate_buffer, flags)
+
+    def _gamestate_contains(self, text: str) -> bool:
+        """Plain substring test against the whole gamestate."""
+        buffer = self.gamestate_buffer
+        needle = text if isinstance(buffer, str) else text.encode("utf-8")
+        return buffer.find(needle) != -1
+
+    def _search_gamestate(self, pattern: str, flags: int = 0) -> bool:
+        """Whether a regex matches anywhere in the gamestate."""
+        return self._gamestate_pattern(pattern, flags).search(self.gamestate_buffer) is not None
+
+    def _count_gamestate(self, pattern: str, flags: int = 0) -> int:
+        """Number of non-overlapping regex matches in the gamestate."""
+        matches = self._gamestate_pattern(pattern, flags).finditer(self.gamestate_buffer)
+        return sum(1 for _ in matches)
+
     @property
     def gamestate_path(self) -> Path:
         """Path to the save file for Rust bridge integration.
@@ -124,16 +467,18 @@ class SaveExtractorBase:
         if self._building_types is not None:
             return self._building_types
 
-        self._building_types = {}
-
-        # Use Rust bridge for parsing (session mode required)
-        sections = extract_sections(self.gamestate_path, ["buildings"])
-        buildings = sections.get("buildings", {})
-        self._building_types = {
-            bid: data.get("type")
-            for bid, data in buildings.items()
-            if isinstance(data, dict) and "type" in data
-        }
+        with self._cache_lock("building_types"):
+            if self._building_types is not None:
+                return self._building_types
+
+            # Use Rust bridge for parsing (session mode required)
+            sections = extract_sections(self.gamestate_path, ["buildings"])
+            buildings = sections.get("buildings", {})
+            self._building_types = {
+                bid: data.get("type")
+                for bid, data in buildings.items()
+                if isinstance(data, dict) and "type" in data
+            }
         return self._building_types
 
     def _load_meta(self) -> None:
@@ -148,47 +493,210 @@ class SaveExtractorBase:
             with io.TextIOWrapper(raw, encoding="utf-8", errors="replace") as text:
                 self._gamestate = text.read()
 
-    def _get_section_bounds(self, section_name: str) -> tuple[int, int] | None:
-        """Get cached (start, end) bounds for a top-level section."""
-        if section_name in self._section_bounds_cache:
-            return self._section_bounds_cache[section_name]
-        bounds = self._find_section_bounds(section_name)
-        self._section_bounds_cache[section_name] = bounds
-        return bounds
+    def _declared_rust_ops(self) -> list[dict[str, Any]]:
+        """Collect RUST_PREFETCH_OPS from every class in the MRO (base first)."""
+        ops: list[dict[str, Any]] = []
+        for cls in reversed(type(self).__mro__):
+            ops.extend(vars(cls).get("RUST_PREFETCH_OPS", ()))
+        return ops
+
+    def _resolve_rust_op(self, op: dict[str, Any]) -> dict[str, Any]:
+        """Substitute ``{player_id}`` placeholders in an op's string values."""
+        if not any(isinstance(v, str) and "{player_id}" in v for v in op.values()):
+            return op
+        player_id = str(self.get_player_empire_id())
+        return {
+            k: v.replace("{player_id}", player_id) if isinstance(v, str) else v
+            for k, v in op.items()
+        }
+
+    def prefetch_rust_ops(self, ops: Iterable[dict[str, Any]] | None = None) -> int:
+        """Issue Rust session ops in a single ``multi`` request and memoize the results.
 
-    def _find_section_bounds(self, section_name: str) -> tuple[int, int] | None:
-        """Find the start and end positions of a top-level section.
+        Ops already answered are skipped and duplicates collapse. ``contains_tokens``,
+        ``contains_kv`` and ``count_keys`` ops are merged into one request each (one
+        scan of the gamestate), with answers memoized per token/pair/key.
 
         Args:
-            section_name: Name of section (e.g., 'country', 'wars', 'fleets')
+            ops: Op dicts as accepted by RustSession.batch_ops(); defaults to every
+                mixin's RUST_PREFETCH_OPS
 
         Returns:
-            Tuple of (start, end) positions, or None if not found
+            Number of ops sent (0 when nothing was missing or no session is active)
+        """
+        session = _get_active_session()
+        if session is None:
+            return 0
+        if ops is None:
+            ops = self._declared_rust_ops()
+
+        queued: dict[str, dict[str, Any]] = {}
+        merged: dict[str, dict[str, Any]] = {}
+        hits = 0
+        for op in ops:
+            op = self._resolve_rust_op(op)
+            name = op["op"]
+            if name in _MERGEABLE_RUST_OPS:
+                field, _ = _MERGEABLE_RUST_OPS[name]
+                known = self._rust_merged_results[name]
+                for item in op.get(field, []):
+                    item_key = _merged_item_key(name, item)
+                    if item_key in known:
+                        hits += 1
+                    else:
+                        merged.setdefault(name, {})[item_key] = item
+                continue
+            key = _rust_op_key(op)
+            if key in self._rust_op_results:
+                hits += 1
+            else:
+                queued[key] = op
+
+        batch = list(queued.values())
+        for name, items in merged.items():
+            batch.append({"op": name, _MERGEABLE_RUST_OPS[name][0]: list(items.values())})
+
+        with self._cache_lock("rust_ops"):
+            self._rust_query_stats["cache_hits"] += hits
+        if not batch:
+            return 0
+
+        results = session.batch_ops(batch)
+        with self._cache_lock("rust_ops"):
+            self._rust_query_stats["requests"] += 1
+            self._rust_query_stats["ops_sent"] += len(batch)
+            for key, result in zip(queued, results, strict=False):
+                self._rust_op_results[key] = result
+            for op, result in zip(batch[len(queued) :], results[len(queued) :], strict=False):
+                name = op["op"]
+                answers = result.get(_MERGEABLE_RUST_OPS[name][1], {})
+                known = self._rust_merged_results[name]
+                for item_key in merged[name]:
+                    known[item_key] = answers.get(item_key, 0 if name == "count_keys" else False)
+        return len(batch)
+
+    def _rust_query(self, op: dict[str, Any]) -> dict:
+        """Run one Rust session op through the prefetch cache.
+
+        Returns the same response shape as the corresponding RustSession method
+        (e.g. ``{"data": ...}`` for extract_sections, ``{"matches": ...}`` for
+        contains_tokens). Requires an active session.
         """
-        # Look for "section_name={" or "section_name ={" at start of line
-        pattern = rf"^{re.escape(section_name)}\s*=\s*\{{"
-        match = re.search(pattern, self.gamestate, re.MULTILINE)
+        if _get_active_session() is None:
+            raise ParserError("No active Rust session")
+        op = self._resolve_rust_op(op)
+        self.prefetch_rust_ops([op])
+        name = op["op"]
+        if name in _MERGEABLE_RUST_OPS:
+            field, result_field = _MERGEABLE_RUST_OPS[name]
+            known = self._rust_merged_results[name]
+            items = (_merged_item_key(name, item) for item in op.get(field, []))
+            return {result_field: {item_key: known[item_key] for item_key in items}}
+        return self._rust_op_results[_rust_op_key(op)]
+
+    def _rust_extract_sections(self, sections: list[str]) -> dict:
+        """Memoized RustSession.extract_sections()."""
+        return self._rust_query({"op": "extract_sections", "sections": sections}).get("data", {})
+
+    def _rust_get_entry(self, section: str, key: str) -> dict | None:
+        """Memoized RustSession.get_entry()."""
+        response = self._rust_query({"op": "get_entry", "section": section, "key": key})
+        return response.get("entry") if response.get("found") else None
+
+    def _rust_get_entry_text(self, section: str, key: str) -> str | None:
+        """Memoized RustSession.get_entry_text()."""
+        response = self._rust_query({"op": "get_entry_text", "section": section, "key": key})
+        return response.get("text", "") if response.get("found") else None
+
+    def _rust_get_duplicate_values(self, section: str, key: str, field: str) -> list[str]:
+        """Memoized RustSession.get_duplicate_values()."""
+        response = self._rust_query(
+            {"op": "get_duplicate_values", "section": section, "key": key, "field": field}
+        )
+        return response.get("values", [])
 
-        if not match:
-            return None
+    def _rust_contains_tokens(self, tokens: list[str]) -> dict:
+        """Memoized RustSession.contains_tokens() (merged with other queued token scans)."""
+        return self._rust_query({"op": "contains_tokens", "tokens": tokens})
 
-        start = match.start()
+    def _rust_contains_kv(self, pairs: list[tuple[str, str]]) -> dict:
+        """Memoized RustSession.contains_kv() (merged with other queued pair checks)."""
+        return self._rust_query({"op": "contains_kv", "pairs": [list(p) for p in pairs]})
 
-        # Find matching closing brace
-        brace_count = 0
-        in_section = False
+    def _rust_count_keys(self, keys: list[str]) -> dict:
+        """Memoized RustSession.count_keys() (merged with other queued key counts)."""
+        return self._rust_query({"op": "count_keys", "keys": keys})
 
-        for i, char in enumerate(self.gamestate[start:], start):
-            if char == "{":
-                brace_count += 1
-                in_section = True
-            elif char == "}":
-                brace_count -= 1
-                if in_section and brace_count == 0:
-                    return (start, i + 1)
+    def get_rust_query_stats(self) -> dict[str, int]:
+        """Counters for the Rust op prefetch cache (multi requests, ops sent, cache hits)."""
+        return dict(self._rust_query_stats)
+
+    def _get_section_index(self) -> dict[str, tuple[int, int]]:
+        """Get the top-level section index, building it on first use."""
+        if self._section_index is not None:
+            return self._section_index
+
+        with self._cache_lock("section_index"):
+            if self._section_index is None:
+                self._section_index = build_section_index(self.gamestate_buffer)
+        return self._section_index
 
+    def _get_section_bounds(self, section_name: str) -> tuple[int, int] | None:
+        """Get (start, end) bounds for a top-level section from the section index."""
+        return self._get_section_index().get(section_name)
+
+    def _section_at(self, pos: int) -> str | None:
+        """Name of the top-level block section containing buffer position ``pos``."""
+        for name, (start, end) in self._get_section_index().items():
+            if start <= pos < end:
+                return name
         return None
 
+    def get_search_index(self, *, should_stop: Callable[[], bool] | None = None):
+        """Load (or build and cache) the full-text search index for this save.
+
+        Indexes live in ``search_index_dir`` as ``<content hash>-<unit>.idx`` so a
+        re-read of an unchanged save reuses the file. Returns None when no
+        directory is configured, the index cannot be built, or ``should_stop``
+        abandoned the build.
+        """
+        if self.search_index_dir is None:
+            return None
+        if self._search_index is not None:
+            return self._search_index
+
+        from .search_index import (
+            GamestateSearchIndex,
+            buffer_unit,
+            prune_index_dir,
+            save_content_key,
+        )
+
+        with self._cache_lock("search_index"):
+            if self._search_index is not None:
+                return self._search_index
+            try:
+                buffer = self.gamestate_buffer
+                path = self.search_index_dir / (
+                    f"{save_content_key(self.save_path)}-{buffer_unit(buffer)}.idx"
+                )
+                index = GamestateSearchIndex.load(path) if path.exists() else None
+                if index is None:
+                    index = GamestateSearchIndex.build(buffer, should_stop=should_stop)
+                    if index is None:
+                        return None
+                    self.search_index_dir.mkdir(parents=True, exist_ok=True)
+                    index.save(path)
+                    prune_index_dir(self.search_index_dir)
+                # The cached sections double as the section index.
+                if self._section_index is None:
+                    self._section_index = index.sections
+                self._search_index = index
+            except Exception as e:
+                logger.warning("Search index unavailable for %s: %s", self.save_path.name, e)
+                return None
+        return self._search_index
+
     def _extract_section(self, section_name: str) -> str | None:
         """Extract a complete top-level section.
 
@@ -203,7 +711,7 @@ class SaveExtractorBase:
 
         bounds = self._get_section_bounds(section_name)
         if bounds:
-            content = self.gamestate[bounds[0] : bounds[1]]
+            content = self._gamestate_text(bounds[0], bounds[1])
             if len(content) <= self._MAX_CACHED_SECTION_CHARS:
                 self._section_cache[section_name] = content
             return content
@@ -292,28 +800,23 @@ class SaveExtractorBase:
         country_start, country_end = bounds
 
         # Search near the start of the country section (player entries are early).
+        buffer = self.gamestate_buffer
         search_end = min(country_end, country_start + 10_000_000)
-        entry_re = re.compile(rf"(?m)^\t{player_id}\s*=\s*\{{")
-        match = entry_re.search(self.gamestate, country_start, search_end)
+        entry_re = self._gamestate_pattern(rf"(?m)^\t{player_id}\s*=\s*\{{")
+        match = entry_re.search(buffer, country_start, search_end)
         if not match:
             return None
 
-        start = match.start()
-        brace_count = 0
-        started = False
-
-        for i, ch in enumerate(self.gamestate[start:country_end], start):
-            if ch == "{":
-                brace_count += 1
-                started = True
-            elif ch == "}":
-                brace_count -= 1
-                if started and brace_count == 0:
-                    result = self.gamestate[start : i + 1]
-                    self._player_country_content_cache = result
-                    return result
+        # Entries sit one tab deep, so the entry's closing brace is the first
+        # line consisting of exactly one tab and "}".
+        close = "\n\t}" if isinstance(buffer, str) else b"\n\t}"
+        end = buffer.find(close, match.end(), country_end)
+        if end == -1:
+            return None
 
-        return None
+        result = self._gamestate_text(match.start(), end + len(close))
+        self._player_country_content_cache = result
+        return result
 
     def _get_player_country_entry(self, player_id: int = 0) -> dict | None:
         """Get the player's country entry as a parsed dict using Rust get_entry.
@@ -336,10 +839,14 @@ class SaveExtractorBase:
         if not session:
             return None
 
-        entry = session.get_entry("country", str(player_id))
-        if entry and isinstance(entry, dict):
-            self._player_country_entry_cache = entry
-            return entry
+        with self._cache_lock("player_country_entry"):
+            if self._player_country_entry_cache is not None:
+                return self._player_country_entry_cache
+
+            entry = self._rust_get_entry("country", str(player_id))
+            if entry and isinstance(entry, dict):
+                self._player_country_entry_cache = entry
+                return entry
 
         return None
 
@@ -426,7 +933,7 @@ class SaveExtractorBase:
         """
         ship_to_fleet = {}
 
-        for ship_id, ship_data in iter_section_entries(self.save_path, "ships"):
+        for ship_id, ship_data in iter_section_entries(self.save_path, "ships", fields=("fleet",)):
             if isinstance(ship_data, dict):
                 fleet_id = ship_data.get("fleet")
                 if fleet_id:
@@ -582,10 +1089,15 @@ class SaveExtractorBase:
         if not session:
             return {}
 
-        self._countries_cache = {}
-        for country_id, country_data in session.iter_section("country"):
-            if isinstance(country_data, dict):
-                self._countries_cache[country_id] = country_data
+        with self._cache_lock("countries"):
+            if self._countries_cache is not None:
+                return self._countries_cache
+
+            cache: dict[str, dict] = {}
+            for country_id, country_data in session.iter_section("country"):
+                if isinstance(country_data, dict):
+                    cache[country_id] = country_data
+            self._countries_cache = cache
 
         return self._countries_cache
 
@@ -606,10 +1118,15 @@ class SaveExtractorBase:
         if not session:
             return {}
 
-        self._galactic_objects_cache = {}
-        for system_id, system_data in session.iter_section("galactic_object"):
-            if isinstance(system_data, dict):
-                self._galactic_objects_cache[system_id] = system_data
+        with self._cache_lock("galactic_objects"):
+            if self._galactic_objects_cache is not None:
+                return self._galactic_objects_cache
+
+            cache: dict[str, dict] = {}
+            for system_id, system_data in session.iter_section("galactic_object"):
+                if isinstance(system_data, dict):
+                    cache[system_id] = system_data
+            self._galactic_objects_cache = cache
 
         return self._galactic_objects_cache
 
@@ -630,10 +1147,15 @@ class SaveExtractorBase:
         if not session:
             return {}
 
-        self._fleets_cache = {}
-        for fleet_id, fleet_data in session.iter_section("fleet"):
-            if isinstance(fleet_data, dict):
-                self._fleets_cache[fleet_id] = fleet_data
+        with self._cache_lock("fleets"):
+            if self._fleets_cache is not None:
+                return self._fleets_cache
+
+            cache: dict[str, dict] = {}
+            for fleet_id, fleet_data in session.iter_section("fleet"):
+                if isinstance(fleet_data, dict):
+                    cache[fleet_id] = fleet_data
+            self._fleets_cache = cache
 
         return self._fleets_cache
 
@@ -654,10 +1176,15 @@ class SaveExtractorBase:
         if not session:
             return {}
 
-        self._pop_groups_cache = {}
-        for group_id, group_data in session.iter_section("pop_groups"):
-            if isinstance(group_data, dict):
-                self._pop_groups_cache[group_id] = group_data
+        with self._cache_lock("pop_groups"):
+            if self._pop_groups_cache is not None:
+                return self._pop_groups_cache
+
+            cache: dict[str, dict] = {}
+            for group_id, group_data in session.iter_section("pop_groups"):
+                if isinstance(group_data, dict):
+                    cache[group_id] = group_data
+            self._pop_groups_cache = cache
 
         return self._pop_groups_cache
 
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import logging
+import time
+
 # Rust bridge for Clausewitz parsing (required for session mode)
-from stellaris_companion.rust_bridge import _get_active_session
+from stellaris_companion.rust_bridge import RustSession, _get_active_session
+
+from .base import literal_search_pattern
+from .briefing_plan import run_briefing_plan
+
+logger = logging.getLogger(__name__)
 
 
 class BriefingMixin:
@@ -16,7 +24,10 @@ class BriefingMixin:
             context_chars: Characters of context around each match (capped at 500)
 
         Returns:
-            Dict with search results (total output capped at ~4000 chars)
+            Dict with search results (total output capped at ~4000 chars). Each
+            match's ``position`` (and the context window) is measured in the
+            units of gamestate_buffer, reported as ``offset_unit``: "byte" when
+            the gamestate is memory-mapped (STELLARIS_GAMESTATE_MMAP), else "char".
         """
         # Cap parameters to prevent context overflow
         max_results = min(max_results, 10)
@@ -32,24 +43,43 @@ class BriefingMixin:
             result["error"] = "Query contains no valid search characters"
             return result
 
-        query_lower = sanitized_query.lower()
-        gamestate_lower = self.gamestate.lower()
+        buffer = self.gamestate_buffer
+        buffer_len = len(buffer)
+        result["offset_unit"] = "char" if isinstance(buffer, str) else "byte"
+
+        # The on-disk token index (when configured) answers counts and first
+        # positions without touching the rest of the buffer.
+        index = self.get_search_index()
+        hits = index.find(sanitized_query, buffer, max_results + 1) if index else None
+        if hits is not None:
+            result["total_found"] = hits.total
+            positions = iter(hits.positions)
+            section_at = index.section_at
+        else:
+            # Case-insensitive scan of the buffer itself (no lowercased copy of the
+            # gamestate). The lookahead keeps overlapping matches, like repeated find().
+            pattern = literal_search_pattern(sanitized_query, buffer)
+            positions = (match.start() for match in pattern.finditer(buffer))
+            section_at = self._section_at
+        result["indexed"] = hits is not None
 
         total_context_size = 0
-        start = 0
-
-        while len(result["matches"]) < max_results:
-            pos = gamestate_lower.find(query_lower, start)
-            if pos == -1:
-                break
+        collecting = True
 
-            result["total_found"] += 1
+        for pos in positions:
+            if hits is None:
+                result["total_found"] += 1
+            if not collecting:
+                continue
+            if len(result["matches"]) >= max_results:
+                collecting = False
+                continue
 
             # Get context
             context_start = max(0, pos - context_chars // 2)
-            context_end = min(len(self.gamestate), pos + len(query) + context_chars // 2)
+            context_end = min(buffer_len, pos + len(query) + context_chars // 2)
 
-            context = self.gamestate[context_start:context_end]
+            context = self._gamestate_text(context_start, context_end)
 
             # Sanitize context output - escape special characters that could
             # be interpreted as instructions
@@ -58,21 +88,14 @@ class BriefingMixin:
             # Check if adding this context would exceed our limit
             if total_context_size + len(context) > MAX_TOTAL_OUTPUT:
                 result["truncated"] = True
-                break
+                collecting = False
+                continue
 
             total_context_size += len(context)
 
-            result["matches"].append({"position": pos, "context": context})
-
-            start = pos + 1
-
-        # Count total matches (without retrieving context)
-        while True:
-            pos = gamestate_lower.find(query_lower, start)
-            if pos == -1:
-                break
-            result["total_found"] += 1
-            start = pos + 1
+            result["matches"].append(
+                {"position": pos, "section": section_at(pos), "context": context}
+            )
 
         return result
 
@@ -93,7 +116,7 @@ class BriefingMixin:
             return self._extract_campaign_id_regex()
 
         try:
-            sections = session.extract_sections(["galaxy"])
+            sections = self._rust_extract_sections(["galaxy"])
             galaxy = sections.get("galaxy", {})
             if isinstance(galaxy, dict):
                 name = galaxy.get("name")
@@ -107,13 +130,11 @@ class BriefingMixin:
     def _extract_campaign_id_regex(self) -> str | None:
         """Extract campaign ID using regex (fallback)."""
         # Stellaris saves include a top-level galaxy block with name="<uuid>".
-        start = self.gamestate.find("\ngalaxy=")
-        if start == -1:
-            if self.gamestate.startswith("galaxy="):
-                start = 0
-            else:
-                return None
-        window = self.gamestate[start : start + 20000]
+        bounds = self._get_section_bounds("galaxy")
+        if not bounds:
+            return None
+        start, end = bounds
+        window = self._gamestate_text(start, min(end, start + 20000))
         key = 'name="'
         pos = window.find(key)
         if pos == -1:
@@ -124,75 +145,74 @@ class BriefingMixin:
         value = window[pos + len(key) : end].strip()
         return value or None
 
-    def get_complete_briefing(self) -> dict:
+    def get_complete_briefing(self, *, max_workers: int = 1) -> dict:
         """Get a complete, untruncated briefing for /ask injection.
 
         This is intended for full precompute (Option B): one background extraction
         produces a single JSON blob that contains the full state needed to answer
         most questions without any tool calls.
 
+        Producers are declared as a dependency graph (see briefing_plan). With
+        ``max_workers > 1`` and an active Rust session, independent producers run
+        concurrently, each extra worker on its own Rust session of the same save.
+        Opening a session re-parses the save; its cost is recorded as
+        ``_session_start`` in get_briefing_timings().
+
+        Args:
+            max_workers: Number of concurrent producer workers (1 = sequential)
+
         Returns:
             Dictionary containing full lists (leaders, planets, relations, fleets,
             starbases, wars, etc.) with no top-k truncation.
         """
-        meta = self.get_metadata()
-        player = self.get_player_status()
-        identity = self.get_empire_identity()
-        resources = self.get_resources()
+        session = _get_active_session()
 
         # Pre-warm the player country content cache for methods that still use regex
         # This saves ~0.45s as many methods share this data
         # In session mode, skip prewarm - use _get_player_country_entry() for O(1) lookup
+        requests_before = session.request_count if session is not None else 0
         player_id = self.get_player_empire_id()
-        if not _get_active_session():
+        if not session:
             self._find_player_country_content(player_id)
-
-        # Call methods that get_situation() would call - we'll build situation inline
-        diplomacy = self.get_diplomacy()
-        fallen = self.get_fallen_empires()
-        crisis = self.get_crisis_status()
-        wars = self.get_wars()
-
-        # Build situation inline from already-fetched data (saves ~1s vs calling get_situation)
-        situation = self._build_situation_from_data(
-            meta, wars, diplomacy, resources, crisis, fallen
-        )
-
-        planets = self.get_planets()
-        starbases = self.get_starbases()
-        leaders = self.get_leaders()
-        technology = self.get_technology()
-        fleets = self.get_fleets()
-        naval_capacity = self.get_naval_capacity()
-        megastructures = self.get_megastructures()
-        # Trimmed species: player species + contacted empire founders + galaxy summary
-        # (~2-4k tokens instead of ~55k for full species dump)
-        contacted_country_ids: set[int] = set()
-        for rel in diplomacy.get("relations", []):
-            cid = rel.get("country_id")
-            if cid is not None:
-                contacted_country_ids.add(int(cid))
-        species = self.get_species_for_briefing(contacted_country_ids)
-        species_rights = self.get_species_rights()
-        claims = self.get_claims()
-        # Trimmed armies: enriched summary by type/location
-        # (~300 tokens instead of ~17.5k for individual entries)
-        armies = self.get_armies_summary()
-        lgate = self.get_lgate_status()
-        menace = self.get_menace()
-        great_khan = self.get_great_khan()
-        projects = self.get_special_projects()
-        leviathans = self.get_leviathans()
-        ascension_perks = self.get_ascension_perks()
-        traditions = self.get_traditions()
-        galactic_community = self.get_galactic_community()
-        federation_details = self.get_federation_details()
-        factions = self.get_factions()
-        relics = self.get_relics()
-        strategic_geography = self.get_strategic_geography()
-        fleet_composition = self.get_fleet_composition(limit=50)
-        pop_statistics = self.get_pop_statistics()
-        archaeology = self.get_archaeology(limit=50)
+        else:
+            # Fetch every op the mixins declare up front in one multi request.
+            try:
+                self.prefetch_rust_ops()
+            except Exception as e:
+                logger.warning("Rust op prefetch failed; falling back to per-call: %s", e)
+
+        started = time.perf_counter()
+        extra_sessions: list[RustSession] = []
+        if session is not None:
+            for _ in range(max(0, max_workers - 1)):
+                try:
+                    extra_sessions.append(RustSession(self.save_path))
+                except Exception as e:
+                    logger.warning("Extra briefing session unavailable: %s", e)
+                    break
+        session_start = time.perf_counter() - started
+        try:
+            r, node_timings = run_briefing_plan(self, sessions=[session, *extra_sessions])
+        finally:
+            round_trips = sum(extra.request_count for extra in extra_sessions)
+            if session is not None:
+                round_trips += session.request_count - requests_before
+            for extra in extra_sessions:
+                extra.close()
+        node_timings["_total"] = time.perf_counter() - started
+        node_timings["_workers"] = float(1 + len(extra_sessions))
+        node_timings["_session_start"] = session_start
+        node_timings["_round_trips"] = float(round_trips)
+        self._briefing_timings = node_timings
+
+        meta = r["meta"]
+        player = r["player"]
+        wars = r["wars"]
+        diplomacy = r["diplomacy"]
+        resources = r["resources"]
+        fleets = r["fleets"]
+        fleet_composition = r["fleet_composition"]
+        archaeology = r["archaeology"]
 
         # Merge ship_classes from fleet_composition into fleet entries
         comp_by_id = {f["fleet_id"]: f["ship_classes"] for f in fleet_composition.get("fleets", [])}
@@ -220,10 +240,10 @@ class BriefingMixin:
                 "date": player_clean.get("date") or meta.get("date"),
                 "version": meta.get("version"),
                 "player_id": player_clean.get("player_id"),
-                "campaign_id": self._extract_campaign_id(),
+                "campaign_id": r["campaign_id"],
             },
-            "identity": identity,
-            "situation": situation,
+            "identity": r["identity"],
+            "situation": r["situation"],
             # Preserve the "briefing schema" used elsewhere, but without list truncation.
             "military": {
                 "military_power": player_clean.get("military_power"),
@@ -231,12 +251,12 @@ class BriefingMixin:
                 "military_ships": player_clean.get("military_ships"),
                 "fleet_size": player_clean.get("fleet_size"),
                 "victory_rank": player_clean.get("victory_rank"),
-                "naval_capacity": naval_capacity,
+                "naval_capacity": r["naval_capacity"],
                 "fleets": fleets,
                 "ship_classes": ship_class_totals,
                 "wars": wars,
-                "megastructures": megastructures,
-                "armies": armies,
+                "megastructures": r["megastructures"],
+                "armies": r["armies"],
             },
             "economy": {
                 "economy_power": player_clean.get("economy_power"),
@@ -250,43 +270,51 @@ class BriefingMixin:
                     "consumer_goods": resources.get("net_monthly", {}).get("consumer_goods"),
                     "research_total": resources.get("summary", {}).get("research_total"),
                 },
-                "pop_statistics": pop_statistics,
+                "pop_statistics": r["pop_statistics"],
             },
             "territory": {
                 "celestial_bodies_in_territory": player_clean.get("celestial_bodies_in_territory"),
                 "colonies": player_clean.get("colonies", {}),
-                "planets": planets,
-                "claims": claims,
+                "planets": r["planets"],
+                "claims": r["claims"],
                 "archaeology": arch_sites,
             },
             "diplomacy": diplomacy,
-            "federation_details": federation_details,
-            "defense": starbases,
-            "leadership": leaders,
-            "technology": technology,
-            "fallen_empires": fallen,
+            "federation_details": r["federation_details"],
+            "defense": r["starbases"],
+            "leadership": r["leaders"],
+            "technology": r["technology"],
+            "fallen_empires": r["fallen"],
             "species": {
-                **species,
-                "rights": species_rights,
+                **r["species"],
+                "rights": r["species_rights"],
             },
             "endgame": {
-                "crisis": crisis,
-                "lgate": lgate,
-                "menace": menace,
-                "great_khan": great_khan,
+                "crisis": r["crisis"],
+                "lgate": r["lgate"],
+                "menace": r["menace"],
+                "great_khan": r["great_khan"],
             },
-            "leviathans": leviathans,
-            "projects": projects,
+            "leviathans": r["leviathans"],
+            "projects": r["projects"],
             "progression": {
-                "ascension_perks": ascension_perks,
-                "traditions": traditions,
-                "galactic_community": galactic_community,
-                "factions": factions,
-                "relics": relics,
+                "ascension_perks": r["ascension_perks"],
+                "traditions": r["traditions"],
+                "galactic_community": r["galactic_community"],
+                "factions": r["factions"],
+                "relics": r["relics"],
             },
-            "strategic_geography": strategic_geography,
+            "strategic_geography": r["strategic_geography"],
         }
 
+    def get_briefing_timings(self) -> dict[str, float]:
+        """Per-producer timings (seconds) from the last get_complete_briefing() call.
+
+        Keys are briefing node names plus ``_total`` (wall time), ``_workers``
+        and ``_round_trips`` (Rust IPC requests across all sessions).
+        """
+        return dict(self._briefing_timings)
+
     def _build_situation_from_data(
         self,
         meta: dict,
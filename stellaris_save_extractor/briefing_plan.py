@@ -0,0 +1,209 @@
+"""Dependency graph and executor for `get_complete_briefing()` producers.
+
+Each node wraps one extractor call. Edges exist only where a producer consumes
+another producer's output; producers that merely share the lazy caches on
+`SaveExtractorBase` are independent (those caches fill once under per-cache
+locks). Nodes are listed roughly heaviest-first so the expensive section scans
+start as early as possible when several workers are available.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from stellaris_companion.rust_bridge import RustSession, bind_session
+
+
+@dataclass(frozen=True, slots=True)
+class BriefingNode:
+    """One producer in the complete-briefing graph.
+
+    - name: Key under which the result is stored.
+    - produce: Called as ``produce(extractor, results)``; ``results`` holds deps.
+    - deps: Names of nodes whose results this producer reads.
+    """
+
+    name: str
+    produce: Callable[[Any, dict[str, Any]], Any]
+    deps: tuple[str, ...] = ()
+
+
+def _contacted_country_ids(diplomacy: dict) -> set[int]:
+    contacted: set[int] = set()
+    for rel in diplomacy.get("relations", []):
+        cid = rel.get("country_id")
+        if cid is not None:
+            contacted.add(int(cid))
+    return contacted
+
+
+BRIEFING_NODES: tuple[BriefingNode, ...] = (
+    BriefingNode("player", lambda ex, r: ex.get_player_status()),
+    BriefingNode("diplomacy", lambda ex, r: ex.get_diplomacy()),
+    BriefingNode("strategic_geography", lambda ex, r: ex.get_strategic_geography()),
+    BriefingNode("fleets", lambda ex, r: ex.get_fleets()),
+    BriefingNode("leviathans", lambda ex, r: ex.get_leviathans()),
+    BriefingNode("wars", lambda ex, r: ex.get_wars()),
+    BriefingNode("fleet_composition", lambda ex, r: ex.get_fleet_composition(limit=50)),
+    BriefingNode("planets", lambda ex, r: ex.get_planets()),
+    BriefingNode("pop_statistics", lambda ex, r: ex.get_pop_statistics()),
+    BriefingNode("leaders", lambda ex, r: ex.get_leaders()),
+    BriefingNode(
+        "species",
+        lambda ex, r: ex.get_species_for_briefing(_contacted_country_ids(r["diplomacy"])),
+        deps=("diplomacy",),
+    ),
+    BriefingNode("meta", lambda ex, r: ex.get_metadata()),
+    BriefingNode("identity", lambda ex, r: ex.get_empire_identity()),
+    BriefingNode("resources", lambda ex, r: ex.get_resources()),
+    BriefingNode("fallen", lambda ex, r: ex.get_fallen_empires()),
+    BriefingNode("crisis", lambda ex, r: ex.get_crisis_status()),
+    BriefingNode("starbases", lambda ex, r: ex.get_starbases()),
+    BriefingNode("technology", lambda ex, r: ex.get_technology()),
+    BriefingNode("naval_capacity", lambda ex, r: ex.get_naval_capacity()),
+    BriefingNode("megastructures", lambda ex, r: ex.get_megastructures()),
+    BriefingNode("species_rights", lambda ex, r: ex.get_species_rights()),
+    BriefingNode("claims", lambda ex, r: ex.get_claims()),
+    BriefingNode("armies", lambda ex, r: ex.get_armies_summary()),
+    BriefingNode("lgate", lambda ex, r: ex.get_lgate_status()),
+    BriefingNode("menace", lambda ex, r: ex.get_menace()),
+    BriefingNode("great_khan", lambda ex, r: ex.get_great_khan()),
+    BriefingNode("projects", lambda ex, r: ex.get_special_projects()),
+    BriefingNode("ascension_perks", lambda ex, r: ex.get_ascension_perks()),
+    BriefingNode("traditions", lambda ex, r: ex.get_traditions()),
+    BriefingNode("galactic_community", lambda ex, r: ex.get_galactic_community()),
+    BriefingNode("federation_details", lambda ex, r: ex.get_federation_details()),
+    BriefingNode("factions", lambda ex, r: ex.get_factions()),
+    BriefingNode("relics", lambda ex, r: ex.get_relics()),
+    BriefingNode("archaeology", lambda ex, r: ex.get_archaeology(limit=50)),
+    BriefingNode("campaign_id", lambda ex, r: ex._extract_campaign_id()),
+    BriefingNode(
+        "situation",
+        lambda ex, r: ex._build_situation_from_data(
+            r["meta"], r["wars"], r["diplomacy"], r["resources"], r["crisis"], r["fallen"]
+        ),
+        deps=("meta", "wars", "diplomacy", "resources", "crisis", "fallen"),
+    ),
+)
+
+
+def _validate_graph(nodes: Sequence[BriefingNode]) -> None:
+    names = {node.name for node in nodes}
+    if len(names) != len(nodes):
+        raise ValueError("Duplicate briefing node names")
+    for node in nodes:
+        missing = [dep for dep in node.deps if dep not in names]
+        if missing:
+            raise ValueError(f"Briefing node {node.name!r} depends on unknown {missing}")
+
+
+def run_briefing_plan(
+    extractor: Any,
+    *,
+    sessions: Sequence[RustSession | None],
+    nodes: Sequence[BriefingNode] = BRIEFING_NODES,
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """Run every producer in ``nodes``, respecting declared dependencies.
+
+    One worker thread is started per entry in ``sessions`` and each worker binds
+    its session as the thread's active Rust session. With a single session the
+    graph runs inline on the calling thread in declared order.
+
+    Args:
+        extractor: SaveExtractor instance whose methods the nodes call
+        sessions: Rust sessions to spread work over (None entries run sessionless)
+        nodes: Producer graph (defaults to BRIEFING_NODES)
+
+    Returns:
+        Tuple of (results by node name, elapsed seconds by node name)
+
+    Raises:
+        ValueError: If the graph references unknown nodes or has a cycle
+        Exception: The first exception raised by any producer
+    """
+    _validate_graph(nodes)
+
+    dependents: dict[str, list[BriefingNode]] = {node.name: [] for node in nodes}
+    waiting_on: dict[str, int] = {}
+    for node in nodes:
+        waiting_on[node.name] = len(node.deps)
+        for dep in node.deps:
+            dependents[dep].append(node)
+
+    ready: deque[BriefingNode] = deque(node for node in nodes if not node.deps)
+    results: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+
+    if len(sessions) <= 1:
+        while ready:
+            node = ready.popleft()
+            t0 = time.perf_counter()
+            results[node.name] = node.produce(extractor, results)
+            timings[node.name] = time.perf_counter() - t0
+            for child in dependents[node.name]:
+                waiting_on[child.name] -= 1
+                if waiting_on[child.name] == 0:
+                    ready.append(child)
+        if len(results) != len(nodes):
+            raise ValueError("Briefing node graph contains a cycle")
+        return results, timings
+
+    cond = threading.Condition()
+    state = {"unfinished": len(nodes), "running": 0}
+    errors: list[BaseException] = []
+
+    def worker(sess: RustSession | None) -> None:
+        with bind_session(sess):
+            while True:
+                with cond:
+                    while not ready and not errors and state["unfinished"] > 0:
+                        if state["running"] == 0:
+                            # Nothing runnable and nothing in flight: a cycle.
+                            errors.append(ValueError("Briefing node graph contains a cycle"))
+                            cond.notify_all()
+                            return
+                        cond.wait()
+                    if errors or state["unfinished"] == 0:
+                        return
+                    node = ready.popleft()
+                    state["running"] += 1
+
+                t0 = time.perf_counter()
+                try:
+                    value = node.produce(extractor, results)
+                except BaseException as e:
+                    with cond:
+                        errors.append(e)
+                        state["running"] -= 1
+                        cond.notify_all()
+                    return
+                elapsed = time.perf_counter() - t0
+
+                with cond:
+                    results[node.name] = value
+                    timings[node.name] = elapsed
+                    state["running"] -= 1
+                    state["unfinished"] -= 1
+                    for child in dependents[node.name]:
+                        waiting_on[child.name] -= 1
+                        if waiting_on[child.name] == 0:
+                            ready.append(child)
+                    cond.notify_all()
+
+    threads = [
+        threading.Thread(target=worker, args=(sess,), daemon=True, name=f"briefing-{i}")
+        for i, sess in enumerate(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results, timings
@@ -59,6 +59,14 @@ def _format_resolution_name(type_key: str) -> str:
 class DiplomacyMixin:
     """Domain methods extracted from the original SaveExtractor."""
 
+    RUST_PREFETCH_OPS = (
+        {"op": "get_entry_text", "section": "country", "key": "{player_id}"},
+        {"op": "extract_sections", "sections": ["galactic_community"]},
+        {"op": "extract_sections", "sections": ["resolution"]},
+        {"op": "extract_sections", "sections": ["sectors"]},
+        {"op": "contains_kv", "pairs": [["war_in_heaven", "yes"]]},
+    )
+
     def _extract_braced_block(self, content: str, key: str) -> str | None:
         """Extract the full `key={...}` block from a larger text chunk."""
         match = re.search(rf"\b{re.escape(key)}\s*=\s*\{{", content)
@@ -172,7 +180,7 @@ class DiplomacyMixin:
         session = _get_active_session()
         if not session:
             raise ParserError("Rust session required for get_diplomacy()")
-        player_chunk = session.get_entry_text("country", str(player_id))
+        player_chunk = self._rust_get_entry_text("country", str(player_id))
         if not player_chunk:
             result["error"] = "Could not find player country"
             return result
@@ -445,7 +453,7 @@ class DiplomacyMixin:
         result["federation_id"] = fed_id
 
         # Get federation entry directly by ID
-        fed_entry = session.get_entry("federation", str(fed_id))
+        fed_entry = self._rust_get_entry("federation", str(fed_id))
         if not fed_entry or not isinstance(fed_entry, dict):
             return result
 
@@ -574,7 +582,7 @@ class DiplomacyMixin:
         }
 
         # Use extract_sections for this small top-level section
-        data = session.extract_sections(["galactic_community"])
+        data = self._rust_extract_sections(["galactic_community"])
         gc = data.get("galactic_community")
 
         # Section might not exist if no galactic community formed
@@ -623,7 +631,7 @@ class DiplomacyMixin:
         if voting_raw is not None:
             with contextlib.suppress(ValueError, TypeError):
                 all_ids.add(int(voting_raw))
-        resolution_names = self._resolve_resolution_names(session, all_ids)
+        resolution_names = self._resolve_resolution_names(all_ids)
 
         def _named_resolutions(id_list: list[int], limit: int) -> list[dict]:
             """Convert ID list to list of {id, name} dicts."""
@@ -685,15 +693,13 @@ class DiplomacyMixin:
 
         return result
 
-    @staticmethod
-    def _resolve_resolution_names(session, resolution_ids: set[int]) -> dict[int, str]:
+    def _resolve_resolution_names(self, resolution_ids: set[int]) -> dict[int, str]:
         """Look up resolution type names from the `resolution` section.
 
         Fetches the resolution section and maps each ID to a cleaned-up
         human-readable name derived from the type key.
 
         Args:
-            session: Active Rust parser session.
             resolution_ids: Set of resolution IDs to resolve.
 
         Returns:
@@ -703,7 +709,7 @@ class DiplomacyMixin:
             return {}
 
         try:
-            data = session.extract_sections(["resolution"])
+            data = self._rust_extract_sections(["resolution"])
             res_section = data.get("resolution")
             if not isinstance(res_section, dict):
                 return {}
@@ -756,7 +762,7 @@ class DiplomacyMixin:
         }
 
         # Use extract_sections for this section
-        data = session.extract_sections(["agreements"])
+        data = self._rust_extract_sections(["agreements"])
         agreements_section = data.get("agreements")
 
         # Section might not exist if no agreements
@@ -963,7 +969,7 @@ class DiplomacyMixin:
 
         # Check for War in Heaven using contains_kv (faster than contains_tokens)
         try:
-            wih_result = session.contains_kv([("war_in_heaven", "yes")])
+            wih_result = self._rust_contains_kv([("war_in_heaven", "yes")])
             if wih_result.get("matches", {}).get("war_in_heaven=yes"):
                 result["war_in_heaven"] = True
         except Exception:
@@ -1109,7 +1115,7 @@ class DiplomacyMixin:
         }
 
         # Use extract_sections to get the espionage_operations section
-        data = session.extract_sections(["espionage_operations"])
+        data = self._rust_extract_sections(["espionage_operations"])
         espionage_section = data.get("espionage_operations")
 
         # Section might not exist if no espionage operations
@@ -1242,7 +1248,7 @@ class DiplomacyMixin:
         # Build system -> owner mapping from sectors
         # This is more reliable than the regex starbase_owner approach
         system_owners: dict[str, int] = {}
-        sectors_data = session.extract_sections(["sectors"])
+        sectors_data = self._rust_extract_sections(["sectors"])
         sectors = sectors_data.get("sectors")
         if sectors and isinstance(sectors, dict):
             for sector_id, sector_data in sectors.items():
@@ -297,17 +297,12 @@ class EconomyMixin:
 
         # Step 3: Find pop_groups section (this is where actual pop data lives)
         # Structure: pop_groups=\n{\n\tID=\n\t{ key={ species=X category="Y" } planet=Z size=N happiness=H ... }
-        pop_groups_match = re.search(r"\npop_groups=\n\{", self.gamestate)
-        if not pop_groups_match:
-            # Fallback: try alternate format
-            pop_groups_match = re.search(r"^pop_groups=\s*\{", self.gamestate, re.MULTILINE)
-            if not pop_groups_match:
-                result["error"] = "Could not find pop_groups section"
-                return result
-
-        pop_start = pop_groups_match.start()
-        # Pop groups section can be large in late game
-        pop_chunk = self.gamestate[pop_start : pop_start + 50000000]  # Up to 50MB
+        pop_bounds = self._get_section_bounds("pop_groups")
+        if not pop_bounds:
+            result["error"] = "Could not find pop_groups section"
+            return result
+
+        pop_chunk = self._gamestate_text(pop_bounds[0], pop_bounds[1])
 
         # Tracking for statistics
         species_counts = {}
@@ -793,7 +788,7 @@ class EconomyMixin:
         tracked = set(self._BUDGET_TRACKED_RESOURCES)
 
         # Get player country entry via Rust session
-        player_entry = session.get_entry("country", str(player_id))
+        player_entry = self._rust_get_entry("country", str(player_id))
         if not player_entry or not isinstance(player_entry, dict):
             result["error"] = "Could not find player country"
             return result
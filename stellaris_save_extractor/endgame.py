@@ -35,6 +35,29 @@ class EndgameMixin:
         "cloud",
     }
 
+    # System flags counted to size crisis-controlled territory
+    CRISIS_SYSTEM_FLAGS = (
+        "prethoryn_system",  # Prethoryn infested systems
+        "prethoryn_invasion_system",  # Prethoryn invasion target
+        "contingency_system",  # Contingency sterilization hubs
+        "contingency_world",  # Contingency machine world
+        "unbidden_portal_system",  # Unbidden dimensional anchor
+        "extradimensional_system",  # Generic extradimensional flag
+    )
+    LGATE_ENABLED_PAIRS = (("lgate_enabled", "yes"), ("lgate_enabled", "no"))
+    LCLUSTER_TOKENS = ("lcluster_", "l_cluster_opened", "gray_tempest_country")
+    KHAN_DEFEATED_TOKENS = ("great_khan_dead", "great_khan_defeated", "khan_successor")
+    KHAN_RISEN_TOKENS = ("great_khan_risen", "great_khan=yes", "khan_country")
+
+    RUST_PREFETCH_OPS = (
+        {"op": "count_keys", "keys": list(CRISIS_SYSTEM_FLAGS)},
+        {"op": "contains_kv", "pairs": [list(p) for p in LGATE_ENABLED_PAIRS]},
+        {
+            "op": "contains_tokens",
+            "tokens": [*LCLUSTER_TOKENS, *KHAN_DEFEATED_TOKENS, *KHAN_RISEN_TOKENS],
+        },
+    )
+
     def get_crisis_status(self) -> dict:
         """Get current crisis status and player involvement.
 
@@ -144,17 +167,8 @@ class EndgameMixin:
 
         # Count crisis-controlled systems via count_keys (tree traversal)
         # This is faster than regex since we traverse the already-parsed JSON tree
-        crisis_system_flags = [
-            "prethoryn_system",  # Prethoryn infested systems
-            "prethoryn_invasion_system",  # Prethoryn invasion target
-            "contingency_system",  # Contingency sterilization hubs
-            "contingency_world",  # Contingency machine world
-            "unbidden_portal_system",  # Unbidden dimensional anchor
-            "extradimensional_system",  # Generic extradimensional flag
-        ]
-
         # Use count_keys operation (session guaranteed to be active from start check)
-        counts_result = session.count_keys(crisis_system_flags)
+        counts_result = self._rust_count_keys(list(self.CRISIS_SYSTEM_FLAGS))
         counts = counts_result.get("counts", {})
         result["crisis_systems_count"] = sum(counts.values())
 
@@ -183,7 +197,9 @@ class EndgameMixin:
         # Find crisis country IDs by scanning the country section
         country_section_start = self._find_country_section_start()
         if country_section_start != -1:
-            country_chunk = self.gamestate[country_section_start : country_section_start + 50000000]
+            country_chunk = self._gamestate_text(
+                country_section_start, country_section_start + 50000000
+            )
 
             # Find countries with crisis types
             for match in re.finditer(r"\n\t(\d+)=\n\t\{", country_chunk):
@@ -265,7 +281,7 @@ class EndgameMixin:
         ]
         total_crisis_systems = 0
         for flag in crisis_system_flags:
-            total_crisis_systems += len(re.findall(rf"\b{flag}=", self.gamestate))
+            total_crisis_systems += self._count_gamestate(rf"\b{flag}=")
 
         result["crisis_systems_count"] = total_crisis_systems
 
@@ -309,7 +325,7 @@ class EndgameMixin:
 
         # Check if L-Gates are enabled using contains_kv (1.8x faster than contains_tokens)
         # contains_kv traverses the parsed tree instead of scanning raw bytes
-        lgate_kv = session.contains_kv([("lgate_enabled", "yes"), ("lgate_enabled", "no")])
+        lgate_kv = self._rust_contains_kv(list(self.LGATE_ENABLED_PAIRS))
         matches = lgate_kv.get("matches", {})
         if matches.get("lgate_enabled=yes"):
             result["lgate_enabled"] = True
@@ -343,9 +359,7 @@ class EndgameMixin:
                             result["player_activation_progress"] = int(activation_progress)
 
         # Check if L-Gate has been opened using contains_tokens
-        lcluster_tokens = session.contains_tokens(
-            ["lcluster_", "l_cluster_opened", "gray_tempest_country"]
-        )
+        lcluster_tokens = self._rust_contains_tokens(list(self.LCLUSTER_TOKENS))
         lcluster_matches = lcluster_tokens.get("matches", {})
         if any(lcluster_matches.values()):
             result["lgate_opened"] = True
@@ -367,9 +381,9 @@ class EndgameMixin:
         }
 
         # Check if L-Gates are enabled in galaxy settings
-        if "lgate_enabled=yes" in self.gamestate:
+        if self._gamestate_contains("lgate_enabled=yes"):
             result["lgate_enabled"] = True
-        elif "lgate_enabled=no" in self.gamestate:
+        elif self._gamestate_contains("lgate_enabled=no"):
             result["lgate_enabled"] = False
             return result  # No point checking further
 
@@ -398,7 +412,7 @@ class EndgameMixin:
         # Check if L-Gate has been opened (look for L-Cluster access)
         # When opened, there will be bypass connections to the L-Cluster
         # Or we can check for gray_tempest/lcluster related flags
-        if re.search(r"lcluster_|l_cluster_opened|gray_tempest_country", self.gamestate):
+        if self._search_gamestate(r"lcluster_|l_cluster_opened|gray_tempest_country"):
             result["lgate_opened"] = True
 
         # Also check if player has the activation tech completed
@@ -597,11 +611,11 @@ class EndgameMixin:
 
         # Check for Khan status via single contains_tokens call (batched for efficiency)
         # Defeated tokens take priority over risen tokens
-        khan_defeated_tokens = ["great_khan_dead", "great_khan_defeated", "khan_successor"]
-        khan_risen_tokens = ["great_khan_risen", "great_khan=yes", "khan_country"]
+        khan_defeated_tokens = list(self.KHAN_DEFEATED_TOKENS)
+        khan_risen_tokens = list(self.KHAN_RISEN_TOKENS)
         all_khan_tokens = khan_defeated_tokens + khan_risen_tokens
 
-        khan_result = session.contains_tokens(all_khan_tokens)
+        khan_result = self._rust_contains_tokens(all_khan_tokens)
         khan_matches = khan_result.get("matches", {})
 
         # Check defeated status first (takes priority)
@@ -644,10 +658,10 @@ class EndgameMixin:
 
         marauder_count = 0
         for pattern in marauder_patterns:
-            matches = re.findall(pattern, self.gamestate)
+            matches = self._count_gamestate(pattern)
             if matches:
                 result["marauders_present"] = True
-                marauder_count += len(matches)
+                marauder_count += matches
 
         # Dedupe - NAME_Marauder appears multiple times per empire
         # Estimate actual marauder empires (usually 1-3)
@@ -665,7 +679,7 @@ class EndgameMixin:
         ]
 
         for pattern, status in khan_patterns:
-            if re.search(pattern, self.gamestate):
+            if self._search_gamestate(pattern):
                 result["khan_risen"] = True
                 result["khan_status"] = status
                 break
@@ -678,7 +692,7 @@ class EndgameMixin:
         ]
 
         for pattern in khan_defeated_patterns:
-            if re.search(pattern, self.gamestate):
+            if self._search_gamestate(pattern):
                 result["khan_risen"] = True  # Was risen at some point
                 result["khan_status"] = "defeated"
                 break
@@ -688,9 +702,9 @@ class EndgameMixin:
             # Look for awakened_marauders country
             country_section_start = self._find_country_section_start()
             if country_section_start != -1:
-                country_chunk = self.gamestate[
-                    country_section_start : country_section_start + 10000000
-                ]
+                country_chunk = self._gamestate_text(
+                    country_section_start, country_section_start + 10000000
+                )
 
                 for match in re.finditer(r"\n\t(\d+)=\n\t\{", country_chunk):
                     country_id = int(match.group(1))
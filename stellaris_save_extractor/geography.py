@@ -20,9 +20,10 @@ class GeographyMixin:
         """
         if self._system_owner_map_cache is not None:
             return self._system_owner_map_cache
-        self._system_owner_map_cache = self._build_system_owner_map(
-            self._get_galactic_objects_cached()
-        )
+        galactic_objects = self._get_galactic_objects_cached()
+        with self._cache_lock("system_owner_map"):
+            if self._system_owner_map_cache is None:
+                self._system_owner_map_cache = self._build_system_owner_map(galactic_objects)
         return self._system_owner_map_cache
 
     def _build_system_owner_map(self, galactic_objects: dict[str, dict]) -> dict[str, int]:
@@ -14,6 +14,21 @@ logger = logging.getLogger(__name__)
 class LeadersMixin:
     """Domain methods extracted from the original SaveExtractor."""
 
+    # Fields read from each `leaders` entry (projected in the Rust stream)
+    LEADER_FIELDS = (
+        "country",
+        "class",
+        "name",
+        "level",
+        "age",
+        "experience",
+        "death_date",
+        "date_added",
+        "recruitment_date",
+        "pre_ruler_date",
+        "date",
+    )
+
     def get_leaders(self) -> dict:
         """Get the player's leader information.
 
@@ -55,7 +70,7 @@ class LeadersMixin:
         # Phase 1: Iterate and collect player leader data
         # (can't call get_duplicate_values during iter_section - same pipe)
         player_leaders_data = []
-        for leader_id, leader_data in session.iter_section("leaders"):
+        for leader_id, leader_data in session.iter_section("leaders", fields=self.LEADER_FIELDS):
             # P010: entry might be string "none" for deleted entries
             if not isinstance(leader_data, dict):
                 continue
@@ -9,6 +9,11 @@ from stellaris_companion.rust_bridge import _get_active_session
 logger = logging.getLogger(__name__)
 
 
+def _flatten_token_map(*token_maps: dict[str, list[str]]) -> list[str]:
+    """All tokens from ``{type: [tokens]}`` maps, in order, without duplicates."""
+    return list(dict.fromkeys(t for m in token_maps for tokens in m.values() for t in tokens))
+
+
 class LeviathansMixin:
     """Extractors for Leviathans, Guardians, and space creatures."""
 
@@ -86,6 +91,80 @@ class LeviathansMixin:
         "drone_country": "drone",
     }
 
+    # Detection tokens for guardians (found anywhere in the gamestate)
+    GUARDIAN_TOKENS = {
+        "ether_drake": ["ether_drake", "dragon_armor", "NAME_Ether_Drake"],
+        "dimensional_horror": ["dimensional_horror", "NAME_Dimensional_Horror"],
+        "automated_dreadnought": ["automated_dreadnought", "NAME_Automated_Dreadnought"],
+        "stellarite": ["stellarite", "NAME_Stellarite"],
+        "enigmatic_fortress": ["enigmatic_fortress", "NAME_Enigmatic_Fortress"],
+        "voidspawn": ["voidspawn", "NAME_Voidspawn"],
+        "wraith": ["spectral_wraith", "NAME_Spectral_Wraith"],
+    }
+
+    # Defeat markers for each guardian type
+    GUARDIAN_DEFEAT_TOKENS = {
+        "ether_drake": [
+            "killed_ether_drake",
+            "ether_drake_defeated",
+            "ether_drake_dead",
+            "defeated_ether_drake",
+            "killed_dragon",
+            "dragon_killed",
+            "ether_drake_killed",
+            "relic_dragon_trophy",
+        ],
+        "dimensional_horror": [
+            "killed_dimensional_horror",
+            "dimensional_horror_defeated",
+            "dimensional_horror_dead",
+            "defeated_dimensional_horror",
+        ],
+        "automated_dreadnought": [
+            "killed_automated_dreadnought",
+            "automated_dreadnought_defeated",
+            "automated_dreadnought_dead",
+            "defeated_automated_dreadnought",
+            "dreadnought_captured",
+            "owns_dreadnought",
+        ],
+        "stellarite": [
+            "killed_stellarite",
+            "stellarite_defeated",
+            "stellarite_dead",
+            "defeated_stellarite",
+        ],
+        "enigmatic_fortress": [
+            "killed_enigmatic_fortress",
+            "enigmatic_fortress_defeated",
+            "enigmatic_fortress_dead",
+            "defeated_enigmatic_fortress",
+            "fortress_solved",
+            "enigmatic_cache",
+        ],
+        "voidspawn": [
+            "killed_voidspawn",
+            "voidspawn_defeated",
+            "voidspawn_dead",
+            "defeated_voidspawn",
+        ],
+        "wraith": [
+            "killed_wraith",
+            "wraith_defeated",
+            "wraith_dead",
+            "defeated_wraith",
+            "killed_spectral_wraith",
+            "spectral_wraith_defeated",
+        ],
+    }
+
+    RUST_PREFETCH_OPS = (
+        {
+            "op": "contains_tokens",
+            "tokens": _flatten_token_map(GUARDIAN_TOKENS, GUARDIAN_DEFEAT_TOKENS),
+        },
+    )
+
     def get_leviathans(self) -> dict:
         """Get status of Leviathans and Guardians in the galaxy.
 
@@ -109,7 +188,7 @@ class LeviathansMixin:
 
         Uses session mode for fast data access:
         - session.iter_section() for countries to find leviathan country types (P031)
-        - session.contains_tokens() for fast guardian detection and defeat markers
+        - self._rust_contains_tokens() for fast guardian detection and defeat markers
 
         Returns:
             Dict with leviathan status details
@@ -153,71 +232,8 @@ class LeviathansMixin:
 
         # Second pass: detect guardians AND defeat status via single contains_tokens call
         # Combines detection and defeat tokens to avoid two Aho-Corasick scans
-        guardian_tokens = {
-            "ether_drake": ["ether_drake", "dragon_armor", "NAME_Ether_Drake"],
-            "dimensional_horror": ["dimensional_horror", "NAME_Dimensional_Horror"],
-            "automated_dreadnought": ["automated_dreadnought", "NAME_Automated_Dreadnought"],
-            "stellarite": ["stellarite", "NAME_Stellarite"],
-            "enigmatic_fortress": ["enigmatic_fortress", "NAME_Enigmatic_Fortress"],
-            "voidspawn": ["voidspawn", "NAME_Voidspawn"],
-            "wraith": ["spectral_wraith", "NAME_Spectral_Wraith"],
-        }
-
-        # Pre-compute ALL defeat tokens for all guardian types
-        defeat_tokens = {
-            "ether_drake": [
-                "killed_ether_drake",
-                "ether_drake_defeated",
-                "ether_drake_dead",
-                "defeated_ether_drake",
-                "killed_dragon",
-                "dragon_killed",
-                "ether_drake_killed",
-                "relic_dragon_trophy",
-            ],
-            "dimensional_horror": [
-                "killed_dimensional_horror",
-                "dimensional_horror_defeated",
-                "dimensional_horror_dead",
-                "defeated_dimensional_horror",
-            ],
-            "automated_dreadnought": [
-                "killed_automated_dreadnought",
-                "automated_dreadnought_defeated",
-                "automated_dreadnought_dead",
-                "defeated_automated_dreadnought",
-                "dreadnought_captured",
-                "owns_dreadnought",
-            ],
-            "stellarite": [
-                "killed_stellarite",
-                "stellarite_defeated",
-                "stellarite_dead",
-                "defeated_stellarite",
-            ],
-            "enigmatic_fortress": [
-                "killed_enigmatic_fortress",
-                "enigmatic_fortress_defeated",
-                "enigmatic_fortress_dead",
-                "defeated_enigmatic_fortress",
-                "fortress_solved",
-                "enigmatic_cache",
-            ],
-            "voidspawn": [
-                "killed_voidspawn",
-                "voidspawn_defeated",
-                "voidspawn_dead",
-                "defeated_voidspawn",
-            ],
-            "wraith": [
-                "killed_wraith",
-                "wraith_defeated",
-                "wraith_dead",
-                "defeated_wraith",
-                "killed_spectral_wraith",
-                "spectral_wraith_defeated",
-            ],
-        }
+        guardian_tokens = self.GUARDIAN_TOKENS
+        defeat_tokens = self.GUARDIAN_DEFEAT_TOKENS
 
         # Build combined token list for single Aho-Corasick scan
         all_tokens = []
@@ -235,7 +251,7 @@ class LeviathansMixin:
                 token_to_defeat[token] = lev_key
 
         # Single contains_tokens call for both detection and defeat status
-        result_data = session.contains_tokens(all_tokens)
+        result_data = self._rust_contains_tokens(all_tokens)
         matches = result_data.get("matches", {})
 
         # Process detection tokens
@@ -350,7 +366,7 @@ class LeviathansMixin:
         for lev_key, patterns in leviathan_patterns.items():
             found = False
             for pattern in patterns:
-                if re.search(pattern, self.gamestate, re.IGNORECASE):
+                if self._search_gamestate(pattern, re.IGNORECASE):
                     found = True
                     break
 
@@ -389,29 +405,27 @@ class LeviathansMixin:
         ]
 
         for pattern in defeat_patterns:
-            if re.search(pattern, self.gamestate, re.IGNORECASE):
+            if self._search_gamestate(pattern, re.IGNORECASE):
                 return True
 
         # Special cases
         if leviathan_type == "ether_drake":
-            if re.search(
-                r"killed_dragon|dragon_killed|ether_drake_killed",
-                self.gamestate,
-                re.IGNORECASE,
+            if self._search_gamestate(
+                r"killed_dragon|dragon_killed|ether_drake_killed", re.IGNORECASE
             ):
                 return True
             # Check for dragon trophy (indicates defeat)
-            if re.search(r"relic_dragon_trophy", self.gamestate):
+            if self._search_gamestate(r"relic_dragon_trophy"):
                 return True
 
         if leviathan_type == "automated_dreadnought":
             # Can be captured instead of destroyed
-            if re.search(r"dreadnought_captured|owns_dreadnought", self.gamestate, re.IGNORECASE):
+            if self._search_gamestate(r"dreadnought_captured|owns_dreadnought", re.IGNORECASE):
                 return True
 
         if leviathan_type == "enigmatic_fortress":
             # Fortress is "solved" not defeated
-            if re.search(r"fortress_solved|enigmatic_cache", self.gamestate, re.IGNORECASE):
+            if self._search_gamestate(r"fortress_solved|enigmatic_cache", re.IGNORECASE):
                 return True
 
         return False
@@ -477,7 +491,7 @@ class LeviathansMixin:
                     token_to_leviathan[token] = lev_type
 
         # Single Aho-Corasick scan for all defeat tokens
-        result_data = session.contains_tokens(all_tokens)
+        result_data = self._rust_contains_tokens(all_tokens)
         matches = result_data.get("matches", {})
 
         # Build defeat status dict
@@ -13,6 +13,21 @@ logger = logging.getLogger(__name__)
 class MilitaryMixin:
     """Domain methods extracted from the original SaveExtractor."""
 
+    RUST_PREFETCH_OPS = ({"op": "extract_sections", "sections": ["starbase_mgr"]},)
+
+    # Fields read from each entry of the sections streamed below (projected in Rust)
+    WAR_FIELDS = (
+        "name",
+        "start_date",
+        "attackers[].country",
+        "defenders[].country",
+        "attacker_war_goal.type",
+        "battles",
+    )
+    SHIP_DESIGN_FIELDS = ("ship_size", "growth_stages[].ship_size")
+    SHIP_DESIGN_REF_FIELDS = ("ship_design_implementation.design", "ship_design")
+    MEGASTRUCTURE_FIELDS = ("type", "owner", "planet", "build_queue", "upgrade")
+
     def _resolve_fleet_name(self, name_block: dict | str | None, fleet_id: str) -> str:
         """Resolve a fleet name from its name block structure.
 
@@ -97,7 +112,7 @@ class MilitaryMixin:
         self._get_galactic_objects_cached()
 
         # Iterate through wars using Rust parser (P031: use session.iter_section directly)
-        for war_id, war_data in session.iter_section("war"):
+        for war_id, war_data in session.iter_section("war", fields=self.WAR_FIELDS):
             # Skip null/ended wars (value is "none" string)
             if not isinstance(war_data, dict):
                 continue
@@ -537,7 +552,9 @@ class MilitaryMixin:
 
         # Build design_id -> ship_size mapping from ship_design section (P031)
         design_to_size: dict[str, str] = {}
-        for design_id, design_data in session.iter_section("ship_design"):
+        for design_id, design_data in session.iter_section(
+            "ship_design", fields=self.SHIP_DESIGN_FIELDS
+        ):
             if not isinstance(design_data, dict):
                 continue
             # ship_size can be directly on design or in growth_stages[0].ship_size
@@ -553,7 +570,7 @@ class MilitaryMixin:
 
         # Build ship_id -> design_id mapping from ships section (P031)
         ship_to_design: dict[str, str] = {}
-        for ship_id, ship_data in session.iter_section("ships"):
+        for ship_id, ship_data in session.iter_section("ships", fields=self.SHIP_DESIGN_REF_FIELDS):
             if not isinstance(ship_data, dict):
                 continue
             impl = ship_data.get("ship_design_implementation", {})
@@ -698,7 +715,7 @@ class MilitaryMixin:
                     starbase_to_system[sb_id_str] = system_id
 
         # Now get starbase details from starbase_mgr (P031)
-        data = session.extract_sections(["starbase_mgr"])
+        data = self._rust_extract_sections(["starbase_mgr"])
         starbase_mgr = data.get("starbase_mgr", {})
         starbases_section = starbase_mgr.get("starbases", {})
 
@@ -831,7 +848,9 @@ class MilitaryMixin:
         ruined_megas = []
         by_type: dict[str, int] = {}
 
-        for mega_id, entry in session.iter_section("megastructures"):
+        for mega_id, entry in session.iter_section(
+            "megastructures", fields=self.MEGASTRUCTURE_FIELDS
+        ):
             # P010: entry might be string "none" for deleted entries
             if not isinstance(entry, dict):
                 continue
@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class PlanetsMixin:
     """Domain methods extracted from the original SaveExtractor."""
 
+    RUST_PREFETCH_OPS = ({"op": "extract_sections", "sections": ["archaeological_sites"]},)
+
     def get_planets(self) -> dict:
         """Get the player's colonized planets.
 
@@ -25,7 +27,9 @@ class PlanetsMixin:
         """
         if self._planets_cache is not None:
             return self._planets_cache
-        self._planets_cache = self._get_planets_rust()
+        with self._cache_lock("planets"):
+            if self._planets_cache is None:
+                self._planets_cache = self._get_planets_rust()
         return self._planets_cache
 
     def _extract_planet_name(self, name_data) -> str:
@@ -87,7 +91,7 @@ class PlanetsMixin:
 
         # Use session extract_sections for planets (reuses parsed data, no spawn)
         # The planets section has nested structure: planets.planet.{id: {...}}
-        data = session.extract_sections(["planets"])
+        data = self._rust_extract_sections(["planets"])
         planets_data = data.get("planets", {}).get("planet", {})
 
         planets_found = []
@@ -359,7 +363,7 @@ class PlanetsMixin:
         }
 
         # Use session extract_sections for archaeological_sites
-        data = session.extract_sections(["archaeological_sites"])
+        data = self._rust_extract_sections(["archaeological_sites"])
         arch_data = data.get("archaeological_sites", {})
         sites_data = arch_data.get("sites", {})
 
@@ -441,7 +445,7 @@ class PlanetsMixin:
                     # Lazy-load planet data (cached from get_planets)
                     if planets_section is None:
                         planets_section = (
-                            session.extract_sections(["planets"])
+                            self._rust_extract_sections(["planets"])
                             .get("planets", {})
                             .get("planet", {})
                         )
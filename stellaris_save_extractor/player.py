@@ -120,6 +120,17 @@ _NAVAL_CAP_TIMED_MODIFIER_HINTS = {
 class PlayerMixin:
     """Domain methods extracted from the original SaveExtractor."""
 
+    RUST_PREFETCH_OPS = (
+        {"op": "extract_sections", "sections": ["galaxy"]},
+        {"op": "extract_sections", "sections": ["agreements"]},
+        {
+            "op": "get_duplicate_values",
+            "section": "country",
+            "key": "{player_id}",
+            "field": "technology",
+        },
+    )
+
     def _extract_braced_block(self, content: str, key: str) -> str | None:
         """Extract the full `key={...}` block from a larger text chunk."""
         match = re.search(rf"\b{re.escape(key)}\s*=\s*\{{", content)
@@ -185,7 +196,7 @@ class PlayerMixin:
         if not session:
             raise ParserError("Rust session required - use 'with session(save_path):' context")
 
-        data = session.extract_sections(["player"])
+        data = self._rust_extract_sections(["player"])
         player_list = data.get("player", [])
         if player_list and isinstance(player_list, list) and len(player_list) > 0:
             country_id = player_list[0].get("country", "0")
@@ -217,10 +228,14 @@ class PlayerMixin:
         if not session:
             raise ParserError("Rust session required - use 'with session(save_path):' context")
 
-        result = self._get_player_status_rust(session)
+        with self._cache_lock("player_status"):
+            if self._player_status_cache is not None:
+                return self._player_status_cache
+
+            result = self._get_player_status_rust(session)
 
-        # Cache the result for subsequent calls
-        self._player_status_cache = result
+            # Cache the result for subsequent calls
+            self._player_status_cache = result
         return result
 
     def _get_player_status_rust(self, session) -> dict:
@@ -788,7 +803,7 @@ class PlayerMixin:
         if not session:
             return None
 
-        galaxy = session.extract_sections(["galaxy"]).get("galaxy", {})
+        galaxy = self._rust_extract_sections(["galaxy"]).get("galaxy", {})
         difficulty = galaxy.get("difficulty") if isinstance(galaxy, dict) else None
         return str(difficulty) if isinstance(difficulty, str) else None
 
@@ -830,7 +845,7 @@ class PlayerMixin:
         session = _get_active_session()
         if not session:
             return []
-        values = session.get_duplicate_values("country", str(player_id), "technology")
+        values = self._rust_get_duplicate_values("country", str(player_id), "technology")
         return [value for value in values if isinstance(value, str)]
 
     @staticmethod
@@ -877,7 +892,7 @@ class PlayerMixin:
 
         with contextlib.suppress(ValueError, TypeError):
             fed_id_str = str(int(fed_id))
-            federation = session.get_entry("federation", fed_id_str)
+            federation = self._rust_get_entry("federation", fed_id_str)
             progression = (
                 federation.get("federation_progression") if isinstance(federation, dict) else None
             )
@@ -902,7 +917,7 @@ class PlayerMixin:
         if not session:
             return set()
 
-        gc = session.extract_sections(["galactic_community"]).get("galactic_community")
+        gc = self._rust_extract_sections(["galactic_community"]).get("galactic_community")
         if not isinstance(gc, dict):
             return set()
 
@@ -910,7 +925,7 @@ class PlayerMixin:
         if not isinstance(passed_ids, list):
             return set()
 
-        resolution_section = session.extract_sections(["resolution"]).get("resolution", {})
+        resolution_section = self._rust_extract_sections(["resolution"]).get("resolution", {})
         if not isinstance(resolution_section, dict):
             return set()
 
@@ -942,7 +957,7 @@ class PlayerMixin:
         modeled_terms: dict[str, float] = {}
         unresolved_families: set[str] = set()
 
-        data = session.extract_sections(["agreements"])
+        data = self._rust_extract_sections(["agreements"])
         agreements_section = data.get("agreements", {})
         inner_agreements = (
             agreements_section.get("agreements", {}) if isinstance(agreements_section, dict) else {}
@@ -1002,8 +1017,8 @@ class PlayerMixin:
         if not session:
             return {"flat_additions": {}, "unresolved_source_families": set()}
 
-        planets = session.extract_sections(["planets"]).get("planets", {}).get("planet", {})
-        pop_jobs_section = session.extract_sections(["pop_jobs"]).get("pop_jobs", {})
+        planets = self._rust_extract_sections(["planets"]).get("planets", {}).get("planet", {})
+        pop_jobs_section = self._rust_extract_sections(["pop_jobs"]).get("pop_jobs", {})
         if not isinstance(planets, dict) or not isinstance(pop_jobs_section, dict):
             return {"flat_additions": {}, "unresolved_source_families": set()}
 
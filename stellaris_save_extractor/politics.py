@@ -13,6 +13,17 @@ logger = logging.getLogger(__name__)
 class PoliticsMixin:
     """Internal politics extractors (factions, elections, agendas, etc.)."""
 
+    # Fields read from each `pop_factions` entry (projected in the Rust stream)
+    FACTION_FIELDS = (
+        "country",
+        "type",
+        "name",
+        "support_percent",
+        "support_power",
+        "faction_approval",
+        "members",
+    )
+
     def _extract_braced_block(self, content: str, key: str) -> str | None:
         """Extract the full `key={...}` block from a larger text chunk."""
         match = re.search(rf"\b{re.escape(key)}\s*=\s*\{{", content)
@@ -120,7 +131,9 @@ class PoliticsMixin:
         factions: list[dict] = []
 
         # P031: Use session.iter_section() directly
-        for faction_id, faction_data in session.iter_section("pop_factions"):
+        for faction_id, faction_data in session.iter_section(
+            "pop_factions", fields=self.FACTION_FIELDS
+        ):
             # P010: Entry might be string "none" - always check isinstance
             if not isinstance(faction_data, dict):
                 continue
@@ -12,6 +12,15 @@ logger = logging.getLogger(__name__)
 class ProjectsMixin:
     """Extractors for special projects, event chains, and precursor progress."""
 
+    RUST_PREFETCH_OPS = (
+        {
+            "op": "get_duplicate_values",
+            "section": "country",
+            "key": "{player_id}",
+            "field": "completed_event_chain",
+        },
+    )
+
     # Known precursor chain identifiers
     PRECURSOR_CHAINS = {
         "yuht": "Yuhtaan (First Colonizers)",
@@ -83,14 +92,14 @@ class ProjectsMixin:
         player_id = self.get_player_empire_id()
 
         # Use session.get_entry for O(1) lookup (P021)
-        player_data = session.get_entry("country", str(player_id))
+        player_data = self._rust_get_entry("country", str(player_id))
 
         if not player_data or not isinstance(player_data, dict):
             return result
 
         # Extract completed event chains using get_duplicate_values (P023)
         # This handles the duplicate key issue where jomini collapses them
-        completed_chains = session.get_duplicate_values(
+        completed_chains = self._rust_get_duplicate_values(
             "country", str(player_id), "completed_event_chain"
         )
         result["completed_chains"] = completed_chains
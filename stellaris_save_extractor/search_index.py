@@ -0,0 +1,300 @@
+"""On-disk token index answering `BriefingMixin.search()` without scanning the gamestate.
+
+The index maps every identifier-like token (``[A-Za-z0-9_]+``, lowercased) to its
+occurrence count and, for tokens seen at most ``MAX_POSTINGS`` times, to its
+positions. A query substring that lies inside one token is answered from the
+vocabulary alone: every token containing it contributes ``count * occurrences``.
+Longer queries are anchored on their rarest token run and verified against the
+buffer. Pure-digit tokens (entity IDs, numbers) are not indexed; queries that
+need them fall back to a linear scan.
+
+Positions are in the units of the buffer the index was built from (chars for a
+decoded str, bytes for raw bytes / an mmap), recorded as ``unit``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import itertools
+import json
+import zlib
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .base import GamestateBuffer, build_section_index, gamestate_pattern, literal_search_pattern
+
+_TOKEN = r"[A-Za-z0-9_]+"
+
+FORMAT_VERSION = 1
+
+# Tokens seen more often than this keep only a count (their first hits are cheap to scan for).
+MAX_POSTINGS = 64
+
+# Index files kept per directory; older ones are pruned after each save.
+MAX_INDEX_FILES = 8
+
+# Tokens scanned between should_stop() checks while building.
+STOP_CHECK_TOKENS = 1 << 16
+
+
+def save_content_key(save_path: str | Path) -> str:
+    """Hash of the .sav file contents, used to key cached indexes."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(save_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def buffer_unit(buffer: GamestateBuffer) -> str:
+    return "chars" if isinstance(buffer, str) else "bytes"
+
+
+def prune_index_dir(index_dir: str | Path, keep: int = MAX_INDEX_FILES) -> None:
+    """Delete all but the ``keep`` most recently written index files."""
+    files = sorted(Path(index_dir).glob("*.idx"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for stale in files[keep:]:
+        stale.unlink(missing_ok=True)
+
+
+def _occurrences(haystack: str, needle: str) -> list[int]:
+    """Offsets of every (overlapping) occurrence of needle in haystack."""
+    found = []
+    pos = haystack.find(needle)
+    while pos != -1:
+        found.append(pos)
+        pos = haystack.find(needle, pos + 1)
+    return found
+
+
+@dataclass
+class SearchHits:
+    """Result of an index lookup: total count plus the first match positions."""
+
+    total: int
+    positions: list[int]
+
+
+class GamestateSearchIndex:
+    """Token inverted index over one gamestate buffer (see module docstring)."""
+
+    def __init__(
+        self,
+        *,
+        unit: str,
+        tokens: list[str],
+        counts: array,
+        posting_offsets: array,
+        postings: array,
+        sections: dict[str, tuple[int, int]],
+    ) -> None:
+        self.unit = unit
+        self._tokens = tokens
+        self._counts = counts
+        self._posting_offsets = posting_offsets
+        self._postings = postings
+        self._sections = sorted((start, end, name) for name, (start, end) in sections.items())
+        self._section_starts = [start for start, _, _ in self._sections]
+
+        # "\n"-joined vocabulary: one str.find() pass finds every token containing a query.
+        self._vocab = "\n".join(tokens)
+        self._vocab_starts: list[int] = []
+        offset = 0
+        for token in tokens:
+            self._vocab_starts.append(offset)
+            offset += len(token) + 1
+
+    @classmethod
+    def build(
+        cls, buffer: GamestateBuffer, *, should_stop: Callable[[], bool] | None = None
+    ) -> GamestateSearchIndex | None:
+        """Tokenize ``buffer`` in one pass.
+
+        Returns None if ``should_stop`` (polled every STOP_CHECK_TOKENS tokens)
+        asks to abandon the build.
+        """
+        as_bytes = not isinstance(buffer, str)
+        counts: dict[str, int] = {}
+        positions: dict[str, list[int] | None] = {}
+        matches = gamestate_pattern(_TOKEN, buffer).finditer(buffer)
+        for n, match in enumerate(matches):
+            if should_stop is not None and n % STOP_CHECK_TOKENS == 0 and should_stop():
+                return None
+            token = match.group()
+            if token.isdigit():
+                continue
+            token = (token.decode("ascii") if as_bytes else token).lower()
+            seen = counts.get(token, 0)
+            counts[token] = seen + 1
+            if seen == 0:
+                positions[token] = [match.start()]
+            elif seen < MAX_POSTINGS:
+                positions[token].append(match.start())
+            elif seen == MAX_POSTINGS:
+                positions[token] = None
+
+        tokens = sorted(counts)
+        count_arr = array("I", (counts[t] for t in tokens))
+        offsets = array("Q", [0])
+        postings = array("I")
+        for token in tokens:
+            token_positions = positions[token]
+            if token_positions:
+                postings.extend(token_positions)
+            offsets.append(len(postings))
+        return cls(
+            unit=buffer_unit(buffer),
+            tokens=tokens,
+            counts=count_arr,
+            posting_offsets=offsets,
+            postings=postings,
+            sections=build_section_index(buffer),
+        )
+
+    @property
+    def sections(self) -> dict[str, tuple[int, int]]:
+        """Top-level section spans captured at build time."""
+        return {name: (start, end) for start, end, name in self._sections}
+
+    # -- persistence -------------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        """Write the index atomically (zlib-compressed header + arrays)."""
+        path = Path(path)
+        header = {
+            "format": FORMAT_VERSION,
+            "unit": self.unit,
+            "tokens": len(self._tokens),
+            "postings": len(self._postings),
+            "sections": [[name, start, end] for start, end, name in self._sections],
+        }
+        vocab = self._vocab.encode("ascii")
+        parts = [
+            json.dumps(header).encode("utf-8"),
+            vocab,
+            self._counts.tobytes(),
+            self._posting_offsets.tobytes(),
+            self._postings.tobytes(),
+        ]
+        frame = b"".join(len(part).to_bytes(8, "little") + part for part in parts)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(zlib.compress(frame, 1))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> GamestateSearchIndex | None:
+        """Read an index written by save(); None if missing, stale or corrupt."""
+        try:
+            frame = zlib.decompress(Path(path).read_bytes())
+            parts: list[bytes] = []
+            pos = 0
+            while pos < len(frame):
+                size = int.from_bytes(frame[pos : pos + 8], "little")
+                parts.append(frame[pos + 8 : pos + 8 + size])
+                pos += 8 + size
+            header_raw, vocab, counts_raw, offsets_raw, postings_raw = parts
+            header = json.loads(header_raw)
+            if header.get("format") != FORMAT_VERSION:
+                return None
+            counts, offsets, postings = array("I"), array("Q"), array("I")
+            counts.frombytes(counts_raw)
+            offsets.frombytes(offsets_raw)
+            postings.frombytes(postings_raw)
+        except (OSError, ValueError, zlib.error):
+            return None
+        tokens = vocab.decode("ascii").split("\n") if vocab else []
+        if len(tokens) != header["tokens"] or len(postings) != header["postings"]:
+            return None
+        return cls(
+            unit=header["unit"],
+            tokens=tokens,
+            counts=counts,
+            posting_offsets=offsets,
+            postings=postings,
+            sections={name: (start, end) for name, start, end in header["sections"]},
+        )
+
+    # -- queries -----------------------------------------------------------
+
+    def section_at(self, pos: int) -> str | None:
+        """Name of the top-level block section containing ``pos``."""
+        i = bisect.bisect_right(self._section_starts, pos) - 1
+        if i >= 0:
+            start, end, name = self._sections[i]
+            if pos < end:
+                return name
+        return None
+
+    def _matching_tokens(self, needle: str) -> dict[int, list[int]]:
+        """Token id -> in-token offsets of ``needle`` for every token containing it."""
+        matches: dict[int, list[int]] = {}
+        for offset in _occurrences(self._vocab, needle):
+            token_id = bisect.bisect_right(self._vocab_starts, offset) - 1
+            matches.setdefault(token_id, []).append(offset - self._vocab_starts[token_id])
+        return matches
+
+    def _piece_hits(self, piece: str) -> tuple[int, list[int] | None]:
+        """Total occurrences of ``piece`` and all positions (None if any token is frequent)."""
+        total = 0
+        positions: list[int] | None = []
+        for token_id, offsets in self._matching_tokens(piece).items():
+            total += self._counts[token_id] * len(offsets)
+            start, end = self._posting_offsets[token_id], self._posting_offsets[token_id + 1]
+            if positions is None or end - start != self._counts[token_id]:
+                positions = None
+                continue
+            for token_pos in self._postings[start:end]:
+                positions.extend(token_pos + k for k in offsets)
+        if positions is not None:
+            positions.sort()
+        return total, positions
+
+    def find(self, query: str, buffer: GamestateBuffer, limit: int) -> SearchHits | None:
+        """Count case-insensitive (overlapping) occurrences of ``query`` in ``buffer``.
+
+        Args:
+            query: Search text (already sanitized by the caller)
+            buffer: The buffer this index was built from
+            limit: Number of leading match positions to return
+
+        Returns:
+            SearchHits, or None when the index cannot answer (no indexed token
+            run, pure-digit runs only, or a multi-token query anchored on a
+            frequent token) and the caller should scan linearly
+        """
+        as_bytes = not isinstance(buffer, str)
+        needle = query.lower()
+        pieces = [p for p in gamestate_pattern(_TOKEN, needle).findall(needle) if not p.isdigit()]
+        if not pieces:
+            return None
+
+        # Single token run: counts come straight from the vocabulary.
+        if pieces[0] == needle:
+            total, positions = self._piece_hits(needle)
+            if positions is None:
+                pattern = literal_search_pattern(needle, buffer)
+                positions = [m.start() for m in itertools.islice(pattern.finditer(buffer), limit)]
+            return SearchHits(total=total, positions=positions[:limit])
+
+        # Several runs: anchor on the rarest piece and verify candidates in the buffer.
+        best: tuple[int, str, list[int] | None] | None = None
+        for piece in set(pieces):
+            piece_total, piece_positions = self._piece_hits(piece)
+            if best is None or piece_total < best[0]:
+                best = (piece_total, piece, piece_positions)
+        _, anchor, candidates = best
+        if candidates is None:
+            return None
+
+        target = needle.encode("utf-8") if as_bytes else needle
+        anchor_offset = target.find(anchor.encode("ascii") if as_bytes else anchor)
+        pattern = literal_search_pattern(needle, buffer)
+        hits = []
+        for pos in candidates:
+            start = pos - anchor_offset
+            if start >= 0 and pattern.match(buffer, start):
+                hits.append(start)
+        return SearchHits(total=len(hits), positions=hits[:limit])
@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 class SpeciesMixin:
     """Species-related extraction methods."""
 
+    # Fields read from each `species_db` entry; traits come from get_duplicate_values
+    SPECIES_FIELDS = ("class", "name", "portrait", "home_planet")
+
     def get_species_full(self) -> dict:
         """Get all species in the game with their traits.
 
@@ -66,7 +69,9 @@ class SpeciesMixin:
         # Phase 1: Iterate species and collect data
         # (can't call get_duplicate_values during iter_section - same pipe)
         species_data_list = []
-        for species_id, species_data in session.iter_section("species_db"):
+        for species_id, species_data in session.iter_section(
+            "species_db", fields=self.SPECIES_FIELDS
+        ):
             # P010: entry might be string "none" for deleted entries
             if not isinstance(species_data, dict):
                 continue
@@ -206,7 +211,9 @@ class SpeciesMixin:
         galaxy_class_counts: dict[str, int] = {}
         total_count = 0
 
-        for species_id, species_data in session.iter_section("species_db"):
+        for species_id, species_data in session.iter_section(
+            "species_db", fields=self.SPECIES_FIELDS
+        ):
             if not isinstance(species_data, dict):
                 continue
             species_class = species_data.get("class")
@@ -291,29 +298,7 @@ class SpeciesMixin:
         Returns:
             The species_db section content, or empty string if not found
         """
-        # Find species_db section
-        species_start = self.gamestate.find("\nspecies_db=")
-        if species_start == -1:
-            species_start = self.gamestate.find("species_db=")
-        if species_start == -1:
-            return ""
-
-        # Find the end of species_db section using brace matching
-        chunk = self.gamestate[species_start:]
-        brace_count = 0
-        started = False
-        end_pos = 0
-        for i, char in enumerate(chunk):
-            if char == "{":
-                brace_count += 1
-                started = True
-            elif char == "}":
-                brace_count -= 1
-                if started and brace_count == 0:
-                    end_pos = i + 1
-                    break
-
-        return self.gamestate[species_start : species_start + end_pos]
+        return self._extract_section("species_db") or ""
 
     def _extract_species_traits_regex(self) -> dict:
         """Extract traits for all species using regex.
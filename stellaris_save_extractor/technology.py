@@ -70,7 +70,7 @@ class TechnologyMixin:
             return result
 
         # Extract researched techs using get_duplicate_values (handles duplicate keys correctly)
-        technologies = session.get_duplicate_values("country", str(player_id), "technology")
+        technologies = self._rust_get_duplicate_values("country", str(player_id), "technology")
         result["researched_techs"] = sorted(list(set(technologies)))
         result["completed_count"] = len(result["researched_techs"])
 
@@ -95,43 +95,37 @@ class ExtractionValidator:
         from .extractor import SaveExtractor
 
         self.extractor = SaveExtractor(save_path)
-        self.raw = self.extractor.gamestate
         self._country_names_cache = None
 
+    @property
+    def raw(self) -> str:
+        """Full decoded gamestate (prefer _find_raw_section for section reads)."""
+        return self.extractor.gamestate
+
     def _get_country_names(self) -> dict[int, str]:
         """Get cached country ID to name mapping."""
         if self._country_names_cache is None:
             self._country_names_cache = self.extractor._get_country_names_map()
         return self._country_names_cache
 
+    def _find_raw_section(self, section_name: str) -> str | None:
+        """Slice a raw top-level section using the extractor's section index."""
+        bounds = self.extractor._get_section_bounds(section_name)
+        if not bounds:
+            return None
+        return self.extractor._gamestate_text(bounds[0], bounds[1])
+
     def _find_raw_war_section(self) -> str | None:
         """Extract the raw war section from gamestate."""
-        match = re.search(r"\nwar=\n\{", self.raw)
-        if not match:
-            return None
-        start = match.start() + 1
-        chunk = self.raw[start : start + 5000000]
-        return chunk
+        return self._find_raw_section("war")
 
     def _find_raw_fleet_section(self) -> str | None:
         """Extract the raw fleet section from gamestate."""
-        match = re.search(r"\nfleet=\n\{", self.raw)
-        if not match:
-            return None
-        start = match.start() + 1
-        # Fleet section can be very large
-        chunk = self.raw[start : start + 50000000]
-        return chunk
+        return self._find_raw_section("fleet")
 
     def _find_raw_country_section(self) -> str | None:
         """Extract the raw country section from gamestate."""
-        match = re.search(r"\ncountry=\n\{", self.raw)
-        if not match:
-            return None
-        start = match.start() + 1
-        # Country section is huge
-        chunk = self.raw[start : start + 50000000]
-        return chunk
+        return self._find_raw_section("country")
 
     def _extract_war_ids_from_raw(self, war_section: str) -> list[int]:
         """Extract all active war IDs from raw section."""
@@ -90,3 +90,38 @@ def rust_session_extractor(test_save_path):
     with rust_session(test_save_path):
         extractor = SaveExtractor(test_save_path)
         yield extractor
+
+
+@pytest.fixture
+def insert_snapshot():
+    """Factory that inserts a snapshot row with only the fields a test varies.
+
+    Called as ``insert_snapshot(db, session_id, game_date, save_hash, full_briefing=...,
+    event_state=...)``; briefing and event state dicts are JSON-encoded and the
+    summary metric columns are left NULL. Returns the new snapshot id.
+    """
+    from backend.core.json_utils import json_dumps
+
+    def _insert(
+        db,
+        session_id: str,
+        game_date: str | None = None,
+        save_hash: str | None = None,
+        *,
+        full_briefing: dict | None = None,
+        event_state: dict | None = None,
+    ) -> int:
+        return db.insert_snapshot(
+            session_id=session_id,
+            game_date=game_date,
+            save_hash=save_hash,
+            military_power=None,
+            colony_count=None,
+            wars_count=None,
+            energy_net=None,
+            alloys_net=None,
+            full_briefing_json=json_dumps(full_briefing) if full_briefing is not None else None,
+            event_state_json=json_dumps(event_state) if event_state is not None else None,
+        )
+
+    return _insert
@@ -0,0 +1,142 @@
+"""Tests for the persistent advisor answer cache."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from backend.core import database
+from backend.core.companion import Companion
+from backend.core.database import GameDatabase
+from backend.core.model_routing import (
+    GEMINI_FLASH_LITE_MODEL,
+    GEMINI_FLASH_MODEL,
+    MODEL_ROUTING_QUALITY_FIRST,
+    clear_model_state,
+)
+
+BRIEFING = {
+    "meta": {"date": "2300.01.01", "empire_name": "Test Empire"},
+    "identity": {"empire_name": "Test Empire"},
+    "economy": {"net_monthly": {"alloys": 10.0}},
+}
+
+
+@pytest.fixture
+def db(tmp_path: Path, monkeypatch):
+    db = GameDatabase(tmp_path / "answers.db")
+    monkeypatch.setattr(database, "_default_db", db)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def companion(db, monkeypatch):
+    clear_model_state()
+    calls: list[str] = []
+
+    def _generate_content(*, model, contents, config):
+        calls.append(contents)
+        return SimpleNamespace(text=f"Answer {len(calls)}")
+
+    client = SimpleNamespace(models=SimpleNamespace(generate_content=_generate_content))
+    monkeypatch.setattr("backend.core.companion.genai.Client", lambda *a, **k: client)
+    companion = Companion(save_path=None, api_key="test-key", auto_precompute=False)
+    companion.apply_precomputed_briefing(
+        save_path=None,
+        briefing_json=json.dumps(BRIEFING),
+        game_date="2300.01.01",
+        identity=BRIEFING["identity"],
+        situation={},
+        metadata=BRIEFING["meta"],
+    )
+    companion.model_calls = calls
+    yield companion
+    clear_model_state()
+
+
+def test_db_answer_cache_matches_exact_state_and_clears_on_new_snapshot(db, insert_snapshot):
+    key = {"save_id": "save-a", "language": "en", "model": "m", "question_key": "am i in danger"}
+    db.put_cached_answer(
+        **key,
+        save_hash="h1",
+        prompt_key="p1",
+        answer="No.",
+        game_date="2300.01.01",
+        response_ms=900,
+    )
+
+    assert db.get_cached_answer(**key, save_hash="h2", prompt_key="p1") is None
+    assert db.get_cached_answer(**key, save_hash="h1", prompt_key="p2") is None
+    hit = db.get_cached_answer(**key, save_hash="h1", prompt_key="p1")
+    assert hit == {"answer": "No.", "game_date": "2300.01.01", "response_ms": 900.0}
+    assert db.execute("SELECT hits FROM answer_cache;").fetchone()[0] == 0
+    db.record_answer_cache_hit(**key)
+    assert db.execute("SELECT hits FROM answer_cache;").fetchone()[0] == 1
+
+    # Other saves keep their answers
+    insert_snapshot(db, db.get_or_create_active_session(save_id="save-b"), "2300.02.01", "next")
+    assert db.get_cached_answer(**key, save_hash="h1", prompt_key="p1") is not None
+    insert_snapshot(db, db.get_or_create_active_session(save_id="save-a"), "2300.02.01", "next")
+    assert db.get_cached_answer(**key, save_hash="h1", prompt_key="p1") is None
+
+
+def test_repeated_question_is_served_from_cache_until_a_new_snapshot(
+    companion, db, insert_snapshot
+):
+    ask = companion.ask_precomputed
+
+    assert ask(question="What should I research next?", session_key="a", save_id="s")[0] == (
+        "Answer 1"
+    )
+    # Same question, different wording/spacing, in a fresh conversation. The save
+    # memory has gained the first turn's Q/A line in between.
+    assert db.flush_writes(5)  # Answers and memory are written on the DB writer thread
+    assert db.get_advisor_memory_summary("s")
+    answer, _elapsed = ask(question="  what should i research NEXT ", session_key="b", save_id="s")
+    stats = companion.get_call_stats()
+    assert answer == "Answer 1" and len(companion.model_calls) == 1
+    assert stats["tools_used"] == ["answer_cache"]
+    assert stats["answer_cache"]["hit"] is True
+    assert stats["answer_cache"]["hits"] == 1 and stats["answer_cache"]["hit_rate"] == 0.5
+    assert stats["answer_cache"]["saved_ms"] >= 0
+    assert db.flush_writes(5)  # The hit counter is bumped on the DB writer thread
+    assert db.execute("SELECT hits FROM answer_cache;").fetchone()[0] == 1
+
+    # A third fresh conversation hits as well.
+    ask(question="What should I research next?", session_key="c", save_id="s")
+    assert len(companion.model_calls) == 1
+
+    # Follow-ups depend on the conversation and never use the cache, however long.
+    ask(question="What should I research next?", session_key="b", save_id="s")
+    assert len(companion.model_calls) == 2
+    assert companion.get_call_stats()["answer_cache"]["hit"] is False
+
+    insert_snapshot(db, db.get_or_create_active_session(save_id="s"), "2300.02.01", "next")
+    ask(question="What should I research next?", session_key="d", save_id="s")
+    assert len(companion.model_calls) == 3
+
+
+def test_fallback_answers_are_found_under_the_requested_model(companion, db):
+    models: list[str] = []
+
+    def _generate_content(*, model, contents, config):
+        models.append(model)
+        if model == GEMINI_FLASH_MODEL:
+            raise RuntimeError("429 RESOURCE_EXHAUSTED: quota exceeded, retry in 60s")
+        return SimpleNamespace(text=f"Answer from {model}")
+
+    companion.client.models.generate_content = _generate_content
+    companion.model_routing_mode = MODEL_ROUTING_QUALITY_FIRST  # Flash, then Flash-Lite
+    first, _elapsed = companion.ask_precomputed(
+        question="Where should I expand next?", session_key="a", save_id="s"
+    )
+    assert models == [GEMINI_FLASH_MODEL, GEMINI_FLASH_LITE_MODEL]
+
+    assert db.flush_writes(5)  # Answers are stored on the DB writer thread
+    answer, _elapsed = companion.ask_precomputed(
+        question="Where should I expand next?", session_key="b", save_id="s"
+    )
+    assert answer == first and len(models) == 2
+    assert companion.get_call_stats()["model"] == GEMINI_FLASH_MODEL
@@ -0,0 +1,240 @@
+"""Load test: LLM endpoints run on the async model client, not the threadpool.
+
+A local fake Gemini server answers generateContent after a fixed delay; the
+real google-genai client talks to it over HTTP.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import anyio
+import httpx
+import pytest
+from google import genai as google_genai
+from google.genai import types
+
+import backend.api.server as server
+from backend.core import database
+from backend.core.companion import Companion
+from backend.core.database import GameDatabase
+from backend.core.model_routing import clear_model_state
+
+MODEL_LATENCY_SECONDS = 0.5
+CONCURRENT_CHATS = 8
+
+BRIEFING = {
+    "meta": {"date": "2300.01.01", "empire_name": "Test Empire"},
+    "identity": {"empire_name": "Test Empire"},
+    "economy": {"net_monthly": {"alloys": 10.0}},
+}
+
+
+class _FakeModelServer(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, latency: float):
+        super().__init__(("127.0.0.1", 0), _FakeModelHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _FakeModelHandler(BaseHTTPRequestHandler):
+    server: _FakeModelServer
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            time.sleep(self.server.latency)
+            body = json.dumps(
+                {
+                    "candidates": [
+                        {
+                            "content": {"role": "model", "parts": [{"text": "Fake answer"}]},
+                            "finishReason": "STOP",
+                        }
+                    ]
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass  # Client went away (cancelled request)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_fake_model(latency: float) -> _FakeModelServer:
+    fake = _FakeModelServer(latency)
+    threading.Thread(target=fake.serve_forever, daemon=True).start()
+    return fake
+
+
+@pytest.fixture
+def app_with_fake_model(tmp_path: Path, monkeypatch):
+    fakes: list[_FakeModelServer] = []
+    db = GameDatabase(tmp_path / "load.db")
+    monkeypatch.setattr(database, "_default_db", db)
+    monkeypatch.setenv(server.ENV_API_TOKEN, "test-token")
+    clear_model_state()
+    real_client = google_genai.Client
+
+    def _make(latency: float = MODEL_LATENCY_SECONDS):
+        fake = _start_fake_model(latency)
+        fakes.append(fake)
+        monkeypatch.setattr(
+            "backend.core.companion.genai.Client",
+            lambda *a, **k: real_client(
+                api_key="test-key", http_options=types.HttpOptions(base_url=fake.url)
+            ),
+        )
+        companion = Companion(save_path=None, api_key="test-key", auto_precompute=False)
+        companion.apply_precomputed_briefing(
+            save_path=None,
+            briefing_json=json.dumps(BRIEFING),
+            game_date="2300.01.01",
+            identity=BRIEFING["identity"],
+            situation={},
+            metadata=BRIEFING["meta"],
+        )
+        # Treat the briefing as a loaded save without parsing a real file.
+        companion.extractor = SimpleNamespace(get_player_empire_id=lambda: 7)
+        companion.save_path = tmp_path / "load.sav"
+        app = server.create_app()
+        app.state.companion = companion
+        return app, fake
+
+    yield _make
+    for fake in fakes:
+        fake.shutdown()
+        fake.server_close()
+    clear_model_state()
+    db.close()
+
+
+def _headers() -> dict[str, str]:
+    return {"Authorization": "Bearer test-token"}
+
+
+def test_health_stays_responsive_while_chats_wait_on_the_model(app_with_fake_model):
+    app, fake = app_with_fake_model()
+
+    async def _run():
+        # A tiny threadpool: sync handlers holding it for the model call would serialize.
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = 2
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.monotonic()
+            chats = [
+                asyncio.create_task(
+                    client.post(
+                        "/api/chat",
+                        headers=_headers(),
+                        json={
+                            "message": f"Load question {i} about alloys?",
+                            "session_key": f"load-{i}",
+                        },
+                    )
+                )
+                for i in range(CONCURRENT_CHATS)
+            ]
+            while fake.in_flight < CONCURRENT_CHATS and time.monotonic() - started < 5:
+                await asyncio.sleep(0.01)
+
+            health_ms = []
+            for _ in range(5):
+                t0 = time.monotonic()
+                resp = await client.get("/api/health", headers=_headers())
+                health_ms.append((time.monotonic() - t0) * 1000)
+                assert resp.status_code == 200
+            borrowed_during_calls = limiter.borrowed_tokens
+
+            responses = await asyncio.gather(*chats)
+            return responses, health_ms, borrowed_during_calls, time.monotonic() - started
+
+    responses, health_ms, borrowed, elapsed = asyncio.run(_run())
+
+    assert [r.status_code for r in responses] == [200] * CONCURRENT_CHATS
+    assert all(r.json()["text"] == "Fake answer" for r in responses)
+    # Every model call overlapped and none of them held a threadpool worker.
+    assert fake.max_in_flight == CONCURRENT_CHATS
+    assert borrowed == 0
+    assert max(health_ms) < 200
+    assert elapsed < MODEL_LATENCY_SECONDS * CONCURRENT_CHATS / 2
+
+
+def test_chat_model_call_is_cancelled_when_the_client_disconnects(app_with_fake_model):
+    app, fake = app_with_fake_model(latency=5.0)
+    body = json.dumps({"message": "Will this be cancelled?", "session_key": "gone"}).encode()
+
+    async def _run():
+        disconnected = asyncio.Event()
+        request_sent = False
+        messages: list[dict] = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/api/chat",
+            "raw_path": b"/api/chat",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"authorization", b"Bearer test-token"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 1234),
+            "server": ("test", 80),
+        }
+        call = asyncio.create_task(app(scope, receive, send))
+        started = time.monotonic()
+        while fake.requests < 1 and time.monotonic() - started < 5:
+            await asyncio.sleep(0.01)
+        disconnected.set()
+        await asyncio.wait_for(call, timeout=3)
+        return messages, time.monotonic() - started
+
+    messages, elapsed = asyncio.run(_run())
+
+    assert fake.requests == 1
+    assert messages[0]["status"] == 499
+    assert elapsed < 3
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -22,7 +23,7 @@ class _DummyCompanion:
     def get_precompute_status(self) -> dict[str, object]:
         return {"ready": True, "game_date": "2230.07.01"}
 
-    def ask_precomputed(
+    async def ask_precomputed_async(
         self,
         *,
         question: str,
@@ -44,6 +45,17 @@ class _DummyCompanion:
         }
         return "Test response", 0.01
 
+    def ask_precomputed_stream(self, **kwargs):
+        self.last_request = kwargs
+        yield {"type": "delta", "text": "Test "}
+        yield {"type": "delta", "text": "response"}
+        yield {
+            "type": "done",
+            "text": "Test response",
+            "ttft_ms": 12.7,
+            "stats": {"model": self._last_model},
+        }
+
     def get_call_stats(self) -> dict[str, object]:
         return {"model": self._last_model}
 
@@ -134,3 +146,27 @@ def test_api_chat_passes_language(monkeypatch):
     assert resp.status_code == 200
     assert companion.last_request is not None
     assert companion.last_request["language"] == "fr"
+
+
+def test_api_chat_stream_sends_deltas_then_done(monkeypatch):
+    app, companion = _make_app(monkeypatch)
+
+    with TestClient(app) as client:
+        resp = client.post(
+            "/api/chat/stream",
+            headers=_auth_headers(),
+            json={"message": "Test question", "session_key": "chat-123", "language": "fr"},
+        )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("data: ", 1)[1]))
+        for block in resp.text.strip().split("\n\n")
+    ]
+    assert [kind for kind, _ in events] == ["delta", "delta", "done"]
+    assert "".join(data["text"] for kind, data in events if kind == "delta") == "Test response"
+    done = events[-1][1]
+    assert done["model"] == "gemini-3-flash-preview"
+    assert done["ttft_ms"] == 12  # Reported from the companion's done event
+    assert companion.last_request["language"] == "fr"
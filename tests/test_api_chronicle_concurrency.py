@@ -1,3 +1,4 @@
+import asyncio
 import threading
 from unittest.mock import MagicMock
 
@@ -31,7 +32,7 @@ def test_api_chronicle_serializes_concurrent_requests(monkeypatch):
     started = threading.Event()
     unblock = threading.Event()
 
-    def slow_generate_chronicle(
+    async def slow_generate_chronicle(
         self,
         session_id,
         *,
@@ -43,12 +44,12 @@ def test_api_chronicle_serializes_concurrent_requests(monkeypatch):
     ):
         started.set()
         # Hold the request open long enough for a second request to arrive.
-        unblock.wait(timeout=10)
+        await asyncio.to_thread(unblock.wait, 10)
         return {"ok": True}
 
     monkeypatch.setattr(
         ChronicleGenerator,
-        "generate_chronicle",
+        "generate_chronicle_async",
         slow_generate_chronicle,
         raising=True,
     )
@@ -91,7 +92,7 @@ def test_api_chronicle_serializes_concurrent_requests(monkeypatch):
 def test_api_chronicle_releases_lock_on_exception(monkeypatch):
     server._chronicle_in_flight.clear()
 
-    def boom(
+    async def boom(
         self,
         session_id,
         *,
@@ -106,13 +107,13 @@ def test_api_chronicle_releases_lock_on_exception(monkeypatch):
     app = _make_app(monkeypatch)
     headers = _auth_headers()
 
-    monkeypatch.setattr(ChronicleGenerator, "generate_chronicle", boom, raising=True)
+    monkeypatch.setattr(ChronicleGenerator, "generate_chronicle_async", boom, raising=True)
     with TestClient(app) as client:
         first = client.post("/api/chronicle", json={"session_id": "session-1"}, headers=headers)
     assert first.status_code == 500
     assert server._chronicle_in_flight == set()
 
-    def ok(
+    async def ok(
         self,
         session_id,
         *,
@@ -124,7 +125,7 @@ def test_api_chronicle_releases_lock_on_exception(monkeypatch):
     ):
         return {"ok": True}
 
-    monkeypatch.setattr(ChronicleGenerator, "generate_chronicle", ok, raising=True)
+    monkeypatch.setattr(ChronicleGenerator, "generate_chronicle_async", ok, raising=True)
     with TestClient(app) as client:
         second = client.post("/api/chronicle", json={"session_id": "session-1"}, headers=headers)
     assert second.status_code == 200
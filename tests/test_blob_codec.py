@@ -0,0 +1,59 @@
+"""Tests for compressed JSON column storage in the history DB."""
+
+from pathlib import Path
+
+from backend.core.blob_codec import CODEC_ZLIB_DICT_V1, decode_json_blob, encode_json_blob
+from backend.core.database import GameDatabase
+from backend.core.json_utils import json_dumps
+
+BRIEFING = {
+    "meta": {"date": "2250.03.01", "empire_name": "Ünited Nations of Earth", "player_id": 0},
+    "military": {"military_power": 125000, "fleet_count": 12},
+    "economy": {"net_monthly": {"energy": 42.5, "alloys": 18.0}},
+    "planets": [{"id": i, "name": f"Planet {i}", "pops": 20 + i} for i in range(200)],
+}
+
+
+def test_round_trip_and_small_values_stay_text():
+    text = json_dumps(BRIEFING)
+    encoded = encode_json_blob(text)
+
+    assert isinstance(encoded, bytes) and encoded[0] == CODEC_ZLIB_DICT_V1
+    assert len(encoded) * 4 < len(text.encode("utf-8"))
+    assert decode_json_blob(encoded) == text
+    assert decode_json_blob(encode_json_blob(text.encode("utf-8"))) == text
+    assert encode_json_blob('{"a":1}') == '{"a":1}'
+    assert encode_json_blob(b"{}") == "{}"
+    assert decode_json_blob(None) is None
+
+
+def test_db_compresses_on_write_and_reads_legacy_text_rows(tmp_path: Path):
+    db = GameDatabase(tmp_path / "codec.db")
+    session_id = db.get_or_create_active_session(save_id="save-a")
+    text = json_dumps(BRIEFING)
+    snapshot_id = db.insert_snapshot(
+        session_id=session_id,
+        game_date="2250.03.01",
+        save_hash="h1",
+        military_power=None,
+        colony_count=None,
+        wars_count=None,
+        energy_net=None,
+        alloys_net=None,
+        full_briefing_json=text,
+        event_state_json=text,
+    )
+    db.update_session_latest_briefing(session_id=session_id, latest_briefing_json=text)
+
+    stored = db.execute(
+        "SELECT typeof(full_briefing_json) AS t, typeof(event_state_json) AS e FROM snapshots;"
+    ).fetchone()
+    assert (stored["t"], stored["e"]) == ("blob", "blob")
+    assert db.get_snapshot_row(snapshot_id)["event_state_json"] == text
+    assert db.get_latest_session_briefing_json(session_id=session_id) == text
+
+    # Rows written by older builds are plain TEXT and must still read back.
+    db.execute("UPDATE sessions SET latest_briefing_json = ? WHERE id = ?;", (text, session_id))
+    assert db.get_latest_session_briefing_json(session_id=session_id) == text
+    first, last = db.get_first_last_snapshot_rows(session_id=session_id)
+    assert first["full_briefing_json"] == last["full_briefing_json"] == text
@@ -0,0 +1,118 @@
+"""Tests for the get_complete_briefing producer graph and executor."""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stellaris_save_extractor.base import SaveExtractorBase
+from stellaris_save_extractor.briefing_plan import (
+    BRIEFING_NODES,
+    BriefingNode,
+    run_briefing_plan,
+)
+
+
+def test_default_graph_is_valid_and_runs_situation_after_inputs():
+    names = [node.name for node in BRIEFING_NODES]
+    assert len(names) == len(set(names))
+
+    situation = next(node for node in BRIEFING_NODES if node.name == "situation")
+    assert set(situation.deps) == {"meta", "wars", "diplomacy", "resources", "crisis", "fallen"}
+
+
+def test_sequential_plan_respects_dependencies():
+    order: list[str] = []
+
+    def make(name):
+        def produce(ex, results):
+            order.append(name)
+            return name.upper()
+
+        return produce
+
+    nodes = [
+        BriefingNode("c", lambda ex, r: r["a"] + r["b"], deps=("a", "b")),
+        BriefingNode("a", make("a")),
+        BriefingNode("b", make("b")),
+    ]
+
+    results, timings = run_briefing_plan(object(), sessions=[None], nodes=nodes)
+
+    assert order == ["a", "b"]
+    assert results["c"] == "AB"
+    assert set(timings) == {"a", "b", "c"}
+
+
+def test_parallel_plan_overlaps_independent_producers():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_peer(ex, results):
+        # Both producers must be in flight at once or the barrier times out.
+        barrier.wait()
+        return threading.current_thread().name
+
+    nodes = [
+        BriefingNode("left", wait_for_peer),
+        BriefingNode("right", wait_for_peer),
+        BriefingNode("joined", lambda ex, r: (r["left"], r["right"]), deps=("left", "right")),
+    ]
+
+    results, _ = run_briefing_plan(object(), sessions=[None, None], nodes=nodes)
+
+    assert results["left"] != results["right"]
+    assert results["joined"] == (results["left"], results["right"])
+
+
+def test_parallel_plan_propagates_producer_errors():
+    def boom(ex, results):
+        raise RuntimeError("producer failed")
+
+    nodes = [
+        BriefingNode("ok", lambda ex, r: time.sleep(0.01)),
+        BriefingNode("bad", boom),
+        BriefingNode("after", lambda ex, r: None, deps=("bad",)),
+    ]
+
+    with pytest.raises(RuntimeError, match="producer failed"):
+        run_briefing_plan(object(), sessions=[None, None], nodes=nodes)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_plan_rejects_cycles(workers):
+    nodes = [
+        BriefingNode("a", lambda ex, r: None, deps=("b",)),
+        BriefingNode("b", lambda ex, r: None, deps=("a",)),
+    ]
+
+    with pytest.raises(ValueError, match="cycle"):
+        run_briefing_plan(object(), sessions=[None] * workers, nodes=nodes)
+
+
+def test_cache_lock_fills_shared_cache_once():
+    extractor = SaveExtractorBase.__new__(SaveExtractorBase)
+    extractor._cache_locks = {}
+    extractor._cache_locks_guard = threading.Lock()
+    fills: list[int] = []
+    cache: dict[str, int] = {}
+
+    def fill():
+        with extractor._cache_lock("shared"):
+            if "value" not in cache:
+                time.sleep(0.01)
+                fills.append(1)
+                cache["value"] = 42
+
+    threads = [threading.Thread(target=fill) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fills == [1]
+    assert cache["value"] == 42
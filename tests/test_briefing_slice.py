@@ -0,0 +1,93 @@
+"""Tests for question-aware briefing slicing in advisor prompts."""
+
+import json
+from types import SimpleNamespace
+
+from backend.core.briefing_slice import resolve_focus, slice_briefing
+from backend.core.companion import Companion
+from backend.core.model_routing import clear_model_state
+
+
+def _briefing() -> dict:
+    filler = [f"entry {i}" for i in range(400)]
+    return {
+        "meta": {"date": "2300.01.01", "version": "Corvus v4.2.4"},
+        "identity": {"empire_name": "Test Empire"},
+        "situation": {"game_phase": "late"},
+        "economy": {"net_monthly": {"alloys": -12.5}, "notes": filler},
+        "military": {"military_power": 125000, "notes": filler},
+        "diplomacy": {"allies": ["Blorg"], "notes": filler},
+        "leadership": {"leaders": filler},
+        "species": {"notes": filler},
+        "history": {"notes": filler * 2},
+    }
+
+
+def test_slice_keeps_focus_sections_and_fills_the_budget():
+    briefing_json = json.dumps(_briefing())
+
+    sliced = slice_briefing(briefing_json, "How do I fix my alloy deficit?", max_chars=12_000)
+
+    assert sliced.focus == ["economy"]
+    assert sliced.sections[:4] == ["meta", "identity", "situation", "economy"]
+    assert "history" in sliced.omitted and not sliced.full
+    assert len(sliced.json) <= 12_000
+    assert json.loads(sliced.json) == {k: _briefing()[k] for k in sliced.sections}
+    # The base is the same for every question; a question's other sections come separately.
+    allies = slice_briefing(briefing_json, "Who are my allies?", max_chars=12_000)
+    assert allies.json == sliced.json and allies.extra_sections == ["diplomacy"]
+    assert json.loads(allies.extra_json) == {"diplomacy": _briefing()["diplomacy"]}
+    assert "diplomacy" in allies.sections and "diplomacy" not in allies.omitted
+    assert sliced.omitted_note == (
+        f"Briefing sections omitted for this question: {', '.join(sliced.omitted)}"
+    )
+
+    # Named sections are kept even past the budget; unknown questions get the general set.
+    leaders = slice_briefing(briefing_json, "Who is my best admiral?", max_chars=1_000)
+    assert {"leadership", "economy", "military"} <= set(leaders.sections)
+    assert slice_briefing(briefing_json, "Hello?", max_chars=None).full
+    assert slice_briefing(briefing_json, "Hello?", max_chars=None).omitted_note is None
+    assert slice_briefing(briefing_json, "Hello?", max_tokens=100_000).json == briefing_json
+    assert resolve_focus("Should I build more fleets?") == "military"
+    assert resolve_focus("anything", "diplomacy") == "diplomacy"
+
+
+def test_ask_precomputed_sends_the_slice_and_records_it(monkeypatch):
+    clear_model_state()
+    captured = {}
+
+    def _fake_generate_content(*, model, contents, config):
+        captured["contents"] = contents
+        return SimpleNamespace(text="Build more alloy foundries.")
+
+    monkeypatch.setattr(
+        "backend.core.companion.genai.Client",
+        lambda *a, **k: SimpleNamespace(models=SimpleNamespace(generate_content=None)),
+    )
+    companion = Companion(
+        save_path=None, api_key="test-key", auto_precompute=False, briefing_budget_chars=12_000
+    )
+    companion.client.models.generate_content = _fake_generate_content
+    briefing_json = json.dumps(_briefing())
+    companion.apply_precomputed_briefing(
+        save_path=None,
+        briefing_json=briefing_json,
+        game_date="2300.01.01",
+        identity=_briefing()["identity"],
+        situation=_briefing()["situation"],
+        metadata=_briefing()["meta"],
+    )
+
+    answer, _elapsed = companion.ask_precomputed(
+        question="How do I fix my alloy deficit?", session_key="slice"
+    )
+
+    stats = companion.get_call_stats()
+    assert answer == "Build more alloy foundries."
+    assert '"economy"' in captured["contents"] and '"history"' not in captured["contents"]
+    assert "omitted for this question: " in captured["contents"]
+    assert "history" in captured["contents"].split("omitted for this question: ")[1]
+    assert stats["briefing_slice"]["focus"] == ["economy"]
+    assert stats["briefing_slice"]["full"] is False
+    assert stats["payload_sizes"]["briefing_json"] < stats["payload_sizes"]["briefing_json_full"]
+    clear_model_state()
@@ -1,8 +1,9 @@
 """Unit tests for chronicle.py."""
 
+import asyncio
 import json
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -612,6 +613,19 @@ class TestGenerateChronicleChapterOnly:
         assert result["current_era"]["narrative"] == "Existing current era narrative."
         assert result["cached"] is True
 
+    def test_async_chapter_only_matches_sync_result(self, generator):
+        """The async variant runs the same phases without touching the model."""
+        generator._should_finalize_chapter = MagicMock(return_value=(False, None))  # type: ignore[method-assign]
+        generator._count_pending_chapters = MagicMock(return_value=0)  # type: ignore[method-assign]
+        generator._generate_current_era_async = AsyncMock()  # type: ignore[method-assign]
+
+        result = asyncio.run(generator.generate_chronicle_async("session-1", chapter_only=True))
+
+        generator._generate_current_era_async.assert_not_awaited()  # type: ignore[attr-defined]
+        assert result["current_era"]["narrative"] == "Existing current era narrative."
+        assert result["cached"] is True
+        generator.db.upsert_chronicle_by_save_id.assert_called_once()
+
     def test_chapter_only_keeps_existing_current_era_cache_after_finalization(self, generator):
         """Chapter-only finalization keeps previous current-era text until visible refresh."""
 
@@ -1375,6 +1389,33 @@ class TestCurrentEraFallbackModel:
         assert second_call.kwargs["model"] == "gemini-3.1-flash-lite-preview"
         assert generator._model_routing_response()["fallback"] is True  # type: ignore[attr-defined]
 
+    def test_async_current_era_uses_aio_client_with_same_fallback(self, generator):
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(
+            side_effect=[
+                RuntimeError("quota"),
+                MagicMock(text=json.dumps({"sections": [{"type": "prose", "text": "Onward."}]})),
+            ]
+        )
+        generator._client = mock_client  # type: ignore[attr-defined]
+
+        result = asyncio.run(
+            generator._generate_current_era_async(  # type: ignore[attr-defined]
+                save_id="save-1",
+                chapters_data={"chapters": [], "current_era_start_date": "2200.01.01"},
+                briefing={"identity": {"empire_name": "Test Empire"}},
+            )
+        )
+
+        assert result is not None and "Onward." in result["narrative"]
+        calls = mock_client.aio.models.generate_content.await_args_list
+        assert [c.kwargs["model"] for c in calls] == [
+            "gemini-3-flash-preview",
+            "gemini-3.1-flash-lite-preview",
+        ]
+        mock_client.models.generate_content.assert_not_called()
+        assert generator._model_routing_response()["fallback"] is True  # type: ignore[attr-defined]
+
 
 class TestSectionsToText:
     """Tests for _sections_to_text helper."""
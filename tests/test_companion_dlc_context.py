@@ -352,3 +352,51 @@ def test_ask_precomputed_routes_to_flash_lite_when_flash_hits_quota(companion):
     assert (
         stats["routing"]["notice"] == "Gemini Flash is cooling down. Routing via Gemini Flash-Lite."
     )
+
+
+def test_ask_precomputed_stream_falls_back_before_output_and_records_turn_at_end(companion):
+    clear_model_state()
+    calls: list[str] = []
+
+    def _fake_generate_content_stream(*, model, contents, config):
+        calls.append(model)
+
+        def _chunks():
+            if model == GEMINI_FLASH_MODEL:
+                raise RuntimeError("429 RESOURCE_EXHAUSTED Quota exceeded. Please retry in 42s")
+            yield SimpleNamespace(text="Build ")
+            yield SimpleNamespace(text=None)
+            yield SimpleNamespace(text="anchorages.")
+
+        return _chunks()
+
+    companion.client.models.generate_content_stream = _fake_generate_content_stream
+    companion.apply_precomputed_briefing(
+        save_path=None,
+        briefing_json=json.dumps({"meta": {"date": "2230.07.01"}}),
+        game_date="2230.07.01",
+        identity=_identity(),
+        situation=_situation(),
+        metadata={"version": "Corvus v4.2.4", "required_dlcs": [], "missing_dlcs": []},
+    )
+
+    try:
+        events = companion.ask_precomputed_stream(
+            question="What now?", session_key="stream", model_routing_mode="quality_first"
+        )
+        first = next(events)
+        # Nothing is remembered until the stream has finished.
+        assert companion._conversations._sessions["stream:lang:en"].history == []
+        rest = list(events)
+    finally:
+        clear_model_state()
+
+    assert calls == [GEMINI_FLASH_MODEL, GEMINI_FLASH_LITE_MODEL]
+    assert [e["text"] for e in [first, *rest[:-1]]] == ["Build ", "anchorages."]
+    done = rest[-1]
+    assert done["type"] == "done" and done["text"] == "Build anchorages."
+    assert done["stats"]["model"] == GEMINI_FLASH_LITE_MODEL
+    assert done["stats"]["routing"]["fallback"] is True
+    assert done["stats"]["ttft_ms"] is not None
+    history = companion._conversations._sessions["stream:lang:en"].history
+    assert [(t.question, t.answer) for t in history] == [("What now?", "Build anchorages.")]
@@ -109,3 +109,67 @@ def test_get_events_in_snapshot_range_falls_back_to_captured_at_when_missing_sna
 
     assert "legacy_event" in event_types
     assert "legacy_event_early" not in event_types
+
+
+def test_migration_backfills_snapshot_columns_from_data_json(tmp_path: Path) -> None:
+    """Rows written before schema 10 get from/to_snapshot_id copied out of data_json."""
+    path = tmp_path / "legacy.db"
+    db = GameDatabase(db_path=path)
+    session_id, snapshot_ids = _create_session_with_snapshots(db, save_id="save-c")
+
+    # Rewind to the schema 9 layout and write rows the way older builds did.
+    db.execute("DROP INDEX idx_events_session_to_snapshot;")
+    db.execute("ALTER TABLE events DROP COLUMN from_snapshot_id;")
+    db.execute("ALTER TABLE events DROP COLUMN to_snapshot_id;")
+    db.execute("ALTER TABLE snapshots DROP COLUMN event_state_base_id;")
+    for column in (
+        "snapshot_count",
+        "event_count",
+        "first_snapshot_game_date",
+        "last_snapshot_game_date",
+    ):
+        db.execute(f"ALTER TABLE sessions DROP COLUMN {column};")
+    db._set_schema_version(9)
+    db.executemany(
+        "INSERT INTO events (session_id, event_type, summary, data_json) VALUES (?, ?, ?, ?);",
+        [
+            (
+                session_id,
+                "war_started",
+                "War started",
+                f'{{"from_snapshot_id": {snapshot_ids[0]}, "to_snapshot_id": "{snapshot_ids[1]}"}}',
+            ),
+            (session_id, "corrupt", "Corrupt data", "not json"),
+        ],
+    )
+    db.close()
+
+    db = GameDatabase(db_path=path)
+    rows = db.execute(
+        "SELECT event_type, from_snapshot_id, to_snapshot_id FROM events ORDER BY id;"
+    ).fetchall()
+
+    assert db.get_schema_version() >= 10
+    assert [tuple(r) for r in rows] == [
+        ("war_started", snapshot_ids[0], snapshot_ids[1]),
+        ("corrupt", None, None),
+    ]
+    ranged = db.get_events_in_snapshot_range(
+        save_id="save-c", from_snapshot_id=snapshot_ids[0], to_snapshot_id=snapshot_ids[1]
+    )
+    assert [r["event_type"] for r in ranged] == ["war_started"]
+
+
+def test_snapshot_range_query_seeks_the_linkage_index(tmp_path: Path) -> None:
+    db = GameDatabase(db_path=tmp_path / "plan.db")
+    plan = db.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT e.id FROM sessions s JOIN events e ON e.session_id = s.id
+        WHERE s.save_id = ? AND e.to_snapshot_id IS NOT NULL
+          AND e.to_snapshot_id > ? AND e.to_snapshot_id <= ?;
+        """,
+        ("save-d", 1, 5),
+    ).fetchall()
+
+    assert any("idx_events_session_to_snapshot" in row["detail"] for row in plan)
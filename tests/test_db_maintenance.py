@@ -0,0 +1,107 @@
+"""Tests for the idle-time DB maintenance scheduler."""
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+import backend.api.server as server
+from backend.core.database import GameDatabase
+
+
+def _date(i: int) -> str:
+    return f"2200.01.{i + 1:02d}"
+
+
+def _briefing(i: int) -> dict:
+    return {"meta": {"date": _date(i)}, "notes": [f"{i}-{n}" for n in range(4000)]}
+
+
+def _full_briefing_count(db: GameDatabase) -> int:
+    return db.execute(
+        "SELECT COUNT(*) FROM snapshots WHERE full_briefing_json IS NOT NULL;"
+    ).fetchone()[0]
+
+
+def test_old_db_is_converted_on_request_then_reclaimed_by_ticks(
+    tmp_path: Path, monkeypatch, insert_snapshot
+):
+    monkeypatch.setenv(server.ENV_API_TOKEN, "test-token")
+    db = GameDatabase(tmp_path / "old.db")
+    db.execute("PRAGMA auto_vacuum = NONE;")
+    db.execute("VACUUM;")  # Like a DB created before auto_vacuum was enabled
+    assert db.get_page_stats()["auto_vacuum"] == "none"
+    session_id = db.get_or_create_active_session(save_id="save-a")
+    for i in range(6):
+        insert_snapshot(db, session_id, _date(i), f"h{i}", full_briefing=_briefing(i))
+    db.close()
+
+    db = GameDatabase(tmp_path / "old.db")
+    scheduler = db.start_maintenance(tick_seconds=3600, budget_seconds=30)
+    # Ticks never run the full VACUUM the conversion needs.
+    assert scheduler.tick(force=True) == ["sessions", "optimize"]
+    assert _full_briefing_count(db) == 1  # Baseline kept
+    pages = db.get_page_stats()
+    assert pages["auto_vacuum"] == "none" and pages["freelist_count"] > 0
+    assert db.get_latest_session_briefing_json(session_id=session_id) is not None
+
+    app = server.create_app()
+    app.state.db = db
+    with TestClient(app) as client:
+        headers = {"Authorization": "Bearer test-token"}
+        first = client.post("/api/db/compact", headers=headers).json()
+        again = client.post("/api/db/compact", headers=headers).json()
+    assert first["converted"] is True and again["converted"] is False
+    assert first["pages"]["auto_vacuum"] == "incremental"
+    assert first["pages"]["freelist_count"] == 0
+
+    # Freed pages are now returned in batches by incremental_vacuum.
+    for i in range(6, 9):
+        insert_snapshot(db, session_id, _date(i), f"h{i}", full_briefing=_briefing(i))
+    db.schedule_retention(session_id=session_id)  # Deferred while the scheduler runs
+    assert _full_briefing_count(db) == 4
+    assert scheduler.tick(force=True) == ["sessions", "vacuum"]
+    assert _full_briefing_count(db) == 1
+    assert db.get_page_stats()["freelist_count"] == 0
+
+    stats = db.get_maintenance_stats()
+    assert stats["running"] and stats["ticks"] == 2
+    assert stats["briefings_cleared"] == 8 and stats["pages_vacuumed"] > 0
+    db.close()
+
+
+def test_tick_respects_idleness_and_budget(tmp_path: Path, monkeypatch, insert_snapshot):
+    db = GameDatabase(tmp_path / "busy.db")
+    assert db.get_page_stats()["auto_vacuum"] == "incremental"  # New DBs start incremental
+    session_id = db.get_or_create_active_session(save_id="save-a")
+    insert_snapshot(db, session_id, _date(0), "h0", full_briefing=_briefing(0))
+    scheduler = db.start_maintenance(tick_seconds=3600, idle_seconds=60)
+
+    assert scheduler.tick() == []  # Just written: not idle
+    assert scheduler.get_stats()["skipped_busy"] == 1
+
+    scheduler.budget_seconds = 0
+    assert scheduler.tick(force=True) == []  # No budget: all work left for later
+    assert scheduler.get_stats()["pending_sessions"] == 1
+    db.close()
+
+    # Without a scheduler, retention runs inline as before.
+    db = GameDatabase(tmp_path / "busy.db")
+    for i in range(1, 3):
+        insert_snapshot(db, session_id, _date(i), f"h{i}", full_briefing=_briefing(i))
+    db.schedule_retention(session_id=session_id)
+    assert _full_briefing_count(db) == 1
+    db.close()
+
+
+def test_diagnostics_reports_maintenance(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(server.ENV_API_TOKEN, "test-token")
+    app = server.create_app()
+    app.state.db = GameDatabase(tmp_path / "diag.db")
+
+    with TestClient(app) as client:
+        resp = client.get("/api/diagnostics", headers={"Authorization": "Bearer test-token"})
+
+    maintenance = resp.json()["dbMaintenance"]
+    assert maintenance["running"] is False
+    assert maintenance["pages"]["auto_vacuum"] == "incremental"
+    app.state.db.close()
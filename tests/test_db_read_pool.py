@@ -0,0 +1,79 @@
+"""Readers use pooled connections and are not blocked by a long ingestion write."""
+
+import threading
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+import backend.api.server as server
+from backend.core.database import GameDatabase
+
+LARGE_BRIEFING = {
+    "meta": {"date": "2250.01.01", "empire_name": "Test Empire"},
+    "planets": [{"id": i, "name": f"Planet {i}", "pops": i % 40} for i in range(20_000)],
+}
+
+
+def test_reads_see_committed_state_and_own_pending_writes(tmp_path: Path, insert_snapshot):
+    db = GameDatabase(tmp_path / "pool.db")
+    session_id = db.get_or_create_active_session(save_id="save-a")
+
+    def job() -> tuple[int, int]:
+        insert_snapshot(db, session_id, "2200.01.01", "h1", full_briefing=LARGE_BRIEFING)
+        # The writer thread reads its own uncommitted snapshot through the primary.
+        return db.get_snapshot_count(session_id), len(
+            db.get_recent_snapshot_points(session_id=session_id)
+        )
+
+    assert db.submit_write(job).result(5) == (1, 1)
+    assert db.get_snapshot_count(session_id) == 1
+    db.close()
+
+
+def test_api_reads_stay_fast_while_a_large_snapshot_is_persisting(
+    tmp_path: Path, monkeypatch, insert_snapshot
+):
+    db = GameDatabase(tmp_path / "api.db")
+    session_id = db.get_or_create_active_session(save_id="save-b", empire_name="Test Empire")
+    insert_snapshot(db, session_id, "2200.01.01", "h0", full_briefing=LARGE_BRIEFING)
+    db.insert_events(
+        session_id=session_id,
+        captured_at=None,
+        game_date="2200.01.01",
+        events=[{"event_type": "war_started", "summary": "War started", "data": {}}],
+    )
+
+    writing, release = threading.Event(), threading.Event()
+
+    def persist_large_snapshot() -> None:
+        # Holds the write transaction (and the primary connection) until released.
+        insert_snapshot(db, session_id, "2250.01.01", "h1", full_briefing=LARGE_BRIEFING)
+        writing.set()
+        release.wait(10)
+
+    monkeypatch.setenv(server.ENV_API_TOKEN, "test-token")
+    app = server.create_app()
+    headers = {"Authorization": "Bearer test-token"}
+    with TestClient(app) as client:
+        app.state.db = db
+        pending = db.submit_write(persist_large_snapshot)
+        assert writing.wait(10)
+        try:
+            latencies = []
+            for _ in range(5):
+                started = time.perf_counter()
+                sessions = client.get("/api/sessions", headers=headers)
+                events = client.get(f"/api/sessions/{session_id}/events", headers=headers)
+                latencies.append(time.perf_counter() - started)
+                assert sessions.status_code == events.status_code == 200
+                # Readers see the last committed state, not the in-flight snapshot.
+                assert sessions.json()["sessions"][0]["snapshot_count"] == 1
+                assert len(events.json()["events"]) == 1
+        finally:
+            release.set()
+        pending.result(10)
+
+    assert max(latencies) < 2.0
+    assert db.get_snapshot_count(session_id) == 2
+    db.close()
@@ -0,0 +1,96 @@
+"""Tests for the GameDatabase write-behind queue and group commit."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.core.database import GameDatabase
+
+
+def _insert_session(db: GameDatabase, save_id: str) -> str:
+    return db.get_or_create_active_session(save_id=save_id)
+
+
+def test_queued_jobs_are_group_committed_and_failures_isolated(tmp_path: Path):
+    db = GameDatabase(tmp_path / "writer.db")
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_job() -> str:
+        started.set()
+        release.wait(5)
+        return _insert_session(db, "save-a")
+
+    def failing_job() -> None:
+        _insert_session(db, "save-rolled-back")
+        raise RuntimeError("boom")
+
+    first = db.submit_write(blocking_job)
+    assert started.wait(5)
+    # These queue up behind the running group and commit together.
+    second = db.submit_write(_insert_session, db, "save-b")
+    failed = db.submit_write(failing_job)
+    third = db.submit_write(_insert_session, db, save_id="save-c")
+    assert db.get_db_stats()["writer"]["queue_depth"] == 3
+
+    release.set()
+    assert isinstance(first.result(5), str)
+    assert isinstance(second.result(5), str) and isinstance(third.result(5), str)
+    with pytest.raises(RuntimeError):
+        failed.result(5)
+
+    saves = {r["save_id"] for r in db.execute("SELECT save_id FROM sessions;").fetchall()}
+    assert saves == {"save-a", "save-b", "save-c"}
+    stats = db.get_write_stats()
+    assert (stats["commits"], stats["jobs"], stats["failed_jobs"]) == (2, 4, 1)
+    assert stats["queue_depth"] == 0 and stats["avg_commit_ms"] is not None
+    db.close()
+
+
+def test_close_drains_pending_writes(tmp_path: Path):
+    path = tmp_path / "drain.db"
+    db = GameDatabase(path)
+    for i in range(10):
+        db.submit_write(_insert_session, db, f"save-{i}")
+    db.close()
+
+    db = GameDatabase(path)
+    assert db.execute("SELECT COUNT(*) AS n FROM sessions;").fetchone()["n"] == 10
+    assert db.flush_writes() is True  # No writer started on this instance
+
+
+def test_concurrent_producers_share_group_commits(tmp_path: Path):
+    db = GameDatabase(tmp_path / "producers.db")
+    started, release = threading.Event(), threading.Event()
+    producers = 8
+    barrier = threading.Barrier(producers + 1)
+    results: list[str] = []
+
+    def blocking_job() -> None:
+        started.set()
+        release.wait(5)
+
+    def produce(i: int) -> None:
+        barrier.wait(5)
+        results.append(db.submit_write(_insert_session, db, f"save-{i}").result(5))
+
+    db.submit_write(blocking_job)
+    assert started.wait(5)
+    threads = [threading.Thread(target=produce, args=(i,)) for i in range(producers)]
+    for t in threads:
+        t.start()
+    barrier.wait(5)
+    deadline = time.monotonic() + 5
+    while db.get_write_stats()["queue_depth"] < producers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(results) == producers
+    stats = db.get_write_stats()
+    # One commit for the blocking job, one shared by every producer's job.
+    assert (stats["commits"], stats["jobs"]) == (2, producers + 1)
+    assert db.execute("SELECT COUNT(*) AS n FROM sessions;").fetchone()["n"] == producers
+    db.close()
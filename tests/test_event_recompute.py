@@ -0,0 +1,121 @@
+"""Tests for bulk regeneration of a session's derived events."""
+
+from pathlib import Path
+
+from backend.core import database
+from backend.core.database import GameDatabase
+from backend.core.events import DetectedEvent
+from backend.core.history import build_event_state_from_briefing, record_snapshot_from_briefing
+from backend.core.json_utils import json_dumps
+
+
+def _briefing(i: int) -> dict:
+    return {
+        "meta": {"date": f"{2200 + i}.01.01", "empire_name": "Test Empire", "player_id": 0},
+        "military": {"military_power": 10_000 * (1 + i % 3), "military_fleets": 3 + i % 2},
+        "territory": {"colonies": {"total_count": 2 + i // 2}},
+        "technology": {"tech_count": 10 + 3 * i},
+        "economy": {"net_monthly": {"energy": 20.0 if i % 4 else -5.0, "alloys": 8.0}},
+    }
+
+
+def _events(db: GameDatabase, session_id: str) -> list[tuple]:
+    return [
+        (e["game_date"], e["event_type"], e["summary"], e["data_json"])
+        for e in db.get_all_events(session_id=session_id)
+    ]
+
+
+def test_recompute_reproduces_incrementally_recorded_events(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(database, "EVENT_STATE_KEYFRAME_INTERVAL", 3)  # Walk through deltas
+    db = GameDatabase(tmp_path / "recompute.db")
+    for i in range(12):
+        _, _, session_id = record_snapshot_from_briefing(
+            db=db, save_path=None, save_hash=f"h{i}", briefing=_briefing(i)
+        )
+    recorded = _events(db, session_id)
+    assert recorded
+
+    assert db.recompute_session_events(session_id=session_id) == len(recorded)
+    assert _events(db, session_id) == recorded
+    assert db.get_event_count(session_id) == len(recorded)
+
+
+def test_recompute_replaces_events_with_new_rules(tmp_path: Path, monkeypatch):
+    db = GameDatabase(tmp_path / "rules.db")
+    for i in range(5):
+        _, _, session_id = record_snapshot_from_briefing(
+            db=db, save_path=None, save_hash=f"h{i}", briefing=_briefing(i)
+        )
+    pairs = []
+
+    def one_event_per_pair(*, prev, curr, from_snapshot_id, to_snapshot_id):
+        pairs.append((prev["meta"]["date"], curr["meta"]["date"]))
+        data = {"from_snapshot_id": from_snapshot_id, "to_snapshot_id": to_snapshot_id}
+        return [DetectedEvent(event_type="tick", summary="Tick", data=data)]
+
+    monkeypatch.setattr(database, "compute_events", one_event_per_pair)
+
+    assert db.recompute_session_events(session_id=session_id) == 4
+    assert pairs == [(f"{2200 + i}.01.01", f"{2201 + i}.01.01") for i in range(4)]
+    assert {e[1] for e in _events(db, session_id)} == {"tick"}
+    assert db.get_event_count(session_id) == 4
+
+
+def test_recompute_keeps_events_of_pairs_it_cannot_rebuild(tmp_path: Path, monkeypatch):
+    db = GameDatabase(tmp_path / "legacy.db")
+    session_id = db.get_or_create_active_session(save_id="legacy")
+    # Legacy snapshots: a full briefing but no event state.
+    legacy_ids = [
+        db.insert_snapshot(
+            session_id=session_id,
+            game_date=f"{2200 + i}.01.01",
+            save_hash=f"legacy{i}",
+            military_power=None,
+            colony_count=None,
+            wars_count=None,
+            energy_net=None,
+            alloys_net=None,
+            full_briefing_json=json_dumps(_briefing(i)),
+            event_state_json=None,
+        )
+        for i in range(2)
+    ]
+    legacy_event = {
+        "event_type": "legacy",
+        "summary": "Recorded before event states",
+        "data": {"from_snapshot_id": legacy_ids[0], "to_snapshot_id": legacy_ids[1]},
+    }
+    db.insert_events(
+        session_id=session_id,
+        captured_at=None,
+        game_date="2201.01.01",
+        events=[legacy_event, {"event_type": "unlinked", "summary": "No snapshot link"}],
+    )
+    for i in range(2, 4):
+        db.insert_snapshot(
+            session_id=session_id,
+            game_date=f"{2200 + i}.01.01",
+            save_hash=f"h{i}",
+            military_power=None,
+            colony_count=None,
+            wars_count=None,
+            energy_net=None,
+            alloys_net=None,
+            full_briefing_json=None,
+            event_state_json=json_dumps(build_event_state_from_briefing(_briefing(i))),
+        )
+
+    def one_event_per_pair(*, prev, curr, from_snapshot_id, to_snapshot_id):
+        data = {"from_snapshot_id": from_snapshot_id, "to_snapshot_id": to_snapshot_id}
+        return [DetectedEvent(event_type="tick", summary="Tick", data=data)]
+
+    monkeypatch.setattr(database, "compute_events", one_event_per_pair)
+
+    # (legacy1 -> 2) uses legacy1's full briefing as its baseline; (legacy0 -> legacy1)
+    # has no event state to rebuild from.
+    assert db.recompute_session_events(session_id=session_id) == 2
+    assert db.recompute_session_events(session_id=session_id) == 2  # Replaced, not duplicated
+    types = sorted(e[1] for e in _events(db, session_id))
+    assert types == ["legacy", "tick", "tick", "unlinked"]
+    assert db.get_event_count(session_id) == 4
@@ -0,0 +1,81 @@
+"""Tests for keyframe + JSON-patch storage of per-snapshot event state."""
+
+import copy
+import json
+from pathlib import Path
+
+from backend.core import database
+from backend.core.database import GameDatabase
+from backend.core.json_patch import apply_json_patch, json_diff
+
+
+def _state(month: int) -> dict:
+    return {
+        "meta": {"date": f"2230.{month:02d}.01", "empire_name": "Test Empire", "player_id": 0},
+        "military": {"military_power": 1000 + month * 10, "fleet_count": 4},
+        "economy": {"net_monthly": {"energy": 10.0, "alloys": 5.0}},
+        "history": {
+            "leaders": [
+                {"id": i, "name": f"Leader {i}", "class": "scientist", "level": 1 + i % 5}
+                for i in range(12 + month // 3)
+            ],
+            "wars": {"count": month % 2, "wars": [{"name": "War/~of Tests"}] * (month % 2)},
+        },
+    }
+
+
+def test_diff_then_apply_round_trips_without_touching_the_base():
+    old, new = _state(1), _state(4)
+    new["history"]["wars"]["wars"] = []
+    new["meta"].pop("player_id")
+    new["technology"] = {"tech_count": 90}
+    base = copy.deepcopy(old)
+
+    ops = json_diff(old, new)
+
+    assert apply_json_patch(old, ops) == new
+    assert old == base
+    assert apply_json_patch(old, json_diff(old, [1, 2])) == [1, 2]  # Root replace
+    assert json_diff(new, new) == []
+
+
+def test_db_stores_deltas_between_keyframes_and_reconstructs_any_snapshot(
+    tmp_path: Path, monkeypatch, insert_snapshot
+):
+    monkeypatch.setattr(database, "EVENT_STATE_KEYFRAME_INTERVAL", 4)
+    db = GameDatabase(tmp_path / "deltas.db")
+    session_id = db.get_or_create_active_session(save_id="save-a")
+    states = [_state(m) for m in range(1, 11)]
+    ids = [
+        insert_snapshot(db, session_id, s["meta"]["date"], f"h{i}", event_state=s)
+        for i, s in enumerate(states)
+    ]
+
+    bases = [
+        r["event_state_base_id"]
+        for r in db.execute("SELECT event_state_base_id FROM snapshots ORDER BY id;").fetchall()
+    ]
+    assert bases == [None, ids[0], ids[1], ids[2], None, ids[4], ids[5], ids[6], None, ids[8]]
+
+    # A fresh connection has no cache and must rebuild from keyframes + patches.
+    db.close()
+    db = GameDatabase(tmp_path / "deltas.db")
+    for snapshot_id, state in zip(ids, states, strict=True):
+        assert db.get_snapshot_event_state(snapshot_id) == state
+        assert json.loads(db.get_snapshot_row(snapshot_id)["event_state_json"]) == state
+    first, last = db.get_first_last_snapshot_rows(session_id=session_id)
+    assert json.loads(last["event_state_json"]) == states[-1]
+
+
+def test_unrelated_states_are_stored_as_keyframes(tmp_path: Path, insert_snapshot):
+    db = GameDatabase(tmp_path / "keyframes.db")
+    session_id = db.get_or_create_active_session(save_id="save-b")
+    insert_snapshot(db, session_id, "2230.01.01", "h0", event_state=_state(1))
+    other = {"meta": {"date": "2231.01.01"}, "history": {"notes": ["x" * 40] * 20}}
+    snapshot_id = insert_snapshot(db, session_id, "2231.01.01", "h1", event_state=other)
+
+    row = db.execute(
+        "SELECT event_state_base_id FROM snapshots WHERE id = ?;", (snapshot_id,)
+    ).fetchone()
+    assert row["event_state_base_id"] is None
+    assert db.get_snapshot_event_state(snapshot_id) == other
@@ -12,8 +12,17 @@ import pytest
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from backend.core.database import GameDatabase
+from backend.core.history import build_event_state_from_briefing, record_snapshot_from_briefing
 from backend.core.ingestion import IngestionManager
-from backend.core.ingestion_worker import WorkerJob, run_worker_job
+from backend.core.ingestion_worker import (
+    IngestionWorkerPool,
+    WorkerJob,
+    discard_briefing,
+    publish_briefing,
+    take_briefing,
+)
+from backend.core.json_utils import json_dumps_bytes
 
 # --- Fixtures ---
 
@@ -57,6 +66,15 @@ class TestIngestionManager:
         assert status["stage"] == "idle"
         assert status["save_loaded"] is False
 
+    def test_stop_closes_worker_pool(self, mock_companion, mock_db):
+        """stop() shuts down the warm worker pool."""
+        pool = MagicMock()
+        manager = IngestionManager(companion=mock_companion, db=mock_db, worker_pool=pool)
+
+        manager.stop()
+
+        pool.close.assert_called_once()
+
     def test_notify_save_updates_pending(self, mock_companion, mock_db, test_save_path):
         """notify_save() updates pending save path and stage."""
         manager = IngestionManager(companion=mock_companion, db=mock_db)
@@ -104,14 +122,18 @@ class TestIngestionWorker:
             "save_path": str(test_save_path),
             "requested_at": time.time(),
         }
-        cancel_event = threading.Event()
-
-        result = run_worker_job(job=job, cancel_event=cancel_event)
+        pool = IngestionWorkerPool()
+        try:
+            result = pool.run_job(job=job, cancel_event=threading.Event())
+        finally:
+            pool.close()
 
         assert result["ok"] is True
         assert "payload" in result
         payload = result["payload"]
-        assert "briefing_json" in payload
+        assert "briefing_handoff" in payload
+        assert isinstance(payload["event_state"], dict)
+        assert take_briefing(payload)
         assert "meta" in payload
         assert "game_date" in payload
         assert isinstance(payload["meta"], dict)
@@ -121,6 +143,128 @@ class TestIngestionWorker:
         assert "Overlord" not in payload["meta"].get("missing_dlcs", [])
 
 
+class TestBriefingHandoff:
+    """Tests for the file-based briefing handoff between worker and manager."""
+
+    BRIEFING = {
+        "meta": {"date": "2230.01.01", "empire_name": "Ünited", "player_id": 0},
+        "military": {"military_power": 1200, "fleet_count": 3},
+        "economy": {"net_monthly": {"energy": 12.5, "alloys": 4.0}},
+        "territory": {"colonies": {"total_count": 4}, "planets": ["big", "list"]},
+        "history": {"wars": {"count": 1}},
+    }
+
+    def test_take_reads_and_removes_the_file(self):
+        data = json_dumps_bytes(self.BRIEFING)
+        handoff = publish_briefing(data)
+
+        assert take_briefing({"briefing_handoff": handoff}) == data
+        assert not Path(handoff["path"]).exists()
+        assert take_briefing({"briefing_json": "{}"}) == b"{}"  # Inline fallback
+
+    def test_discard_and_short_file(self):
+        handoff = publish_briefing(b'{"a":1}')
+        discard_briefing({"briefing_handoff": handoff})
+        assert not Path(handoff["path"]).exists()
+
+        short = publish_briefing(b'{"a":1}')
+        Path(short["path"]).write_bytes(b"{")
+        assert take_briefing({"briefing_handoff": short}) is None
+
+    def test_event_state_and_bytes_persist_like_the_full_briefing(self, tmp_path):
+        event_state = build_event_state_from_briefing(self.BRIEFING)
+        assert build_event_state_from_briefing(event_state) == event_state
+
+        db = GameDatabase(tmp_path / "history.db")
+        inserted, snapshot_id, session_id = record_snapshot_from_briefing(
+            db=db,
+            save_path=None,
+            save_hash="h1",
+            briefing=event_state,
+            briefing_json=json_dumps_bytes(self.BRIEFING),
+        )
+
+        assert inserted
+        row = db.get_snapshot_row(snapshot_id)
+        assert row["military_power"] == 1200 and row["colony_count"] == 4
+        assert row["wars_count"] == 1
+        assert isinstance(row["full_briefing_json"], str)  # Stored as TEXT, not BLOB
+        assert "Ünited" in db.get_latest_session_briefing_json(session_id=session_id)
+
+
+class TestIngestionWorkerPool:
+    """Tests for the warm, long-lived ingestion worker."""
+
+    @staticmethod
+    def _job(save_path: str) -> WorkerJob:
+        return {"tier": "t2", "save_path": save_path, "requested_at": time.time()}
+
+    def test_second_job_reuses_warm_worker(self, tmp_path):
+        """Jobs after the first run on the same pre-imported process."""
+        pool = IngestionWorkerPool()
+        try:
+            missing = str(tmp_path / "missing.sav")
+            first = pool.run_job(job=self._job(missing), cancel_event=threading.Event())
+            second = pool.run_job(job=self._job(missing), cancel_event=threading.Event())
+
+            assert first["ok"] is False
+            assert second["ok"] is False
+            assert first["worker_pid"] == second["worker_pid"]
+
+            stats = pool.get_stats()
+            assert stats["cold_starts"] == 1
+            assert stats["warm_starts"] == 1
+            assert stats["last_start"] == "warm"
+        finally:
+            pool.close()
+
+    def test_cancellation_recycles_worker(self, tmp_path):
+        """A cancelled job kills the worker and a fresh one is spawned."""
+        pool = IngestionWorkerPool()
+        try:
+            missing = str(tmp_path / "missing.sav")
+            warmup = pool.run_job(job=self._job(missing), cancel_event=threading.Event())
+
+            cancel_event = threading.Event()
+            cancel_event.set()
+            result = pool.run_job(job=self._job(missing), cancel_event=cancel_event)
+
+            assert result["error"] == "cancelled"
+            stats = pool.get_stats()
+            assert stats["recycled_cancelled"] == 1
+            assert stats["worker_pid"] not in (None, warmup["worker_pid"])
+        finally:
+            pool.close()
+
+    def test_memory_high_water_recycles_worker(self, tmp_path):
+        """Crossing the peak-RSS high-water mark recycles the worker after the job."""
+        pool = IngestionWorkerPool(memory_high_water_mb=0.0)
+        try:
+            missing = str(tmp_path / "missing.sav")
+            result = pool.run_job(job=self._job(missing), cancel_event=threading.Event())
+
+            stats = pool.get_stats()
+            assert stats["recycled_memory"] == 1
+            assert stats["worker_pid"] != result["worker_pid"]
+        finally:
+            pool.close()
+
+    def test_t2_payload_reports_warm_and_cold_starts(self, test_save_path):
+        """Payload timings distinguish cold and warm worker starts."""
+        pool = IngestionWorkerPool()
+        try:
+            cold = pool.run_job(job=self._job(str(test_save_path)), cancel_event=threading.Event())
+            warm = pool.run_job(job=self._job(str(test_save_path)), cancel_event=threading.Event())
+
+            assert cold["ok"] is True and warm["ok"] is True
+            assert cold["payload"]["worker_start"] == "cold"
+            assert "worker_cold_start" in cold["payload"]["timings"]
+            assert warm["payload"]["worker_start"] == "warm"
+            assert "worker_warm_start" in warm["payload"]["timings"]
+        finally:
+            pool.close()
+
+
 # --- Integration Tests ---
 
 
@@ -0,0 +1,201 @@
+"""Tests for the per-snapshot metrics timeline and its downsampled series API."""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.api.server as server
+from backend.core.database import GameDatabase
+from backend.core.history import record_snapshot_from_briefing
+from backend.core.metrics_timeline import TIMELINE_METRICS, extract_timeline_metrics
+
+
+def _briefing(month_index: int) -> dict:
+    year, month = 2200 + month_index // 12, month_index % 12 + 1
+    return {
+        "meta": {"date": f"{year}.{month:02d}.01", "empire_name": "Test Empire", "player_id": 0},
+        "military": {"military_power": 1000.0 + month_index, "military_fleets": 3},
+        "economy": {
+            "net_monthly": {"energy": 10.0, "alloys": float(month_index), "unity": 5.5},
+            "pop_statistics": {"total_pops": 40 + month_index},
+        },
+        "territory": {"colonies": {"total_count": 4}},
+        "technology": {"completed_count": 20 + month_index},
+    }
+
+
+def test_timeline_metrics_match_the_schema(tmp_path: Path, monkeypatch):
+    db = GameDatabase(tmp_path / "t.db")
+    columns = {row["name"] for row in db.execute("PRAGMA table_info(snapshot_metrics);")}
+    assert set(TIMELINE_METRICS) <= columns
+    db.close()
+
+    # A metric without a migration is caught when the database is opened.
+    monkeypatch.setattr(
+        "backend.core.database.TIMELINE_METRICS",
+        {**TIMELINE_METRICS, "starbase_count": ("military", "starbase_count")},
+    )
+    with pytest.raises(RuntimeError, match="starbase_count"):
+        GameDatabase(tmp_path / "t.db")
+
+
+def test_extract_reads_briefing_paths_and_fallbacks():
+    metrics = extract_timeline_metrics(_briefing(3))
+
+    assert set(metrics) == set(TIMELINE_METRICS)
+    assert metrics["alloys_net"] == 3.0 and metrics["unity_net"] == 5.5
+    assert metrics["total_pops"] == 43 and metrics["tech_count"] == 23
+    assert metrics["rare_crystals_net"] is None
+    # The compact event state names a few things differently.
+    compact = extract_timeline_metrics(
+        {"military": {"fleet_count": 7}, "history": {"wars": {"count": 2}}}
+    )
+    assert (compact["military_fleets"], compact["wars_count"]) == (7.0, 2.0)
+
+
+def test_series_is_downsampled_over_a_date_range(tmp_path: Path):
+    db = GameDatabase(tmp_path / "timeline.db")
+    session_id = None
+    for i in range(120):
+        _, _, session_id = record_snapshot_from_briefing(
+            db=db, save_path=None, save_hash=f"h{i}", briefing=_briefing(i)
+        )
+
+    full = db.get_metric_series(session_id=session_id, metric="alloys_net", max_points=500)
+    assert len(full) == 120 and full[0] == {
+        "game_date": "2200.01.01",
+        "value": 0.0,
+        "min": 0.0,
+        "max": 0.0,
+        "last": 0.0,
+        "samples": 1,
+    }
+
+    decade = db.get_metric_series(
+        session_id=session_id,
+        metric="alloys_net",
+        from_game_date="2202.01.01",
+        to_game_date="2205.12.01",
+        max_points=12,
+    )
+    assert len(decade) == 12 and sum(p["samples"] for p in decade) == 48
+    assert (decade[0]["min"], decade[-1]["max"], decade[-1]["game_date"]) == (
+        24.0,
+        71.0,
+        "2205.12.01",
+    )
+    assert decade[0]["value"] == pytest.approx(25.5) and decade[0]["last"] == 27.0
+
+    with pytest.raises(ValueError):
+        db.get_metric_series(session_id=session_id, metric="alloys_net; DROP TABLE x")
+
+
+def test_migration_backfills_timeline_from_snapshot_columns(tmp_path: Path):
+    path = tmp_path / "legacy.db"
+    db = GameDatabase(path)
+    _, snapshot_id, session_id = record_snapshot_from_briefing(
+        db=db, save_path=None, save_hash="h1", briefing=_briefing(5)
+    )
+    db.execute("DROP TABLE snapshot_metrics;")
+    db._set_schema_version(12)
+    db.close()
+
+    db = GameDatabase(path)
+    row = db.execute(
+        "SELECT military_power, alloys_net, tech_count FROM snapshot_metrics WHERE snapshot_id = ?;",
+        (snapshot_id,),
+    ).fetchone()
+    assert tuple(row) == (1005.0, 5.0, None)
+
+
+def test_api_metric_series_endpoint(tmp_path: Path, monkeypatch):
+    db = GameDatabase(tmp_path / "api.db")
+    for i in range(3):
+        _, _, session_id = record_snapshot_from_briefing(
+            db=db, save_path=None, save_hash=f"h{i}", briefing=_briefing(i)
+        )
+    monkeypatch.setenv(server.ENV_API_TOKEN, "test-token")
+    app = server.create_app()
+    app.state.db = db
+    headers = {"Authorization": "Bearer test-token"}
+
+    with TestClient(app) as client:
+        ok = client.get(f"/api/sessions/{session_id}/metrics/total_pops?points=2", headers=headers)
+        bad = client.get(f"/api/sessions/{session_id}/metrics/nope", headers=headers)
+        missing = client.get("/api/sessions/missing/metrics/total_pops", headers=headers)
+
+    assert ok.status_code == 200
+    assert [p["samples"] for p in ok.json()["points"]] == [2, 1]
+    assert (bad.status_code, missing.status_code) == (400, 404)
+
+
+def _long_campaign(db: GameDatabase, years: int = 100) -> str:
+    session_id = ""
+    for i in range(years * 2):  # Two autosaves a year
+        briefing = _briefing(i * 6)
+        briefing["economy"]["net_monthly"]["alloys"] = float(i)
+        _, _, session_id = record_snapshot_from_briefing(
+            db=db, save_path=None, save_hash=f"h{i}", briefing=briefing
+        )
+    return session_id
+
+
+def test_trend_picks_resolution_for_span_and_budget(tmp_path: Path):
+    db = GameDatabase(tmp_path / "rollups.db")
+    session_id = _long_campaign(db)
+
+    decades = db.get_metric_trend(session_id=session_id, metric="alloys_net", max_points=60)
+    assert decades["resolution"] == "decade" and len(decades["points"]) == 10
+    first = decades["points"][0]
+    assert (first["period"], first["samples"], first["min"], first["max"], first["last"]) == (
+        "2200s",
+        20,
+        0.0,
+        19.0,
+        19.0,
+    )
+    assert first["value"] == pytest.approx(9.5)
+
+    years = db.get_metric_trend(session_id=session_id, metric="alloys_net", max_points=120)
+    assert years["resolution"] == "year" and len(years["points"]) == 100
+    assert years["points"][-1]["period"] == "2299" and years["points"][-1]["last"] == 199.0
+
+    recent = db.get_metric_trend(
+        save_id=db.get_session_by_id(session_id)["save_id"],
+        metric="alloys_net",
+        from_game_date="2290.01.01",
+        to_game_date="2291.12.01",
+        max_points=60,
+    )
+    assert recent["resolution"] == "snapshot"
+    assert [p["last"] for p in recent["points"]] == [180.0, 181.0, 182.0, 183.0]
+
+
+def test_rollup_backfill_matches_incremental_rollups(tmp_path: Path):
+    path = tmp_path / "legacy.db"
+    db = GameDatabase(path)
+    _long_campaign(db, years=15)
+    query = "SELECT * FROM metric_rollups ORDER BY session_id, resolution, metric, period;"
+    incremental = [tuple(r) for r in db.execute(query).fetchall()]
+    db.execute("DROP TABLE metric_rollups;")
+    db._set_schema_version(13)
+    db.close()
+
+    db = GameDatabase(path)
+    assert [tuple(r) for r in db.execute(query).fetchall()] == incremental
+
+
+def test_chronicle_prompts_get_bounded_campaign_trends(tmp_path: Path):
+    from backend.core.chronicle import TREND_METRICS, ChronicleGenerator
+
+    db = GameDatabase(tmp_path / "chronicle.db")
+    session_id = _long_campaign(db)
+    generator = ChronicleGenerator(db=db, api_key="fake-key")
+
+    text = generator._format_metric_trends(session_id=session_id)
+
+    assert text.startswith("=== EMPIRE TRENDS (end of each decade) ===")
+    # Ten decades merged into MAX_TREND_POINTS (8) runs of two.
+    assert "- Alloys per month: 2200s: 39 → 2220s: 79 → " in text
+    assert text.count("\n- ") == len(TREND_METRICS)
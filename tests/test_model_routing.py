@@ -3,6 +3,7 @@ from backend.core.model_routing import (
     GEMINI_FLASH_MODEL,
     GOOGLE_GEMMA_MODEL,
     ModelFailure,
+    ModelRoute,
     classify_model_error,
     clear_model_state,
     get_model_unavailable_event,
@@ -87,3 +88,40 @@ def test_mark_rate_limit_failure_makes_flash_temporarily_unavailable():
         assert event.notice == "Gemini Flash is cooling down. Routing via Gemini Flash-Lite."
     finally:
         clear_model_state()
+
+
+def test_model_route_falls_back_on_quota_error_and_reports_the_route():
+    clear_model_state()
+    try:
+        route = ModelRoute(
+            [GEMINI_FLASH_MODEL, GEMINI_FLASH_LITE_MODEL], purpose_label="Chronicle recap"
+        )
+        tried = []
+        for model in route:
+            tried.append(model)
+            if model == GEMINI_FLASH_MODEL:
+                assert route.should_fall_back(model, RuntimeError("429 RESOURCE_EXHAUSTED"))
+                continue
+            payload = route.succeeded(model)
+
+        assert tried == [GEMINI_FLASH_MODEL, GEMINI_FLASH_LITE_MODEL]
+        assert payload["fallback"] is True
+        assert payload["attempted_model"] == GEMINI_FLASH_MODEL
+        assert payload["final_model"] == GEMINI_FLASH_LITE_MODEL
+
+        # Flash is now cooling down, so the next route skips it up front.
+        route = ModelRoute([GEMINI_FLASH_MODEL, GEMINI_FLASH_LITE_MODEL], purpose_label="Advisor")
+        assert list(route) == [GEMINI_FLASH_LITE_MODEL]
+        assert route.route_event is not None and route.route_event.fallback is True
+
+        # Without a fallback left, the last error is raised as-is.
+        route = ModelRoute([GEMINI_FLASH_LITE_MODEL], purpose_label="Advisor")
+        error = RuntimeError("429 RESOURCE_EXHAUSTED")
+        for model in route:
+            assert not route.should_fall_back(model, error)
+        assert route.exhausted_error() is error
+        assert str(ModelRoute([], purpose_label="Advisor").exhausted_error()) == (
+            "No Advisor model was available"
+        )
+    finally:
+        clear_model_state()
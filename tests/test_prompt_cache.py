@@ -0,0 +1,225 @@
+"""Tests for the stable advisor prompt prefix and provider-side context caching."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.core.companion import Companion
+from backend.core.model_routing import clear_model_state
+from backend.core.prompt_cache import PromptCache, PromptPrefix, build_prompt_prefix
+
+
+class _FakeLLM:
+    """Stand-in for the Gemini client that records every request."""
+
+    def __init__(self, *, with_caches: bool = True):
+        self.generated: list[dict] = []
+        self.created: list[dict] = []
+        self.reject_handles = False
+        self.models = SimpleNamespace(generate_content=self._generate_content)
+        if with_caches:
+            self.caches = SimpleNamespace(create=self._create, delete=lambda **k: None)
+
+    def _create(self, *, model, config):
+        self.created.append(
+            {"model": model, "system": config.system_instruction, "contents": config.contents}
+        )
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+    def _generate_content(self, *, model, contents, config):
+        if config.cached_content and self.reject_handles:
+            raise RuntimeError("400 INVALID_ARGUMENT CachedContent not found")
+        self.generated.append(
+            {
+                "contents": contents,
+                "cached": config.cached_content,
+                "system": config.system_instruction,
+            }
+        )
+        return SimpleNamespace(text=f"Answer {len(self.generated)}")
+
+
+def _companion(monkeypatch, llm: _FakeLLM, *, alloys: float = 10.0) -> Companion:
+    monkeypatch.setattr("backend.core.companion.genai.Client", lambda *a, **k: llm)
+    companion = Companion(save_path=None, api_key="test-key", auto_precompute=False)
+    _load(companion, alloys)
+    return companion
+
+
+def _load(companion: Companion, alloys: float) -> None:
+    briefing = {
+        "meta": {"date": "2300.01.01"},
+        "identity": {"empire_name": "Test Empire"},
+        "economy": {
+            "net_monthly": {"alloys": alloys},
+            "notes": [f"entry {i}" for i in range(2000)],
+        },
+    }
+    companion.apply_precomputed_briefing(
+        save_path=None,
+        briefing_json=json.dumps(briefing),
+        game_date="2300.01.01",
+        identity=briefing["identity"],
+        situation={},
+        metadata=briefing["meta"],
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean_model_state():
+    clear_model_state()
+    yield
+    clear_model_state()
+
+
+def test_turns_reuse_one_cached_prefix_until_the_briefing_changes(monkeypatch):
+    llm = _FakeLLM()
+    companion = _companion(monkeypatch, llm)
+
+    companion.ask_precomputed(question="How are my alloys?", session_key="s")
+    first_key = companion.get_call_stats()["prompt_cache"]["key"]
+    companion.ask_precomputed(question="And my energy?", session_key="s")
+
+    assert len(llm.created) == 1
+    assert llm.created[0]["contents"][0].startswith("EMPIRE STATE (2300.01.01):")
+    assert [g["cached"] for g in llm.generated] == ["cachedContents/1"] * 2
+    assert all(g["system"] is None for g in llm.generated)
+    assert "And my energy?" in llm.generated[1]["contents"]
+    assert "How are my alloys?" in llm.generated[1]["contents"]  # Conversation is per turn
+    stats = companion.get_call_stats()["prompt_cache"]
+    assert stats["cached"] is True and stats["hits"] == 1 and stats["key"] == first_key
+
+    _load(companion, alloys=-5.0)  # New T2 briefing
+    companion.ask_precomputed(question="How are my alloys?", session_key="s")
+    assert len(llm.created) == 2
+    assert companion.get_call_stats()["prompt_cache"]["key"][1:] == first_key[1:]
+
+
+def test_without_provider_caching_prefix_bytes_stay_identical(monkeypatch):
+    llm = _FakeLLM(with_caches=False)
+    companion = _companion(monkeypatch, llm)
+
+    for question in ("How are my alloys?", "And my energy?", "Should I save alloys?"):
+        companion.ask_precomputed(question=question, session_key="s")
+
+    prefixes = {g["contents"].split("```\n\n", 1)[0] for g in llm.generated}
+    systems = {g["system"] for g in llm.generated}
+    assert len(prefixes) == 1 and len(systems) == 1
+    assert all(g["cached"] is None for g in llm.generated)
+
+
+def test_rejected_handle_falls_back_to_the_full_prompt(monkeypatch):
+    llm = _FakeLLM()
+    companion = _companion(monkeypatch, llm)
+    companion.ask_precomputed(question="How are my alloys?", session_key="s")
+
+    llm.reject_handles = True
+    answer, _elapsed = companion.ask_precomputed(question="And now?", session_key="s")
+
+    assert answer == "Answer 2"
+    assert llm.generated[-1]["cached"] is None
+    assert llm.generated[-1]["contents"].startswith("EMPIRE STATE (2300.01.01):")
+    assert companion.get_call_stats()["prompt_cache"]["invalidations"] == 1
+
+
+def test_new_focus_reuses_the_cached_prefix_and_sends_its_sections_per_turn(monkeypatch):
+    llm = _FakeLLM()
+    monkeypatch.setattr("backend.core.companion.genai.Client", lambda *a, **k: llm)
+    companion = Companion(
+        save_path=None, api_key="test-key", auto_precompute=False, briefing_budget_chars=30_000
+    )
+    notes = [f"entry {i}" for i in range(2000)]
+    briefing = {
+        "meta": {"date": "2300.01.01"},
+        "identity": {"empire_name": "Test Empire"},
+        "economy": {"net_monthly": {"alloys": 10.0}, "notes": notes},
+        "military": {"military_power": 125000, "notes": notes},
+        "diplomacy": {"allies": ["Blorg"], "notes": notes},
+    }
+    companion.apply_precomputed_briefing(
+        save_path=None,
+        briefing_json=json.dumps(briefing),
+        game_date="2300.01.01",
+        identity=briefing["identity"],
+        situation={},
+        metadata=briefing["meta"],
+    )
+
+    companion.ask_precomputed(question="How are my alloys?", session_key="a")
+    companion.ask_precomputed(question="Who are my federation allies?", session_key="b")
+
+    assert len(llm.created) == 1  # The prefix does not depend on the question's focus
+    assert '"diplomacy"' not in llm.created[0]["contents"][0]
+    first, second = (g["contents"] for g in llm.generated)
+    assert "MORE EMPIRE STATE FOR THIS QUESTION:" not in first
+    assert "MORE EMPIRE STATE FOR THIS QUESTION:" in second and '"diplomacy"' in second
+    assert companion.get_call_stats()["briefing_slice"]["extra_sections"] == ["diplomacy"]
+
+
+def _prefix() -> PromptPrefix:
+    return build_prompt_prefix(
+        system_instruction="system", text="x" * 100, briefing_json="{}", language="en"
+    )
+
+
+def test_concurrent_turns_share_one_in_flight_create():
+    release = threading.Event()
+    created: list[str] = []
+
+    def create(*, model, config):
+        created.append(model)
+        release.wait(5)
+        return SimpleNamespace(name="cachedContents/1")
+
+    client = SimpleNamespace(caches=SimpleNamespace(create=create, delete=lambda **k: None))
+    cache = PromptCache(min_chars=0)
+    handles: list[str | None] = []
+    threads = [
+        threading.Thread(
+            target=lambda: handles.append(cache.handle_for(client, model="m", prefix=_prefix()))
+        )
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    while cache.get_stats()["create_waits"] < 3:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert created == ["m"] and handles == ["cachedContents/1"] * 4
+    assert cache.get_stats()["creates"] == 1
+
+
+def test_create_retries_transient_errors_and_backs_off_only_when_unsupported():
+    errors: list[Exception] = []
+    calls: list[str] = []
+
+    def create(*, model, config):
+        calls.append(model)
+        if errors:
+            raise errors.pop(0)
+        return SimpleNamespace(name=f"cachedContents/{len(calls)}")
+
+    client = SimpleNamespace(caches=SimpleNamespace(create=create, delete=lambda **k: None))
+    cache = PromptCache(min_chars=0, retry_delay_seconds=0)
+
+    errors[:] = [RuntimeError("503 UNAVAILABLE"), TimeoutError("read timed out")]
+    assert cache.handle_for(client, model="m", prefix=_prefix()) == "cachedContents/3"
+    assert cache.get_stats()["create_retries"] == 2
+
+    # Other failures fall back to the inline prompt this turn, and the next turn tries again.
+    errors[:] = [RuntimeError("400 INVALID_ARGUMENT bad request")]
+    assert cache.handle_for(client, model="other", prefix=_prefix()) is None
+    assert cache.handle_for(client, model="other", prefix=_prefix()) is not None
+
+    errors[:] = [RuntimeError("400 Cached content is too small. min_total_token_count=4096")]
+    assert cache.handle_for(client, model="small", prefix=_prefix()) is None
+    attempts = len(calls)
+    assert cache.handle_for(client, model="small", prefix=_prefix()) is None
+    assert len(calls) == attempts  # Backed off: no create until the TTL passes
+    assert cache.get_stats()["create_failures"] == 2
@@ -0,0 +1,111 @@
+"""Tests for the Rust op prefetch/memoization layer on SaveExtractorBase."""
+
+import os
+import sys
+import threading
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stellaris_companion.rust_bridge import bind_session
+from stellaris_save_extractor import SaveExtractor
+
+
+class RecordingSession:
+    """Answers batch_ops from canned data and records each request."""
+
+    def __init__(self):
+        self.requests: list[list[dict]] = []
+
+    @property
+    def request_count(self) -> int:
+        return len(self.requests)
+
+    def batch_ops(self, ops):
+        self.requests.append(ops)
+        results = []
+        for op in ops:
+            if op["op"] == "extract_sections":
+                if op["sections"] == ["player"]:
+                    results.append({"data": {"player": [{"name": "p", "country": 3}]}})
+                else:
+                    results.append({"data": {name: {"n": name} for name in op["sections"]}})
+            elif op["op"] == "get_entry":
+                results.append({"entry": {"key": op["key"]}, "found": True})
+            elif op["op"] == "contains_tokens":
+                results.append({"matches": {t: t.startswith("yes") for t in op["tokens"]}})
+            elif op["op"] == "contains_kv":
+                results.append({"matches": {f"{k}={v}": v == "yes" for k, v in op["pairs"]}})
+            elif op["op"] == "count_keys":
+                results.append({"counts": {k: len(k) for k in op["keys"]}})
+            else:
+                results.append({})
+        return results
+
+
+def _extractor() -> SaveExtractor:
+    extractor = SaveExtractor.__new__(SaveExtractor)
+    extractor._cache_locks = {}
+    extractor._cache_locks_guard = threading.Lock()
+    extractor._rust_op_results = {}
+    extractor._rust_merged_results = {"contains_tokens": {}, "contains_kv": {}, "count_keys": {}}
+    extractor._rust_query_stats = {"requests": 0, "ops_sent": 0, "cache_hits": 0}
+    return extractor
+
+
+def test_prefetch_batches_declared_ops_into_one_request():
+    extractor = _extractor()
+    sess = RecordingSession()
+
+    with bind_session(sess):
+        sent = extractor.prefetch_rust_ops()
+        assert sess.request_count == 2  # player lookup for {player_id}, then one multi
+
+        # Everything the mixins declared is now answered without IPC.
+        assert extractor._rust_get_entry("country", "3") == {"key": "3"}
+        assert extractor._rust_extract_sections(["starbase_mgr"]) == {
+            "starbase_mgr": {"n": "starbase_mgr"}
+        }
+        extractor._rust_count_keys(list(extractor.CRISIS_SYSTEM_FLAGS))
+        extractor._rust_contains_tokens(list(extractor.LCLUSTER_TOKENS))
+        assert sess.request_count == 2
+
+    multi = sess.requests[1]
+    assert sent == len(multi)
+    # Mergeable ops from several mixins collapse into a single scan each.
+    assert [op["op"] for op in multi].count("contains_tokens") == 1
+    assert [op["op"] for op in multi].count("contains_kv") == 1
+    stats = extractor.get_rust_query_stats()
+    assert stats["requests"] == 2
+    assert stats["cache_hits"] >= 4
+
+
+def test_merged_ops_answer_per_item_and_fetch_only_missing():
+    extractor = _extractor()
+    sess = RecordingSession()
+
+    with bind_session(sess):
+        first = extractor._rust_contains_tokens(["yes_a", "no_b"])
+        second = extractor._rust_contains_tokens(["no_b", "yes_c"])
+        kv = extractor._rust_contains_kv([("flag", "yes"), ("flag", "no")])
+
+    assert first == {"matches": {"yes_a": True, "no_b": False}}
+    assert second == {"matches": {"no_b": False, "yes_c": True}}
+    assert kv == {"matches": {"flag=yes": True, "flag=no": False}}
+    assert sess.requests[1] == [{"op": "contains_tokens", "tokens": ["yes_c"]}]
+
+
+def test_release_gamestate_drops_memoized_results():
+    extractor = _extractor()
+    extractor._section_cache = {}
+    extractor._section_index = None
+    extractor._gamestate_mm = None
+    extractor._gamestate_file = None
+    sess = RecordingSession()
+
+    with bind_session(sess):
+        extractor._rust_extract_sections(["galaxy"])
+        extractor.release_gamestate()
+        extractor._rust_extract_sections(["galaxy"])
+
+    assert sess.request_count == 2
@@ -0,0 +1,124 @@
+"""Tests for RustSession response framing and request options."""
+
+import io
+import json
+import os
+import queue
+import sys
+from collections import deque
+
+import msgpack
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stellaris_companion.rust_bridge import ParserError, RustSession
+
+
+class _FakeProc:
+    def __init__(self, stdout: bytes):
+        self.stdout = io.BufferedReader(io.BytesIO(stdout))
+
+    def poll(self):
+        return None
+
+
+def _session(stdout: bytes, *, hello: bool) -> RustSession:
+    """Build a session over canned stdout and run the reader to completion."""
+    sess = RustSession.__new__(RustSession)
+    sess._proc = _FakeProc(stdout)
+    sess._timeout = 1.0
+    sess._response_queue = queue.Queue()
+    sess._stderr_lines = deque()
+    sess._closed = False
+    sess._in_stream = False
+    sess._request_count = 0
+    sess._wire_requested = "msgpack" if hello else "json"
+    sess._wire = "json"
+    sess._awaiting_hello_ack = hello
+    sess._hello_pending = hello
+    sess._bytes_received = 0
+    sess._decode_seconds = 0.0
+    sess._reader_loop()
+    return sess
+
+
+def _line(obj: dict) -> bytes:
+    return json.dumps(obj).encode() + b"\n"
+
+
+def test_json_lines_without_hello():
+    sess = _session(_line({"ok": True, "data": {"meta": {"name": "x"}}}), hello=False)
+
+    assert sess._recv() == {"ok": True, "data": {"meta": {"name": "x"}}}
+    assert sess.wire == "json"
+    assert sess.get_wire_stats()["bytes_received"] > 0
+
+
+def test_old_parser_rejecting_hello_falls_back_to_json():
+    stdout = _line(
+        {"ok": False, "error": "InvalidRequest", "message": "unknown variant", "exit_code": 3}
+    ) + _line({"ok": True, "found": True, "entry": {"name": "UNE"}})
+    sess = _session(stdout, hello=True)
+
+    assert sess._recv()["entry"] == {"name": "UNE"}
+    assert sess.wire == "json"
+
+
+def test_hello_ack_with_json_wire_keeps_json():
+    stdout = _line({"ok": True, "wire": "json", "tool_version": "0.4.0"}) + _line(
+        {"ok": True, "counts": {"name": 2}}
+    )
+    sess = _session(stdout, hello=True)
+
+    assert sess._recv() == {"ok": True, "counts": {"name": 2}}
+
+
+def test_load_error_is_still_raised_after_hello():
+    stdout = _line({"ok": False, "error": "ParseError", "message": "bad save", "exit_code": 2})
+    sess = _session(stdout, hello=True)
+
+    with pytest.raises(ParserError, match="bad save"):
+        sess._recv()
+
+
+def test_msgpack_frames_after_ack():
+    def frame(obj: dict) -> bytes:
+        payload = msgpack.packb(obj)
+        return len(payload).to_bytes(4, "big") + payload
+
+    stdout = (
+        _line({"ok": True, "wire": "msgpack", "tool_version": "0.4.0"})
+        + frame({"ok": True, "stream": True, "op": "iter_section", "section": "country"})
+        + frame({"ok": True, "entries": [{"key": "0", "value": {"name": "UNE"}}]})
+        + frame({"ok": True, "done": True, "op": "iter_section", "section": "country"})
+    )
+    sess = _session(stdout, hello=True)
+    sess._send = lambda request: None
+
+    assert list(sess.iter_section("country")) == [("0", {"name": "UNE"})]
+    assert sess.wire == "msgpack"
+
+
+def _stream(section: str, value: dict) -> bytes:
+    return (
+        _line({"ok": True, "stream": True, "op": "iter_section", "section": section})
+        + _line({"ok": True, "entries": [{"key": "1", "value": value}]})
+        + _line({"ok": True, "done": True, "op": "iter_section", "section": section})
+    )
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [(None, None), (("coordinate.x", "hyperlane[].to"), ["coordinate.x", "hyperlane[].to"])],
+)
+def test_iter_section_sends_field_projection(fields, expected):
+    sess = _session(_stream("galactic_object", {"coordinate": {"x": 2.5}}), hello=False)
+    sent: list[dict] = []
+    sess._send = sent.append
+
+    entries = list(sess.iter_section("galactic_object", fields=fields))
+
+    assert entries == [("1", {"coordinate": {"x": 2.5}})]
+    assert sent[0].get("fields") == expected
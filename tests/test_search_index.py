@@ -0,0 +1,101 @@
+"""Tests for the on-disk gamestate search index behind BriefingMixin.search()."""
+
+import os
+import re
+import sys
+import zipfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.ingestion_worker import _build_search_index
+from stellaris_save_extractor import SaveExtractor
+from stellaris_save_extractor.search_index import MAX_POSTINGS, GamestateSearchIndex
+
+GAMESTATE = (
+    'version="Corvus v4.0.2"\n'
+    'species_db=\n{\n\t0=\n\t{\n\t\tclass=HUM\n\t\tname={ key="SPEC_Human" }\n\t}\n}\n'
+    "fleet=\n{\n"
+    + "".join(f'\t{i}=\n\t{{\n\t\tname={{ key="Fleet_{i}" }}\n\t}}\n' for i in range(100))
+    + "}\n"
+    'war=\n{\n\t1=\n\t{\n\t\tname={ key="war_name" }\n\t\tstart_date="2250.01.01"\n\t}\n}\n'
+)
+
+
+def _linear(query: str, buffer: str) -> list[int]:
+    return [m.start() for m in re.finditer(f"(?={re.escape(query)})", buffer, re.IGNORECASE)]
+
+
+def test_counts_and_positions_match_a_linear_scan():
+    index = GamestateSearchIndex.build(GAMESTATE)
+
+    for query in ("war_name", "NAME", "spec_h", 'key="war', "Fleet_9"):
+        expected = _linear(query, GAMESTATE)
+        hits = index.find(query, GAMESTATE, limit=5)
+        assert hits is not None, query
+        assert hits.total == len(expected), query
+        assert hits.positions == expected[:5], query
+
+
+def test_frequent_tokens_keep_counts_only():
+    index = GamestateSearchIndex.build(GAMESTATE)
+
+    assert GAMESTATE.count("key=") > MAX_POSTINGS
+    hits = index.find("key", GAMESTATE, limit=3)
+    assert hits.total == len(_linear("key", GAMESTATE))
+    assert hits.positions == _linear("key", GAMESTATE)[:3]
+    # A phrase anchored only on frequent tokens is left to the linear scan.
+    assert index.find("name={ key", GAMESTATE, limit=3) is None
+    assert index.find("2250", GAMESTATE, limit=3) is None  # Digits are not indexed
+
+
+def test_round_trip_and_section_lookup(tmp_path):
+    buffer = GAMESTATE.encode("utf-8")
+    path = tmp_path / "save.idx"
+    GamestateSearchIndex.build(buffer).save(path)
+
+    index = GamestateSearchIndex.load(path)
+    hits = index.find("war_name", buffer, limit=1)
+    assert index.unit == "bytes"
+    assert hits.total == 1 and index.section_at(hits.positions[0]) == "war"
+
+    path.write_bytes(b"garbage")
+    assert GamestateSearchIndex.load(path) is None
+
+
+def test_extractor_search_uses_cached_index(tmp_path):
+    save = tmp_path / "save.sav"
+    with zipfile.ZipFile(save, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("meta", 'version="Corvus v4.0.2"\nname="Test"\n')
+        z.writestr("gamestate", GAMESTATE)
+
+    plain = SaveExtractor(str(save)).search("Fleet_42")
+    indexed = SaveExtractor(str(save), search_index_dir=tmp_path / "idx").search("Fleet_42")
+
+    assert not plain["indexed"] and indexed["indexed"]
+    assert indexed["total_found"] == plain["total_found"] == 1
+    assert indexed["matches"] == plain["matches"]
+    assert indexed["matches"][0]["section"] == "fleet"
+    assert len(list((tmp_path / "idx").glob("*.idx"))) == 1
+
+    # A second extractor over the same save reuses the file.
+    again = SaveExtractor(str(save), search_index_dir=tmp_path / "idx")
+    assert again.search("fleet_4", max_results=2)["total_found"] == 11
+
+
+def test_build_can_be_abandoned(tmp_path):
+    assert GamestateSearchIndex.build(GAMESTATE, should_stop=lambda: True) is None
+
+    save = tmp_path / "save.sav"
+    with zipfile.ZipFile(save, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("meta", 'version="Corvus v4.0.2"\nname="Test"\n')
+        z.writestr("gamestate", GAMESTATE)
+    job = {"tier": "t2", "save_path": str(save), "requested_at": 0.0}
+    job["search_index_dir"] = str(tmp_path / "idx")
+
+    # The worker gives way when the next job is already queued ...
+    assert not _build_search_index(job, should_stop=lambda: True)
+    assert not list(tmp_path.glob("idx/*.idx"))
+    # ... and otherwise leaves the index for the app's extractors.
+    assert _build_search_index(job, should_stop=lambda: False)
+    assert len(list(tmp_path.glob("idx/*.idx"))) == 1
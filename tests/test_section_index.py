@@ -0,0 +1,177 @@
+"""Tests for the top-level section index and mmap-backed gamestate access."""
+
+import mmap
+import os
+import re
+import sys
+import tempfile
+import threading
+import zipfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stellaris_save_extractor import SaveExtractor
+from stellaris_save_extractor.base import (
+    SaveExtractorBase,
+    build_section_index,
+    inflate_gamestate,
+    literal_search_pattern,
+)
+
+GAMESTATE = (
+    'version="Corvus v4.0.2"\n'
+    "country=0\n"
+    'species_db=\n{\n\t0=\n\t{\n\t\tclass=HUM\n\t\tname={ key="SPEC_Human" }\n\t}\n}\n'
+    'galaxy={\n\tname="abc-123"\n}\n'
+    'war=\n{\n\t0=none\n\t1=\n\t{\n\t\tname={ key="war_name" }\n\t}\n}\n'
+    'country=\n{\n\t0=\n\t{\n\t\tflag={ colors={ "red" } }\n\t}\n}\n'
+    "market=\n{\n\tid=1\n}\n"
+)
+
+
+def _span(name: str) -> str:
+    start, end = build_section_index(GAMESTATE)[name]
+    return GAMESTATE[start:end]
+
+
+def test_index_covers_each_block_section_exactly():
+    index = build_section_index(GAMESTATE)
+
+    assert set(index) == {"species_db", "galaxy", "war", "country", "market"}
+    assert _span("war").startswith("war=\n{") and _span("war").endswith("\n}")
+    assert _span("market") == "market=\n{\n\tid=1\n}"  # Last section runs to the final brace
+
+
+def test_scalar_assignment_does_not_shadow_block():
+    # `country=0` near the top is a scalar; the index must point at the block.
+    assert _span("country").startswith("country=\n{\n\t0=")
+
+
+def test_extractor_builds_index_once_and_resets_on_release():
+    extractor = SaveExtractorBase.__new__(SaveExtractorBase)
+    extractor._cache_locks = {}
+    extractor._cache_locks_guard = threading.Lock()
+    extractor.mmap_gamestate = False
+    extractor._gamestate = GAMESTATE
+    extractor._gamestate_mm = None
+    extractor._gamestate_file = None
+    extractor._section_index = None
+    extractor._section_cache = {}
+
+    assert extractor._extract_section("galaxy") == 'galaxy={\n\tname="abc-123"\n}'
+    index = extractor._get_section_index()
+    assert extractor._get_section_bounds("missing") is None
+    assert extractor._get_section_index() is index
+
+    extractor._rust_op_results = {}
+    extractor._rust_merged_results = {}
+    extractor.release_gamestate()
+    assert extractor._section_index is None
+
+
+def _write_save(path, gamestate: str) -> None:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("meta", 'version="Corvus v4.0.2"\nname="Test"\n')
+        z.writestr("gamestate", gamestate.encode("utf-8"))
+
+
+def test_mmap_mode_serves_sections_and_search_from_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    save = tmp_path / "save.sav"
+    # Non-ASCII before the sections shifts byte offsets away from char offsets.
+    _write_save(save, 'name="Ünited Ëmpire"\n' + GAMESTATE)
+
+    extractor = SaveExtractor(str(save), mmap_gamestate=True)
+    plain = SaveExtractor(str(save))
+
+    assert isinstance(extractor.gamestate_buffer, mmap.mmap)
+    assert extractor._gamestate is None  # No decoded str was built
+    for name in ("species_db", "war", "country"):
+        assert extractor._extract_section(name) == plain._extract_section(name)
+    assert extractor._count_gamestate(r"\bname=") == plain._count_gamestate(r"\bname=")
+    assert extractor._search_gamestate("SPEC_HUMAN", re.IGNORECASE)
+
+    hits = extractor.search("war_name")
+    assert hits["total_found"] == 1
+    assert "war_name" in hits["matches"][0]["context"]
+    assert extractor._gamestate is None
+
+    # Positions are byte offsets into the mapped file; the decoded str counts chars.
+    plain_hits = plain.search("war_name")
+    assert (hits["offset_unit"], plain_hits["offset_unit"]) == ("byte", "char")
+    byte_pos = hits["matches"][0]["position"]
+    assert plain_hits["matches"][0]["position"] == byte_pos - 2  # Ü and Ë are 2 bytes
+    assert extractor.gamestate_buffer[byte_pos : byte_pos + 8] == b"war_name"
+
+    # Non-ASCII letters fold case in bytes mode too.
+    assert extractor.search("ünited ëmpire")["total_found"] == 1
+    assert plain.search("ünited ëmpire")["total_found"] == 1
+
+    inflated = extractor._gamestate_file
+    assert inflated is not None and inflated.exists()
+    extractor.release_gamestate()
+    assert extractor._gamestate_mm is None
+    assert not inflated.exists()  # Released extractors take their inflation with them
+
+
+def test_inflated_gamestate_is_reused_until_the_save_changes(tmp_path):
+    save = tmp_path / "save.sav"
+    _write_save(save, GAMESTATE)
+
+    first = inflate_gamestate(save, cache_dir=tmp_path / "cache")
+    assert inflate_gamestate(save, cache_dir=tmp_path / "cache") == first
+    assert first.read_bytes() == GAMESTATE.encode("utf-8")
+
+    _write_save(save, GAMESTATE + "market2=\n{\n}\n")
+    os.utime(save, ns=(first.stat().st_mtime_ns + 10**9,) * 2)
+    second = inflate_gamestate(save, cache_dir=tmp_path / "cache")
+    assert second != first
+    assert not first.exists()  # Stale inflation removed
+
+
+def test_inflated_cache_evicts_oldest_files_past_the_size_cap(tmp_path):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    size = len(GAMESTATE.encode("utf-8"))
+    saves = []
+    for i in range(3):
+        save = tmp_path / f"save{i}.sav"
+        _write_save(save, GAMESTATE)
+        saves.append(save)
+
+    first = inflate_gamestate(saves[0], cache_dir=cache, max_cache_bytes=2 * size)
+    second = inflate_gamestate(saves[1], cache_dir=cache, max_cache_bytes=2 * size)
+    os.utime(first, (1, 1))
+    os.utime(second, (2, 2))
+    abandoned = cache / "other.gamestate.1-2.tmp"
+    abandoned.write_bytes(b"partial")
+    os.utime(abandoned, (1, 1))
+
+    third = inflate_gamestate(saves[2], cache_dir=cache, max_cache_bytes=2 * size)
+
+    assert not first.exists()  # Oldest save's file evicted to stay under the cap
+    assert second.exists() and third.exists()
+    assert not abandoned.exists()
+
+
+def test_reused_inflation_counts_as_recently_used(tmp_path):
+    cache = tmp_path / "cache"
+    save = tmp_path / "save.sav"
+    _write_save(save, GAMESTATE)
+    first = inflate_gamestate(save, cache_dir=cache)
+    os.utime(first, (1, 1))
+
+    assert inflate_gamestate(save, cache_dir=cache) == first
+    assert first.stat().st_mtime > 1
+
+
+def test_literal_search_pattern_folds_non_ascii_case_in_bytes():
+    text = 'name="Ünited Ëmpire" adj="ünited"'
+    data = text.encode("utf-8")
+
+    char_hits = [m.start() for m in literal_search_pattern("üNITED", text).finditer(text)]
+    byte_hits = [m.start() for m in literal_search_pattern("üNITED", data).finditer(data)]
+
+    assert char_hits == [6, 26]
+    assert byte_hits == [6, 28]  # Shifted by the 2-byte Ü and Ë before the second hit
@@ -0,0 +1,131 @@
+"""Tests for the materialized per-session snapshot/event counters."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from backend.core.database import GameDatabase
+
+STATS_COLUMNS = (
+    "snapshot_count",
+    "event_count",
+    "first_snapshot_game_date",
+    "last_snapshot_game_date",
+)
+
+
+def _event(event_type: str) -> dict:
+    return {"event_type": event_type, "summary": event_type.replace("_", " "), "data": {}}
+
+
+def test_counters_follow_inserts(tmp_path: Path, insert_snapshot):
+    db = GameDatabase(tmp_path / "stats.db")
+    session_id = db.get_or_create_active_session(save_id="save-a", empire_name="Test Empire")
+
+    assert db.get_session_snapshot_stats(session_id) == {
+        "snapshot_count": 0,
+        "first_game_date": None,
+        "last_game_date": None,
+    }
+    insert_snapshot(db, session_id, "2201.06.01", "h1")
+    insert_snapshot(db, session_id, None, "h2")
+    insert_snapshot(db, session_id, "2200.01.01", "h3")  # Out-of-order dates still widen the range
+    insert_snapshot(db, session_id, "2203.02.01", "h4")
+    db.insert_events(
+        session_id=session_id,
+        captured_at=None,
+        game_date="2203.02.01",
+        events=[_event("war_started"), _event("leader_hired")],
+    )
+
+    assert db.get_session_snapshot_stats(session_id) == {
+        "snapshot_count": 4,
+        "first_game_date": "2200.01.01",
+        "last_game_date": "2203.02.01",
+    }
+    assert db.get_snapshot_count(session_id) == 4
+    assert db.get_event_count(session_id) == 2
+    (listed,) = db.get_sessions()
+    assert listed == db.get_session_by_id(session_id)
+    assert (
+        listed["snapshot_count"],
+        listed["first_game_date"],
+        listed["last_game_date_computed"],
+    ) == (4, "2200.01.01", "2203.02.01")
+
+
+def test_failed_insert_leaves_counters_untouched(tmp_path: Path, insert_snapshot):
+    db = GameDatabase(tmp_path / "atomic.db")
+    session_id = db.get_or_create_active_session(save_id="save-b")
+    insert_snapshot(db, session_id, "2200.01.01", "h1")
+    db.execute(
+        "CREATE TRIGGER reject_events BEFORE INSERT ON events "
+        "BEGIN SELECT RAISE(ABORT, 'rejected'); END;"
+    )
+
+    with pytest.raises(sqlite3.IntegrityError):
+        db.insert_events(
+            session_id=session_id, captured_at=None, game_date=None, events=[_event("x")]
+        )
+
+    assert db.get_event_count(session_id) == 0
+    assert db.get_snapshot_count(session_id) == 1
+
+
+def test_migration_backfills_counters_for_existing_sessions(tmp_path: Path, insert_snapshot):
+    path = tmp_path / "legacy.db"
+    db = GameDatabase(path)
+    session_id = db.get_or_create_active_session(save_id="save-c")
+    insert_snapshot(db, session_id, "2210.01.01", "h1")
+    insert_snapshot(db, session_id, "2215.01.01", "h2")
+    db.insert_events(
+        session_id=session_id, captured_at=None, game_date=None, events=[_event("war_started")]
+    )
+    empty_id = db.get_or_create_active_session(save_id="save-d")
+
+    # Rewind to the schema 11 layout (counters computed on every read).
+    for column in STATS_COLUMNS:
+        db.execute(f"ALTER TABLE sessions DROP COLUMN {column};")
+    db._set_schema_version(11)
+    db.close()
+
+    db = GameDatabase(path)
+    assert db.get_schema_version() >= 12
+    assert db.get_session_snapshot_stats(session_id) == {
+        "snapshot_count": 2,
+        "first_game_date": "2210.01.01",
+        "last_game_date": "2215.01.01",
+    }
+    assert db.get_event_count(session_id) == 1
+    assert db.get_session_by_id(empty_id)["snapshot_count"] == 0
+
+    # The repair path recomputes the same values from the rows.
+    db.execute("UPDATE sessions SET snapshot_count = 99, event_count = 99;")
+    db.refresh_session_stats(session_id)
+    assert (db.get_snapshot_count(session_id), db.get_event_count(session_id)) == (2, 1)
+    assert db.get_snapshot_count(empty_id) == 99
+    db.refresh_session_stats()
+    assert db.get_snapshot_count(empty_id) == 0
+
+
+def test_session_list_does_not_read_snapshots(tmp_path: Path, insert_snapshot):
+    db = GameDatabase(tmp_path / "reads.db")
+    session_id = db.get_or_create_active_session(save_id="save-e")
+    insert_snapshot(db, session_id, "2200.01.01", "h1")
+    tables: set[str] = set()
+
+    def authorizer(action, arg1, arg2, dbname, source):
+        if action == sqlite3.SQLITE_READ:
+            tables.add(arg1)
+        return sqlite3.SQLITE_OK
+
+    with db._read() as conn:  # Single-threaded, so the pool hands this one back below
+        conn.set_authorizer(authorizer)
+    db.get_sessions()
+    db.get_session_by_id(session_id)
+    db.get_session_snapshot_stats(session_id)
+    with db._read() as conn:
+        conn.set_authorizer(None)
+
+    assert tables == {"sessions"}